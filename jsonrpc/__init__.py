@@ -1,10 +1,17 @@
+import functools
 import re
 import sys
 import six
 from inspect import getargspec
+try:
+    from inspect import iscoroutinefunction
+except ImportError:
+    # python < 3.5 has no native coroutines
+    iscoroutinefunction = lambda func: False
 from jsonrpc.site import jsonrpc_site
 from jsonrpc._types import *
 from jsonrpc.exceptions import *
+from jsonrpc.errorlog import report_exception
 
 try:
     from collections import OrderedDict
@@ -15,11 +22,7 @@ except ImportError:
     from django.utils.datastructures import SortedDict as OrderedDict
 
 default_site = jsonrpc_site
-KWARG_RE = re.compile(
-    r'\s*(?P<arg_name>[a-zA-Z0-9_]+)\s*=\s*(?P<arg_type>[a-zA-Z]+)\s*$')
-SIG_RE = re.compile(
-    r'\s*(?P<method_name>[a-zA-Z0-9._]+)\s*(\((?P<args_sig>[^)].*)?\)'
-    r'\s*(\->\s*(?P<return_sig>.*))?)?\s*$')
+SIG_RE = re.compile(r'\s*(?P<method_name>[a-zA-Z0-9._]+)(?P<rest>.*)$', re.S)
 
 
 class JSONRPCTypeCheckingUnavailable(Exception):
@@ -43,27 +46,23 @@ def _validate_arg(value, expected):
 
 def _eval_arg_type(arg_type, T=Any, arg=None, sig=None):
     """
-    Returns a type from a snippet of python source. Should normally be
-    something just like 'str' or 'Object'.
+    Returns a type from its source in a signature. Should normally be
+    something just like 'str', 'Object' or 'Array(Number)'. Nothing is
+    evaluated, see `SigParser` for what can be written.
 
-      arg_type      the source to be evaluated
+      arg_type      the source to be parsed
       T             the default type
       arg           context of where this type was extracted
       sig           context from where the arg was extracted
 
-    Returns a type or a Type
+    Returns a type, a Type or a Container
     """
     try:
-        T = eval(arg_type)
-    except Exception as e:
+        return parse_type(arg_type)
+    except ValueError as e:
         raise ValueError(
-            'The type of %s could not be evaluated in %s for %s: %s' %
+            'The type of %s could not be parsed in %s for %s: %s' %
             (arg_type, arg, sig, str(e)))
-    else:
-        if type(T) not in (type, Type):
-            raise TypeError(
-                '%s is not a valid type in %s for %s' % (repr(T), arg, sig))
-        return T
 
 
 def _parse_sig(sig, arg_names, validate=False):
@@ -81,40 +80,37 @@ def _parse_sig(sig, arg_names, validate=False):
     d = SIG_RE.match(sig)
     if not d:
         raise ValueError('Invalid method signature %s' % sig)
-    d = d.groupdict()
     ret = [(n, Any) for n in arg_names]
-    if 'args_sig' in d and type(
-            d['args_sig']) is str and d['args_sig'].strip():
-        for i, arg in enumerate(d['args_sig'].strip().split(',')):
+    return_type = Any
+    p = SigParser(d.group('rest'), sig)
+    if not p.at_end():
+        p.expect('(')
+        i = 0
+        while not p.accept(')'):
+            if i:
+                p.expect(',')
             _type_checking_available(sig, validate)
-            if '=' in arg:
+            if p.peek(1) == '=':
                 if not type(ret) is OrderedDict:
                     ret = OrderedDict(ret)
-                dk = KWARG_RE.match(arg)
-                if not dk:
-                    raise ValueError('Could not parse arg type %s in %s' %
-                                     (arg, sig))
-                dk = dk.groupdict()
-                if not sum(
-                    [(k in dk and type(dk[k]) is str and bool(dk[k].strip()))
-                         for k in ('arg_name', 'arg_type')]):
-                    raise ValueError('Invalid kwarg value %s in %s' %
-                                     (arg, sig))
-                ret[dk['arg_name']] = _eval_arg_type(dk['arg_type'], None, arg,
-                                                     sig)
+                name = p.name()
+                p.expect('=')
+                ret[name] = p.type()
             else:
                 if type(ret) is OrderedDict:
                     raise ValueError('Positional arguments must occur '
                                      'before keyword arguments in %s' % sig)
                 if len(ret) < i + 1:
-                    ret.append((str(i), _eval_arg_type(arg, None, arg, sig)))
+                    ret.append((str(i), p.type()))
                 else:
-                    ret[i] = (ret[i][0], _eval_arg_type(arg, None, arg, sig))
+                    ret[i] = (ret[i][0], p.type())
+            i += 1
+        if p.accept('->'):
+            return_type = p.type()
+        p.expect_end()
     if not type(ret) is OrderedDict:
         ret = OrderedDict(ret)
-    return (d['method_name'], ret,
-            (_eval_arg_type(d['return_sig'], Any, 'return', sig) if
-             d['return_sig'] else Any))
+    return (d.group('method_name'), ret, return_type)
 
 
 def _inject_args(sig, types):
@@ -129,7 +125,7 @@ def _inject_args(sig, types):
     Returns the altered signature.
     """
     if '(' in sig:
-        parts = sig.split('(')
+        parts = sig.split('(', 1)
         sig = '%s(%s%s%s' % (
             parts[0], ', '.join(types),
             (', ' if parts[1].index(')') > 0 else ''), parts[1])
@@ -143,7 +139,10 @@ def jsonrpc_method(name,
                    authentication_arguments=['username', 'password'],
                    safe=False,
                    validate=False,
-                   site=default_site):
+                   site=default_site,
+                   cache=None,
+                   http_cache=None,
+                   timeout=None):
     """
     Wraps a function turns it into a json-rpc method. Adds several attributes
     to the function specific to the JSON-RPC machinery and adds it to the default
@@ -168,6 +167,13 @@ def jsonrpc_method(name,
             as the authentication method. It must return either a User or `None`
             and take the keyword arguments `username` and `password`.
 
+            On sites with `system.login` enabled (`JSONRPCSite.enable_login`)
+            the token it returns can be sent instead of the username and
+            password, in an `Authorization: Bearer <token>` header or a `token`
+            param. Successful credentials are remembered for a little while by
+            the site's `credential_cache`, so the password hasher does not run
+            on every call.
+
         safe=False
 
             Designates whether or not your method may be accessed by HTTP GET.
@@ -193,53 +199,129 @@ def jsonrpc_method(name,
             Defines which site the jsonrpc method will be added to. Can be any
             object that provides a `register(name, func)` method.
 
+        cache=None
+
+            Caches the results of a `safe` method, keyed on the method name and
+            its params. Pass the number of seconds results stay valid, `True`
+            for the defaults, a dict of `jsonrpc.cache.ResultCache` options
+            (`ttl`, `max_entries`, `key`, `backend`) or a `ResultCache`. Cached
+            results are shared by every caller, give a `key` function to tell
+            callers apart:
+
+            @jsonrpc_method('myapp.lookup', safe=True,
+                            cache={'ttl': 60, 'backend': 'default'})
+            def lookup(request, code):
+              return Country.objects.get(code=code).name
+
+            Use `JSONRPCSite.invalidate` to drop cached results.
+
+        http_cache=None
+
+            Lets HTTP caches (browsers, proxies, CDNs) keep the responses to
+            GET calls of a `safe` method. `True`, or a dict of `Cache-Control`
+            directives
+            as taken by `django.utils.cache.patch_cache_control`, like
+            `{'max_age': 60, 'public': True}`. Responses carry an ETag computed
+            from their body and requests with a matching `If-None-Match` get
+            an empty 304. Two optional entries are cheap validators called
+            with the method's arguments before the method itself, which is not
+            run at all when the client's copy is still current:
+
+              'etag'            returns a string identifying the result
+              'last_modified'   returns the datetime (UTC) the result changed
+
+        timeout=None
+
+            The number of seconds a call may take. Clients may ask for less,
+            with an `X-JSONRPC-Timeout` header or a `timeout` member of the
+            call. Calls that would start after their deadline are not run,
+            `async def` methods are cancelled at it with a
+            `DeadlineExceededError`, other methods that finish late still
+            return their result. The deadline is `request.jsonrpc_deadline`
+            (a `time.time()` timestamp, or `None`), `ServiceProxy` calls made
+            by the method are given what is left of it.
+
+    Methods may also be declared with `async def`. They are awaited by
+    `JSONRPCSite.async_dispatch` and run on a private event loop by the
+    synchronous `JSONRPCSite.dispatch`.
     """
 
+    if (cache or http_cache) and not safe:
+        raise ValueError('Only safe methods can be cached, %s is not' % name)
+
     def decorator(func):
         arg_names = getargspec(func)[0][1:]
         X = {'name': name, 'arg_names': arg_names}
+        is_async = iscoroutinefunction(func)
+        result_cache = None
+        if cache:
+            from jsonrpc.cache import ResultCache
+            result_cache = ResultCache.from_option(cache)
+            func = result_cache.wrap(func)
         if authenticated:
-            if authenticated is True or six.callable(authenticated):
-                # TODO: this is an assumption
-                X['arg_names'] = authentication_arguments + X['arg_names']
-                X['name'] = _inject_args(X['name'], ('String', 'String'))
-                from django.contrib.auth import authenticate as _authenticate
-                from django.contrib.auth.models import User
+            # TODO: this is an assumption
+            X['arg_names'] = authentication_arguments + X['arg_names']
+            X['name'] = _inject_args(X['name'], ('String', 'String'))
+            if six.callable(authenticated):
+                _authenticate = authenticated
             else:
-                authenticate = authenticated
+                from django.contrib.auth import authenticate as _authenticate
+            from jsonrpc.auth import request_authenticated, request_token, \
+                user_from_token
 
             @six.wraps(func)
             def _func(request, *args, **kwargs):
-                user = getattr(request, 'user', None)
-                is_authenticated = getattr(user, 'is_authenticated',
-                                           lambda: False)
-                if ((user is not None and six.callable(is_authenticated) and
-                     not is_authenticated()) or user is None):
+                if not request_authenticated(request):
                     user = None
-                    try:
-                        creds = args[:len(authentication_arguments)]
-                        if len(creds) == 0:
-                            raise IndexError
-                        # Django's authenticate() method takes arguments as dict
-                        user = _authenticate(username=creds[0],
-                                             password=creds[1], *creds[2:])
-                        if user is not None:
-                            args = args[len(authentication_arguments):]
-                    except IndexError:
-                        auth_kwargs = {}
+                    # tokens are only accepted by sites that issue them
+                    max_age = getattr(site, 'token_max_age', None)
+                    token = None
+                    if max_age:
+                        token = kwargs.pop('token', None) or request_token(
+                            request)
+                    credential_cache = getattr(site, 'credential_cache', None)
+                    if credential_cache is not None:
+                        authenticate = functools.partial(
+                            credential_cache.authenticate, _authenticate)
+                    else:
+                        authenticate = _authenticate
+                    check_token = user_from_token
+                    # the elements of a batch share what was checked already
+                    batch = getattr(request, 'jsonrpc_batch_credentials', None)
+                    if batch is not None:
+                        authenticate = functools.partial(
+                            batch.authenticate, _authenticate, authenticate)
+                        check_token = functools.partial(
+                            batch.authenticate, user_from_token, user_from_token)
+                    if token is not None:
+                        user = check_token(token, max_age)
+                        if user is None:
+                            raise InvalidCredentialsError
+                    else:
                         try:
-                            for auth_kwarg in authentication_arguments:
-                                auth_kwargs[auth_kwarg] = kwargs[auth_kwarg]
-                        except KeyError:
-                            raise InvalidParamsError(
-                                'Authenticated methods require at least '
-                                '[%(arguments)s] or {%(arguments)s} arguments' %
-                                {'arguments': ', '.join(authentication_arguments)})
-
-                        user = _authenticate(**auth_kwargs)
-                        if user is not None:
-                            for auth_kwarg in authentication_arguments:
-                                kwargs.pop(auth_kwarg)
+                            creds = args[:len(authentication_arguments)]
+                            if len(creds) == 0:
+                                raise IndexError
+                            # Django's authenticate() method takes arguments as dict
+                            user = authenticate(username=creds[0],
+                                                password=creds[1], *creds[2:])
+                            if user is not None:
+                                args = args[len(authentication_arguments):]
+                        except IndexError:
+                            auth_kwargs = {}
+                            try:
+                                for auth_kwarg in authentication_arguments:
+                                    auth_kwargs[auth_kwarg] = kwargs[auth_kwarg]
+                            except KeyError:
+                                raise InvalidParamsError(
+                                    'Authenticated methods require at least '
+                                    '[%(arguments)s] or {%(arguments)s} arguments' %
+                                    {'arguments': ', '.join(authentication_arguments)})
+
+                            user = authenticate(**auth_kwargs)
+                            if user is not None:
+                                for auth_kwarg in authentication_arguments:
+                                    kwargs.pop(auth_kwarg)
                     if user is None:
                         raise InvalidCredentialsError
                     request.user = user
@@ -247,23 +329,28 @@ def jsonrpc_method(name,
         else:
             _func = func
 
+        method, arg_types, return_type = \
+      _parse_sig(X['name'], X['arg_names'], validate)
+
         @six.wraps(_func)
         def exc_printer(*a, **kw):
             try:
                 return _func(*a, **kw)
             except Exception as e:
+                exc_info = sys.exc_info()
                 try:
-                    print('JSONRPC SERVICE EXCEPTION')
-                    import traceback
-                    traceback.print_exc()
+                    report_exception(method, exc_info)
                 except:
                     pass
-                six.reraise(*sys.exc_info())
-
-        ret_func = exc_printer
+                six.reraise(*exc_info)
 
-        method, arg_types, return_type = \
-      _parse_sig(X['name'], X['arg_names'], validate)
+        if is_async:
+            from jsonrpc._async import async_authenticated, async_exc_printer
+            if authenticated:
+                _func = async_authenticated(_func, site)
+            ret_func = async_exc_printer(_func, method)
+        else:
+            ret_func = exc_printer
         ret_func.json_args = X['arg_names']
         ret_func.json_arg_types = arg_types
         ret_func.json_return_type = return_type
@@ -271,6 +358,17 @@ def jsonrpc_method(name,
         ret_func.json_safe = safe
         ret_func.json_sig = X['name']
         ret_func.json_validate = validate
+        ret_func.json_async = is_async
+        ret_func.json_cache = result_cache
+        ret_func.json_http_cache = (
+            dict(http_cache) if isinstance(http_cache, dict) else
+            ({} if http_cache else None))
+        ret_func.json_timeout = timeout
+        # the params callers may leave out when authenticated otherwise
+        ret_func.json_auth_args = (
+            list(authentication_arguments) if authenticated else [])
+        if result_cache is not None:
+            result_cache.bind(method, arg_names, per_user=bool(authenticated))
         site.register(method, ret_func)
         return ret_func
 
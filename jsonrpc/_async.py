@@ -0,0 +1,268 @@
+"""
+asyncio support for JSON-RPC sites. This module uses python 3.5 syntax and
+is only imported by `jsonrpc.site` on python versions that support it.
+"""
+import asyncio
+import copy
+import functools
+import sys
+import time
+import weakref
+
+from jsonrpc._json import encode_response
+from jsonrpc import deadlines
+from jsonrpc.errorlog import report_exception
+from jsonrpc.exceptions import DeadlineExceededError
+from jsonrpc.metrics import timer
+
+
+# the loops of run_sync, which own the thread they run in
+_private_loops = weakref.WeakSet()
+
+
+def run_sync(coro, timeout=None):
+    """
+    Runs the coroutine ``coro`` to completion on a private event loop,
+    cancelling it after ``timeout`` seconds. This is how `async def` methods
+    are called by the synchronous `dispatch`.
+    """
+    loop = asyncio.new_event_loop()
+    _private_loops.add(loop)
+    try:
+        return loop.run_until_complete(with_timeout(coro, timeout))
+    finally:
+        proxies = sys.modules.get('jsonrpc._asyncproxy')
+        if proxies is not None:
+            # connections the method opened die with the loop
+            loop.run_until_complete(proxies.close_idle_connections())
+        loop.close()
+
+
+async def with_timeout(coro, timeout):
+    "Awaits ``coro`` for ``timeout`` seconds, raises `DeadlineExceededError`"
+    if timeout is None:
+        return await coro
+    try:
+        return await asyncio.wait_for(coro, max(timeout, 0))
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError()
+
+
+def call_with_deadline(deadline, func, *args):
+    "Calls ``func`` in an executor thread with ``deadline`` as the current one"
+    from jsonrpc.site import call_pooled
+    token = deadlines.set_deadline(deadline)
+    try:
+        return call_pooled(func, *args)
+    finally:
+        deadlines.reset_deadline(token)
+
+
+def async_exc_printer(func, name):
+    "The `async def` counterpart of the exception reporter of `jsonrpc_method`"
+
+    @functools.wraps(func)
+    async def exc_printer(*a, **kw):
+        try:
+            return await func(*a, **kw)
+        except Exception:
+            try:
+                report_exception(name, sys.exc_info())
+            except:
+                pass
+            raise
+
+    return exc_printer
+
+
+def async_authenticated(func, site):
+    """
+    Runs ``func``, the authentication `jsonrpc_method` puts around an `async
+    def` method, in the executor of ``site``: the password hasher would hold
+    up the event loop. Returns the coroutine of the method.
+    """
+
+    from jsonrpc.site import call_pooled
+
+    @functools.wraps(func)
+    async def authenticated(request, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        if loop in _private_loops:  # nothing else to hold up
+            return await func(request, *args, **kwargs)
+        return await (await loop.run_in_executor(
+            getattr(site, 'batch_executor', None),
+            functools.partial(call_pooled, func, request, *args, **kwargs)))
+
+    return authenticated
+
+
+def async_cached(cache, func):
+    "The `async def` counterpart of `ResultCache.wrap`"
+    from jsonrpc.cache import MISSING
+
+    @functools.wraps(func)
+    async def cached(request, *args, **kwargs):
+        key = cache.make_key(request, args, kwargs)
+        if key is None:
+            return await func(request, *args, **kwargs)
+        value = cache.get(key)
+        if value is MISSING:
+            request.jsonrpc_cache = 'miss'
+            value = await func(request, *args, **kwargs)
+            cache.set(key, value)
+        else:
+            request.jsonrpc_cache = 'hit'
+        return value
+
+    return cached
+
+
+class AsyncDispatchMixin(object):
+    """
+    Adds `async_dispatch`, a coroutine view for ASGI deployments, to
+    `JSONRPCSite`. Methods declared with `async def` are awaited on the
+    event loop, everything else runs in the site's batch thread pool (or the
+    loop's default executor when parallel batches are not enabled). So does
+    whatever else may block: reading and decoding the request, importing
+    lazy namespaces, authentication and GET calls with an `http_cache`.
+
+    Batches are answered in one piece, `stream_batch_size` only applies to
+    `dispatch`.
+    """
+
+    def load_async_request(self, request, method=''):
+        """
+        `load_request` for `async_dispatch`, run in the executor: batches
+        are read in full and the lazy namespaces of the methods called are
+        loaded
+        """
+        D = self.load_request(request, method)
+        if self.is_batch_request(D):
+            D = list(D)
+        for call in (D if type(D) is list else [D]):
+            if type(call) is not dict:
+                continue
+            try:
+                self.load_method(call.get('method'))
+            except Exception:  # the call fails with it in prepare_call
+                pass
+        return D
+
+    async def async_response_dict(self, request, D,
+                                  is_batch=False,
+                                  version_hint='1.0',
+                                  json_encoder=None):
+        json_encoder = json_encoder or self.json_encoder
+        response = self.empty_response(version=version_hint)
+        metrics = self.metrics
+        if metrics is not None:
+            started = timer()
+
+        try:
+            method, invoke, version = self.prepare_call(request, D, response)
+            deadline = self.check_deadline(request, D, method)
+            # waiting for a slot would block the event loop
+            taken = self.admit(D['method'], wait=False) if self.limits else ()
+            token = deadlines.set_deadline(deadline)
+            try:
+                if getattr(method, 'json_async', False):
+                    R = await with_timeout(invoke(request, D['params']),
+                                           deadlines.remaining(deadline))
+                else:
+                    # executor threads do not share the context of the loop
+                    R = await asyncio.get_event_loop().run_in_executor(
+                        self.batch_executor, functools.partial(
+                            call_with_deadline, deadline, invoke, request,
+                            D['params']))
+            finally:
+                deadlines.reset_deadline(token)
+                for limit in taken:
+                    limit.release()
+            result = self.result_response(D, response, R, version,
+                                          json_encoder)
+            error = None
+        except Exception as e:
+            version = self.response_version(response, version_hint)
+            result = self.error_response(request, response, e,
+                                         version=version)
+            error = e.__class__.__name__
+        if metrics is not None:
+            metrics.record(self.metrics_name(D), version, timer() - started,
+                           error)
+        return result
+
+    async def async_batch(self, request, batch, json_encoder=None):
+        """
+        Runs every element of ``batch`` concurrently, at most
+        `batch_concurrency` at a time when it is set, and returns their
+        responses in request order, leaving out notifications.
+        """
+        from jsonrpc.auth import BatchCredentials
+        request.jsonrpc_batch_credentials = BatchCredentials()
+        limit = (asyncio.Semaphore(self.batch_concurrency)
+                 if self.batch_concurrency else None)
+
+        async def run(D):
+            if limit is None:
+                return (await self.async_response_dict(
+                    copy.copy(request), D, is_batch=True,
+                    json_encoder=json_encoder))[0]
+            async with limit:
+                return (await self.async_response_dict(
+                    copy.copy(request), D, is_batch=True,
+                    json_encoder=json_encoder))[0]
+
+        return [R for R in await asyncio.gather(*[run(D) for D in batch])
+                if R is not None]
+
+    async def async_dispatch(self, request, method='', json_encoder=None):
+        from django.http import HttpResponse
+        from jsonrpc.site import call_pooled
+        json_encoder = json_encoder or self.json_encoder
+        request.jsonrpc_started = time.time()
+
+        try:
+            loop = asyncio.get_event_loop()
+            D = await loop.run_in_executor(
+                self.batch_executor, functools.partial(
+                    call_pooled, self.load_async_request, request, method))
+
+            if request.method.lower() == 'get' and getattr(
+                    self.urls[D['method']], 'json_http_cache', None) is not None:
+                return self.compress_response(
+                    request, await loop.run_in_executor(
+                        self.batch_executor, functools.partial(
+                            call_pooled, self.conditional_response, request,
+                            D, json_encoder=json_encoder)))
+
+            if self.is_batch_request(D):
+                response = await self.async_batch(request, D,
+                                                  json_encoder=json_encoder)
+                if not response:  # nothing but notifications
+                    return HttpResponse('', status=204)
+                status = 200
+            else:
+                response, status = await self.async_response_dict(
+                    request, D,
+                    json_encoder=json_encoder)
+                if response is None and (not 'id' in D or D['id'] is None):  # a notification
+                    return HttpResponse('', status=status)
+
+            json_rpc = encode_response(response, cls=json_encoder)
+            if self.metrics is not None and not self.is_batch_request(D):
+                self.record_sizes(request, D, response, json_rpc)
+        except Exception as e:
+            response, status = self.error_response(request,
+                                                   self.empty_response(), e)
+            json_rpc = encode_response(response, cls=json_encoder)
+
+        http = HttpResponse(json_rpc, status=status,
+                            content_type='application/json-rpc')
+        if status == 503:
+            self.set_retry_after(http, response)
+        self.set_result_cache_header(request, http)
+        return self.compress_response(request, http)
+
+    # csrf_exempt wraps views in a synchronous function on older versions of
+    # Django, which would hide the coroutine from the handler
+    async_dispatch.csrf_exempt = True
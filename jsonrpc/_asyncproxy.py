@@ -0,0 +1,277 @@
+"""
+An asyncio counterpart of `ServiceProxy`. This module uses python 3.5 syntax
+and is only imported by `jsonrpc.proxy` on python versions that support it.
+"""
+import asyncio
+import io
+import threading
+import time
+import uuid
+import weakref
+from http import client as http_client
+from urllib.parse import urlsplit
+
+from jsonrpc._json import loads, dumps_bytes
+from jsonrpc.proxy import ServiceProxy, call_timeout, encode_request, \
+    response_text, logger
+
+
+async def read_response(reader, first=b''):
+    """
+    Reads an HTTP response from ``reader``, whose ``first`` bytes were read
+    already. Returns its status, headers and body and whether the connection
+    may be used for another request.
+    """
+    head = first + await reader.readuntil(b'\r\n\r\n')
+    status_line, _, header_block = head.partition(b'\r\n')
+    http_version, status = status_line.split(None, 2)[:2]
+    status = int(status)
+    headers = http_client.parse_headers(io.BytesIO(header_block))
+    keep_alive = (http_version == b'HTTP/1.1' and
+                  'close' not in headers.get('Connection', '').lower())
+
+    if headers.get('Transfer-Encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+            if not size:
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass  # trailers
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b''.join(chunks)
+    elif 'Content-Length' in headers:
+        body = await reader.readexactly(int(headers['Content-Length']))
+    elif status in (204, 304) or 100 <= status < 200:
+        body = b''
+    else:  # the body ends with the connection
+        body = await reader.read()
+        keep_alive = False
+    return status, headers, body, keep_alive
+
+
+class AsyncConnectionPool(object):
+    """
+    A pool of persistent HTTP/1.1 connections for `AsyncServiceProxy`. Up to
+    ``max_size`` idle connections are kept per host and event loop, for at
+    most ``idle_timeout`` seconds. ``connect_timeout`` is in seconds, `None`
+    waits forever. At most ``max_in_flight`` requests are sent at the same
+    time through the pool on each event loop, `None` for no limit.
+
+    Every event loop has connections of its own, streams only work on the
+    loop they were opened on, so a pool may be shared by the loops of
+    several threads. Idle connections are closed by `clear` and by
+    `jsonrpc._async.run_sync` when its loop is done.
+    """
+
+    def __init__(self, max_size=10, idle_timeout=60, connect_timeout=None,
+                 max_in_flight=None):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.max_in_flight = max_in_flight
+        # loop -> (scheme, host, port) -> list of (reader, writer, last used)
+        self._idle = weakref.WeakKeyDictionary()
+        self._limits = weakref.WeakKeyDictionary()  # loop -> Semaphore
+        self._lock = threading.Lock()  # for the maps keyed by loop
+        _pools.add(self)
+
+    def limit(self):
+        "The semaphore capping in-flight requests on the current event loop"
+        if not self.max_in_flight:
+            return None
+        loop = asyncio.get_event_loop()
+        with self._lock:
+            limit = self._limits.get(loop)
+            if limit is None:
+                limit = self._limits[loop] = asyncio.Semaphore(
+                    self.max_in_flight)
+        return limit
+
+    def idle(self, key):
+        "The idle connections to the host ``key`` of the current event loop"
+        loop = asyncio.get_event_loop()
+        with self._lock:
+            return self._idle.setdefault(loop, {}).setdefault(key, [])
+
+    async def acquire(self, key):
+        """
+        Returns the reader and writer of an idle connection to the host
+        ``key`` or of a new one, and whether the connection was reused
+        """
+        now = time.time()
+        idle = self.idle(key)
+        while idle:
+            reader, writer, last_used = idle.pop()
+            if now - last_used < self.idle_timeout and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        return await self.connect(key) + (False, )
+
+    async def connect(self, key):
+        scheme, host, port = key
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port,
+                                    ssl=True if scheme == 'https' else None),
+            self.connect_timeout)
+
+    def release(self, key, reader, writer):
+        "Puts a connection back into the pool, or closes it when it is full"
+        idle = self.idle(key)
+        if len(idle) < self.max_size:
+            idle.append((reader, writer, time.time()))
+        else:
+            writer.close()
+
+    def clear(self):
+        "Closes every idle connection of the current event loop"
+        loop = asyncio.get_event_loop()
+        with self._lock:
+            idle = self._idle.pop(loop, {})
+        for connections in idle.values():
+            for reader, writer, last_used in connections:
+                writer.close()
+
+    async def post(self, url, body, headers):
+        """
+        POSTs ``body`` to ``url`` and returns the status, headers and body of
+        the response. When a reused connection turns out to have been closed
+        by the server before a single byte of the response came back, the
+        request is sent once more on a new connection. Other failures are
+        raised, as the server may have run the call already.
+        """
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        head = ['POST %s HTTP/1.1' % path,
+                'Host: %s' % parts.netloc.rpartition('@')[2]]
+        head.extend('%s: %s' % item for item in headers.items())
+        request = ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body
+
+        reader, writer, reused = await self.acquire(key)
+        while True:
+            try:
+                writer.write(request)
+                await writer.drain()
+                first = await reader.read(1)
+                if not first:
+                    raise ConnectionResetError('Connection closed')
+            except ConnectionError:
+                writer.close()
+                if reused:  # nothing came back, the request was not answered
+                    (reader, writer), reused = await self.connect(key), False
+                    continue
+                raise
+            except BaseException:  # timeouts cancel us half way through
+                writer.close()
+                raise
+            try:
+                status, resp_headers, data, keep_alive = \
+                    await read_response(reader, first)
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self.release(key, reader, writer)
+            else:
+                writer.close()
+            return status, resp_headers, data
+
+
+# every pool, so connections can be closed with the loop they belong to
+_pools = weakref.WeakSet()
+
+
+async def close_idle_connections():
+    "Closes the idle connections of every pool on the current event loop"
+    for pool in list(_pools):
+        pool.clear()
+    await asyncio.sleep(0)  # let the transports close
+
+
+# used by every AsyncServiceProxy that is not given a pool of its own
+default_pool = AsyncConnectionPool()
+
+
+class AsyncServiceProxy(object):
+    """
+    The asyncio counterpart of `ServiceProxy`, calling a method returns an
+    awaitable of its response:
+
+        proxy = AsyncServiceProxy('http://localhost:8080/json/', timeout=5)
+        response = await proxy.myapp.sayHello('Sam')
+
+    Requests are sent over the connections of ``pool``, by default a pool
+    shared with every other proxy. Calls that take more than ``timeout``
+    seconds, including the time spent waiting for the pool's in-flight
+    limit, raise `asyncio.TimeoutError`. So do calls outliving the deadline
+    of the JSON-RPC method making them, which is passed on as by
+    `ServiceProxy`. Requests of at least
+    ``compress_min_size`` bytes are sent gzipped.
+    """
+
+    def __init__(self, service_url, service_name=None, version='1.0',
+                 pool=None, timeout=None, compress_min_size=None):
+        self.version = str(version)
+        self.service_url = service_url
+        self.service_name = service_name
+        self.pool = pool or default_pool
+        self.timeout = timeout
+        self.compress_min_size = compress_min_size
+
+    def __getattr__(self, name):
+        if self.service_name != None:
+            name = "%s.%s" % (self.service_name, name)
+        params = dict(self.__dict__, service_name=name)
+        return self.__class__(**params)
+
+    def __repr__(self):
+        return "AsyncServiceProxy %r" % {
+            'jsonrpc': self.version,
+            'method': self.service_name
+        }
+
+    make_params = ServiceProxy.make_params
+
+    def with_timeout(self, timeout):
+        "Returns this proxy with a different ``timeout``"
+        return self.__class__(**dict(self.__dict__, timeout=timeout))
+
+    async def post_data(self, data, timeout=None):
+        """
+        POSTs the serialized request ``data`` to the service and returns the
+        body of the response
+        """
+        data, headers = encode_request(data, self.compress_min_size, timeout)
+        limit = self.pool.limit()
+        if limit is not None:
+            await limit.acquire()
+        try:
+            status, resp_headers, body = await self.pool.post(
+                self.service_url, data, headers)
+        finally:
+            if limit is not None:
+                limit.release()
+        return response_text(status, resp_headers, body,
+                             self.service_url, data, headers)
+
+    async def send_payload(self, params):
+        data = dumps_bytes({
+            'jsonrpc': self.version,
+            'method': self.service_name,
+            'params': params,
+            'id': str(uuid.uuid1())
+        })
+        timeout = call_timeout(self.timeout)
+        r = await asyncio.wait_for(self.post_data(data, timeout), timeout)
+        y = loads(r)
+        if y.get('error') is not None:
+            logger.debug('%s error %r', self.service_name, y)
+        return y
+
+    def __call__(self, *args, **kwargs):
+        return self.send_payload(self.make_params(args, kwargs))
@@ -0,0 +1,210 @@
+"""
+Content codings for request and response bodies. gzip is always available,
+brotli when the `brotli` package is installed.
+"""
+import gzip
+import io
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# the codings we can produce, best first
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip', )
+# brotli >= 1.1 can stop decoding after a given number of bytes, older
+# versions can only decode brotli data in one go
+BOUNDED_BROTLI = brotli is not None and hasattr(
+    getattr(brotli, 'Decompressor', None), 'can_accept_more_data')
+ACCEPT_ENCODING = ', '.join(ENCODINGS)
+
+
+class TooLarge(ValueError):
+    "Raised when decoded data would be larger than allowed"
+
+
+def gzip_bytes(data, level=6):
+    buf = io.BytesIO()
+    f = gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=level, mtime=0)
+    try:
+        f.write(data)
+    finally:
+        f.close()
+    return buf.getvalue()
+
+
+def compress(data, encoding, best=False):
+    """
+    Encodes ``data`` with the content coding ``encoding``. ``best`` trades
+    speed for size, for things compressed once and sent many times.
+    """
+    if encoding == 'gzip':
+        return gzip_bytes(data, 9 if best else 6)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=11 if best else 5)
+    raise ValueError('Unsupported content coding %r' % encoding)
+
+
+def decompress(data, encoding, max_size=None):
+    """
+    Decodes ``data`` from the content coding ``encoding``. Raises `TooLarge`
+    rather than decoding more than ``max_size`` bytes, or `ValueError` for
+    brotli data when the `brotli` package is too old to stop early.
+    """
+    encoding = (encoding or 'identity').strip().lower()
+    if encoding == 'identity':
+        decoded = data
+    elif encoding in ('gzip', 'x-gzip'):
+        if max_size is None:
+            return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        decoded = d.decompress(data, max_size + 1)
+        if len(decoded) <= max_size:
+            decoded += d.flush()
+            if not getattr(d, 'eof', True):
+                raise zlib.error('Incomplete gzip data')
+    elif encoding == 'br' and brotli is not None:
+        if max_size is None:
+            return brotli.decompress(data)
+        if not BOUNDED_BROTLI:
+            raise ValueError('Bounded brotli decoding needs brotli >= 1.1')
+        d = brotli.Decompressor()
+        pieces = [d.process(data, output_buffer_limit=max_size + 1)]
+        size = len(pieces[0])
+        while size <= max_size and not d.is_finished():
+            # the rest of the output, decoded from the input kept inside
+            pieces.append(d.process(b'', output_buffer_limit=max_size + 1 -
+                                    size))
+            if not pieces[-1]:
+                raise brotli.error('Incomplete brotli data')
+            size += len(pieces[-1])
+        decoded = b''.join(pieces)
+    else:
+        raise ValueError('Unsupported content coding %r' % encoding)
+    if max_size is not None and len(decoded) > max_size:
+        raise TooLarge('Decoded data larger than %d bytes' % max_size)
+    return decoded
+
+
+def supported(encoding, bounded=False):
+    """
+    Whether bodies in the content coding ``encoding`` can be decoded, with a
+    bound on the decoded size when ``bounded`` is true
+    """
+    encoding = (encoding or 'identity').strip().lower()
+    return encoding in ('identity', 'gzip', 'x-gzip') or (
+        encoding == 'br' and (BOUNDED_BROTLI if bounded
+                              else brotli is not None))
+
+
+def decompressing_reader(read, encoding, chunk_size=64 * 1024):
+    """
+    Wraps the `read` function of a stream of ``encoding`` encoded data in
+    one returning decoded data. The returned function ignores its size
+    argument, it returns the next piece of decoded data, `b''` at the end.
+    Data is decoded about ``chunk_size`` bytes at a time, brotli data in one
+    go when the `brotli` package is older than 1.1.
+    """
+    encoding = (encoding or 'identity').strip().lower()
+    if encoding == 'identity':
+        return read
+    if encoding == 'br' and BOUNDED_BROTLI:
+        return brotli_reader(read, chunk_size)
+    if encoding not in ('gzip', 'x-gzip'):
+        # decoded in one go
+        buf = io.BytesIO(decompress(read(), encoding))
+        return lambda size=-1: buf.read(chunk_size)
+
+    d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    state = {'done': False}
+
+    def reader(size=-1):
+        while True:
+            if d.unconsumed_tail:
+                data = d.decompress(d.unconsumed_tail, chunk_size)
+            elif state['done']:
+                return b''
+            else:
+                chunk = read(chunk_size)
+                if not chunk:
+                    state['done'] = True
+                    return d.flush()
+                data = d.decompress(chunk, chunk_size)
+            if data:
+                return data
+
+    return reader
+
+
+def brotli_reader(read, chunk_size):
+    "The brotli `decompressing_reader`"
+    d = brotli.Decompressor()
+    state = {'done': False}
+
+    def reader(size=-1):
+        while not d.is_finished():
+            # output left over from the input read so far comes first
+            data = d.process(b'', output_buffer_limit=chunk_size)
+            if data:
+                return data
+            if state['done']:
+                raise brotli.error('Incomplete brotli data')
+            chunk = read(chunk_size)
+            if not chunk:
+                state['done'] = True
+                continue
+            data = d.process(chunk, output_buffer_limit=chunk_size)
+            if data:
+                return data
+        return b''
+
+    return reader
+
+
+def accepted_encodings(header):
+    """
+    Returns the content codings an Accept-Encoding header names, each
+    mapped to whether it is accepted: `False` for those it refuses with
+    `q=0`
+    """
+    accepted = {}
+    for coding in header.split(','):
+        coding, _, params = coding.partition(';')
+        params = params.replace(' ', '')
+        if params.startswith('q=') and params[2:] in ('0', '0.0', '0.00',
+                                                      '0.000'):
+            accepted[coding.strip().lower()] = False
+        else:
+            accepted[coding.strip().lower()] = True
+    return accepted
+
+
+def choose_encoding(header, encodings=ENCODINGS):
+    """
+    Returns the first of ``encodings`` the Accept-Encoding ``header``
+    accepts, `None` if it accepts none of them. `*` accepts the codings
+    the header does not name, never those it refuses.
+    """
+    accepted = accepted_encodings(header or '')
+    for encoding in encodings:
+        if accepted.get(encoding, accepted.get('*', False)):
+            return encoding
+    return None
+
+
+def limited_reader(read, max_size):
+    """
+    Wraps a `read` function so it raises `TooLarge` once more than
+    ``max_size`` bytes have been read through it
+    """
+    state = {'read': 0}
+
+    def reader(size=-1):
+        data = read(size)
+        state['read'] += len(data)
+        if state['read'] > max_size:
+            raise TooLarge('Data larger than %d bytes' % max_size)
+        return data
+
+    return reader
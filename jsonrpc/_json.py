@@ -1,3 +1,4 @@
+import six
 try:
     import json
 except (ImportError, NameError):
@@ -19,3 +20,236 @@ except AttributeError:
 
 loads = json.loads
 dumps = json.dumps
+
+# Faster JSON libraries are used for requests and responses when they are
+# installed. Pick one with the JSONRPC_JSON_BACKEND setting: 'auto' (the
+# default) takes the first of BACKENDS that can be imported, 'json' always
+# uses the library above.
+BACKENDS = ('orjson', 'ujson', 'rapidjson')
+
+_stdlib_loads = loads
+_stdlib_dumps = dumps
+
+
+def _orjson():
+    import orjson
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    return (orjson.loads,
+            lambda obj, default: orjson.dumps(obj, default=default,
+                                              option=option))
+
+
+def _ujson():
+    import ujson
+    return (ujson.loads,
+            lambda obj, default: ujson.dumps(
+                obj, default=default, ensure_ascii=False).encode('utf-8'))
+
+
+def _rapidjson():
+    import rapidjson
+    return (rapidjson.loads,
+            lambda obj, default: rapidjson.dumps(
+                obj, default=default, ensure_ascii=False).encode('utf-8'))
+
+
+_backend_loaders = {
+    'orjson': _orjson,
+    'ujson': _ujson,
+    'rapidjson': _rapidjson,
+}
+_backend = None
+_default_hooks = {}
+
+
+def _load_backend(name):
+    """
+    Returns a tuple of (name, loads, dumps) for the backend ``name``, where
+    `loads` and `dumps` are `None` for the standard library.
+    """
+    if name in ('json', 'stdlib'):
+        return ('json', None, None)
+    if name == 'auto':
+        for name in BACKENDS:
+            try:
+                return (name, ) + _backend_loaders[name]()
+            except ImportError:
+                pass
+        return ('json', None, None)
+    if name not in _backend_loaders:
+        raise ValueError('Unknown JSON backend %r, use one of %s' %
+                         (name, ', '.join(('auto', 'json') + BACKENDS)))
+    return (name, ) + _backend_loaders[name]()
+
+
+def set_backend(name='auto'):
+    "Selects the JSON backend, overriding the JSONRPC_JSON_BACKEND setting"
+    global _backend
+    _backend = _load_backend(name)
+    return _backend[0]
+
+
+def get_backend():
+    "Returns the name of the JSON backend in use"
+    return _get_backend()[0]
+
+
+def _get_backend():
+    if _backend is None:
+        try:
+            from django.conf import settings
+            name = getattr(settings, 'JSONRPC_JSON_BACKEND', 'auto')
+        except Exception:  # no Django or settings not configured
+            name = 'auto'
+        set_backend(name)
+    return _backend
+
+
+def _default_hook(cls):
+    "Adapts the `default` method of a JSONEncoder class to a default hook"
+    if cls is None:
+        return None
+    try:
+        return _default_hooks[cls]
+    except KeyError:
+        hook = _default_hooks[cls] = cls().default
+        return hook
+
+
+def loads(s, *args, **kwargs):
+    """
+    Decodes the JSON document ``s``, which may be text or UTF-8 bytes.
+    Anything the backend refuses gets another try with the standard library,
+    which is more lenient (NaN, Infinity, ...).
+    """
+    backend_loads = _get_backend()[1]
+    if backend_loads is not None and not args and not kwargs:
+        try:
+            return backend_loads(s)
+        except Exception:
+            pass
+    if six.PY3 and isinstance(s, six.binary_type):
+        s = s.decode('utf-8')
+    return _stdlib_loads(s, *args, **kwargs)
+
+
+def dumps_bytes(obj, cls=None):
+    """
+    Encodes ``obj`` to UTF-8 JSON bytes. ``cls`` is a JSONEncoder subclass
+    whose `default` method handles the types JSON does not know about. If the
+    backend can not encode ``obj`` the standard library is used instead.
+    """
+    backend_dumps = _get_backend()[2]
+    if backend_dumps is not None:
+        try:
+            return backend_dumps(obj, _default_hook(cls))
+        except Exception:
+            pass
+    return _stdlib_dumps(obj, cls=cls).encode('utf-8')
+
+
+class ArrayStream(object):
+    """
+    Iterates over the elements of a JSON array read piece by piece from a
+    byte stream, so only the element being decoded has to be kept in memory.
+
+      read        a callable like `file.read`, taking a number of bytes
+      prefix      bytes that were already read from the stream
+      chunk_size  how many bytes to read at a time
+
+    Raises `ValueError` when the document is not a valid array.
+    """
+
+    def __init__(self, read, prefix=b'', chunk_size=64 * 1024):
+        import codecs
+        self.read = read
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buf = self.decoder.decode(prefix)
+        self.pos = 0
+        self.eof = False
+        self.started = False
+
+    def _fill(self, size=None):
+        "Reads more data, returns False once the stream is exhausted"
+        if self.eof:
+            return False
+        # drop what has been decoded already
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        chunk = self.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+        self.buf += self.decoder.decode(chunk or b'', final=self.eof)
+        return True
+
+    def _next_char(self):
+        "Skips whitespace and returns the next character, '' at the end"
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def __iter__(self):
+        if self.started:
+            raise ValueError('ArrayStream can only be iterated once')
+        self.started = True
+        raw_decode = json.JSONDecoder().raw_decode
+        if self._next_char() != '[':
+            raise ValueError('Expected a JSON array')
+        self.pos += 1
+        if self._next_char() == ']':
+            return
+        while True:
+            self._next_char()
+            try:
+                value, end = raw_decode(self.buf, self.pos)
+            except ValueError:
+                value, end = None, None
+            # a value running up to the end of the buffer may continue in the
+            # next chunk (think of numbers), so make sure we have seen past it
+            if end is None or (end == len(self.buf) and not self.eof):
+                if not self._fill(max(self.chunk_size,
+                                      len(self.buf) - self.pos)):
+                    raise ValueError('Truncated or invalid JSON array')
+                continue
+            self.pos = end
+            yield value
+            c = self._next_char()
+            if c == ']':
+                return
+            if c != ',':
+                raise ValueError('Expected "," or "]" in JSON array')
+            self.pos += 1
+
+
+class RawJSON(object):
+    "JSON that is serialized already, `encode_response` copies it as it is"
+    __slots__ = ('data', )
+
+    def __init__(self, data):
+        self.data = data
+
+
+def encode_response(response, cls=None):
+    """
+    Serializes a JSON-RPC response, or a list of them, to UTF-8 bytes. A
+    `RawJSON` result is spliced into the output without being decoded.
+    """
+    if type(response) is list:
+        if any(type(R) is dict and isinstance(R.get('result'), RawJSON)
+               for R in response):
+            return b'[' + b','.join(encode_response(R, cls)
+                                    for R in response) + b']'
+        return dumps_bytes(response, cls)
+    result = response.get('result') if type(response) is dict else None
+    if not isinstance(result, RawJSON):
+        return dumps_bytes(response, cls)
+    head = dict(response)
+    del head['result']
+    head = dumps_bytes(head, cls).rstrip()[:-1]  # leave the object open
+    return (head + (b',' if head.rstrip() != b'{' else b'') +
+            b'"result":' + result.data + b'}')
@@ -1,5 +1,10 @@
+import re
 import six
-from functools import reduce
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from django.utils.datastructures import SortedDict as OrderedDict
 
 
 def _types_gen(T):
@@ -26,12 +31,33 @@ class Type(type):
   assert Any.kind('') == String
   assert Any.decode('str') == String
   assert Any.kind({}) == Object
+
+  Comparisons, `kind` and `decode` are answered from tables that are built
+  when the type is defined or filled in the first time a python type is
+  seen, so they cost a dict lookup once warmed up.
   """
 
     def __init__(self, *args, **kwargs):
         type.__init__(self, *args, **kwargs)
+        self._reset()
+
+    def _reset(self):
+        self._eq_cache = {}
+        self._kinds = None
+        self._decodes = None
 
     def __eq__(self, other):
+        if not isinstance(other, type):
+            return self._eq(other)
+        try:
+            return self._eq_cache[other]
+        except KeyError:
+            eq = self._eq_cache[other] = self._eq(other)
+            return eq
+
+    __hash__ = type.__hash__
+
+    def _eq(self, other):
         if six.PY2:
             for T in _types_gen(self):
                 if isinstance(other, Type):
@@ -53,24 +79,50 @@ class Type(type):
 
     def N(self, n):
         self._name = n
+        self._decodes = None
         return self
 
     def I(self, *args):
         self.t = list(args)
+        self._reset()
         return self
 
     def kind(self, t):
         if type(t) is Type:
             return t
-        ty = lambda t: type(t)
-        if type(t) is type:
-            ty = lambda t: t
-        return reduce(
-            lambda L, R: R if (hasattr(R, 't') and ty(t) == R) else L,
-            [T for T in _types_gen(self) if T is not Any])
+        ty = t if type(t) is type else type(t)
+        try:
+            return self._kinds[ty]
+        except (KeyError, TypeError):
+            return self._resolve_kind(ty)
+
+    def _resolve_kind(self, ty):
+        "Classifies a python type we have not seen yet and remembers it"
+        kinds = self._kinds
+        if kinds is None:
+            # python type => the last of our JSON types that holds it, built
+            # aside so other threads never see it half done
+            kinds = {}
+            for T in _types_gen(self):
+                if T is not Any and hasattr(T, 't'):
+                    for B in _basetypes(T):
+                        kinds[B] = T
+            self._kinds = kinds
+            if ty in kinds:
+                return kinds[ty]
+        for B in getattr(ty, '__mro__', ())[1:]:
+            if B in kinds:
+                T = kinds[B]
+                break
+        else:
+            T = [T for T in _types_gen(self) if T is not Any][0]
+        kinds[ty] = T
+        return T
 
     def decode(self, n):
-        return reduce(lambda L, R: R if (str(R) == n) else L, _types_gen(self))
+        if self._decodes is None:
+            self._decodes = dict((str(R), R) for R in _types_gen(self))
+        return self._decodes.get(n, self)
 
 
 str_types = (six.text_type, )
@@ -87,3 +139,234 @@ Array = Type('Array', (object, ), {}).I(list, set, tuple).N('arr')
 Nil = Type('Nil', (object, ), {}).I(type(None)).N('nil')
 Any = Type('Any', (object, ), {}).I(
     Object, Number, Boolean, String, Array, Nil).N('any')
+
+
+class Container(object):
+    """
+    Base of the types of signatures that say more than a JSON type does:
+    arrays of a type, objects with typed members and optional types. See
+    `parse_type`.
+    """
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        return str(self)
+
+
+class ArrayOf(Container):
+    "An Array whose items are all of the type ``items``"
+
+    def __init__(self, items, base=Array):
+        self.items = items
+        self.base = base
+
+    def __str__(self):
+        return '%s(%s)' % (type_name(self.base), type_name(self.items))
+
+
+class ObjectOf(Container):
+    """
+    An Object with the members ``fields`` (name => type), members of an
+    `Optional` type may be left out. Other members are allowed.
+    """
+
+    def __init__(self, fields, base=Object):
+        self.fields = fields
+        self.base = base
+
+    def __str__(self):
+        return '%s{%s}' % (type_name(self.base), ', '.join(
+            '%s: %s' % (k, type_name(T)) for k, T in self.fields.items()))
+
+
+class Optional(Container):
+    "The type ``type`` or null, optional params and members may be left out"
+
+    def __init__(self, type):
+        self.type = type
+
+    def __str__(self):
+        return '%s?' % type_name(self.type)
+
+
+def base_type(T):
+    "The JSON type (or python type) of the values of the type ``T``"
+    while isinstance(T, Container):
+        T = T.type if isinstance(T, Optional) else T.base
+    return T
+
+
+def type_name(T):
+    "The name of the type ``T`` as it is written in signatures"
+    if isinstance(T, Container):
+        return str(T)
+    return Any.kind(T).__name__
+
+
+JSON_TYPES = dict((T.__name__, T)
+                  for T in (Object, Number, Boolean, String, Array, Nil, Any))
+SIG_TOKEN_RE = re.compile(r'\s*(?:(?P<name>[A-Za-z0-9_]+)|(?P<op>->|[-(){}:,?=]))')
+
+
+class SigParser(object):
+    """
+    Parses the types of a signature without evaluating anything:
+
+      type    := name ['(' type ')' | '{' [member (',' member)*] '}'] ['?']
+      member  := name ':' type
+
+    Names are our JSON types (`String`, `Array`, ...) or python builtins
+    (`str`, `list`, ...). ``sig`` is the whole signature, for messages.
+    """
+
+    def __init__(self, source, sig=None):
+        self.sig = sig or source
+        self.tokens = []
+        pos = 0
+        source = source.rstrip()
+        while pos < len(source):
+            m = SIG_TOKEN_RE.match(source, pos)
+            if not m:
+                raise ValueError('Could not parse %r in %s' %
+                                 (source[pos:], self.sig))
+            self.tokens.append(m.group('name') or m.group('op'))
+            pos = m.end()
+        self.pos = 0
+
+    def peek(self, ahead=0):
+        try:
+            return self.tokens[self.pos + ahead]
+        except IndexError:
+            return None
+
+    def at_end(self):
+        return self.pos >= len(self.tokens)
+
+    def accept(self, op):
+        if self.peek() == op:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, op):
+        if not self.accept(op):
+            raise ValueError('Expected %r instead of %r in %s' %
+                             (op, self.peek(), self.sig))
+
+    def expect_end(self):
+        if not self.at_end():
+            raise ValueError('Unexpected %r in %s' % (self.peek(), self.sig))
+
+    def name(self):
+        token = self.peek()
+        if token is None or not SIG_TOKEN_RE.match(token).group('name'):
+            raise ValueError('Expected a name instead of %r in %s' %
+                             (token, self.sig))
+        self.pos += 1
+        return token
+
+    def type(self):
+        name = self.name()
+        T = JSON_TYPES.get(name)
+        if T is None:
+            T = getattr(six.moves.builtins, name, None)
+            if not isinstance(T, type):
+                raise ValueError('%s is not a valid type in %s' %
+                                 (name, self.sig))
+        if self.accept('('):
+            if not Any.kind(T) == Array:
+                raise ValueError('%s can not have an item type in %s' %
+                                 (name, self.sig))
+            T = ArrayOf(self.type(), T)
+            self.expect(')')
+        elif self.accept('{'):
+            if not Any.kind(T) == Object:
+                raise ValueError('%s can not have members in %s' %
+                                 (name, self.sig))
+            fields = OrderedDict()
+            if not self.accept('}'):
+                while True:
+                    member = self.name()
+                    self.expect(':')
+                    fields[member] = self.type()
+                    if self.accept('}'):
+                        break
+                    self.expect(',')
+            T = ObjectOf(fields, T)
+        if self.accept('?'):
+            T = Optional(T)
+        return T
+
+
+def parse_type(source):
+    "Returns the type written as ``source`` in a signature"
+    parser = SigParser(source)
+    T = parser.type()
+    parser.expect_end()
+    return T
+
+
+def type_checker(T):
+    """
+    Compiles the type ``T`` into a function that returns `None` for values
+    of that type and what is wrong for others. Returns `None` for types
+    that accept everything.
+    """
+    if T is Any:
+        return None
+
+    if isinstance(T, Optional):
+        inner = type_checker(T.type)
+        if inner is None:
+            return None
+
+        def check(value):
+            if value is not None:
+                return inner(value)
+
+    elif isinstance(T, ArrayOf):
+        base, items = type_checker(T.base), type_checker(T.items)
+        if items is None:
+            return base
+
+        def check(value):
+            wrong = base(value)
+            if wrong is not None:
+                return wrong
+            for i, item in enumerate(value):
+                wrong = items(item)
+                if wrong is not None:
+                    return '[%d]: %s' % (i, wrong)
+
+    elif isinstance(T, ObjectOf):
+        base = type_checker(T.base)
+        members = [(k, type_checker(M), isinstance(M, Optional))
+                   for k, M in T.fields.items()]
+
+        def check(value):
+            wrong = base(value)
+            if wrong is not None:
+                return wrong
+            for k, member, optional in members:
+                if k in value:
+                    if member is not None:
+                        wrong = member(value[k])
+                        if wrong is not None:
+                            return '%s: %s' % (k, wrong)
+                elif not optional:
+                    return 'member %s is missing' % k
+
+    else:
+        def check(value):
+            if not Any.kind(value) == T:
+                return '%s is not the correct type %s' % (type(value), T)
+
+    return check
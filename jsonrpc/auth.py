@@ -0,0 +1,191 @@
+"""
+Cheaper authentication for `authenticated` methods: signed tokens issued by
+`system.login` (see `JSONRPCSite.enable_login`) and a cache of verified
+credentials for clients that keep sending a username and password.
+"""
+import copy
+import hashlib
+import hmac
+import os
+import threading
+
+import six
+
+from jsonrpc.cache import LRUCache
+
+TOKEN_SALT = 'jsonrpc.auth.token'
+
+
+def get_user_model():
+    try:
+        from django.contrib.auth import get_user_model
+    except ImportError:  # Django < 1.5
+        from django.contrib.auth.models import User
+        return User
+    return get_user_model()
+
+
+def credentials_hash(user):
+    """
+    A digest of the password of ``user``, so changing the password revokes
+    the tokens issued before
+    """
+    get_hash = getattr(user, 'get_session_auth_hash', None)
+    if get_hash is not None:
+        return get_hash()
+    from django.utils.crypto import salted_hmac  # Django < 1.7
+    return salted_hmac(TOKEN_SALT, user.password).hexdigest()
+
+
+def issue_token(user):
+    "Returns a token standing in for the credentials of ``user``"
+    from django.core import signing
+    return signing.dumps([user.pk, credentials_hash(user)], salt=TOKEN_SALT,
+                         compress=True)
+
+
+def load_user(model, pk, auth_hash):
+    """
+    Reads the user ``pk`` of ``model`` from the database, `None` when it is
+    gone, deactivated or its password changed since ``auth_hash`` was taken
+    """
+    from django.core.exceptions import ObjectDoesNotExist
+    from django.utils.crypto import constant_time_compare
+    try:
+        user = model._default_manager.get(pk=pk)
+    except (ObjectDoesNotExist, TypeError, ValueError):
+        return None
+    if not getattr(user, 'is_active', True) or not constant_time_compare(
+            credentials_hash(user), auth_hash):
+        return None
+    return user
+
+
+def user_from_token(token, max_age):
+    """
+    Returns the user a token was issued to, `None` when the token is forged,
+    older than ``max_age`` seconds or its user changed password or was
+    deactivated since.
+    """
+    from django.core import signing
+    try:
+        pk, auth_hash = signing.loads(token, salt=TOKEN_SALT,
+                                      max_age=max_age)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    return load_user(get_user_model(), pk, auth_hash)
+
+
+def request_token(request):
+    "The token of the `Authorization: Bearer` header of ``request``, if any"
+    scheme, _, token = request.META.get('HTTP_AUTHORIZATION',
+                                        '').partition(' ')
+    token = token.strip()
+    if scheme.lower() == 'bearer' and token:
+        return token
+    return None
+
+
+def request_authenticated(request):
+    """
+    Whether ``request`` comes from a user authenticated already, by a
+    session or some middleware
+    """
+    user = getattr(request, 'user', None)
+    if user is None:
+        return False
+    is_authenticated = getattr(user, 'is_authenticated', lambda: False)
+    return not six.callable(is_authenticated) or bool(is_authenticated())
+
+
+def sends_credentials(request, params):
+    """
+    Whether a call of an `authenticated` method with ``params`` is expected
+    to start with the username and password, rather than rely on the user of
+    the request or a token
+    """
+    if request_authenticated(request):
+        return False
+    return not ((type(params) is dict and 'token' in params) or
+                request_token(request))
+
+
+class CredentialCache(object):
+    """
+    Remembers the users successfully authenticated with a set of credentials
+    for ``ttl`` seconds, so clients sending a username and password with
+    every call only pay for the password hasher once in a while. Only a
+    digest of the credentials, keyed with a random per-process secret, is
+    kept. Failed attempts are not cached.
+
+    Cached users are read again on every hit and only reused while they are
+    active and their password is unchanged, so a password change or
+    deactivation locks out the old credentials right away. Users that are
+    not saved models are never cached.
+    """
+
+    def __init__(self, ttl=60, max_entries=1000):
+        self.users = LRUCache(max_entries, ttl)
+        self.secret = os.urandom(32)
+
+    def make_key(self, authenticate, args, kwargs):
+        credentials = six.text_type(
+            repr((id(authenticate), args, sorted(kwargs.items()))))
+        return hmac.new(self.secret, credentials.encode('utf-8'),
+                        hashlib.sha256).hexdigest()
+
+    def authenticate(self, authenticate, *args, **kwargs):
+        """
+        Calls ``authenticate`` with the credentials unless they were verified
+        recently. Returns the user, or `None`.
+        """
+        key = self.make_key(authenticate, args, kwargs)
+        entry = self.users.get(key, None)
+        if entry is not None:
+            model, pk, auth_hash, backend = entry
+            user = load_user(model, pk, auth_hash)
+            if user is not None:
+                if backend is not None:
+                    user.backend = backend
+                return user
+            self.users.delete(key)
+        user = authenticate(*args, **kwargs)
+        if user is not None and getattr(user, 'pk', None) is not None and \
+                hasattr(type(user), '_default_manager'):
+            self.users.set(key, (type(user), user.pk, credentials_hash(user),
+                                 getattr(user, 'backend', None)))
+        return user
+
+    def clear(self):
+        self.users.clear()
+
+
+class BatchCredentials(object):
+    """
+    The outcome of every authentication attempted while handling one batch.
+    It is shared by the copies of the request the elements get, so each set
+    of credentials is checked once per batch. Failures are remembered too,
+    every element repeating them fails with `InvalidCredentialsError`.
+    Different credentials are checked in parallel, elements repeating some
+    wait for the first one checking them.
+    """
+
+    def __init__(self):
+        self.users = {}
+        self._locks = {}  # key => Lock held while checking its credentials
+        self._lock = threading.Lock()  # for _locks
+
+    def authenticate(self, ident, authenticate, *args, **kwargs):
+        """
+        Calls ``authenticate`` with the credentials unless a call with the
+        same ``ident`` did so earlier in the batch. Returns a copy of the
+        user, or `None`.
+        """
+        key = repr((id(ident), args, sorted(kwargs.items())))
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self.users:
+                self.users[key] = authenticate(*args, **kwargs)
+            user = self.users[key]
+        return copy.copy(user) if user is not None else None
@@ -0,0 +1,233 @@
+import hashlib
+import threading
+import time
+import six
+
+from jsonrpc._json import dumps
+
+try:
+    from inspect import iscoroutinefunction
+except ImportError:
+    iscoroutinefunction = lambda func: False
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from django.utils.datastructures import SortedDict as OrderedDict
+
+MISSING = object()
+
+
+def user_ident(user):
+    "What tells ``user`` apart in a cache key: its pk, or else its username"
+    if user is None:
+        return None
+    if getattr(user, 'pk', None) is not None:
+        return [user.__class__.__name__, user.pk]
+    get_username = getattr(user, 'get_username', None)
+    return get_username() if get_username is not None else str(user)
+
+
+class LRUCache(object):
+    """
+    A thread-safe, in-process least recently used cache whose entries expire
+    ``ttl`` seconds after they were set (never when ``ttl`` is `None`).
+    """
+
+    def __init__(self, max_entries=1000, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            try:
+                expires, value = self._data.pop(key)
+            except KeyError:
+                return default
+            if expires is not None and expires < time.time():
+                return default
+            self._data[key] = (expires, value)  # most recently used
+            return value
+
+    def set(self, key, value, ttl=MISSING):
+        ttl = self.ttl if ttl is MISSING else ttl
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (expires, value)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class ResultCache(object):
+    """
+    Caches the results of a `safe` JSON-RPC method, see the `cache` argument
+    of `jsonrpc_method`. Results are kept in an in-process LRU and, when
+    ``backend`` names one of your Django caches, in that cache as well.
+
+      ttl           seconds a result stays valid
+      max_entries   size of the in-process LRU
+      key           optional `key(request, *args, **kwargs)` returning what
+                    identifies a call, by default the call's params (and
+                    the user, for authenticated methods)
+      backend       alias of a Django cache (`CACHES` setting) used as the
+                    second tier, `None` for the in-process LRU only
+
+    Entries in the Django cache are keyed on a generation number kept in
+    that cache too, forgetting every result bumps it.
+    """
+
+    def __init__(self, ttl=300, max_entries=1000, key=None, backend=None):
+        self.ttl = ttl
+        self.key_func = key
+        self.backend = backend
+        self.local = LRUCache(max_entries, ttl)
+        self.hits = 0
+        self.misses = 0
+        self.method = None
+        self.arg_names = []
+        self.per_user = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_option(cls, option):
+        "Builds a cache from the `cache` argument of `jsonrpc_method`"
+        if isinstance(option, cls):
+            return option
+        if option is True:
+            return cls()
+        if isinstance(option, dict):
+            return cls(**option)
+        return cls(ttl=option)
+
+    def bind(self, method, arg_names, per_user=False):
+        """
+        Tells the cache which method it is for and its argument names, and
+        with ``per_user`` that results depend on the authenticated user.
+        """
+        self.method = method
+        self.arg_names = list(arg_names)
+        self.per_user = per_user
+
+    def make_key(self, request, args, kwargs):
+        """
+        Returns the cache key of a call, `None` if its params can not be
+        serialized. Positional params are keyed by their argument names, so
+        `f('a')` and `f(s='a')` share an entry. Each user has entries of its
+        own when the cache is `per_user`.
+        """
+        if self.key_func is not None:
+            ident = self.key_func(request, *args, **kwargs)
+        else:
+            ident = dict(zip(self.arg_names, args), **kwargs)
+            if len(args) > len(self.arg_names):
+                ident['*'] = list(args[len(self.arg_names):])
+            if self.per_user:
+                ident = [user_ident(getattr(request, 'user', None)), ident]
+        try:
+            canonical = dumps(ident, sort_keys=True, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return None
+        return 'jsonrpc:%s:%s' % (self.method, hashlib.sha1(
+            canonical.encode('utf-8')).hexdigest())
+
+    def get_backend(self):
+        if self.backend is None:
+            return None
+        try:
+            from django.core.cache import caches
+            return caches[self.backend]
+        except ImportError:  # Django < 1.7
+            from django.core.cache import get_cache
+            return get_cache(self.backend)
+
+    def generation_key(self):
+        return 'jsonrpc-generation:%s' % self.method
+
+    def backend_key(self, backend, key):
+        "The key of an entry in the Django cache, in the current generation"
+        return '%s:%s' % (key, backend.get(self.generation_key(), 0))
+
+    def get(self, key):
+        value = self.local.get(key)
+        if value is MISSING:
+            backend = self.get_backend()
+            if backend is not None:
+                value = backend.get(self.backend_key(backend, key), MISSING)
+                if value is not MISSING:
+                    self.local.set(key, value)
+        with self._lock:
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self.local.set(key, value)
+        backend = self.get_backend()
+        if backend is not None:
+            backend.set(self.backend_key(backend, key), value, self.ttl)
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Forgets the result of the call with the given params, or every result
+        of the method when none are given (or when results are cached per
+        user). The in-process LRUs of other processes are not reached, their
+        entries expire after `ttl`. A custom `key` function is called with
+        `None` for the request here.
+        """
+        backend = self.get_backend()
+        if (not args and not kwargs) or (self.per_user and
+                                         self.key_func is None):
+            self.local.clear()
+            if backend is not None:
+                # entries of older generations are never read again
+                backend.add(self.generation_key(), 0, None)
+                backend.incr(self.generation_key())
+            return
+        key = self.make_key(None, args, kwargs)
+        if key is None:
+            return
+        self.local.delete(key)
+        if backend is not None:
+            backend.delete(self.backend_key(backend, key))
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self.local)}
+
+    def wrap(self, func):
+        "Returns ``func`` with its results cached"
+        if iscoroutinefunction(func):
+            from jsonrpc._async import async_cached
+            return async_cached(self, func)
+
+        @six.wraps(func)
+        def cached(request, *args, **kwargs):
+            key = self.make_key(request, args, kwargs)
+            if key is None:
+                return func(request, *args, **kwargs)
+            value = self.get(key)
+            if value is MISSING:
+                request.jsonrpc_cache = 'miss'
+                value = func(request, *args, **kwargs)
+                self.set(key, value)
+            else:
+                request.jsonrpc_cache = 'hit'
+            return value
+
+        return cached
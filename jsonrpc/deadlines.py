@@ -0,0 +1,84 @@
+"""
+Deadlines of JSON-RPC calls. A site works out the deadline of every call
+from the `timeout` of its method and the one the client asks for, either in
+an `X-JSONRPC-Timeout` header or a `timeout` member of the call, both in
+seconds. While the method runs its deadline is the current one, so calls it
+makes through `ServiceProxy` pass on whatever time is left.
+
+Deadlines are `time.time()` timestamps.
+"""
+import threading
+import time
+
+HEADER = 'X-JSONRPC-Timeout'
+META_KEY = 'HTTP_X_JSONRPC_TIMEOUT'
+
+try:
+    import contextvars
+except ImportError:  # python < 3.7
+    contextvars = None
+
+if contextvars is not None:
+    # follows coroutines from task to task, as well as threads
+    _deadline = contextvars.ContextVar('jsonrpc_deadline', default=None)
+
+    def get_deadline():
+        "The deadline of the call being handled, `None` if it has none"
+        return _deadline.get()
+
+    def set_deadline(deadline):
+        "Makes ``deadline`` the current one, returns a token to undo it"
+        return _deadline.set(deadline)
+
+    def reset_deadline(token):
+        _deadline.reset(token)
+else:
+    _local = threading.local()
+
+    def get_deadline():
+        "The deadline of the call being handled, `None` if it has none"
+        return getattr(_local, 'deadline', None)
+
+    def set_deadline(deadline):
+        "Makes ``deadline`` the current one, returns a token to undo it"
+        token = get_deadline()
+        _local.deadline = deadline
+        return token
+
+    def reset_deadline(token):
+        _local.deadline = token
+
+
+def remaining(deadline=None):
+    """
+    The seconds left until ``deadline`` (by default the current one), `None`
+    when there is no deadline
+    """
+    if deadline is None:
+        deadline = get_deadline()
+        if deadline is None:
+            return None
+    return deadline - time.time()
+
+
+def timeout_for(timeout=None):
+    """
+    The timeout of an outgoing call: ``timeout`` or what is left of the
+    current deadline, whichever is shorter
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if timeout is None:
+        return left
+    return min(timeout, left)
+
+
+def parse_timeout(value):
+    "Returns a timeout in seconds sent by a client, raises `ValueError`"
+    if isinstance(value, bool):
+        raise ValueError('Invalid timeout %r' % value)
+    timeout = float(value)
+    if not timeout > 0:  # also NaN
+        raise ValueError('Invalid timeout %r' % value)
+    return timeout
@@ -0,0 +1,208 @@
+"""
+Reporting of the exceptions raised by JSON-RPC methods through `logging`.
+
+Reports go to the `jsonrpc.errors` logger. Identical exceptions (same method,
+exception class and raising code) are reported at most `burst` times per
+`interval` seconds each, the next report after that says how many were left
+out. On python 3.2 or greater records are handed to a background thread
+through a bounded queue, their tracebacks are only formatted there, by the
+handlers configured for the `jsonrpc` logger (or the root logger), so a
+storm of failing calls does not hold up workers on log output.
+
+The defaults can be changed with the `JSONRPC_ERROR_LOG` setting, a dict
+with the keys `interval`, `burst`, `max_keys`, `queue_size` and
+`background` (`False` logs from the failing thread).
+"""
+import atexit
+import logging
+import threading
+import time
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from django.utils.datastructures import SortedDict as OrderedDict
+
+try:
+    from logging.handlers import QueueHandler, QueueListener
+except ImportError:  # python < 3.2
+    QueueHandler = QueueListener = None
+
+try:
+    import queue
+except ImportError:  # python 2
+    import Queue as queue
+
+DEFAULTS = {
+    'interval': 60,
+    'burst': 5,
+    'max_keys': 1000,
+    'queue_size': 10000,
+    'background': True,
+}
+
+
+class RateLimiter(object):
+    """
+    Counts reports by key and tells which of them may be emitted: at most
+    ``burst`` per ``interval`` seconds for every key. Up to ``max_keys``
+    keys are remembered, the least recently reported are forgotten first.
+    """
+
+    def __init__(self, interval=60, burst=5, max_keys=1000):
+        self.interval = interval
+        self.burst = burst
+        self.max_keys = max_keys
+        self._keys = OrderedDict()  # key => [window start, emitted, left out]
+        self._lock = threading.Lock()
+
+    def allow(self, key):
+        """
+        Returns `None` when a report for ``key`` must be left out, otherwise
+        how many were left out since the last one emitted
+        """
+        now = time.time()
+        with self._lock:
+            state = self._keys.pop(key, None)
+            if state is None or now - state[0] >= self.interval:
+                suppressed = state[2] if state is not None else 0
+                state = [now, 0, suppressed]
+            self._keys[key] = state
+            while len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+            if state[1] >= self.burst:
+                state[2] += 1
+                return None
+            state[1] += 1
+            suppressed, state[2] = state[2], 0
+            return suppressed
+
+
+if QueueHandler is not None:
+    class BackgroundHandler(QueueHandler):
+        """
+        Queues records for a `QueueListener` as they are. Unlike its base
+        class it does not format them in the logging thread, and drops them
+        when the queue is full rather than blocking or complaining.
+        """
+
+        def __init__(self, queue):
+            QueueHandler.__init__(self, queue)
+            self.dropped = 0
+
+        def prepare(self, record):
+            return record
+
+        def enqueue(self, record):
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+    class ForwardHandler(logging.Handler):
+        "Hands the records of the listener thread to another logger"
+
+        def __init__(self, logger):
+            logging.Handler.__init__(self)
+            self.logger = logger
+
+        def handle(self, record):
+            self.logger.handle(record)
+
+        emit = handle
+
+
+class ErrorLog(object):
+    """
+    Reports exceptions of JSON-RPC methods to the logger ``name``, see the
+    module documentation. In the background its records are re-emitted
+    through the parent of that logger.
+    """
+
+    def __init__(self, interval=60, burst=5, max_keys=1000, queue_size=10000,
+                 background=True, name='jsonrpc.errors'):
+        self.logger = logging.getLogger(name)
+        self.limiter = RateLimiter(interval, burst, max_keys)
+        self.queue_size = queue_size
+        self.background = background and QueueHandler is not None
+        self.handler = None
+        self.listener = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Puts the background handler on the logger, its records are
+        re-emitted through the parent logger by a thread
+        """
+        with self._lock:
+            if self.listener is not None or not self.background:
+                return
+            self.handler = BackgroundHandler(queue.Queue(self.queue_size))
+            self.listener = QueueListener(
+                self.handler.queue,
+                ForwardHandler(logging.getLogger(
+                    self.logger.name.rpartition('.')[0] or None)))
+            self.listener.start()
+            atexit.register(self.stop)
+            self.logger.addHandler(self.handler)
+            self.logger.propagate = False
+
+    def stop(self):
+        "Emits the queued records and goes back to logging synchronously"
+        with self._lock:
+            if self.listener is None:
+                return
+            self.logger.removeHandler(self.handler)
+            self.logger.propagate = True
+            self.listener.stop()
+            self.listener = self.handler = None
+
+    def report(self, method, exc_info):
+        """
+        Reports the exception ``exc_info`` raised by ``method`` unless
+        identical ones have been reported too often lately
+        """
+        suppressed = self.limiter.allow((method, ) + fingerprint(exc_info))
+        if suppressed is None:
+            return
+        if self.background and self.listener is None:
+            self.start()
+        if suppressed:
+            self.logger.error('Exception in %s (%d more like it left out)',
+                              method, suppressed, exc_info=exc_info)
+        else:
+            self.logger.error('Exception in %s', method, exc_info=exc_info)
+
+
+def fingerprint(exc_info):
+    "The exception class and the code it went through, without formatting"
+    tb = exc_info[2]
+    frames = []
+    while tb is not None:
+        frames.append((tb.tb_frame.f_code.co_filename, tb.tb_lineno))
+        tb = tb.tb_next
+    return (exc_info[0], tuple(frames))
+
+
+_error_log = []
+_error_log_lock = threading.Lock()
+
+
+def get_error_log():
+    "The process wide `ErrorLog`, configured by the `JSONRPC_ERROR_LOG` setting"
+    if not _error_log:
+        with _error_log_lock:
+            if not _error_log:
+                options = dict(DEFAULTS)
+                try:
+                    from django.conf import settings
+                    options.update(getattr(settings, 'JSONRPC_ERROR_LOG', {}))
+                except Exception:  # no Django or settings not configured
+                    pass
+                _error_log.append(ErrorLog(**options))
+    return _error_log[0]
+
+
+def report_exception(method, exc_info):
+    "Reports ``exc_info`` raised by the JSON-RPC method ``method``"
+    get_error_log().report(method, exc_info)
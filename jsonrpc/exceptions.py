@@ -29,7 +29,12 @@ class Error(Exception):
 
     @property
     def json_rpc_format(self):
-        """ return the Exception data in a format for JSON-RPC """
+        """ return the Exception data in a format for JSON-RPC, without a stack trace """
+        return self.json_rpc_error()
+
+    def json_rpc_error(self, stack=False):
+        """ return the Exception data in a format for JSON-RPC. With `stack`
+        the traceback of the exception being handled is formatted in too. """
 
         error = {
             'name': smart_text(self.__class__.__name__),
@@ -39,9 +44,7 @@ class Error(Exception):
             'data': self.data
         }
 
-        from django.conf import settings
-
-        if settings.DEBUG:
+        if stack:
             import sys, traceback
             error['stack'] = traceback.format_exc()
             error['executable'] = sys.executable
@@ -88,6 +91,25 @@ class ServerError(Error):
 
 # -32099..-32000    Server error.     Reserved for implementation-defined server-errors.
 
+
+class ServerBusyError(ServerError):
+    """ Too many calls are running, the client should retry later. """
+    code = -32000
+    message = _('Server busy, try again later.')
+    status = 503
+
+    def __init__(self, message=None, retry_after=1):
+        super(ServerBusyError, self).__init__(message)
+        self.retry_after = retry_after
+        self.data = {'retry_after': retry_after}
+
+
+class DeadlineExceededError(ServerError):
+    """ The call did not finish before its deadline. """
+    code = -32001
+    message = _('Deadline exceeded.')
+    status = 504
+
 # The remainder of the space is available for application defined errors.
 
 
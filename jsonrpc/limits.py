@@ -0,0 +1,77 @@
+"""
+Admission control for `JSONRPCSite`, see `JSONRPCSite.set_limit`.
+"""
+import threading
+import time
+
+timer = getattr(time, 'perf_counter', time.time)
+
+
+class Limit(object):
+    """
+    Lets at most ``max_in_flight`` calls run at the same time. Up to
+    ``max_queue`` more calls (as many as ``max_in_flight`` when `None`) wait
+    at most ``timeout`` seconds for one of them to finish, any other call is
+    turned away. Clients turned away are told to retry after
+    ``retry_after`` seconds.
+    """
+
+    def __init__(self, max_in_flight, max_queue=None, timeout=0.25,
+                 retry_after=1):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_in_flight if max_queue is None else max_queue
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._cond = threading.Condition(threading.Lock())
+
+    def acquire(self, wait=True, timeout=None):
+        """
+        Takes a slot, waiting for one when ``wait`` is true and the queue
+        has room, no longer than ``timeout`` seconds if that is shorter than
+        the limit's own. Returns whether a slot was taken.
+        """
+        own = self.timeout or 0
+        timeout = own if timeout is None else min(own, timeout)
+        with self._cond:
+            if self.in_flight < self.max_in_flight:
+                self.in_flight += 1
+                self.admitted += 1
+                return True
+            if not wait or timeout <= 0 or \
+                    self.waiting >= self.max_queue:
+                self.rejected += 1
+                return False
+            self.waiting += 1
+            try:
+                deadline = timer() + timeout
+                while self.in_flight >= self.max_in_flight:
+                    remaining = deadline - timer()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        return False
+                    self._cond.wait(remaining)
+                self.in_flight += 1
+                self.admitted += 1
+                return True
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    def occupancy(self):
+        with self._cond:
+            return {
+                'max_in_flight': self.max_in_flight,
+                'max_queue': self.max_queue,
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+            }
@@ -0,0 +1,154 @@
+"""
+Per-method call metrics of a `JSONRPCSite`, see its `metrics` argument.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+# the timer latencies are measured with
+timer = getattr(time, 'perf_counter', time.time)
+
+# upper bounds (in seconds) of the latency histogram buckets
+BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+# the name calls of methods that do not exist are counted under
+UNKNOWN = '<unknown>'
+
+
+class Series(object):
+    "The metrics of one method called with one protocol version"
+    __slots__ = ('calls', 'seconds', 'histogram', 'errors', 'sized',
+                 'request_bytes', 'response_bytes')
+
+    def __init__(self, buckets):
+        self.calls = 0
+        self.seconds = 0.0
+        self.histogram = [0] * (buckets + 1)  # the last one is +Inf
+        self.errors = {}  # exception class name => count
+        self.sized = 0  # calls whose payload sizes are known
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class Metrics(object):
+    """
+    Thread-safe counters and fixed-bucket latency histograms for every
+    method and protocol version. Recording a call costs a lookup, a bisect
+    and a few additions under a lock.
+
+    Payload sizes are those of the HTTP bodies, so they are only known for
+    calls that are not part of a batch.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # (method, version) => Series
+        self._lock = threading.Lock()
+
+    def _get(self, method, version):
+        key = (method or UNKNOWN, version)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = Series(len(self.buckets))
+        return series
+
+    def record(self, method, version, seconds, error=None):
+        """
+        Counts a call of ``method`` that took ``seconds``. ``error`` is the
+        class name of the exception it raised, if any.
+        """
+        i = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._get(method, version)
+            series.calls += 1
+            series.seconds += seconds
+            series.histogram[i] += 1
+            if error is not None:
+                series.errors[error] = series.errors.get(error, 0) + 1
+
+    def record_sizes(self, method, version, request_bytes, response_bytes):
+        "Adds the body sizes of a call that was not part of a batch"
+        with self._lock:
+            series = self._get(method, version)
+            series.sized += 1
+            series.request_bytes += request_bytes
+            series.response_bytes += response_bytes
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+
+    def snapshot(self):
+        """
+        Returns the metrics as a JSON-able dict: the histogram ``buckets``
+        and, for every method and protocol version, the number of calls,
+        their total seconds, the count of each histogram bucket (the last
+        one counts the calls slower than all buckets), the errors by
+        exception class and the total payload sizes of the sized calls.
+        """
+        with self._lock:
+            methods = {}
+            for (method, version), s in self._series.items():
+                methods.setdefault(method, {})[version] = {
+                    'calls': s.calls,
+                    'seconds': s.seconds,
+                    'histogram': list(s.histogram),
+                    'errors': dict(s.errors),
+                    'sized': s.sized,
+                    'request_bytes': s.request_bytes,
+                    'response_bytes': s.response_bytes,
+                }
+        return {'buckets': list(self.buckets), 'methods': methods}
+
+    def prometheus(self, prefix='jsonrpc'):
+        "Returns the metrics in the Prometheus text exposition format"
+        snapshot = self.snapshot()
+        buckets = ['%g' % b for b in snapshot['buckets']] + ['+Inf']
+        series = sorted((method, version, s) for method, versions in
+                        snapshot['methods'].items()
+                        for version, s in versions.items())
+        lines = [
+            '# HELP %s_call_duration_seconds Time spent handling calls' % prefix,
+            '# TYPE %s_call_duration_seconds histogram' % prefix]
+        for method, version, s in series:
+            labels = 'method="%s",version="%s"' % (escape_label(method),
+                                                   escape_label(version))
+            count = 0
+            for le, n in zip(buckets, s['histogram']):
+                count += n
+                lines.append('%s_call_duration_seconds_bucket{%s,le="%s"} %d'
+                             % (prefix, labels, le, count))
+            lines.append('%s_call_duration_seconds_sum{%s} %r' %
+                         (prefix, labels, s['seconds']))
+            lines.append('%s_call_duration_seconds_count{%s} %d' %
+                         (prefix, labels, s['calls']))
+        lines.extend([
+            '# HELP %s_call_errors_total Calls that raised an exception' %
+            prefix, '# TYPE %s_call_errors_total counter' % prefix])
+        for method, version, s in series:
+            for error, n in sorted(s['errors'].items()):
+                lines.append(
+                    '%s_call_errors_total{method="%s",version="%s",'
+                    'error="%s"} %d' % (prefix, escape_label(method),
+                                        escape_label(version),
+                                        escape_label(error), n))
+        for name, key, help in (
+                ('request_size_bytes', 'request_bytes',
+                 'Sizes of request bodies of calls outside batches'),
+                ('response_size_bytes', 'response_bytes',
+                 'Sizes of response bodies of calls outside batches')):
+            lines.extend(['# HELP %s_%s %s' % (prefix, name, help),
+                          '# TYPE %s_%s summary' % (prefix, name)])
+            for method, version, s in series:
+                labels = 'method="%s",version="%s"' % (escape_label(method),
+                                                       escape_label(version))
+                lines.append('%s_%s_sum{%s} %d' % (prefix, name, labels,
+                                                   s[key]))
+                lines.append('%s_%s_count{%s} %d' % (prefix, name, labels,
+                                                     s['sized']))
+        return '\n'.join(lines) + '\n'
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace(
+        '\n', '\\n')
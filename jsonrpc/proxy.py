@@ -1,17 +1,291 @@
+import base64
+import logging
+import select
+import socket
+import sys
+import threading
+import time
 import uuid
+from collections import deque
+from six.moves import http_client
 from six.moves.urllib import request as urllib_request
-from six.moves.urllib import error as urllib_error
+from six.moves.urllib.parse import unquote, urlsplit
 from django.test.client import FakePayload
 
-from jsonrpc._json import loads, dumps
+from jsonrpc import deadlines
+from jsonrpc._compress import ACCEPT_ENCODING, compress, decompress
+from jsonrpc.exceptions import DeadlineExceededError
+from jsonrpc._json import loads, dumps, dumps_bytes
 from jsonrpc._types import *
 
+logger = logging.getLogger('jsonrpc.proxy')
+
+
+class ConnectionPool(object):
+    """
+    A thread-safe pool of persistent HTTP/1.1 connections. Up to ``max_size``
+    idle connections are kept per host, for at most ``idle_timeout`` seconds.
+    ``connect_timeout`` and ``timeout`` (for sending a request and reading its
+    response) are in seconds, `None` waits forever.
+
+    Requests go through the proxies of ``proxies``, a dict of proxy URLs by
+    scheme like `urllib`'s, by default those of the `http_proxy`,
+    `https_proxy` and `no_proxy` environment variables. HTTPS requests are
+    tunnelled through their proxy.
+    """
+
+    def __init__(self, max_size=10, idle_timeout=60, connect_timeout=None,
+                 timeout=None, proxies=None):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
+        self.proxies = (urllib_request.getproxies() if proxies is None
+                        else proxies)
+        self._idle = {}  # (scheme, host, port) -> deque of (conn, last used)
+        self._proxy_for = {}  # (scheme, host, port) -> proxy or None
+        self._lock = threading.Lock()
+
+    def proxy_for(self, key):
+        """
+        The host, port and `Proxy-Authorization` header of the proxy
+        requests to the host ``key`` go through, `None` for none
+        """
+        try:
+            return self._proxy_for[key]
+        except KeyError:
+            pass
+        scheme, host, port = key
+        proxy = self.proxies.get(scheme)
+        if proxy and not self.bypass(host):
+            parts = urlsplit(proxy if '://' in proxy else 'http://' + proxy)
+            auth = None
+            if parts.username:
+                credentials = '%s:%s' % (unquote(parts.username),
+                                         unquote(parts.password or ''))
+                auth = 'Basic ' + base64.b64encode(
+                    credentials.encode('utf-8')).decode('ascii')
+            proxy = (parts.hostname, parts.port or 80, auth)
+        else:
+            proxy = None
+        self._proxy_for[key] = proxy
+        return proxy
+
+    def bypass(self, host):
+        "Whether ``host`` is one of the `no` hosts (or their domains)"
+        for name in self.proxies.get('no', '').split(','):
+            name = name.strip().lstrip('.').lower()
+            if name == '*' or name and (host == name or
+                                        host.endswith('.' + name)):
+                return True
+        return False
+
+    def connect(self, key):
+        scheme, host, port = key
+        proxy = self.proxy_for(key)
+        address = (host, port) if proxy is None else proxy[:2]
+        if scheme == 'https':
+            conn = http_client.HTTPSConnection(*address,
+                                               timeout=self.connect_timeout)
+            if proxy is not None:
+                conn.set_tunnel(host, port, {'Proxy-Authorization': proxy[2]}
+                                if proxy[2] else None)
+        else:
+            conn = http_client.HTTPConnection(*address,
+                                              timeout=self.connect_timeout)
+        conn.connect()
+        conn.sock.settimeout(self.timeout)
+        return conn
+
+    def acquire(self, key):
+        """
+        Returns an idle connection to the host ``key`` or a new one, and
+        whether it was reused
+        """
+        expired = []
+        conn = None
+        now = time.time()
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used < self.idle_timeout and \
+                        not dropped(candidate):
+                    conn = candidate
+                    break
+                expired.append(candidate)
+            # whatever is left is older still
+            while idle:
+                expired.append(idle.pop()[0])
+        for old in expired:
+            old.close()
+        if conn is not None:
+            return conn, True
+        return self.connect(key), False
+
+    def release(self, key, conn):
+        "Puts ``conn`` back into the pool, or closes it when the pool is full"
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_size:
+                idle.append((conn, time.time()))
+                return
+        conn.close()
+
+    def clear(self):
+        "Closes every idle connection"
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn, last_used in connections:
+                conn.close()
+
+    def post(self, url, body, headers, timeout=None):
+        """
+        POSTs ``body`` to ``url`` and returns the status, headers and body of
+        the response. Idle connections the server closed are not reused, and
+        when sending the request over a reused connection fails it is sent
+        once more on a new connection. Failures once the request was sent
+        are raised, even without a status line in answer: the server may
+        have run the call already. ``timeout`` replaces the pool's for this
+        request when it is shorter.
+        """
+        if timeout is None or (self.timeout is not None and
+                               self.timeout <= timeout):
+            timeout = self.timeout
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        proxy = self.proxy_for(key) if parts.scheme == 'http' else None
+        if proxy is not None:  # the proxy needs to know where to go
+            path = '%s://%s:%d%s' % (parts.scheme, parts.hostname, port, path)
+            if proxy[2]:
+                headers = dict(headers, **{'Proxy-Authorization': proxy[2]})
+
+        conn, reused = self.acquire(key)
+        while True:
+            try:
+                conn.sock.settimeout(timeout)
+                conn.request('POST', path, body, headers)
+            except (http_client.HTTPException, socket.error) as e:
+                conn.close()
+                # the server closed the idle connection before the request
+                # was sent, it never saw it
+                if reused and not isinstance(e, socket.timeout):
+                    conn, reused = self.connect(key), False
+                    continue
+                raise
+            try:
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http_client.HTTPException, socket.error):
+                conn.close()
+                raise
+            if resp.will_close or conn.sock is None:
+                conn.close()
+            else:
+                conn.sock.settimeout(self.timeout)
+                self.release(key, conn)
+            return resp.status, resp.msg, data
+
+
+def dropped(conn):
+    """
+    Whether the idle connection ``conn`` was closed by the server: it reads
+    as ready (end of file, or data nobody asked for)
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        if hasattr(select, 'poll'):
+            poll = select.poll()
+            poll.register(sock, select.POLLIN)
+            return bool(poll.poll(0))
+        return bool(select.select([sock], [], [], 0)[0])
+    except (ValueError, select.error, socket.error):
+        return True
+
+
+def call_timeout(timeout=None):
+    """
+    The timeout of a call made now: ``timeout`` or what is left of the
+    deadline of the call being handled, whichever is shorter. Raises
+    `DeadlineExceededError` rather than letting a call start too late.
+    """
+    timeout = deadlines.timeout_for(timeout)
+    if timeout is not None and timeout <= 0:
+        raise DeadlineExceededError()
+    return timeout
+
+
+def encode_request(data, compress_min_size=None, timeout=None):
+    """
+    Returns the body and headers of a request carrying ``data``, the body is
+    gzipped when it has at least ``compress_min_size`` bytes. A ``timeout``
+    tells the service how many seconds the caller is going to wait.
+    """
+    headers = {
+        'Content-Type': 'application/json-rpc',
+        'Accept': 'application/json-rpc',
+        'Accept-Encoding': ACCEPT_ENCODING
+    }
+    if compress_min_size is not None and len(data) >= compress_min_size:
+        data = compress(data, 'gzip')
+        headers['Content-Encoding'] = 'gzip'
+    headers['Content-Length'] = str(len(data))
+    if timeout is not None:
+        headers[deadlines.HEADER] = '%.3f' % max(timeout, 0.001)
+    return data, headers
+
+
+def response_text(status, headers, body, url, data, req_headers):
+    """
+    Returns the decoded ``body`` of a response to the request ``data`` sent
+    to ``url``, raises `ServiceProxyException` for HTTP errors that do not
+    carry a JSON-RPC response
+    """
+    body = decompress(body, headers.get('Content-Encoding'))
+    if not 200 <= status < 300:
+        if status not in (401, 403) and headers.get(
+                'Content-Type') == 'application/json-rpc':
+            return body.decode('utf-8')  # we got a jsonrpc-formatted respnose
+        raise ServiceProxyException(status, headers, urllib_request.Request(
+            url, data, req_headers))
+    return body.decode('utf-8')
+
+
+# used by every ServiceProxy that is not given a pool of its own
+default_pool = ConnectionPool()
+
 
 class ServiceProxy(object):
-    def __init__(self, service_url, service_name=None, version='1.0'):
+    """
+    Calls the methods of the JSON-RPC service at ``service_url``. Requests
+    are sent over the persistent connections of ``pool``, by default a pool
+    shared with every other proxy. Proxies for methods derived from this one
+    (``proxy.namespace.method``) use the same pool.
+
+    Requests of at least ``compress_min_size`` bytes are sent gzipped, which
+    the service must support (sites of this package do). Compressed responses
+    are always accepted.
+
+    Calls made while a JSON-RPC method runs are given what is left of its
+    deadline: the service is told in an `X-JSONRPC-Timeout` header, the
+    socket gives up when it passes, and once it has passed calls raise
+    `DeadlineExceededError` without being sent.
+    """
+
+    def __init__(self, service_url, service_name=None, version='1.0',
+                 pool=None, compress_min_size=None):
         self.version = str(version)
         self.service_url = service_url
         self.service_name = service_name
+        self.pool = pool or default_pool
+        self.compress_min_size = compress_min_size
 
     def __getattr__(self, name):
         if self.service_name != None:
@@ -25,52 +299,166 @@ class ServiceProxy(object):
             'method': self.service_name
         }
 
+    def make_params(self, args, kwargs):
+        params = kwargs if len(kwargs) else args
+        if Any.kind(params) == Object and self.version != '2.0':
+            raise Exception('Unsupported arg type for JSON-RPC 1.0 '
+                            '(the default version for this client, '
+                            'pass version="2.0" to use keyword arguments)')
+        return params
+
+    def post_data(self, data):
+        """
+        POSTs the serialized request ``data`` to the service and returns the
+        body of the response
+        """
+        timeout = call_timeout()
+        data, headers = encode_request(data, self.compress_min_size, timeout)
+        status, resp_headers, body = self.pool.post(self.service_url, data,
+                                                    headers, timeout)
+        return response_text(status, resp_headers, body,
+                             self.service_url, data, headers)
+
     def send_payload(self, params):
         """Performs the actual sending action and returns the result"""
-        data = dumps({
+        return self.post_data(dumps_bytes({
             'jsonrpc': self.version,
             'method': self.service_name,
             'params': params,
             'id': str(uuid.uuid1())
-        }).encode('utf-8')
-        headers = {
-            'Content-Type': 'application/json-rpc',
-            'Accept': 'application/json-rpc',
-            'Content-Length': len(data)
-        }
-        try:
-            req = urllib_request.Request(self.service_url, data, headers)
-            resp = urllib_request.urlopen(req)
-        except IOError as e:
-            if isinstance(e, urllib_error.HTTPError):
-                if e.code not in (
-                        401, 403
-                ) and e.headers['Content-Type'] == 'application/json-rpc':
-                    return e.read().decode('utf-8')  # we got a jsonrpc-formatted respnose
-                raise ServiceProxyException(e.code, e.headers, req)
-            else:
-                raise e
-        return resp.read().decode('utf-8')
+        }))
 
-    def __call__(self, *args, **kwargs):
-        params = kwargs if len(kwargs) else args
-        if Any.kind(params) == Object and self.version != '2.0':
-            raise Exception('Unsupported arg type for JSON-RPC 1.0 '
-                            '(the default version for this client, '
-                            'pass version="2.0" to use keyword arguments)')
+    def batch(self):
+        """
+        Returns a `Batch` of calls to this service, sent in a single request
+        when the `with` block using it ends
+        """
+        return Batch(self)
 
-        r = self.send_payload(params)
+    def __call__(self, *args, **kwargs):
+        r = self.send_payload(self.make_params(args, kwargs))
         y = loads(r)
-        if 'error' in y:
-            try:
-                from django.conf import settings
-                if settings.DEBUG:
-                    print('JSONRPC: %s error %r' % (self.service_name, y))
-            except:
-                pass
+        if y.get('error') is not None:
+            logger.debug('%s error %r', self.service_name, y)
         return y
 
 
+class BatchCall(object):
+    "The pending response of a call queued in a `Batch`"
+
+    def __init__(self, method, id):
+        self.method = method
+        self.id = id
+        self.response = None
+
+    def done(self):
+        return self.response is not None
+
+    def result(self):
+        """
+        Returns the response of the call, the same dict calling the method on
+        a `ServiceProxy` returns
+        """
+        if self.response is None:
+            raise ValueError('No response to the call of %s, the batch has '
+                             'not been sent or the service left it out' %
+                             self.method)
+        return self.response
+
+    def __repr__(self):
+        return 'BatchCall %r' % {'method': self.method, 'id': self.id,
+                                 'done': self.done()}
+
+
+class BatchMethod(object):
+    def __init__(self, batch, name):
+        self._batch = batch
+        self._name = name
+
+    def __getattr__(self, name):
+        return BatchMethod(self._batch, '%s.%s' % (self._name, name))
+
+    def __call__(self, *args, **kwargs):
+        return self._batch.call(self._name, *args, **kwargs)
+
+
+class Batch(object):
+    """
+    Queues calls to a service and sends them as one JSON-RPC batch:
+
+        with proxy.batch() as b:
+            hello = b.myapp.sayHello('Sam')
+            b.notify('myapp.log', 'said hello')
+        hello.result()['result']
+
+    Calls return a `BatchCall` that holds their response once the batch has
+    been sent. Notifications get no response.
+    """
+
+    def __init__(self, proxy):
+        self.proxy = proxy
+        self.requests = []
+        self.calls = {}
+
+    def __getattr__(self, name):
+        return BatchMethod(self, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.send()
+
+    def method_name(self, name):
+        if self.proxy.service_name is not None:
+            return '%s.%s' % (self.proxy.service_name, name)
+        return name
+
+    def call(self, method, *args, **kwargs):
+        "Queues a call of ``method`` and returns its `BatchCall`"
+        call = BatchCall(self.method_name(method), str(uuid.uuid1()))
+        self.requests.append({
+            'jsonrpc': self.proxy.version,
+            'method': call.method,
+            'params': self.proxy.make_params(args, kwargs),
+            'id': call.id
+        })
+        self.calls[call.id] = call
+        return call
+
+    def notify(self, method, *args, **kwargs):
+        "Queues a notification, a call whose result is not sent back"
+        D = {
+            'jsonrpc': self.proxy.version,
+            'method': self.method_name(method),
+            'params': self.proxy.make_params(args, kwargs)
+        }
+        if self.proxy.version != '2.0':
+            D['id'] = None  # JSON-RPC 1.0 notifications have a null id
+        self.requests.append(D)
+
+    def send(self):
+        """
+        Sends the queued calls and hands every `BatchCall` its response. An
+        error response to the batch as a whole is handed to every call.
+        """
+        if not self.requests:
+            return
+        requests, self.requests = self.requests, []
+        r = self.proxy.post_data(dumps_bytes(requests))
+        responses = loads(r) if r.strip() else []
+        if isinstance(responses, dict):
+            for call in self.calls.values():
+                call.response = responses
+        else:
+            for response in responses:
+                call = self.calls.get(response.get('id'))
+                if call is not None:
+                    call.response = response
+        self.calls = {}
+
+
 class ServiceProxyException(IOError):
     def __init__(self, code, headers, request):
         self.args = ('An Error Occurred', code, headers, request)
@@ -87,17 +475,23 @@ class TestingServiceProxy(ServiceProxy):
         super(TestingServiceProxy, self).__init__(*args, **kwargs)
         self.client = client
 
-    def send_payload(self, params):
-        json_data = dumps({
-            'jsonrpc': self.version,
-            'method': self.service_name,
-            'params': params,
-            'id': str(uuid.uuid1())
-        })
-        json_payload = FakePayload(json_data)
+    def post_data(self, data):
+        data, headers = encode_request(data, self.compress_min_size,
+                                       call_timeout())
+        json_payload = FakePayload(data)
         client_args = {
             'wsgi.input': json_payload,
-            'CONTENT_LENGTH': len(json_data)
+            'CONTENT_LENGTH': len(data),
+            'HTTP_ACCEPT_ENCODING': headers['Accept-Encoding']
         }
+        if 'Content-Encoding' in headers:
+            client_args['HTTP_CONTENT_ENCODING'] = headers['Content-Encoding']
+        if deadlines.HEADER in headers:
+            client_args[deadlines.META_KEY] = headers[deadlines.HEADER]
         response = self.client.post(self.service_url, **client_args)
-        return response.content.decode('utf-8')
+        return decompress(response.content,
+                          response.get('Content-Encoding')).decode('utf-8')
+
+
+if sys.version_info >= (3, 5):
+    from jsonrpc._asyncproxy import AsyncConnectionPool, AsyncServiceProxy
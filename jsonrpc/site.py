@@ -1,12 +1,27 @@
 import datetime, decimal
 import sys
+import calendar
+import copy
+import hashlib
+import math
+import threading
+import time
+import types
+import zlib
+from collections import deque
 from functools import wraps
 from uuid import uuid1
-from jsonrpc._json import loads, dumps
+from jsonrpc._json import loads, dumps, dumps_bytes, encode_response, \
+    ArrayStream, RawJSON
+from jsonrpc import _compress
+from jsonrpc.metrics import Metrics, timer
+from jsonrpc.limits import Limit
+from jsonrpc import deadlines
 from jsonrpc.exceptions import *
 from jsonrpc._types import *
 from django.conf import settings
 from django.core import signals
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.encoding import smart_text
 empty_dec = lambda f: f
 try:
@@ -14,12 +29,53 @@ try:
 except (NameError, ImportError):
     csrf_exempt = empty_dec
 
+try:
+    from importlib import import_module
+except ImportError:  # python 2.6
+    from django.utils.importlib import import_module
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # python 2 needs the `futures` backport for parallel batches
+    ThreadPoolExecutor = None
+
+if sys.version_info >= (3, 5):
+    from jsonrpc._async import AsyncDispatchMixin
+else:
+    AsyncDispatchMixin = object
+
 from django.core.serializers.json import DjangoJSONEncoder
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    from django.utils.datastructures import SortedDict as OrderedDict
+
 NoneType = type(None)
+BUILTIN_TYPES = (dict, list, set, NoneType, bool, six.text_type, RawJSON
+                 ) + six.integer_types + six.string_types
 encode_kw = lambda p: dict([(str(k), v) for k, v in p.items()])
 
 
+def call_pooled(func, *args, **kwargs):
+    """
+    Calls ``func`` in a pool thread the way Django's request cycle would:
+    the thread's database connections that are past `CONN_MAX_AGE` or
+    broken are closed before and after, pool threads never see the
+    `request_started` and `request_finished` signals that do it otherwise.
+    """
+    try:
+        from django.db import close_old_connections
+    except ImportError:  # Django < 1.6
+        from django.db import close_connection as close_old_connections
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
 def trim_docstring(docstring):
     if not docstring:
         return ''
@@ -81,55 +137,564 @@ def encode_arg11(p):
         return [d[str(i)] for i in pos]
 
 
+def compile_validator(method):
+    """
+    Returns a function that checks the params of a call to ``method``
+    against the types of its signature in a single pass, raising
+    `InvalidParamsError` on the first discrepancy. Params of an `Optional`
+    type may be left out.
+
+    The function takes the params and, optionally, the request. Calls of
+    `authenticated` methods whose request is authenticated already or
+    carries a token are checked without the username and password params.
+    """
+    arg_types = [(k, type_checker(T), isinstance(T, Optional))
+                 for k, T in method.json_arg_types.items()]
+    # where in a param a discrepancy was found is worth saying for
+    # containers only
+    labels = dict((k, '%s: ' % k if isinstance(T, Container) else '')
+                  for k, T in method.json_arg_types.items())
+    sig = method.json_sig
+    validate = compile_checks(arg_types, labels, sig)
+    auth_args = getattr(method, 'json_auth_args', None)
+    if not auth_args:
+        return validate
+
+    from jsonrpc.auth import sends_credentials
+    labels = dict((k, label) for k, label in labels.items()
+                  if k not in auth_args)
+    labels['token'] = ''
+    validate_token = compile_checks(arg_types[len(auth_args):], labels, sig)
+
+    def validate_authenticated(params, request=None):
+        if request is None or sends_credentials(request, params):
+            validate(params)
+        else:
+            validate_token(params)
+
+    return validate_authenticated
+
+
+def compile_checks(arg_types, labels, sig):
+    "The validator of `compile_validator` for the params ``arg_types``"
+    required = max([i + 1 for i, (k, check, optional)
+                    in enumerate(arg_types) if not optional] or [0])
+
+    def check_type(value, check, k):
+        if check is not None:
+            wrong = check(value)
+            if wrong is not None:
+                raise InvalidParamsError('%s%s for %s' %
+                                         (labels[k], wrong, sig))
+
+    def validate(params, request=None):
+        if type(params) is dict:
+            for k in params:
+                if not k in labels:
+                    raise InvalidParamsError(
+                        '%s is not a valid parameter for %s' % (k, sig))
+            for k, check, optional in arg_types:
+                if k in params:
+                    check_type(params[k], check, k)
+                elif not optional:
+                    raise InvalidParamsError(
+                        'Not enough params provided for %s' % sig)
+        elif type(params) in (list, tuple, set):
+            for arg, (k, check, optional) in zip(params, arg_types):
+                check_type(arg, check, k)
+            if len(params) > len(arg_types):
+                raise InvalidParamsError('Too many params provided for %s' %
+                                         sig)
+            if len(params) < required:
+                raise InvalidParamsError('Not enough params provided for %s' %
+                                         sig)
+
+    return validate
+
+
 def validate_params(method, D):
-    if type(D['params']) == Object:
-        keys = list(method.json_arg_types.keys())
-        if len(keys) != len(D['params']):
-            raise InvalidParamsError('Not enough params provided for %s' %
-                                     method.json_sig)
-        for k in keys:
-            if not k in D['params']:
-                print('\n\n\n\nSHITTER SHITTER', k, D, '\n\n\n\n')
-                raise InvalidParamsError('%s is not a valid parameter for %s' %
-                                         (k, method.json_sig))
-            if not Any.kind(D['params'][k]) == method.json_arg_types[k]:
-                raise InvalidParamsError(
-                    '%s is not the correct type %s for %s' %
-                    (type(D['params'][k]), method.json_arg_types[k],
-                     method.json_sig))
-    elif type(D['params']) == Array:
-        arg_types = list(method.json_arg_types.values())
+    compile_validator(method)(D['params'])
+
+
+def bind_params_11(params):
+    """
+    Splits JSON-RPC 1.1 params into positional and keyword arguments, numeric
+    keys of an Object are positions.
+    """
+    if type(params) is list:
+        return params, {}
+    elif not type(params) is dict:
+        return [], {}
+    pos, kw = {}, {}
+    for k, v in params.items():
+        k = str(k)
         try:
-            for i, arg in enumerate(D['params']):
-                if not Any.kind(arg) == arg_types[i]:
-                    raise InvalidParamsError(
-                        '%s is not the correct type %s for %s' %
-                        (type(arg), arg_types[i], method.json_sig))
-        except IndexError:
-            raise InvalidParamsError('Too many params provided for %s' %
-                                     method.json_sig)
+            pos[int(k)] = v
+        except ValueError:
+            kw[k] = v
+    return [pos[i] for i in sorted(pos)], kw
+
+
+def too_deep(value, max_depth):
+    """
+    Whether arrays and objects are nested more than ``max_depth`` levels
+    deep in ``value``, counting ``value`` itself as the first level
+    """
+    stack = [(value, 1)]
+    while stack:
+        value, depth = stack.pop()
+        if type(value) is dict:
+            children = value.values()
+        elif type(value) is list:
+            children = value
         else:
-            if len(D['params']) != len(arg_types):
-                raise InvalidParamsError('Not enough params provided for %s' %
-                                         method.json_sig)
+            continue
+        if depth > max_depth:
+            return True
+        stack.extend((child, depth + 1) for child in children
+                     if type(child) in (dict, list))
+    return False
+
+
+def parse_etags(header):
+    "Returns the entity tags listed in an If-None-Match header"
+    etags = []
+    for etag in header.split(','):
+        etag = etag.strip()
+        if etag.startswith('W/'):  # If-None-Match uses the weak comparison
+            etag = etag[2:]
+        if etag:
+            etags.append(etag)
+    return etags
+
+
+def system_method(func, name, doc=None, safe=False, http_cache=None):
+    """
+    Gives ``func`` the attributes `jsonrpc_method` puts on methods, for the
+    methods sites register themselves.
+    """
+    func.__doc__ = doc
+    func.json_args = []
+    func.json_arg_types = OrderedDict()
+    func.json_return_type = Any
+    func.json_method = name
+    func.json_safe = safe
+    func.json_sig = name
+    func.json_validate = False
+    func.json_async = False
+    func.json_cache = None
+    func.json_http_cache = http_cache
+    func.json_timeout = None
+    func.json_auth_args = []
+    return func
+
+
+def build_invokers(method):
+    """
+    Builds the invokers of ``method``, one per protocol version. An invoker
+    takes ``(request, params)``, validates the params if the method asks for
+    it and calls the method with them bound the way that version wants.
+    Sites build these once in `register` so calls only need a lookup.
+    """
+    validate = (compile_validator(method)
+                if getattr(method, 'json_validate', False) else None)
+    bind_11 = bind_params_11
+
+    if validate is None:
+        def invoke_10(request, params):
+            return method(request, *params)
+
+        def invoke_11(request, params):
+            args, kwargs = bind_11(params)
+            return method(request, *args, **kwargs)
+
+        def invoke_20(request, params):
+            if type(params) is dict:
+                return method(request, **encode_kw(params))
+            return method(request, *params)
+    else:
+        def invoke_10(request, params):
+            validate(params, request)
+            return method(request, *params)
 
+        def invoke_11(request, params):
+            validate(params, request)
+            args, kwargs = bind_11(params)
+            return method(request, *args, **kwargs)
 
-class JSONRPCSite(object):
+        def invoke_20(request, params):
+            validate(params, request)
+            if type(params) is dict:
+                return method(request, **encode_kw(params))
+            return method(request, *params)
+
+    return {'1.0': invoke_10, '1.1': invoke_11, '2.0': invoke_20}
+
+
+class JSONRPCSite(AsyncDispatchMixin):
     "A JSON-RPC Site"
 
-    def __init__(self, json_encoder=DjangoJSONEncoder):
+    def __init__(self, json_encoder=DjangoJSONEncoder,
+                 batch_workers=None, batch_concurrency=None,
+                 stream_batch_size=None, incremental_request_size=None,
+                 namespaces=None, compress_min_size=None, metrics=False,
+                 login=False, credential_cache=False, limits=None,
+                 max_body_size=None, max_batch_size=None,
+                 max_params_depth=None):
         self.urls = {}
+        self.invokers = {}
+        self.namespaces = {}
+        self._namespace_locks = {}  # prefix => RLock
+        self._namespace_lock = threading.Lock()  # for _namespace_locks
         self.uuid = str(uuid1())
         self.version = '1.0'
         self.name = 'django-json-rpc'
-        self.register('system.describe', self.describe)
+        self._description = None
+        self.register('system.describe', system_method(
+            lambda request, *args, **kwargs: RawJSON(
+                self.service_desc_json()),
+            'system.describe', self.describe.__doc__, safe=True,
+            http_cache={'etag': lambda request, *args, **kwargs:
+                        self.service_desc_etag()}))
         self.set_json_encoder(json_encoder)
+        self.set_batch_workers(batch_workers, batch_concurrency)
+        # batches with at least this many elements are sent with a
+        # StreamingHttpResponse, None always buffers the whole response
+        self.stream_batch_size = stream_batch_size
+        # POST bodies of at least this many bytes are parsed one batch
+        # element at a time, None always parses the whole body at once
+        self.incremental_request_size = incremental_request_size
+        # responses of at least this many bytes are compressed when the
+        # client accepts it, None never compresses them
+        self.compress_min_size = compress_min_size
+        # requests whose (decoded) body is larger than this many bytes, with
+        # more batch elements or with params nested deeper are turned away,
+        # None for no limit
+        self.max_body_size = max_body_size
+        self.max_batch_size = max_batch_size
+        self.max_params_depth = max_params_depth
+        self.metrics = None
+        if metrics:
+            self.enable_metrics(metrics)
+        # seconds the tokens of system.login are valid, None when the site
+        # does not issue tokens
+        self.token_max_age = None
+        if login:
+            self.enable_login(*([] if login is True else [login]))
+        # users recently authenticated by `authenticated` methods, see
+        # jsonrpc.auth.CredentialCache
+        if credential_cache is True:
+            from jsonrpc.auth import CredentialCache
+            credential_cache = CredentialCache()
+        self.credential_cache = credential_cache or None
+        # method or namespace name ('*' for the whole site) => Limit
+        self.limits = {}
+        self._method_limits = {}
+        for name, options in (limits or {}).items():
+            if isinstance(options, dict):
+                self.set_limit(name, **options)
+            else:
+                self.set_limit(name, options)
+        for prefix, module in (namespaces or {}).items():
+            self.add_namespace(prefix, module)
 
     def set_json_encoder(self, json_encoder=DjangoJSONEncoder):
         self.json_encoder = json_encoder
+        self.invalidate_description()
+
+    def set_batch_workers(self, batch_workers=None, batch_concurrency=None):
+        """
+        Enables parallel execution of batch requests.
+
+          batch_workers       size of the thread pool shared by every batch
+                              handled by this site, `None` or 0 runs batch
+                              elements one after another (the default)
+          batch_concurrency   maximum number of elements of a single batch
+                              that may run at the same time, defaults to
+                              `batch_workers`
+
+        Each element is dispatched with its own shallow copy of the request,
+        so attributes like `request.jsonrpc_version` or `request.user` set
+        while handling one element are not seen by the others. Keep in mind
+        that methods running in the pool get their own database connections.
+        """
+        if batch_workers and ThreadPoolExecutor is None:
+            raise ImproperlyConfigured(
+                'Parallel batches require concurrent.futures, on python 2 '
+                'install the `futures` package')
+        old_executor = getattr(self, '_batch_executor', None)
+        self.batch_workers = batch_workers or 0
+        self.batch_concurrency = batch_concurrency or self.batch_workers
+        self._batch_executor = None
+        self._batch_executor_lock = threading.Lock()
+        if old_executor is not None:
+            old_executor.shutdown(wait=False)
+
+    @property
+    def batch_executor(self):
+        "The thread pool used for parallel batches, created on first use"
+        if self._batch_executor is None and self.batch_workers:
+            with self._batch_executor_lock:
+                if self._batch_executor is None:
+                    self._batch_executor = ThreadPoolExecutor(
+                        max_workers=self.batch_workers)
+        return self._batch_executor
 
     def register(self, name, method):
-        self.urls[smart_text(name)] = method
+        name = smart_text(name)
+        self.urls[name] = method
+        self.invokers[name] = build_invokers(method)
+        self.invalidate_description()
+
+    def add_namespace(self, prefix, module):
+        """
+        Declares that the methods named ``prefix`` or ``prefix.*`` are
+        registered by the module ``module`` (a dotted path), which is only
+        imported on the first call into the namespace or the first
+        `system.describe`. The module must register its methods on this site.
+        """
+        prefix = smart_text(prefix)
+        self.namespaces[prefix] = {'module': module, 'loaded': False,
+                                   'seconds': None, 'methods': 0,
+                                   'error': None}
+        with self._namespace_lock:
+            self._namespace_locks[prefix] = threading.RLock()
+        self.invalidate_description()
+
+    def load_namespace(self, prefix):
+        """
+        Imports the module of the lazy namespace ``prefix`` unless it is.
+        Each namespace is imported under a lock of its own, a module asking
+        for its own namespace (or the description) while it is imported
+        gets what is registered so far.
+        """
+        ns = self.namespaces[prefix]
+        if ns['loaded']:
+            return
+        with self._namespace_lock:
+            lock = self._namespace_locks.setdefault(prefix,
+                                                    threading.RLock())
+        with lock:
+            if ns['loaded'] or ns.get('loading'):
+                return
+            before = len(self.urls)
+            start = time.time()
+            ns['loading'] = True
+            try:
+                import_module(ns['module'])
+            except Exception as e:
+                ns['error'] = '%s: %s' % (e.__class__.__name__, e)
+                raise
+            finally:
+                ns['seconds'] = time.time() - start
+                del ns['loading']
+            ns.update(loaded=True, methods=len(self.urls) - before,
+                      error=None)
+        self.invalidate_description()
+
+    def load_namespaces(self):
+        """
+        Imports every lazy namespace that is not loaded yet. Namespaces that
+        failed to import are left out, their error is in `namespace_report`
+        and the next call into them tries again.
+        """
+        for prefix, ns in list(self.namespaces.items()):
+            if ns['loaded'] or ns['error'] is not None:
+                continue
+            try:
+                self.load_namespace(prefix)
+            except Exception:
+                pass
+
+    def load_method(self, name):
+        """
+        Makes sure the lazy namespace the method ``name`` belongs to, if any,
+        is loaded. The longest matching prefix wins.
+        """
+        if not self.namespaces or not isinstance(name, six.string_types) \
+                or name in self.urls:
+            return
+        parts = name.split('.')
+        for i in range(len(parts), 0, -1):
+            prefix = '.'.join(parts[:i])
+            if prefix in self.namespaces:
+                self.load_namespace(prefix)
+                return
+
+    def namespace_report(self):
+        """
+        Returns how the lazy namespaces were loaded, the slowest first: for
+        each the prefix, module, whether it is loaded, the seconds its import
+        took, the number of methods it registered and the error of its last
+        failed import.
+        """
+        report = [dict(ns, namespace=prefix)
+                  for prefix, ns in self.namespaces.items()]
+        report.sort(key=lambda ns: -(ns['seconds'] or 0))
+        return report
+
+    def set_limit(self, name, max_in_flight, max_queue=None, timeout=0.25,
+                  retry_after=1):
+        """
+        Caps the number of calls of the method or namespace ``name`` (`'*'`
+        for every call to the site) running at the same time. A call beyond
+        the limit waits up to ``timeout`` seconds for a slot, in a queue of at
+        most ``max_queue`` calls (``max_in_flight`` by default), and otherwise
+        fails right away with a `ServerBusyError`: HTTP 503 and a
+        `Retry-After` of ``retry_after`` seconds. A call is held to the limit
+        of the most specific of its namespaces that has one, and to the
+        site's. Every element of a batch counts on its own. `None` for
+        ``max_in_flight`` lifts the limit.
+
+        The first limit registers `system.limits`, which reports how busy
+        each limit is.
+        """
+        name = smart_text(name)
+        if max_in_flight is None:
+            self.limits.pop(name, None)
+        else:
+            self.limits[name] = Limit(max_in_flight, max_queue, timeout,
+                                      retry_after)
+        self._method_limits = {}
+        if not 'system.limits' in self.urls:
+            self.register('system.limits', system_method(
+                lambda request: self.limits_report(), 'system.limits',
+                'Returns the occupancy of every concurrency limit of this '
+                'service'))
+
+    def limits_report(self):
+        "The occupancy of every limit, by the name it was set for"
+        return dict((name, limit.occupancy())
+                    for name, limit in self.limits.items())
+
+    def method_limit(self, name):
+        "The limit of the method ``name`` or its closest namespace, if any"
+        try:
+            return self._method_limits[name]
+        except KeyError:
+            pass
+        limit = None
+        prefix = name
+        while prefix:
+            limit = self.limits.get(prefix)
+            if limit is not None:
+                break
+            prefix = prefix.rpartition('.')[0]
+        if name in self.urls:  # only known names are remembered
+            self._method_limits[name] = limit
+        return limit
+
+    def admit(self, name, wait=True, deadline=None):
+        """
+        Takes a slot of the limits a call of the method ``name`` is held to
+        and returns them, to be released once the call is done. Raises
+        `ServerBusyError` when the call may not run now, or
+        `DeadlineExceededError` when ``deadline`` passed waiting for a slot.
+        """
+        taken = []
+        for limit in (self.method_limit(name), self.limits.get('*')):
+            if limit is None:
+                continue
+            if not limit.acquire(wait, deadlines.remaining(deadline)
+                                 if deadline is not None else None):
+                for other in taken:
+                    other.release()
+                if deadline is not None and time.time() >= deadline:
+                    raise DeadlineExceededError()
+                raise ServerBusyError(retry_after=limit.retry_after)
+            taken.append(limit)
+        return taken
+
+    def set_retry_after(self, http, response):
+        "Tells the client of a call turned away when to try again"
+        error = response.get('error') if type(response) is dict else None
+        data = error.get('data') if type(error) is dict else None
+        if type(data) is dict and data.get('retry_after') is not None:
+            http['Retry-After'] = str(int(math.ceil(data['retry_after'])))
+        return http
+
+    def set_result_cache_header(self, request, http):
+        """
+        Tells the client whether a single call was answered from the result
+        cache of its method, in an `X-JSONRPC-Cache: hit` (or `miss`) header
+        """
+        state = getattr(request, 'jsonrpc_cache', None)
+        if state is not None:
+            http['X-JSONRPC-Cache'] = state
+        return http
+
+    def enable_metrics(self, metrics=True):
+        """
+        Starts recording per-method metrics in ``metrics``, a
+        `jsonrpc.metrics.Metrics` (a new one when `True` is given), and
+        registers `system.metrics` which returns them.
+        """
+        self.metrics = metrics if isinstance(metrics, Metrics) else Metrics()
+        self.register('system.metrics', system_method(
+            lambda request: self.metrics.snapshot(), 'system.metrics',
+            'Returns the call metrics of every method of this service'))
+
+    def enable_login(self, max_age=3600, authenticate=None):
+        """
+        Registers `system.login(username, password)`, which returns a token
+        signed with your `SECRET_KEY`. For ``max_age`` seconds `authenticated`
+        methods accept it in place of the username and password, so the
+        password is only hashed once. ``authenticate`` replaces
+        `django.contrib.auth.authenticate`.
+        """
+        from jsonrpc.auth import issue_token
+        if authenticate is None:
+            from django.contrib.auth import authenticate
+
+        def login(request, username, password):
+            user = authenticate(username=username, password=password)
+            if user is None or not getattr(user, 'is_active', True):
+                raise InvalidCredentialsError
+            return {'token': issue_token(user), 'expires_in': max_age}
+
+        system_method(login, 'system.login',
+                      'Exchanges a username and password for a token '
+                      'accepted by authenticated methods')
+        login.json_args = ['username', 'password']
+        login.json_arg_types = OrderedDict([('username', String),
+                                            ('password', String)])
+        login.json_return_type = Object
+        login.json_sig = 'system.login(String, String) -> Object'
+        self.token_max_age = max_age
+        self.register('system.login', login)
+
+    def metrics_name(self, D):
+        "The name a call is counted under, `None` for unknown methods"
+        name = D.get('method') if type(D) is dict else None
+        if isinstance(name, six.string_types) and name in self.urls:
+            return name
+        return None
+
+    def metrics_view(self, request):
+        "A view answering with the site's metrics in the Prometheus format"
+        from django.http import HttpResponse
+        if self.metrics is None:
+            return HttpResponse('', status=404)
+        return HttpResponse(self.metrics.prometheus(),
+                            content_type='text/plain; version=0.0.4')
+
+    def invalidate(self, name, *args, **kwargs):
+        """
+        Drops cached results of the method ``name`` (see the `cache` argument
+        of `jsonrpc_method`): those of the call with the given params, or all
+        of them when no params are given.
+        """
+        name = smart_text(name)
+        self.load_method(name)
+        cache = getattr(self.urls[name], 'json_cache', None)
+        if cache is not None:
+            cache.invalidate(*args, **kwargs)
+
+    def cache_stats(self):
+        "Returns the hits, misses and size of every method's result cache"
+        return dict((name, M.json_cache.stats())
+                    for name, M in self.urls.items()
+                    if getattr(M, 'json_cache', None) is not None)
 
     def empty_response(self, version='1.0'):
         resp = {'id': None}
@@ -145,6 +710,7 @@ class JSONRPCSite(object):
         encode_get_params = lambda r: dict([(k, v[0] if len(v) == 1 else v) for k, v in r])
         if request.method == 'GET':
             method = smart_text(method)
+            self.load_method(method)
             if method in self.urls and getattr(self.urls[method], 'json_safe',
                                                    False):
                 D = {
@@ -161,135 +727,491 @@ class JSONRPCSite(object):
                       version_hint='1.0',
                       json_encoder=None):
         json_encoder = json_encoder or self.json_encoder
-        version = version_hint
-        response = self.empty_response(version=version)
-        apply_version = {
-            '2.0':
-            lambda f, r, p: f(r, **encode_kw(p)) if type(p) is dict else f(r, *p),
-            '1.1':
-            lambda f, r, p: f(r, *encode_arg11(p), **encode_kw(encode_kw11(p))),
-            '1.0': lambda f, r, p: f(r, *p)
-        }
+        response = self.empty_response(version=version_hint)
+        metrics = self.metrics
+        if metrics is not None:
+            started = timer()
 
         try:
-            # params: An Array or Object, that holds the actual parameter values
-            # for the invocation of the procedure. Can be omitted if empty.
-            if 'params' not in D:
-                D['params'] = []
-            if 'method' not in D or 'params' not in D:
-                raise InvalidParamsError(
-                    'Request requires str:"method" and list:"params"')
-            if D['method'] not in self.urls:
-                raise MethodNotFoundError(
-                    'Method not found. Available methods: %s' % (
-                        '\n'.join(self.urls.keys())))
-
-            if 'jsonrpc' in D:
-                if str(D['jsonrpc']) not in apply_version:
-                    raise InvalidRequestError(
-                        'JSON-RPC version %s not supported.' % D['jsonrpc'])
-                version = request.jsonrpc_version = response['jsonrpc'] = str(
-                    D['jsonrpc'])
-            elif 'version' in D:
-                if str(D['version']) not in apply_version:
-                    raise InvalidRequestError(
-                        'JSON-RPC version %s not supported.' % D['version'])
-                version = request.jsonrpc_version = response['version'] = str(
-                    D['version'])
-            else:
-                request.jsonrpc_version = '1.0'
+            method, invoke, version = self.prepare_call(request, D, response)
+            deadline = self.check_deadline(request, D, method)
+            taken = (self.admit(D['method'], deadline=deadline)
+                     if self.limits else ())
+            token = deadlines.set_deadline(deadline)
+            try:
+                R = invoke(request, D['params'])
+                if getattr(method, 'json_async', False):
+                    from jsonrpc._async import run_sync
+                    R = run_sync(R, deadlines.remaining(deadline))
+            finally:
+                deadlines.reset_deadline(token)
+                for limit in taken:
+                    limit.release()
+            # a method that finished late still did its work, its result
+            # is returned all the same
+            result = self.result_response(D, response, R, version,
+                                          json_encoder)
+            error = None
+        except Exception as e:
+            version = self.response_version(response, version_hint)
+            result = self.error_response(request, response, e,
+                                         version=version)
+            error = e.__class__.__name__
+        if metrics is not None:
+            metrics.record(self.metrics_name(D), version, timer() - started,
+                           error)
+        return result
 
-            method = self.urls[str(D['method'])]
-            if getattr(method, 'json_validate', False):
-                validate_params(method, D)
+    def response_version(self, response, version_hint='1.0'):
+        "The protocol version a (possibly half-built) response answers with"
+        return str(response.get('jsonrpc', response.get('version',
+                                                        version_hint)))
 
-            if 'id' in D and D['id'] is not None:  # regular request
-                response['id'] = D['id']
-                if version in ('1.1', '2.0') and 'error' in response:
-                    response.pop('error')
-            elif is_batch:  # notification, not ok in a batch format, but happened anyway
-                raise InvalidRequestError
+    def prepare_call(self, request, D, response):
+        """
+        Checks the request ``D`` and fills in the protocol parts of
+        ``response``. Returns the method, its invoker for the protocol
+        version of the request and that version.
+        """
+        # params: An Array or Object, that holds the actual parameter values
+        # for the invocation of the procedure. Can be omitted if empty.
+        if 'params' not in D:
+            D['params'] = []
+        if 'method' not in D or 'params' not in D:
+            raise InvalidParamsError(
+                'Request requires str:"method" and list:"params"')
+        if 'id' in D and D['id'] is not None:
+            # so errors can be matched to their call, batches need this
+            response['id'] = D['id']
+        if self.max_params_depth is not None and too_deep(
+                D['params'], self.max_params_depth):
+            raise InvalidRequestError('Params nested more than %d levels deep'
+                                      % self.max_params_depth)
+        self.load_method(D['method'])
+        if D['method'] not in self.urls:
+            raise MethodNotFoundError(
+                'Method not found. Available methods: %s' % (
+                    '\n'.join(self.urls.keys())))
+
+        version = '1.0'
+        if 'jsonrpc' in D:
+            if str(D['jsonrpc']) not in ('1.0', '1.1', '2.0'):
+                raise InvalidRequestError(
+                    'JSON-RPC version %s not supported.' % D['jsonrpc'])
+            version = request.jsonrpc_version = response['jsonrpc'] = str(
+                D['jsonrpc'])
+        elif 'version' in D:
+            if str(D['version']) not in ('1.0', '1.1', '2.0'):
+                raise InvalidRequestError(
+                    'JSON-RPC version %s not supported.' % D['version'])
+            version = request.jsonrpc_version = response['version'] = str(
+                D['version'])
+        else:
+            request.jsonrpc_version = '1.0'
 
-            R = apply_version[version](method, request, D['params'])
+        name = str(D['method'])
+        method = self.urls[name]
+        try:
+            invoke = self.invokers[name][version]
+        except KeyError:  # put in `urls` without going through `register`
+            invoke = build_invokers(method)[version]
 
-            if 'id' not in D or ('id' in D and D['id'] is None):  # notification
-                return None, 204
+        if 'id' in D and D['id'] is not None:  # regular request
+            response['id'] = D['id']
+            if version in ('1.1', '2.0') and 'error' in response:
+                response.pop('error')
 
-            if isinstance(R, tuple):
-                R = list(R)
+        return method, invoke, version
 
-            encoder = json_encoder()
-            builtin_types = (dict, list, set, NoneType, bool, six.text_type
-                       ) + six.integer_types + six.string_types
-            if all(not isinstance(R, e) for e in builtin_types):
-                try:
-                    rs = encoder.default(R)  # ...or something this thing supports
-                except TypeError as exc:
-                    raise TypeError("Return type not supported, for %r" % R)
+    def check_deadline(self, request, D, method):
+        """
+        Works out the deadline of the call ``D`` from the `timeout` of its
+        method and the timeouts the client sent, counting from the arrival of
+        the request, and puts it on ``request`` as `jsonrpc_deadline`.
+        Returns it, or `None` when the call has none. Raises
+        `DeadlineExceededError` when it passed already, so the elements of a
+        batch left waiting too long are not run at all.
+        """
+        timeouts = []
+        if getattr(method, 'json_timeout', None) is not None:
+            timeouts.append(method.json_timeout)
+        try:
+            if request.META.get(deadlines.META_KEY):
+                timeouts.append(deadlines.parse_timeout(
+                    request.META[deadlines.META_KEY]))
+            if D.get('timeout') is not None:
+                timeouts.append(deadlines.parse_timeout(D['timeout']))
+        except (TypeError, ValueError):
+            raise InvalidRequestError('Timeouts must be positive numbers')
+        if not timeouts:
+            request.jsonrpc_deadline = None
+            return None
+        started = getattr(request, 'jsonrpc_started', None) or time.time()
+        deadline = request.jsonrpc_deadline = started + min(timeouts)
+        if time.time() >= deadline:
+            raise DeadlineExceededError()
+        return deadline
 
-            response['result'] = R
+    def result_response(self, D, response, R, version, json_encoder=None):
+        "Puts the return value ``R`` of a method into ``response``"
+        if 'id' not in D or ('id' in D and D['id'] is None):  # notification
+            return None, 204
 
-            status = 200
+        if isinstance(R, tuple):
+            R = list(R)
 
-        except Error as e:
-            response['error'] = e.json_rpc_format
-            if version in ('1.1', '2.0') and 'result' in response:
-                response.pop('result')
-            status = e.status
-        except Exception as e:
+        if not isinstance(R, BUILTIN_TYPES):
+            encoder = (json_encoder or self.json_encoder)()
+            try:
+                rs = encoder.default(R)  # ...or something this thing supports
+            except TypeError as exc:
+                raise TypeError("Return type not supported, for %r" % R)
+
+        response['result'] = R
+
+        # Exactly one of result or error MUST be specified. It's not
+        # allowed to specify both or none.
+        if version in ('1.1', '2.0'
+                   ) and 'error' in response and not response['error']:
+            response.pop('error')
+
+        return response, 200
+
+    def error_response(self, request, response, e, version='1.0'):
+        "Puts the exception ``e`` raised while handling a call into ``response``"
+        if isinstance(e, Error):
+            error = e
+        else:
             # exception missed by others
             signals.got_request_exception.send(sender=self.__class__,
                                                request=request)
 
             # Put stacktrace into the OtherError only if DEBUG is enabled
             if settings.DEBUG:
-                other_error = OtherError(e)
+                error = OtherError(e)
             else:
-                other_error = OtherError("Internal Server Error")
+                error = OtherError("Internal Server Error")
 
-            response['error'] = other_error.json_rpc_format
-            status = other_error.status
-            if version in ('1.1', '2.0') and 'result' in response:
-                response.pop('result')
+        # tracebacks are only formatted into responses in DEBUG, and can be
+        # left out there too with the JSONRPC_DEBUG_STACKS setting
+        response['error'] = error.json_rpc_error(
+            stack=settings.DEBUG and getattr(settings, 'JSONRPC_DEBUG_STACKS',
+                                             True))
+        if version in ('1.1', '2.0') and 'result' in response:
+            response.pop('result')
 
-        # Exactly one of result or error MUST be specified. It's not
-        # allowed to specify both or none.
-        if version in ('1.1', '2.0'
-                   ) and 'error' in response and not response['error']:
-            response.pop('error')
+        return response, error.status
 
-        return response, status
+    def not_modified(self, request, etag=None, last_modified=None):
+        """
+        Whether the conditional headers of ``request`` match the given
+        quoted ``etag`` or ``last_modified`` timestamp.
+        """
+        from django.utils.http import parse_http_date_safe
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            return etag is not None and ('*' in etags or etag in etags)
+        if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+        if if_modified_since and last_modified is not None:
+            since = parse_http_date_safe(if_modified_since)
+            return since is not None and int(last_modified) <= since
+        return False
 
-    @csrf_exempt
-    def dispatch(self, request, method='', json_encoder=None):
-        from django.http import HttpResponse
-        json_encoder = json_encoder or self.json_encoder
+    def set_cache_headers(self, response, policy, etag=None,
+                          last_modified=None):
+        from django.utils.cache import patch_cache_control
+        from django.utils.http import http_date
+        directives = dict((k, v) for k, v in policy.items()
+                          if k not in ('etag', 'last_modified'))
+        if directives:
+            patch_cache_control(response, **directives)
+        if etag is not None:
+            response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
 
+    def conditional_response(self, request, D, json_encoder=None):
+        """
+        Answers a GET call of a method with an `http_cache` policy. The
+        method's cheap `etag` and `last_modified` validators are consulted
+        first so an unchanged result does not even have to be computed,
+        otherwise the ETag is a digest of the response body. Either way a
+        request whose `If-None-Match` or `If-Modified-Since` matches gets an
+        empty 304.
+        """
+        from django.http import HttpResponse, HttpResponseNotModified
+        from django.utils.http import quote_etag
+        policy = self.urls[D['method']].json_http_cache
+        args, kwargs = bind_params_11(D['params'])
+        etag = last_modified = None
         try:
-            # in case we do something json doesn't like, we always get back valid json-rpc response
-            response = self.empty_response()
-            if request.method.lower() == 'get':
-                valid, D = self.validate_get(request, method)
-                if not valid:
-                    raise InvalidRequestError(
-                        'The method you are trying to access is '
-                        'not available by GET requests')
-            elif not request.method.lower() == 'post':
-                raise RequestPostError
+            if policy.get('etag'):
+                etag = quote_etag(policy['etag'](request, *args, **kwargs))
+            if policy.get('last_modified'):
+                last_modified = calendar.timegm(policy['last_modified'](
+                    request, *args, **kwargs).utctimetuple())
+        except Exception:
+            # let the method itself run into whatever is wrong
+            etag = last_modified = None
+        if (etag is not None or last_modified is not None) and \
+                self.not_modified(request, etag, last_modified):
+            return self.set_cache_headers(HttpResponseNotModified(), policy,
+                                          etag, last_modified)
+
+        response, status = self.response_dict(request, D,
+                                              json_encoder=json_encoder)
+        json_rpc = encode_response(response,
+                                   cls=json_encoder or self.json_encoder)
+        http = self.set_result_cache_header(request, HttpResponse(
+            json_rpc, status=status, content_type='application/json-rpc'))
+        if status != 200:
+            return self.set_retry_after(http, response)
+        if etag is None:
+            etag = '"%s"' % hashlib.sha1(json_rpc).hexdigest()
+        if self.not_modified(request, etag, last_modified):
+            http = self.set_result_cache_header(request,
+                                                HttpResponseNotModified())
+        return self.set_cache_headers(http, policy, etag, last_modified)
+
+    def iter_batch(self, request, batch, json_encoder=None):
+        """
+        Yields the response of every element of ``batch`` in request order,
+        `None` for notifications. ``batch`` may be any iterable, elements
+        are only taken from it as they are dispatched.
+
+        When parallel batches are enabled up to `batch_concurrency` elements
+        are submitted to the thread pool ahead of the one being yielded.
+        Every element gets its own shallow copy of ``request``.
+        """
+        from jsonrpc.auth import BatchCredentials
+        request.jsonrpc_batch_credentials = BatchCredentials()
+        executor = (self.batch_executor
+                    if not isinstance(batch, list) or len(batch) > 1 else None)
+        if executor is None:
+            for D in batch:
+                yield self.response_dict(copy.copy(request), D,
+                                         is_batch=True,
+                                         json_encoder=json_encoder)[0]
+            return
+
+        def run(D):
+            return call_pooled(self.response_dict, copy.copy(request), D,
+                               is_batch=True, json_encoder=json_encoder)[0]
+
+        pending = deque()
+        elements = iter(batch)
+        for D in elements:
+            pending.append(executor.submit(run, D))
+            if len(pending) >= self.batch_concurrency:
+                break
+        while pending:
+            # response_dict never raises, every failure ends up as an error
+            # response for its own element
+            response = pending.popleft().result()
+            for D in elements:
+                pending.append(executor.submit(run, D))
+                break
+            yield response
+
+    def load_request(self, request, method=''):
+        "Returns the decoded JSON-RPC request (or batch) carried by ``request``"
+        if request.method.lower() == 'get':
+            valid, D = self.validate_get(request, method)
+            if not valid:
+                raise InvalidRequestError(
+                    'The method you are trying to access is '
+                    'not available by GET requests')
+        elif not request.method.lower() == 'post':
+            raise RequestPostError
+        else:
+            encoding = request.META.get('HTTP_CONTENT_ENCODING')
+            if not _compress.supported(
+                    encoding, bounded=self.max_body_size is not None):
+                raise InvalidRequestError(
+                    'Unsupported Content-Encoding %s' % encoding)
+            self.check_content_length(request)
+            if self.parses_incrementally(request):
+                D = self.load_incremental(request)
             else:
                 try:
                     if hasattr(request, "body"):
-                        D = loads(request.body.decode('utf-8'))
+                        body = request.body
                     else:
-                        D = loads(request.raw_post_data.decode('utf-8'))
+                        body = request.raw_post_data
+                    D = loads(_compress.decompress(body, encoding,
+                                                   self.max_body_size))
+                except _compress.TooLarge:
+                    raise self.body_too_large()
                 except:
                     raise InvalidRequestError
+                if self.max_batch_size is not None and type(D) is list and \
+                        len(D) > self.max_batch_size:
+                    raise self.batch_too_large()
+        return D
+
+    def check_content_length(self, request):
+        "Turns ``request`` away if it announces a body over `max_body_size`"
+        if self.max_body_size is None:
+            return
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            raise InvalidRequestError('Invalid Content-Length')
+        if length > self.max_body_size:
+            raise self.body_too_large()
+
+    def body_too_large(self):
+        return InvalidRequestError('Request body larger than %d bytes' %
+                                   self.max_body_size)
+
+    def batch_too_large(self):
+        return InvalidRequestError('Batch of more than %d elements' %
+                                   self.max_batch_size)
+
+    def parses_incrementally(self, request):
+        "Whether the body of ``request`` is parsed one batch element at a time"
+        if self.incremental_request_size is None or hasattr(request, '_body'):
+            return False  # disabled, or somebody has read the body already
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return False
+        return length >= self.incremental_request_size
 
-            if type(D) is list:
-                response = [self.response_dict(request, d,
-                                               is_batch=True,
-                                               json_encoder=json_encoder)[0]
-                            for d in D]
+    def load_incremental(self, request):
+        """
+        Returns a lazy batch (an iterable of elements) when the body of
+        ``request`` is a JSON array. Any other body is read and decoded as
+        usual.
+        """
+        try:
+            read = _compress.decompressing_reader(
+                request.read, request.META.get('HTTP_CONTENT_ENCODING'))
+            if self.max_body_size is not None:
+                read = _compress.limited_reader(read, self.max_body_size)
+            head = read(8 * 1024)
+            while head and len(head) < 8 * 1024 and not head.strip():
+                head += read(8 * 1024)
+        except _compress.TooLarge:
+            raise self.body_too_large()
+        except Exception:  # a broken compressed body
+            raise InvalidRequestError
+        if head.lstrip()[:1] != b'[':
+            try:
+                rest = []
+                while True:
+                    data = read(64 * 1024)
+                    if not data:
+                        break
+                    rest.append(data)
+                return loads(head + b''.join(rest))
+            except _compress.TooLarge:
+                raise self.body_too_large()
+            except:
+                raise InvalidRequestError
+        return self.iter_elements(ArrayStream(read, head))
+
+    def iter_elements(self, stream):
+        """
+        Yields the elements of ``stream``, turning parse errors into ours.
+        Going over `max_body_size` or `max_batch_size` half way through
+        fails the rest of the batch, the elements read so far have been
+        dispatched already.
+        """
+        count = 0
+        try:
+            for D in stream:
+                count += 1
+                if self.max_batch_size is not None and \
+                        count > self.max_batch_size:
+                    raise self.batch_too_large()
+                yield D
+        except _compress.TooLarge:
+            raise self.body_too_large()
+        except (ValueError, zlib.error):
+            raise InvalidRequestError
+
+    def is_batch_request(self, D):
+        "Whether the decoded request ``D`` is a batch"
+        return type(D) is list or isinstance(D, types.GeneratorType)
+
+    def iter_batch_json(self, request, batch, json_encoder=None):
+        """
+        Yields the JSON array of responses to ``batch`` piece by piece, each
+        element is serialized as soon as it has been handled. An element that
+        can not be serialized is replaced by its error response.
+        """
+        json_encoder = json_encoder or self.json_encoder
+        yield b'['
+        first = True
+        responses = self.iter_batch(request, batch, json_encoder=json_encoder)
+        while True:
+            try:
+                response = next(responses)
+            except StopIteration:
+                break
+            except Exception as e:
+                # the rest of a lazily parsed batch is broken, the status
+                # line is gone already so all we can do is report it here
+                response, status = self.error_response(
+                    request, self.empty_response(), e)
+                responses = iter(())
+            if response is None:
+                continue
+            try:
+                data = encode_response(response, cls=json_encoder)
+            except Exception as e:
+                response['result'] = None
+                response, status = self.error_response(
+                    request, response, e,
+                    version=self.response_version(response))
+                data = encode_response(response, cls=json_encoder)
+            yield data if first else b',' + data
+            first = False
+        yield b']'
+
+    def streams_batch(self, batch):
+        "Whether the response to ``batch`` is streamed"
+        if self.stream_batch_size is None:
+            return False
+        # lazily parsed batches come from large bodies
+        return (not isinstance(batch, list) or
+                len(batch) >= self.stream_batch_size)
+
+    @csrf_exempt
+    def dispatch(self, request, method='', json_encoder=None):
+        from django.http import HttpResponse
+        json_encoder = json_encoder or self.json_encoder
+        request.jsonrpc_started = time.time()
+
+        try:
+            # in case we do something json doesn't like, we always get back valid json-rpc response
+            D = self.load_request(request, method)
+
+            if request.method.lower() == 'get' and getattr(
+                    self.urls[D['method']], 'json_http_cache', None) is not None:
+                return self.compress_response(
+                    request, self.conditional_response(
+                        request, D, json_encoder=json_encoder))
+
+            if self.is_batch_request(D) and self.streams_batch(D):
+                try:
+                    from django.http import StreamingHttpResponse
+                except ImportError:  # Django < 1.5
+                    pass
+                else:
+                    return StreamingHttpResponse(
+                        self.iter_batch_json(request, D,
+                                             json_encoder=json_encoder),
+                        content_type='application/json-rpc')
+
+            if self.is_batch_request(D):
+                response = [R for R in self.iter_batch(
+                    request, D, json_encoder=json_encoder) if R is not None]
+                if not response:  # nothing but notifications
+                    return HttpResponse('', status=204)
                 status = 200
             else:
                 response, status = self.response_dict(
@@ -298,55 +1220,120 @@ class JSONRPCSite(object):
                 if response is None and (not 'id' in D or D['id'] is None):  # a notification
                     return HttpResponse('', status=status)
 
-            json_rpc = dumps(response, cls=json_encoder)
-        except Error as e:
-            response['error'] = e.json_rpc_format
-            status = e.status
-            json_rpc = dumps(response, cls=json_encoder)
+            json_rpc = encode_response(response, cls=json_encoder)
+            if self.metrics is not None and not self.is_batch_request(D):
+                self.record_sizes(request, D, response, json_rpc)
         except Exception as e:
-            # exception missed by others
-            signals.got_request_exception.send(sender=self.__class__,
-                                               request=request)
+            response, status = self.error_response(request,
+                                                   self.empty_response(), e)
+            json_rpc = encode_response(response, cls=json_encoder)
 
-            # Put stacktrace into the OtherError only if DEBUG is enabled
-            if settings.DEBUG:
-                other_error = OtherError(e)
-            else:
-                other_error = OtherError("Internal Server Error")
-
-            response['result'] = None
-            response['error'] = other_error.json_rpc_format
-            status = other_error.status
+        http = HttpResponse(json_rpc, status=status,
+                            content_type='application/json-rpc')
+        if status == 503:
+            self.set_retry_after(http, response)
+        self.set_result_cache_header(request, http)
+        return self.compress_response(request, http)
 
-            json_rpc = dumps(response, cls=json_encoder)
+    def record_sizes(self, request, D, response, body):
+        if request.method.lower() == 'get':
+            size = len(request.META.get('QUERY_STRING', ''))
+        else:
+            try:
+                size = int(request.META.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                size = 0
+        self.metrics.record_sizes(self.metrics_name(D),
+                                  self.response_version(response), size,
+                                  len(body))
 
-        return HttpResponse(json_rpc,
-                            status=status,
-                            content_type='application/json-rpc')
+    def compress_response(self, request, response):
+        """
+        Compresses the body of ``response`` with the best content coding
+        ``request`` accepts, when it has at least `compress_min_size` bytes.
+        """
+        if self.compress_min_size is None or getattr(response, 'streaming',
+                                                     False):
+            return response
+        from django.utils.cache import patch_vary_headers
+        patch_vary_headers(response, ('Accept-Encoding', ))
+        if len(response.content) < self.compress_min_size or \
+                response.has_header('Content-Encoding'):
+            return response
+        encoding = _compress.choose_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING'))
+        if encoding is None:
+            return response
+        response.content = _compress.compress(response.content, encoding)
+        response['Content-Encoding'] = encoding
+        if response.has_header('Content-Length'):
+            response['Content-Length'] = str(len(response.content))
+        etag = response.get('ETag')
+        if etag and not etag.startswith('W/'):
+            # the bytes differ from the uncompressed ones
+            response['ETag'] = 'W/' + etag
+        return response
 
     def procedure_desc(self, key):
         M = self.urls[key]
+        # a session or a token may stand in for the credentials
+        auth_args = getattr(M, 'json_auth_args', None) or ()
         return {
             'name': M.json_method,
             'summary': trim_docstring(M.__doc__),
             'idempotent': M.json_safe,
-            'params': [{'type': str(Any.kind(t)),
+            'params': [{'type': str(Any.kind(base_type(t))),
+                        'sig': type_name(t),
+                        'optional': isinstance(t, Optional) or
+                        k in auth_args,
                         'name': k} for k, t in M.json_arg_types.items()],
-            'return': {'type': str(M.json_return_type)}
+            'return': {'type': str(M.json_return_type),
+                       'sig': type_name(M.json_return_type)}
         }
 
     def service_desc(self):
-        return {
-            'sdversion': '1.0',
-            'name': self.name,
-            'id': 'urn:uuid:%s' % str(self.uuid),
-            'summary': trim_docstring(self.__doc__),
-            'version': self.version,
-            'procs': [self.procedure_desc(k) for k in self.urls.keys()
-                      if self.urls[k] != self.describe]
-        }
+        return self.description_snapshot()[0]
+
+    def description_snapshot(self):
+        """
+        The service description, serialized and its ETag, as one
+        `(desc, data, etag)` tuple. Read them from one snapshot: `register`
+        and lazy namespaces may drop the cached one any time.
+        """
+        self.load_namespaces()
+        description = self._description
+        if description is None:
+            desc = {
+                'sdversion': '1.0',
+                'name': self.name,
+                'id': 'urn:uuid:%s' % str(self.uuid),
+                'summary': trim_docstring(self.__doc__),
+                'version': self.version,
+                'procs': [self.procedure_desc(k) for k in self.urls.keys()
+                          if k != 'system.describe']
+            }
+            data = dumps_bytes(desc, cls=self.json_encoder)
+            description = (desc, data, hashlib.sha1(data).hexdigest())
+            self._description = description
+        return description
+
+    def service_desc_json(self):
+        "The service description, serialized"
+        return self.description_snapshot()[1]
+
+    def service_desc_etag(self):
+        "An ETag value that changes whenever the service description does"
+        return self.description_snapshot()[2]
+
+    def invalidate_description(self):
+        """
+        Forgets the cached service description. `register` calls this, call
+        it yourself when changing the site's name or version afterwards.
+        """
+        self._description = None
 
     def describe(self, request):
+        "Describes the methods of this service"
         return self.service_desc()
 
 
@@ -0,0 +1,7300 @@
+/***
+
+    MochiKit.MochiKit 1.5 : PACKED VERSION
+
+    THIS FILE IS AUTOMATICALLY GENERATED.  If creating patches, please
+    diff against the source tree, not this file.
+
+    See <http://mochikit.com/> for documentation, downloads, license, etc.
+
+    (c) 2005 Bob Ippolito.  All rights Reserved.
+
+***/
+
+if(typeof (MochiKit)=="undefined"){
+MochiKit={};
+}
+if(typeof (MochiKit.__export__)=="undefined"){
+MochiKit.__export__=true;
+}
+if(typeof (MochiKit.Base)=="undefined"){
+MochiKit.Base={};
+}
+MochiKit.Base._module=function(_1,_2,_3){
+if(!(_1 in MochiKit)){
+MochiKit[_1]={};
+}
+var _4=MochiKit[_1];
+_4.NAME="MochiKit."+_1;
+_4.VERSION=_2;
+_4.__repr__=function(){
+return "["+this.NAME+" "+this.VERSION+"]";
+};
+_4.toString=function(){
+return this.__repr__();
+};
+for(var i=0;i<_3.length;i++){
+if(!(_3[i] in MochiKit)){
+throw "MochiKit."+_1+" depends on MochiKit."+_3[i]+"!";
+}
+}
+};
+MochiKit.Base._module("Base","1.5",[]);
+MochiKit.Base.update=function(_6,_7){
+if(_6===null||_6===undefined){
+_6={};
+}
+for(var i=1;i<arguments.length;i++){
+var o=arguments[i];
+if(typeof (o)!="undefined"&&o!==null){
+for(var k in o){
+_6[k]=o[k];
+}
+}
+}
+return _6;
+};
+MochiKit.Base.update(MochiKit.Base,{camelize:function(_b){
+var _c=_b.split("-");
+var cc=_c[0];
+for(var i=1;i<_c.length;i++){
+cc+=_c[i].charAt(0).toUpperCase()+_c[i].substring(1);
+}
+return cc;
+},counter:function(n){
+if(arguments.length===0){
+n=1;
+}
+return function(){
+return n++;
+};
+},clone:function(obj){
+var me=arguments.callee;
+if(arguments.length==1){
+me.prototype=obj;
+return new me();
+}
+},_flattenArray:function(res,lst){
+for(var i=0;i<lst.length;i++){
+var o=lst[i];
+if(o instanceof Array){
+arguments.callee(res,o);
+}else{
+res.push(o);
+}
+}
+return res;
+},flattenArray:function(lst){
+return MochiKit.Base._flattenArray([],lst);
+},flattenArguments:function(lst){
+var res=[];
+var m=MochiKit.Base;
+var _1a=m.extend(null,arguments);
+while(_1a.length){
+var o=_1a.shift();
+if(o&&typeof (o)=="object"&&typeof (o.length)=="number"){
+for(var i=o.length-1;i>=0;i--){
+_1a.unshift(o[i]);
+}
+}else{
+res.push(o);
+}
+}
+return res;
+},extend:function(_1d,obj,_1f){
+if(!_1f){
+_1f=0;
+}
+if(obj){
+var l=obj.length;
+if(typeof (l)!="number"){
+if(typeof (MochiKit.Iter)!="undefined"){
+obj=MochiKit.Iter.list(obj);
+l=obj.length;
+}else{
+throw new TypeError("Argument not an array-like and MochiKit.Iter not present");
+}
+}
+if(!_1d){
+_1d=[];
+}
+for(var i=_1f;i<l;i++){
+_1d.push(obj[i]);
+}
+}
+return _1d;
+},updatetree:function(_22,obj){
+if(_22===null||_22===undefined){
+_22={};
+}
+for(var i=1;i<arguments.length;i++){
+var o=arguments[i];
+if(typeof (o)!="undefined"&&o!==null){
+for(var k in o){
+var v=o[k];
+if(typeof (_22[k])=="object"&&typeof (v)=="object"){
+arguments.callee(_22[k],v);
+}else{
+_22[k]=v;
+}
+}
+}
+}
+return _22;
+},setdefault:function(_28,obj){
+if(_28===null||_28===undefined){
+_28={};
+}
+for(var i=1;i<arguments.length;i++){
+var o=arguments[i];
+for(var k in o){
+if(!(k in _28)){
+_28[k]=o[k];
+}
+}
+}
+return _28;
+},keys:function(obj){
+var _2e=[];
+for(var _2f in obj){
+_2e.push(_2f);
+}
+return _2e;
+},values:function(obj){
+var _31=[];
+for(var _32 in obj){
+_31.push(obj[_32]);
+}
+return _31;
+},items:function(obj){
+var _34=[];
+var e;
+for(var _36 in obj){
+var v;
+try{
+v=obj[_36];
+}
+catch(e){
+continue;
+}
+_34.push([_36,v]);
+}
+return _34;
+},_newNamedError:function(_38,_39,_3a){
+_3a.prototype=new MochiKit.Base.NamedError(_38.NAME+"."+_39);
+_38[_39]=_3a;
+},operator:{truth:function(a){
+return !!a;
+},lognot:function(a){
+return !a;
+},identity:function(a){
+return a;
+},not:function(a){
+return ~a;
+},neg:function(a){
+return -a;
+},add:function(a,b){
+return a+b;
+},sub:function(a,b){
+return a-b;
+},div:function(a,b){
+return a/b;
+},mod:function(a,b){
+return a%b;
+},mul:function(a,b){
+return a*b;
+},and:function(a,b){
+return a&b;
+},or:function(a,b){
+return a|b;
+},xor:function(a,b){
+return a^b;
+},lshift:function(a,b){
+return a<<b;
+},rshift:function(a,b){
+return a>>b;
+},zrshift:function(a,b){
+return a>>>b;
+},eq:function(a,b){
+return a==b;
+},ne:function(a,b){
+return a!=b;
+},gt:function(a,b){
+return a>b;
+},ge:function(a,b){
+return a>=b;
+},lt:function(a,b){
+return a<b;
+},le:function(a,b){
+return a<=b;
+},seq:function(a,b){
+return a===b;
+},sne:function(a,b){
+return a!==b;
+},ceq:function(a,b){
+return MochiKit.Base.compare(a,b)===0;
+},cne:function(a,b){
+return MochiKit.Base.compare(a,b)!==0;
+},cgt:function(a,b){
+return MochiKit.Base.compare(a,b)==1;
+},cge:function(a,b){
+return MochiKit.Base.compare(a,b)!=-1;
+},clt:function(a,b){
+return MochiKit.Base.compare(a,b)==-1;
+},cle:function(a,b){
+return MochiKit.Base.compare(a,b)!=1;
+},logand:function(a,b){
+return a&&b;
+},logor:function(a,b){
+return a||b;
+},contains:function(a,b){
+return b in a;
+}},forwardCall:function(_78){
+return function(){
+return this[_78].apply(this,arguments);
+};
+},itemgetter:function(_79){
+return function(arg){
+return arg[_79];
+};
+},bool:function(_7b){
+if(typeof (_7b)==="boolean"||_7b instanceof Boolean){
+return _7b.valueOf();
+}else{
+if(typeof (_7b)==="string"||_7b instanceof String){
+return _7b.length>0&&_7b!="false"&&_7b!="null"&&_7b!="undefined"&&_7b!="0";
+}else{
+if(typeof (_7b)==="number"||_7b instanceof Number){
+return !isNaN(_7b)&&_7b!=0;
+}else{
+if(_7b!=null&&typeof (_7b.length)==="number"){
+return _7b.length!==0;
+}else{
+return _7b!=null;
+}
+}
+}
+}
+},typeMatcher:function(){
+var _7c={};
+for(var i=0;i<arguments.length;i++){
+var typ=arguments[i];
+_7c[typ]=typ;
+}
+return function(){
+for(var i=0;i<arguments.length;i++){
+if(!(typeof (arguments[i]) in _7c)){
+return false;
+}
+}
+return true;
+};
+},isNull:function(){
+for(var i=0;i<arguments.length;i++){
+if(arguments[i]!==null){
+return false;
+}
+}
+return true;
+},isUndefinedOrNull:function(){
+for(var i=0;i<arguments.length;i++){
+var o=arguments[i];
+if(!(typeof (o)=="undefined"||o===null)){
+return false;
+}
+}
+return true;
+},isEmpty:function(obj){
+return !MochiKit.Base.isNotEmpty.apply(this,arguments);
+},isNotEmpty:function(obj){
+for(var i=0;i<arguments.length;i++){
+var o=arguments[i];
+if(!(o&&o.length)){
+return false;
+}
+}
+return true;
+},isArrayLike:function(){
+for(var i=0;i<arguments.length;i++){
+var o=arguments[i];
+var typ=typeof (o);
+if((typ!="object"&&!(typ=="function"&&typeof (o.item)=="function"))||o===null||typeof (o.length)!="number"||o.nodeType===3||o.nodeType===4){
+return false;
+}
+}
+return true;
+},isDateLike:function(){
+for(var i=0;i<arguments.length;i++){
+var o=arguments[i];
+if(typeof (o)!="object"||o===null||typeof (o.getTime)!="function"){
+return false;
+}
+}
+return true;
+},xmap:function(fn){
+if(fn===null){
+return MochiKit.Base.extend(null,arguments,1);
+}
+var _8d=[];
+for(var i=1;i<arguments.length;i++){
+_8d.push(fn(arguments[i]));
+}
+return _8d;
+},map:function(fn,lst){
+var m=MochiKit.Base;
+var itr=MochiKit.Iter;
+var _93=m.isArrayLike;
+if(arguments.length<=2){
+if(!_93(lst)){
+if(itr){
+lst=itr.list(lst);
+if(fn===null){
+return lst;
+}
+}else{
+throw new TypeError("Argument not an array-like and MochiKit.Iter not present");
+}
+}
+if(fn===null){
+return m.extend(null,lst);
+}
+var _94=[];
+for(var i=0;i<lst.length;i++){
+_94.push(fn(lst[i]));
+}
+return _94;
+}else{
+if(fn===null){
+fn=Array;
+}
+var _96=null;
+for(var i=1;i<arguments.length;i++){
+if(!_93(arguments[i])){
+if(itr){
+return itr.list(itr.imap.apply(null,arguments));
+}else{
+throw new TypeError("Argument not an array-like and MochiKit.Iter not present");
+}
+}
+var l=arguments[i].length;
+if(_96===null||_96>l){
+_96=l;
+}
+}
+_94=[];
+for(var i=0;i<_96;i++){
+var _98=[];
+for(var j=1;j<arguments.length;j++){
+_98.push(arguments[j][i]);
+}
+_94.push(fn.apply(this,_98));
+}
+return _94;
+}
+},xfilter:function(fn){
+var _9b=[];
+if(fn===null){
+fn=MochiKit.Base.operator.truth;
+}
+for(var i=1;i<arguments.length;i++){
+var o=arguments[i];
+if(fn(o)){
+_9b.push(o);
+}
+}
+return _9b;
+},filter:function(fn,lst,_a0){
+var _a1=[];
+var m=MochiKit.Base;
+if(!m.isArrayLike(lst)){
+if(MochiKit.Iter){
+lst=MochiKit.Iter.list(lst);
+}else{
+throw new TypeError("Argument not an array-like and MochiKit.Iter not present");
+}
+}
+if(fn===null){
+fn=m.operator.truth;
+}
+if(typeof (Array.prototype.filter)=="function"){
+return Array.prototype.filter.call(lst,fn,_a0);
+}else{
+if(typeof (_a0)=="undefined"||_a0===null){
+for(var i=0;i<lst.length;i++){
+var o=lst[i];
+if(fn(o)){
+_a1.push(o);
+}
+}
+}else{
+for(var i=0;i<lst.length;i++){
+o=lst[i];
+if(fn.call(_a0,o)){
+_a1.push(o);
+}
+}
+}
+}
+return _a1;
+},_wrapDumbFunction:function(_a5){
+return function(){
+switch(arguments.length){
+case 0:
+return _a5();
+case 1:
+return _a5(arguments[0]);
+case 2:
+return _a5(arguments[0],arguments[1]);
+case 3:
+return _a5(arguments[0],arguments[1],arguments[2]);
+}
+var _a6=[];
+for(var i=0;i<arguments.length;i++){
+_a6.push("arguments["+i+"]");
+}
+return eval("(func("+_a6.join(",")+"))");
+};
+},methodcaller:function(_a8){
+var _a9=MochiKit.Base.extend(null,arguments,1);
+if(typeof (_a8)=="function"){
+return function(obj){
+return _a8.apply(obj,_a9);
+};
+}else{
+return function(obj){
+return obj[_a8].apply(obj,_a9);
+};
+}
+},method:function(_ac,_ad){
+var m=MochiKit.Base;
+return m.bind.apply(this,m.extend([_ad,_ac],arguments,2));
+},compose:function(f1,f2){
+var _b1=[];
+var m=MochiKit.Base;
+if(arguments.length===0){
+throw new TypeError("compose() requires at least one argument");
+}
+for(var i=0;i<arguments.length;i++){
+var fn=arguments[i];
+if(typeof (fn)!="function"){
+throw new TypeError(m.repr(fn)+" is not a function");
+}
+_b1.push(fn);
+}
+return function(){
+var _b5=arguments;
+for(var i=_b1.length-1;i>=0;i--){
+_b5=[_b1[i].apply(this,_b5)];
+}
+return _b5[0];
+};
+},bind:function(_b7,_b8){
+if(typeof (_b7)=="string"){
+_b7=_b8[_b7];
+}
+var _b9=_b7.im_func;
+var _ba=_b7.im_preargs;
+var _bb=_b7.im_self;
+var m=MochiKit.Base;
+if(typeof (_b7)=="function"&&typeof (_b7.apply)=="undefined"){
+_b7=m._wrapDumbFunction(_b7);
+}
+if(typeof (_b9)!="function"){
+_b9=_b7;
+}
+if(typeof (_b8)!="undefined"){
+_bb=_b8;
+}
+if(typeof (_ba)=="undefined"){
+_ba=[];
+}else{
+_ba=_ba.slice();
+}
+m.extend(_ba,arguments,2);
+var _bd=function(){
+var _be=arguments;
+var me=arguments.callee;
+if(me.im_preargs.length>0){
+_be=m.concat(me.im_preargs,_be);
+}
+var _c0=me.im_self;
+if(!_c0){
+_c0=this;
+}
+return me.im_func.apply(_c0,_be);
+};
+_bd.im_self=_bb;
+_bd.im_func=_b9;
+_bd.im_preargs=_ba;
+return _bd;
+},bindLate:function(_c1,_c2){
+var m=MochiKit.Base;
+var _c4=arguments;
+if(typeof (_c1)==="string"){
+_c4=m.extend([m.forwardCall(_c1)],arguments,1);
+return m.bind.apply(this,_c4);
+}
+return m.bind.apply(this,_c4);
+},bindMethods:function(_c5){
+var _c6=MochiKit.Base.bind;
+for(var k in _c5){
+var _c8=_c5[k];
+if(typeof (_c8)=="function"){
+_c5[k]=_c6(_c8,_c5);
+}
+}
+},registerComparator:function(_c9,_ca,_cb,_cc){
+MochiKit.Base.comparatorRegistry.register(_c9,_ca,_cb,_cc);
+},_primitives:{"boolean":true,"string":true,"number":true},compare:function(a,b){
+if(a==b){
+return 0;
+}
+var _cf=(typeof (a)=="undefined"||a===null);
+var _d0=(typeof (b)=="undefined"||b===null);
+if(_cf&&_d0){
+return 0;
+}else{
+if(_cf){
+return -1;
+}else{
+if(_d0){
+return 1;
+}
+}
+}
+var m=MochiKit.Base;
+var _d2=m._primitives;
+if(!(typeof (a) in _d2&&typeof (b) in _d2)){
+try{
+return m.comparatorRegistry.match(a,b);
+}
+catch(e){
+if(e!=m.NotFound){
+throw e;
+}
+}
+}
+if(a<b){
+return -1;
+}else{
+if(a>b){
+return 1;
+}
+}
+var _d3=m.repr;
+throw new TypeError(_d3(a)+" and "+_d3(b)+" can not be compared");
+},compareDateLike:function(a,b){
+return MochiKit.Base.compare(a.getTime(),b.getTime());
+},compareArrayLike:function(a,b){
+var _d8=MochiKit.Base.compare;
+var _d9=a.length;
+var _da=0;
+if(_d9>b.length){
+_da=1;
+_d9=b.length;
+}else{
+if(_d9<b.length){
+_da=-1;
+}
+}
+for(var i=0;i<_d9;i++){
+var cmp=_d8(a[i],b[i]);
+if(cmp){
+return cmp;
+}
+}
+return _da;
+},registerRepr:function(_dd,_de,_df,_e0){
+MochiKit.Base.reprRegistry.register(_dd,_de,_df,_e0);
+},repr:function(o){
+if(typeof (o)=="undefined"){
+return "undefined";
+}else{
+if(o===null){
+return "null";
+}
+}
+try{
+if(typeof (o.__repr__)=="function"){
+return o.__repr__();
+}else{
+if(typeof (o.repr)=="function"&&o.repr!=arguments.callee){
+return o.repr();
+}
+}
+return MochiKit.Base.reprRegistry.match(o);
+}
+catch(e){
+try{
+if(typeof (o.NAME)=="string"&&(o.toString==Function.prototype.toString||o.toString==Object.prototype.toString)){
+return o.NAME;
+}
+}
+catch(ignore){
+}
+}
+try{
+var _e2=(o+"");
+}
+catch(e){
+return "["+typeof (o)+"]";
+}
+if(typeof (o)=="function"){
+_e2=_e2.replace(/^\s+/,"").replace(/\s+/g," ");
+_e2=_e2.replace(/,(\S)/,", $1");
+var idx=_e2.indexOf("{");
+if(idx!=-1){
+_e2=_e2.substr(0,idx)+"{...}";
+}
+}
+return _e2;
+},reprArrayLike:function(o){
+var m=MochiKit.Base;
+return "["+m.map(m.repr,o).join(", ")+"]";
+},reprString:function(o){
+return ("\""+o.replace(/(["\\])/g,"\\$1")+"\"").replace(/[\f]/g,"\\f").replace(/[\b]/g,"\\b").replace(/[\n]/g,"\\n").replace(/[\t]/g,"\\t").replace(/[\v]/g,"\\v").replace(/[\r]/g,"\\r");
+},reprNumber:function(o){
+return o+"";
+},registerJSON:function(_e8,_e9,_ea,_eb){
+MochiKit.Base.jsonRegistry.register(_e8,_e9,_ea,_eb);
+},evalJSON:function(){
+return eval("("+MochiKit.Base._filterJSON(arguments[0])+")");
+},_filterJSON:function(s){
+var m=s.match(/^\s*\/\*(.*)\*\/\s*$/);
+if(m){
+return m[1];
+}
+return s;
+},serializeJSON:function(o){
+var _ef=typeof (o);
+if(_ef=="number"||_ef=="boolean"){
+return o+"";
+}else{
+if(o===null){
+return "null";
+}else{
+if(_ef=="string"){
+var res="";
+for(var i=0;i<o.length;i++){
+var c=o.charAt(i);
+if(c=="\""){
+res+="\\\"";
+}else{
+if(c=="\\"){
+res+="\\\\";
+}else{
+if(c=="\b"){
+res+="\\b";
+}else{
+if(c=="\f"){
+res+="\\f";
+}else{
+if(c=="\n"){
+res+="\\n";
+}else{
+if(c=="\r"){
+res+="\\r";
+}else{
+if(c=="\t"){
+res+="\\t";
+}else{
+if(o.charCodeAt(i)<=31){
+var hex=o.charCodeAt(i).toString(16);
+if(hex.length<2){
+hex="0"+hex;
+}
+res+="\\u00"+hex.toUpperCase();
+}else{
+res+=c;
+}
+}
+}
+}
+}
+}
+}
+}
+}
+return "\""+res+"\"";
+}
+}
+}
+var me=arguments.callee;
+var _f5;
+if(typeof (o.__json__)=="function"){
+_f5=o.__json__();
+if(o!==_f5){
+return me(_f5);
+}
+}
+if(typeof (o.json)=="function"){
+_f5=o.json();
+if(o!==_f5){
+return me(_f5);
+}
+}
+if(_ef!="function"&&typeof (o.length)=="number"){
+var res=[];
+for(var i=0;i<o.length;i++){
+var val=me(o[i]);
+if(typeof (val)!="string"){
+continue;
+}
+res.push(val);
+}
+return "["+res.join(", ")+"]";
+}
+var m=MochiKit.Base;
+try{
+_f5=m.jsonRegistry.match(o);
+if(o!==_f5){
+return me(_f5);
+}
+}
+catch(e){
+if(e!=m.NotFound){
+throw e;
+}
+}
+if(_ef=="undefined"){
+throw new TypeError("undefined can not be serialized as JSON");
+}
+if(_ef=="function"){
+return null;
+}
+res=[];
+for(var k in o){
+var _f9;
+if(typeof (k)=="number"){
+_f9="\""+k+"\"";
+}else{
+if(typeof (k)=="string"){
+_f9=me(k);
+}else{
+continue;
+}
+}
+val=me(o[k]);
+if(typeof (val)!="string"){
+continue;
+}
+res.push(_f9+":"+val);
+}
+return "{"+res.join(", ")+"}";
+},objEqual:function(a,b){
+return (MochiKit.Base.compare(a,b)===0);
+},arrayEqual:function(_fc,arr){
+if(_fc.length!=arr.length){
+return false;
+}
+return (MochiKit.Base.compare(_fc,arr)===0);
+},concat:function(){
+var _fe=[];
+var _ff=MochiKit.Base.extend;
+for(var i=0;i<arguments.length;i++){
+_ff(_fe,arguments[i]);
+}
+return _fe;
+},keyComparator:function(key){
+var m=MochiKit.Base;
+var _103=m.compare;
+if(arguments.length==1){
+return function(a,b){
+return _103(a[key],b[key]);
+};
+}
+var _106=m.extend(null,arguments);
+return function(a,b){
+var rval=0;
+for(var i=0;(rval===0)&&(i<_106.length);i++){
+var key=_106[i];
+rval=_103(a[key],b[key]);
+}
+return rval;
+};
+},reverseKeyComparator:function(key){
+var _10d=MochiKit.Base.keyComparator.apply(this,arguments);
+return function(a,b){
+return _10d(b,a);
+};
+},partial:function(func){
+var m=MochiKit.Base;
+return m.bind.apply(this,m.extend([func,undefined],arguments,1));
+},listMinMax:function(_112,lst){
+if(lst.length===0){
+return null;
+}
+var cur=lst[0];
+var _115=MochiKit.Base.compare;
+for(var i=1;i<lst.length;i++){
+var o=lst[i];
+if(_115(o,cur)==_112){
+cur=o;
+}
+}
+return cur;
+},objMax:function(){
+return MochiKit.Base.listMinMax(1,arguments);
+},objMin:function(){
+return MochiKit.Base.listMinMax(-1,arguments);
+},findIdentical:function(lst,_119,_11a,end){
+if(typeof (end)=="undefined"||end===null){
+end=lst.length;
+}
+if(typeof (_11a)=="undefined"||_11a===null){
+_11a=0;
+}
+for(var i=_11a;i<end;i++){
+if(lst[i]===_119){
+return i;
+}
+}
+return -1;
+},mean:function(){
+var sum=0;
+var m=MochiKit.Base;
+var args=m.extend(null,arguments);
+var _120=args.length;
+while(args.length){
+var o=args.shift();
+if(o&&typeof (o)=="object"&&typeof (o.length)=="number"){
+_120+=o.length-1;
+for(var i=o.length-1;i>=0;i--){
+sum+=o[i];
+}
+}else{
+sum+=o;
+}
+}
+if(_120<=0){
+throw new TypeError("mean() requires at least one argument");
+}
+return sum/_120;
+},median:function(){
+var data=MochiKit.Base.flattenArguments(arguments);
+if(data.length===0){
+throw new TypeError("median() requires at least one argument");
+}
+data.sort(compare);
+if(data.length%2==0){
+var _124=data.length/2;
+return (data[_124]+data[_124-1])/2;
+}else{
+return data[(data.length-1)/2];
+}
+},findValue:function(lst,_126,_127,end){
+if(typeof (end)=="undefined"||end===null){
+end=lst.length;
+}
+if(typeof (_127)=="undefined"||_127===null){
+_127=0;
+}
+var cmp=MochiKit.Base.compare;
+for(var i=_127;i<end;i++){
+if(cmp(lst[i],_126)===0){
+return i;
+}
+}
+return -1;
+},nodeWalk:function(node,_12c){
+var _12d=[node];
+var _12e=MochiKit.Base.extend;
+while(_12d.length){
+var res=_12c(_12d.shift());
+if(res){
+_12e(_12d,res);
+}
+}
+},nameFunctions:function(_130){
+var base=_130.NAME;
+if(typeof (base)=="undefined"){
+base="";
+}else{
+base=base+".";
+}
+for(var name in _130){
+var o=_130[name];
+if(typeof (o)=="function"&&typeof (o.NAME)=="undefined"){
+try{
+o.NAME=base+name;
+}
+catch(e){
+}
+}
+}
+},queryString:function(_134,_135){
+if(typeof (MochiKit.DOM)!="undefined"&&arguments.length==1&&(typeof (_134)=="string"||(typeof (_134.nodeType)!="undefined"&&_134.nodeType>0))){
+var kv=MochiKit.DOM.formContents(_134);
+_134=kv[0];
+_135=kv[1];
+}else{
+if(arguments.length==1){
+if(typeof (_134.length)=="number"&&_134.length==2){
+return arguments.callee(_134[0],_134[1]);
+}
+var o=_134;
+_134=[];
+_135=[];
+for(var k in o){
+var v=o[k];
+if(typeof (v)=="function"){
+continue;
+}else{
+if(MochiKit.Base.isArrayLike(v)){
+for(var i=0;i<v.length;i++){
+_134.push(k);
+_135.push(v[i]);
+}
+}else{
+_134.push(k);
+_135.push(v);
+}
+}
+}
+}
+}
+var rval=[];
+var len=Math.min(_134.length,_135.length);
+var _13d=MochiKit.Base.urlEncode;
+for(var i=0;i<len;i++){
+v=_135[i];
+if(typeof (v)!="undefined"&&v!==null){
+rval.push(_13d(_134[i])+"="+_13d(v));
+}
+}
+return rval.join("&");
+},parseQueryString:function(_13e,_13f){
+var qstr=(_13e.charAt(0)=="?")?_13e.substring(1):_13e;
+var _141=qstr.replace(/\+/g,"%20").split(/\&amp\;|\&\#38\;|\&#x26;|\&/);
+var o={};
+var _143;
+if(typeof (decodeURIComponent)!="undefined"){
+_143=decodeURIComponent;
+}else{
+_143=unescape;
+}
+if(_13f){
+for(var i=0;i<_141.length;i++){
+var pair=_141[i].split("=");
+var name=_143(pair.shift());
+if(!name){
+continue;
+}
+var arr=o[name];
+if(!(arr instanceof Array)){
+arr=[];
+o[name]=arr;
+}
+arr.push(_143(pair.join("=")));
+}
+}else{
+for(var i=0;i<_141.length;i++){
+pair=_141[i].split("=");
+var name=pair.shift();
+if(!name){
+continue;
+}
+o[_143(name)]=_143(pair.join("="));
+}
+}
+return o;
+}});
+MochiKit.Base.AdapterRegistry=function(){
+this.pairs=[];
+};
+MochiKit.Base.AdapterRegistry.prototype={register:function(name,_149,wrap,_14b){
+if(_14b){
+this.pairs.unshift([name,_149,wrap]);
+}else{
+this.pairs.push([name,_149,wrap]);
+}
+},match:function(){
+for(var i=0;i<this.pairs.length;i++){
+var pair=this.pairs[i];
+if(pair[1].apply(this,arguments)){
+return pair[2].apply(this,arguments);
+}
+}
+throw MochiKit.Base.NotFound;
+},unregister:function(name){
+for(var i=0;i<this.pairs.length;i++){
+var pair=this.pairs[i];
+if(pair[0]==name){
+this.pairs.splice(i,1);
+return true;
+}
+}
+return false;
+}};
+MochiKit.Base._exportSymbols=function(_151,_152){
+if(MochiKit.__export__===false||_152.__export__===false){
+return;
+}
+for(var k in _152){
+var v=_152[k];
+if(v!=null){
+var _155=(k[0]!=="_"&&k!=="toString");
+if(v.__export__===true||(v.__export__!==false&&_155)){
+_151[k]=_152[k];
+}
+}
+}
+};
+MochiKit.Base._deprecated=function(_156,name,_158,_159,_15a){
+if(typeof (_156)==="string"){
+if(_156.indexOf("MochiKit.")===0){
+_156=_156.substring(9);
+}
+_156=MochiKit[_156];
+}
+var _15b=_158.split(".")[1];
+var _15c=_158.split(".")[2];
+var func=function(){
+var self=arguments.callee;
+var msg=_156.NAME+"."+name+" is deprecated since version "+_159+". Use "+_158+" instead.";
+if(self.logged!==true){
+self.logged=true;
+if(MochiKit.Logging){
+MochiKit.Logging.logDebug(msg);
+}else{
+if(console&&console.log){
+console.log(msg);
+}
+}
+}
+if(!MochiKit[_15b]){
+throw new Error(msg);
+}
+return MochiKit[_15b][_15c].apply(this,arguments);
+};
+func.__export__=(_15a===true);
+_156[name]=func;
+};
+MochiKit.Base.__new__=function(){
+var m=this;
+m.noop=m.operator.identity;
+m._deprecated(m,"forward","MochiKit.Base.forwardCall","1.3");
+m._deprecated(m,"find","MochiKit.Base.findValue","1.3");
+if(typeof (encodeURIComponent)!="undefined"){
+m.urlEncode=function(_161){
+return encodeURIComponent(_161).replace(/\'/g,"%27");
+};
+}else{
+m.urlEncode=function(_162){
+return escape(_162).replace(/\+/g,"%2B").replace(/\"/g,"%22").rval.replace(/\'/g,"%27");
+};
+}
+m.NamedError=function(name){
+this.message=name;
+this.name=name;
+};
+m.NamedError.prototype=new Error();
+m.update(m.NamedError.prototype,{repr:function(){
+if(this.message&&this.message!=this.name){
+return this.name+"("+m.repr(this.message)+")";
+}else{
+return this.name+"()";
+}
+},toString:m.forwardCall("repr")});
+m.NotFound=new m.NamedError("MochiKit.Base.NotFound");
+m.listMax=m.partial(m.listMinMax,1);
+m.listMin=m.partial(m.listMinMax,-1);
+m.isCallable=m.typeMatcher("function");
+m.isUndefined=m.typeMatcher("undefined");
+m.merge=m.partial(m.update,null);
+m.zip=m.partial(m.map,null);
+m.average=m.mean;
+m.comparatorRegistry=new m.AdapterRegistry();
+m.registerComparator("dateLike",m.isDateLike,m.compareDateLike);
+m.registerComparator("arrayLike",m.isArrayLike,m.compareArrayLike);
+m.reprRegistry=new m.AdapterRegistry();
+m.registerRepr("arrayLike",m.isArrayLike,m.reprArrayLike);
+m.registerRepr("string",m.typeMatcher("string"),m.reprString);
+m.registerRepr("numbers",m.typeMatcher("number","boolean"),m.reprNumber);
+m.jsonRegistry=new m.AdapterRegistry();
+m.nameFunctions(this);
+};
+MochiKit.Base.__new__();
+if(MochiKit.__export__){
+compare=MochiKit.Base.compare;
+compose=MochiKit.Base.compose;
+serializeJSON=MochiKit.Base.serializeJSON;
+mean=MochiKit.Base.mean;
+median=MochiKit.Base.median;
+}
+MochiKit.Base._exportSymbols(this,MochiKit.Base);
+MochiKit.Base._module("Iter","1.5",["Base"]);
+MochiKit.Base.update(MochiKit.Iter,{registerIteratorFactory:function(name,_165,_166,_167){
+MochiKit.Iter.iteratorRegistry.register(name,_165,_166,_167);
+},isIterable:function(o){
+return o!=null&&(typeof (o.next)=="function"||typeof (o.iter)=="function");
+},iter:function(_169,_16a){
+var self=MochiKit.Iter;
+if(arguments.length==2){
+return self.takewhile(function(a){
+return a!=_16a;
+},_169);
+}
+if(typeof (_169.next)=="function"){
+return _169;
+}else{
+if(typeof (_169.iter)=="function"){
+return _169.iter();
+}
+}
+try{
+return self.iteratorRegistry.match(_169);
+}
+catch(e){
+var m=MochiKit.Base;
+if(e==m.NotFound){
+e=new TypeError(typeof (_169)+": "+m.repr(_169)+" is not iterable");
+}
+throw e;
+}
+},count:function(n){
+if(!n){
+n=0;
+}
+var m=MochiKit.Base;
+return {repr:function(){
+return "count("+n+")";
+},toString:m.forwardCall("repr"),next:m.counter(n)};
+},cycle:function(p){
+var self=MochiKit.Iter;
+var m=MochiKit.Base;
+var lst=[];
+var _174=self.iter(p);
+return {repr:function(){
+return "cycle(...)";
+},toString:m.forwardCall("repr"),next:function(){
+try{
+var rval=_174.next();
+lst.push(rval);
+return rval;
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+if(lst.length===0){
+this.next=function(){
+throw self.StopIteration;
+};
+}else{
+var i=-1;
+this.next=function(){
+i=(i+1)%lst.length;
+return lst[i];
+};
+}
+return this.next();
+}
+}};
+},repeat:function(elem,n){
+var m=MochiKit.Base;
+if(typeof (n)=="undefined"){
+return {repr:function(){
+return "repeat("+m.repr(elem)+")";
+},toString:m.forwardCall("repr"),next:function(){
+return elem;
+}};
+}
+return {repr:function(){
+return "repeat("+m.repr(elem)+", "+n+")";
+},toString:m.forwardCall("repr"),next:function(){
+if(n<=0){
+throw MochiKit.Iter.StopIteration;
+}
+n-=1;
+return elem;
+}};
+},next:function(_17a){
+return _17a.next();
+},izip:function(p,q){
+var m=MochiKit.Base;
+var self=MochiKit.Iter;
+var next=self.next;
+var _180=m.map(self.iter,arguments);
+return {repr:function(){
+return "izip(...)";
+},toString:m.forwardCall("repr"),next:function(){
+return m.map(next,_180);
+}};
+},ifilter:function(pred,seq){
+var m=MochiKit.Base;
+seq=MochiKit.Iter.iter(seq);
+if(pred===null){
+pred=m.operator.truth;
+}
+return {repr:function(){
+return "ifilter(...)";
+},toString:m.forwardCall("repr"),next:function(){
+while(true){
+var rval=seq.next();
+if(pred(rval)){
+return rval;
+}
+}
+return undefined;
+}};
+},ifilterfalse:function(pred,seq){
+var m=MochiKit.Base;
+seq=MochiKit.Iter.iter(seq);
+if(pred===null){
+pred=m.operator.truth;
+}
+return {repr:function(){
+return "ifilterfalse(...)";
+},toString:m.forwardCall("repr"),next:function(){
+while(true){
+var rval=seq.next();
+if(!pred(rval)){
+return rval;
+}
+}
+return undefined;
+}};
+},islice:function(seq){
+var self=MochiKit.Iter;
+var m=MochiKit.Base;
+seq=self.iter(seq);
+var _18c=0;
+var stop=0;
+var step=1;
+var i=-1;
+if(arguments.length==2){
+stop=arguments[1];
+}else{
+if(arguments.length==3){
+_18c=arguments[1];
+stop=arguments[2];
+}else{
+_18c=arguments[1];
+stop=arguments[2];
+step=arguments[3];
+}
+}
+return {repr:function(){
+return "islice("+["...",_18c,stop,step].join(", ")+")";
+},toString:m.forwardCall("repr"),next:function(){
+var rval;
+while(i<_18c){
+rval=seq.next();
+i++;
+}
+if(_18c>=stop){
+throw self.StopIteration;
+}
+_18c+=step;
+return rval;
+}};
+},imap:function(fun,p,q){
+var m=MochiKit.Base;
+var self=MochiKit.Iter;
+var _196=m.map(self.iter,m.extend(null,arguments,1));
+var map=m.map;
+var next=self.next;
+return {repr:function(){
+return "imap(...)";
+},toString:m.forwardCall("repr"),next:function(){
+return fun.apply(this,map(next,_196));
+}};
+},applymap:function(fun,seq,self){
+seq=MochiKit.Iter.iter(seq);
+var m=MochiKit.Base;
+return {repr:function(){
+return "applymap(...)";
+},toString:m.forwardCall("repr"),next:function(){
+return fun.apply(self,seq.next());
+}};
+},chain:function(p,q){
+var self=MochiKit.Iter;
+var m=MochiKit.Base;
+if(arguments.length==1){
+return self.iter(arguments[0]);
+}
+var _1a1=m.map(self.iter,arguments);
+return {repr:function(){
+return "chain(...)";
+},toString:m.forwardCall("repr"),next:function(){
+while(_1a1.length>1){
+try{
+var _1a2=_1a1[0].next();
+return _1a2;
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+_1a1.shift();
+var _1a2=_1a1[0].next();
+return _1a2;
+}
+}
+if(_1a1.length==1){
+var arg=_1a1.shift();
+this.next=m.bind("next",arg);
+return this.next();
+}
+throw self.StopIteration;
+}};
+},takewhile:function(pred,seq){
+var self=MochiKit.Iter;
+seq=self.iter(seq);
+return {repr:function(){
+return "takewhile(...)";
+},toString:MochiKit.Base.forwardCall("repr"),next:function(){
+var rval=seq.next();
+if(!pred(rval)){
+this.next=function(){
+throw self.StopIteration;
+};
+this.next();
+}
+return rval;
+}};
+},dropwhile:function(pred,seq){
+seq=MochiKit.Iter.iter(seq);
+var m=MochiKit.Base;
+var bind=m.bind;
+return {"repr":function(){
+return "dropwhile(...)";
+},"toString":m.forwardCall("repr"),"next":function(){
+while(true){
+var rval=seq.next();
+if(!pred(rval)){
+break;
+}
+}
+this.next=bind("next",seq);
+return rval;
+}};
+},_tee:function(_1ad,sync,_1af){
+sync.pos[_1ad]=-1;
+var m=MochiKit.Base;
+var _1b1=m.listMin;
+return {repr:function(){
+return "tee("+_1ad+", ...)";
+},toString:m.forwardCall("repr"),next:function(){
+var rval;
+var i=sync.pos[_1ad];
+if(i==sync.max){
+rval=_1af.next();
+sync.deque.push(rval);
+sync.max+=1;
+sync.pos[_1ad]+=1;
+}else{
+rval=sync.deque[i-sync.min];
+sync.pos[_1ad]+=1;
+if(i==sync.min&&_1b1(sync.pos)!=sync.min){
+sync.min+=1;
+sync.deque.shift();
+}
+}
+return rval;
+}};
+},tee:function(_1b4,n){
+var rval=[];
+var sync={"pos":[],"deque":[],"max":-1,"min":-1};
+if(arguments.length==1||typeof (n)=="undefined"||n===null){
+n=2;
+}
+var self=MochiKit.Iter;
+_1b4=self.iter(_1b4);
+var _tee=self._tee;
+for(var i=0;i<n;i++){
+rval.push(_tee(i,sync,_1b4));
+}
+return rval;
+},list:function(_1bb){
+var rval;
+if(_1bb instanceof Array){
+return _1bb.slice();
+}
+if(typeof (_1bb)=="function"&&!(_1bb instanceof Function)&&typeof (_1bb.length)=="number"){
+rval=[];
+for(var i=0;i<_1bb.length;i++){
+rval.push(_1bb[i]);
+}
+return rval;
+}
+var self=MochiKit.Iter;
+_1bb=self.iter(_1bb);
+var rval=[];
+var _1bf;
+try{
+while(true){
+_1bf=_1bb.next();
+rval.push(_1bf);
+}
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+return rval;
+}
+return undefined;
+},reduce:function(fn,_1c1,_1c2){
+var i=0;
+var x=_1c2;
+var self=MochiKit.Iter;
+_1c1=self.iter(_1c1);
+if(arguments.length<3){
+try{
+x=_1c1.next();
+}
+catch(e){
+if(e==self.StopIteration){
+e=new TypeError("reduce() of empty sequence with no initial value");
+}
+throw e;
+}
+i++;
+}
+try{
+while(true){
+x=fn(x,_1c1.next());
+}
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+}
+return x;
+},range:function(){
+var _1c6=0;
+var stop=0;
+var step=1;
+if(arguments.length==1){
+stop=arguments[0];
+}else{
+if(arguments.length==2){
+_1c6=arguments[0];
+stop=arguments[1];
+}else{
+if(arguments.length==3){
+_1c6=arguments[0];
+stop=arguments[1];
+step=arguments[2];
+}else{
+throw new TypeError("range() takes 1, 2, or 3 arguments!");
+}
+}
+}
+if(step===0){
+throw new TypeError("range() step must not be 0");
+}
+return {next:function(){
+if((step>0&&_1c6>=stop)||(step<0&&_1c6<=stop)){
+throw MochiKit.Iter.StopIteration;
+}
+var rval=_1c6;
+_1c6+=step;
+return rval;
+},repr:function(){
+return "range("+[_1c6,stop,step].join(", ")+")";
+},toString:MochiKit.Base.forwardCall("repr")};
+},sum:function(_1ca,_1cb){
+if(typeof (_1cb)=="undefined"||_1cb===null){
+_1cb=0;
+}
+var x=_1cb;
+var self=MochiKit.Iter;
+_1ca=self.iter(_1ca);
+try{
+while(true){
+x+=_1ca.next();
+}
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+}
+return x;
+},exhaust:function(_1ce){
+var self=MochiKit.Iter;
+_1ce=self.iter(_1ce);
+try{
+while(true){
+_1ce.next();
+}
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+}
+},forEach:function(_1d0,func,obj){
+var m=MochiKit.Base;
+var self=MochiKit.Iter;
+if(arguments.length>2){
+func=m.bind(func,obj);
+}
+if(m.isArrayLike(_1d0)&&!self.isIterable(_1d0)){
+try{
+for(var i=0;i<_1d0.length;i++){
+func(_1d0[i]);
+}
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+}
+}else{
+self.exhaust(self.imap(func,_1d0));
+}
+},every:function(_1d6,func){
+var self=MochiKit.Iter;
+try{
+self.ifilterfalse(func,_1d6).next();
+return false;
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+return true;
+}
+},sorted:function(_1d9,cmp){
+var rval=MochiKit.Iter.list(_1d9);
+if(arguments.length==1){
+cmp=MochiKit.Base.compare;
+}
+rval.sort(cmp);
+return rval;
+},reversed:function(_1dc){
+var rval=MochiKit.Iter.list(_1dc);
+rval.reverse();
+return rval;
+},some:function(_1de,func){
+var self=MochiKit.Iter;
+try{
+self.ifilter(func,_1de).next();
+return true;
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+return false;
+}
+},iextend:function(lst,_1e2){
+var m=MochiKit.Base;
+var self=MochiKit.Iter;
+if(m.isArrayLike(_1e2)&&!self.isIterable(_1e2)){
+for(var i=0;i<_1e2.length;i++){
+lst.push(_1e2[i]);
+}
+}else{
+_1e2=self.iter(_1e2);
+try{
+while(true){
+lst.push(_1e2.next());
+}
+}
+catch(e){
+if(e!=self.StopIteration){
+throw e;
+}
+}
+}
+return lst;
+},groupby:function(_1e6,_1e7){
+var m=MochiKit.Base;
+var self=MochiKit.Iter;
+if(arguments.length<2){
+_1e7=m.operator.identity;
+}
+_1e6=self.iter(_1e6);
+var pk=undefined;
+var k=undefined;
+var v;
+function fetch(){
+v=_1e6.next();
+k=_1e7(v);
+}
+function eat(){
+var ret=v;
+v=undefined;
+return ret;
+}
+var _1ee=true;
+var _1ef=m.compare;
+return {repr:function(){
+return "groupby(...)";
+},next:function(){
+while(_1ef(k,pk)===0){
+fetch();
+if(_1ee){
+_1ee=false;
+break;
+}
+}
+pk=k;
+return [k,{next:function(){
+if(v==undefined){
+fetch();
+}
+if(_1ef(k,pk)!==0){
+throw self.StopIteration;
+}
+return eat();
+}}];
+}};
+},groupby_as_array:function(_1f0,_1f1){
+var m=MochiKit.Base;
+var self=MochiKit.Iter;
+if(arguments.length<2){
+_1f1=m.operator.identity;
+}
+_1f0=self.iter(_1f0);
+var _1f4=[];
+var _1f5=true;
+var _1f6;
+var _1f7=m.compare;
+while(true){
+try{
+var _1f8=_1f0.next();
+var key=_1f1(_1f8);
+}
+catch(e){
+if(e==self.StopIteration){
+break;
+}
+throw e;
+}
+if(_1f5||_1f7(key,_1f6)!==0){
+var _1fa=[];
+_1f4.push([key,_1fa]);
+}
+_1fa.push(_1f8);
+_1f5=false;
+_1f6=key;
+}
+return _1f4;
+},arrayLikeIter:function(_1fb){
+var i=0;
+return {repr:function(){
+return "arrayLikeIter(...)";
+},toString:MochiKit.Base.forwardCall("repr"),next:function(){
+if(i>=_1fb.length){
+throw MochiKit.Iter.StopIteration;
+}
+return _1fb[i++];
+}};
+},hasIterateNext:function(_1fd){
+return (_1fd&&typeof (_1fd.iterateNext)=="function");
+},iterateNextIter:function(_1fe){
+return {repr:function(){
+return "iterateNextIter(...)";
+},toString:MochiKit.Base.forwardCall("repr"),next:function(){
+var rval=_1fe.iterateNext();
+if(rval===null||rval===undefined){
+throw MochiKit.Iter.StopIteration;
+}
+return rval;
+}};
+}});
+MochiKit.Iter.__new__=function(){
+var m=MochiKit.Base;
+if(typeof (StopIteration)!="undefined"){
+this.StopIteration=StopIteration;
+}else{
+this.StopIteration=new m.NamedError("StopIteration");
+}
+this.iteratorRegistry=new m.AdapterRegistry();
+this.registerIteratorFactory("arrayLike",m.isArrayLike,this.arrayLikeIter);
+this.registerIteratorFactory("iterateNext",this.hasIterateNext,this.iterateNextIter);
+m.nameFunctions(this);
+};
+MochiKit.Iter.__new__();
+if(MochiKit.__export__){
+reduce=MochiKit.Iter.reduce;
+}
+MochiKit.Base._exportSymbols(this,MochiKit.Iter);
+MochiKit.Base._module("Logging","1.5",["Base"]);
+MochiKit.Logging.LogMessage=function(num,_202,info){
+this.num=num;
+this.level=_202;
+this.info=info;
+this.timestamp=new Date();
+};
+MochiKit.Logging.LogMessage.prototype={repr:function(){
+var m=MochiKit.Base;
+return "LogMessage("+m.map(m.repr,[this.num,this.level,this.info]).join(", ")+")";
+},toString:MochiKit.Base.forwardCall("repr")};
+MochiKit.Base.update(MochiKit.Logging,{logLevelAtLeast:function(_205){
+var self=MochiKit.Logging;
+if(typeof (_205)=="string"){
+_205=self.LogLevel[_205];
+}
+return function(msg){
+var _208=msg.level;
+if(typeof (_208)=="string"){
+_208=self.LogLevel[_208];
+}
+return _208>=_205;
+};
+},isLogMessage:function(){
+var _209=MochiKit.Logging.LogMessage;
+for(var i=0;i<arguments.length;i++){
+if(!(arguments[i] instanceof _209)){
+return false;
+}
+}
+return true;
+},compareLogMessage:function(a,b){
+return MochiKit.Base.compare([a.level,a.info],[b.level,b.info]);
+},alertListener:function(msg){
+alert("num: "+msg.num+"\nlevel: "+msg.level+"\ninfo: "+msg.info.join(" "));
+}});
+MochiKit.Logging.Logger=function(_20e){
+this.counter=0;
+if(typeof (_20e)=="undefined"||_20e===null){
+_20e=-1;
+}
+this.maxSize=_20e;
+this._messages=[];
+this.listeners={};
+this.useNativeConsole=false;
+};
+MochiKit.Logging.Logger.prototype={clear:function(){
+this._messages.splice(0,this._messages.length);
+},logToConsole:function(msg){
+if(typeof (window)!="undefined"&&window.console&&window.console.log){
+window.console.log(msg.replace(/%/g,"\uff05"));
+}else{
+if(typeof (opera)!="undefined"&&opera.postError){
+opera.postError(msg);
+}else{
+if(typeof (Debug)!="undefined"&&Debug.writeln){
+Debug.writeln(msg);
+}else{
+if(typeof (debug)!="undefined"&&debug.trace){
+debug.trace(msg);
+}
+}
+}
+}
+},dispatchListeners:function(msg){
+for(var k in this.listeners){
+var pair=this.listeners[k];
+if(pair.ident!=k||(pair[0]&&!pair[0](msg))){
+continue;
+}
+pair[1](msg);
+}
+},addListener:function(_213,_214,_215){
+if(typeof (_214)=="string"){
+_214=MochiKit.Logging.logLevelAtLeast(_214);
+}
+var _216=[_214,_215];
+_216.ident=_213;
+this.listeners[_213]=_216;
+},removeListener:function(_217){
+delete this.listeners[_217];
+},baseLog:function(_218,_219){
+if(typeof (_218)=="number"){
+if(_218>=MochiKit.Logging.LogLevel.FATAL){
+_218="FATAL";
+}else{
+if(_218>=MochiKit.Logging.LogLevel.ERROR){
+_218="ERROR";
+}else{
+if(_218>=MochiKit.Logging.LogLevel.WARNING){
+_218="WARNING";
+}else{
+if(_218>=MochiKit.Logging.LogLevel.INFO){
+_218="INFO";
+}else{
+_218="DEBUG";
+}
+}
+}
+}
+}
+var msg=new MochiKit.Logging.LogMessage(this.counter,_218,MochiKit.Base.extend(null,arguments,1));
+this._messages.push(msg);
+this.dispatchListeners(msg);
+if(this.useNativeConsole){
+this.logToConsole(msg.level+": "+msg.info.join(" "));
+}
+this.counter+=1;
+while(this.maxSize>=0&&this._messages.length>this.maxSize){
+this._messages.shift();
+}
+},getMessages:function(_21b){
+var _21c=0;
+if(!(typeof (_21b)=="undefined"||_21b===null)){
+_21c=Math.max(0,this._messages.length-_21b);
+}
+return this._messages.slice(_21c);
+},getMessageText:function(_21d){
+if(typeof (_21d)=="undefined"||_21d===null){
+_21d=30;
+}
+var _21e=this.getMessages(_21d);
+if(_21e.length){
+var lst=MochiKit.Base.map(function(m){
+return "\n  ["+m.num+"] "+m.level+": "+m.info.join(" ");
+},_21e);
+lst.unshift("LAST "+_21e.length+" MESSAGES:");
+return lst.join("");
+}
+return "";
+},debuggingBookmarklet:function(_221){
+if(typeof (MochiKit.LoggingPane)=="undefined"){
+alert(this.getMessageText());
+}else{
+MochiKit.LoggingPane.createLoggingPane(_221||false);
+}
+}};
+MochiKit.Logging.__new__=function(){
+this.LogLevel={ERROR:40,FATAL:50,WARNING:30,INFO:20,DEBUG:10};
+var m=MochiKit.Base;
+m.registerComparator("LogMessage",this.isLogMessage,this.compareLogMessage);
+var _223=m.partial;
+var _224=this.Logger;
+var _225=_224.prototype.baseLog;
+m.update(this.Logger.prototype,{debug:_223(_225,"DEBUG"),log:_223(_225,"INFO"),error:_223(_225,"ERROR"),fatal:_223(_225,"FATAL"),warning:_223(_225,"WARNING")});
+var self=this;
+var _227=function(name){
+return function(){
+self.logger[name].apply(self.logger,arguments);
+};
+};
+this.log=_227("log");
+this.logError=_227("error");
+this.logDebug=_227("debug");
+this.logFatal=_227("fatal");
+this.logWarning=_227("warning");
+this.logger=new _224();
+this.logger.useNativeConsole=true;
+m.nameFunctions(this);
+};
+MochiKit.Logging.__new__();
+MochiKit.Base._exportSymbols(this,MochiKit.Logging);
+MochiKit.Base._module("DateTime","1.5",["Base"]);
+MochiKit.DateTime.isoDate=function(str){
+str=str+"";
+if(typeof (str)!="string"||str.length===0){
+return null;
+}
+var iso=str.split("-");
+if(iso.length===0){
+return null;
+}
+var date=new Date(iso[0],iso[1]-1,iso[2]);
+date.setFullYear(iso[0]);
+date.setMonth(iso[1]-1);
+date.setDate(iso[2]);
+return date;
+};
+MochiKit.DateTime._isoRegexp=/(\d{4,})(?:-(\d{1,2})(?:-(\d{1,2})(?:[T ](\d{1,2}):(\d{1,2})(?::(\d{1,2})(?:\.(\d+))?)?(?:(Z)|([+-])(\d{1,2})(?::(\d{1,2}))?)?)?)?)?/;
+MochiKit.DateTime.isoTimestamp=function(str){
+str=str+"";
+if(typeof (str)!="string"||str.length===0){
+return null;
+}
+var res=str.match(MochiKit.DateTime._isoRegexp);
+if(typeof (res)=="undefined"||res===null){
+return null;
+}
+var year,_22f,day,hour,min,sec,msec;
+year=parseInt(res[1],10);
+if(typeof (res[2])=="undefined"||res[2]===""){
+return new Date(year);
+}
+_22f=parseInt(res[2],10)-1;
+day=parseInt(res[3],10);
+if(typeof (res[4])=="undefined"||res[4]===""){
+return new Date(year,_22f,day);
+}
+hour=parseInt(res[4],10);
+min=parseInt(res[5],10);
+sec=(typeof (res[6])!="undefined"&&res[6]!=="")?parseInt(res[6],10):0;
+if(typeof (res[7])!="undefined"&&res[7]!==""){
+msec=Math.round(1000*parseFloat("0."+res[7]));
+}else{
+msec=0;
+}
+if((typeof (res[8])=="undefined"||res[8]==="")&&(typeof (res[9])=="undefined"||res[9]==="")){
+return new Date(year,_22f,day,hour,min,sec,msec);
+}
+var ofs;
+if(typeof (res[9])!="undefined"&&res[9]!==""){
+ofs=parseInt(res[10],10)*3600000;
+if(typeof (res[11])!="undefined"&&res[11]!==""){
+ofs+=parseInt(res[11],10)*60000;
+}
+if(res[9]=="-"){
+ofs=-ofs;
+}
+}else{
+ofs=0;
+}
+return new Date(Date.UTC(year,_22f,day,hour,min,sec,msec)-ofs);
+};
+MochiKit.DateTime.toISOTime=function(date,_237){
+if(typeof (date)=="undefined"||date===null){
+return null;
+}
+var hh=date.getHours();
+var mm=date.getMinutes();
+var ss=date.getSeconds();
+var lst=[((_237&&(hh<10))?"0"+hh:hh),((mm<10)?"0"+mm:mm),((ss<10)?"0"+ss:ss)];
+return lst.join(":");
+};
+MochiKit.DateTime.toISOTimestamp=function(date,_23d){
+if(typeof (date)=="undefined"||date===null){
+return null;
+}
+var sep=_23d?"T":" ";
+var foot=_23d?"Z":"";
+if(_23d){
+date=new Date(date.getTime()+(date.getTimezoneOffset()*60000));
+}
+return MochiKit.DateTime.toISODate(date)+sep+MochiKit.DateTime.toISOTime(date,_23d)+foot;
+};
+MochiKit.DateTime.toISODate=function(date){
+if(typeof (date)=="undefined"||date===null){
+return null;
+}
+var _241=MochiKit.DateTime._padTwo;
+var _242=MochiKit.DateTime._padFour;
+return [_242(date.getFullYear()),_241(date.getMonth()+1),_241(date.getDate())].join("-");
+};
+MochiKit.DateTime.americanDate=function(d){
+d=d+"";
+if(typeof (d)!="string"||d.length===0){
+return null;
+}
+var a=d.split("/");
+return new Date(a[2],a[0]-1,a[1]);
+};
+MochiKit.DateTime._padTwo=function(n){
+return (n>9)?n:"0"+n;
+};
+MochiKit.DateTime._padFour=function(n){
+switch(n.toString().length){
+case 1:
+return "000"+n;
+break;
+case 2:
+return "00"+n;
+break;
+case 3:
+return "0"+n;
+break;
+case 4:
+default:
+return n;
+}
+};
+MochiKit.DateTime.toPaddedAmericanDate=function(d){
+if(typeof (d)=="undefined"||d===null){
+return null;
+}
+var _248=MochiKit.DateTime._padTwo;
+return [_248(d.getMonth()+1),_248(d.getDate()),d.getFullYear()].join("/");
+};
+MochiKit.DateTime.toAmericanDate=function(d){
+if(typeof (d)=="undefined"||d===null){
+return null;
+}
+return [d.getMonth()+1,d.getDate(),d.getFullYear()].join("/");
+};
+MochiKit.DateTime.__new__=function(){
+MochiKit.Base.nameFunctions(this);
+};
+MochiKit.DateTime.__new__();
+MochiKit.Base._exportSymbols(this,MochiKit.DateTime);
+MochiKit.Base._module("Format","1.5",["Base"]);
+MochiKit.Format._numberFormatter=function(_24a,_24b,_24c,_24d,_24e,_24f,_250,_251,_252){
+return function(num){
+num=parseFloat(num);
+if(typeof (num)=="undefined"||num===null||isNaN(num)){
+return _24a;
+}
+var _254=_24b;
+var _255=_24c;
+if(num<0){
+num=-num;
+}else{
+_254=_254.replace(/-/,"");
+}
+var me=arguments.callee;
+var fmt=MochiKit.Format.formatLocale(_24d);
+if(_24e){
+num=num*100;
+_255=fmt.percent+_255;
+}
+num=MochiKit.Format.roundToFixed(num,_24f);
+var _258=num.split(/\./);
+var _259=_258[0];
+var frac=(_258.length==1)?"":_258[1];
+var res="";
+while(_259.length<_250){
+_259="0"+_259;
+}
+if(_251){
+while(_259.length>_251){
+var i=_259.length-_251;
+res=fmt.separator+_259.substring(i,_259.length)+res;
+_259=_259.substring(0,i);
+}
+}
+res=_259+res;
+if(_24f>0){
+while(frac.length<_252){
+frac=frac+"0";
+}
+res=res+fmt.decimal+frac;
+}
+return _254+res+_255;
+};
+};
+MochiKit.Format.numberFormatter=function(_25d,_25e,_25f){
+if(typeof (_25e)=="undefined"){
+_25e="";
+}
+var _260=_25d.match(/((?:[0#]+,)?[0#]+)(?:\.([0#]+))?(%)?/);
+if(!_260){
+throw TypeError("Invalid pattern");
+}
+var _261=_25d.substr(0,_260.index);
+var _262=_25d.substr(_260.index+_260[0].length);
+if(_261.search(/-/)==-1){
+_261=_261+"-";
+}
+var _263=_260[1];
+var frac=(typeof (_260[2])=="string"&&_260[2]!="")?_260[2]:"";
+var _265=(typeof (_260[3])=="string"&&_260[3]!="");
+var tmp=_263.split(/,/);
+var _267;
+if(typeof (_25f)=="undefined"){
+_25f="default";
+}
+if(tmp.length==1){
+_267=null;
+}else{
+_267=tmp[1].length;
+}
+var _268=_263.length-_263.replace(/0/g,"").length;
+var _269=frac.length-frac.replace(/0/g,"").length;
+var _26a=frac.length;
+var rval=MochiKit.Format._numberFormatter(_25e,_261,_262,_25f,_265,_26a,_268,_267,_269);
+var m=MochiKit.Base;
+if(m){
+var fn=arguments.callee;
+var args=m.concat(arguments);
+rval.repr=function(){
+return [self.NAME,"(",map(m.repr,args).join(", "),")"].join("");
+};
+}
+return rval;
+};
+MochiKit.Format.formatLocale=function(_26f){
+if(typeof (_26f)=="undefined"||_26f===null){
+_26f="default";
+}
+if(typeof (_26f)=="string"){
+var rval=MochiKit.Format.LOCALE[_26f];
+if(typeof (rval)=="string"){
+rval=arguments.callee(rval);
+MochiKit.Format.LOCALE[_26f]=rval;
+}
+return rval;
+}else{
+return _26f;
+}
+};
+MochiKit.Format.twoDigitAverage=function(_271,_272){
+if(_272){
+var res=_271/_272;
+if(!isNaN(res)){
+return MochiKit.Format.twoDigitFloat(res);
+}
+}
+return "0";
+};
+MochiKit.Format.twoDigitFloat=function(_274){
+var res=roundToFixed(_274,2);
+if(res.indexOf(".00")>0){
+return res.substring(0,res.length-3);
+}else{
+if(res.charAt(res.length-1)=="0"){
+return res.substring(0,res.length-1);
+}else{
+return res;
+}
+}
+};
+MochiKit.Format.lstrip=function(str,_277){
+str=str+"";
+if(typeof (str)!="string"){
+return null;
+}
+if(!_277){
+return str.replace(/^\s+/,"");
+}else{
+return str.replace(new RegExp("^["+_277+"]+"),"");
+}
+};
+MochiKit.Format.rstrip=function(str,_279){
+str=str+"";
+if(typeof (str)!="string"){
+return null;
+}
+if(!_279){
+return str.replace(/\s+$/,"");
+}else{
+return str.replace(new RegExp("["+_279+"]+$"),"");
+}
+};
+MochiKit.Format.strip=function(str,_27b){
+var self=MochiKit.Format;
+return self.rstrip(self.lstrip(str,_27b),_27b);
+};
+MochiKit.Format.truncToFixed=function(_27d,_27e){
+var _27f=MochiKit.Format._numberToFixed(_27d,_27e);
+var _280=_27f.indexOf(".");
+if(_280>0&&_280+_27e+1<_27f.length){
+_27f=_27f.substring(0,_280+_27e+1);
+_27f=MochiKit.Format._shiftNumber(_27f,0);
+}
+return _27f;
+};
+MochiKit.Format.roundToFixed=function(_281,_282){
+var _283=MochiKit.Format._numberToFixed(_281,_282);
+var _284=_283.indexOf(".");
+if(_284>0&&_284+_282+1<_283.length){
+var str=MochiKit.Format._shiftNumber(_283,_282);
+str=MochiKit.Format._numberToFixed(Math.round(parseFloat(str)),0);
+_283=MochiKit.Format._shiftNumber(str,-_282);
+}
+return _283;
+};
+MochiKit.Format._numberToFixed=function(_286,_287){
+var str=_286.toString();
+var _289=str.split(/[eE]/);
+var exp=(_289.length===1)?0:parseInt(_289[1])||0;
+var _28b=MochiKit.Format._shiftNumber(_289[0],exp);
+_289=_28b.split(/\./);
+var _28c=_289[0];
+var frac=(_289.length===1)?"":_289[1];
+while(frac.length<_287){
+frac+="0";
+}
+if(frac.length>0){
+return _28c+"."+frac;
+}else{
+return _28c;
+}
+};
+MochiKit.Format._shiftNumber=function(num,exp){
+var pos=num.indexOf(".");
+if(pos<0){
+pos=num.length;
+}else{
+num=num.substring(0,pos)+num.substring(pos+1);
+}
+pos+=exp;
+while(pos<=0||(pos<=1&&num.charAt(0)==="-")){
+if(num.charAt(0)==="-"){
+num="-0"+num.substring(1);
+}else{
+num="0"+num;
+}
+pos++;
+}
+while(pos>num.length){
+num+="0";
+}
+if(pos<num.length){
+num=num.substring(0,pos)+"."+num.substring(pos);
+}
+while(/^0[^.]/.test(num)){
+num=num.substring(1);
+}
+while(/^-0[^.]/.test(num)){
+num="-"+num.substring(2);
+}
+return num;
+};
+MochiKit.Format.percentFormat=function(_291){
+return MochiKit.Format.twoDigitFloat(100*_291)+"%";
+};
+MochiKit.Format.LOCALE={en_US:{separator:",",decimal:".",percent:"%"},de_DE:{separator:".",decimal:",",percent:"%"},pt_BR:{separator:".",decimal:",",percent:"%"},fr_FR:{separator:" ",decimal:",",percent:"%"},"default":"en_US",__export__:false};
+MochiKit.Format.__new__=function(){
+MochiKit.Base.nameFunctions(this);
+var base=this.NAME+".";
+var k,v,o;
+for(k in this.LOCALE){
+o=this.LOCALE[k];
+if(typeof (o)=="object"){
+o.repr=function(){
+return this.NAME;
+};
+o.NAME=base+"LOCALE."+k;
+}
+}
+};
+MochiKit.Format.__new__();
+MochiKit.Base._exportSymbols(this,MochiKit.Format);
+MochiKit.Base._module("Text","1.5",["Base","Format"]);
+MochiKit.Text.startsWith=function(_296,str){
+return str!=null&&_296!=null&&str.indexOf(_296)==0;
+};
+MochiKit.Text.endsWith=function(_298,str){
+return str!=null&&_298!=null&&str.lastIndexOf(_298)==Math.max(str.length-_298.length,0);
+};
+MochiKit.Text.contains=function(_29a,str){
+return str!=null&&_29a!=null&&str.indexOf(_29a)>=0;
+};
+MochiKit.Text.padLeft=function(str,_29d,_29e){
+str=str||"";
+_29e=_29e||" ";
+while(str.length<_29d){
+str=_29e+str;
+}
+return str;
+};
+MochiKit.Text.padRight=function(str,_2a0,_2a1){
+str=str||"";
+_2a1=_2a1||" ";
+while(str.length<_2a0){
+str+=_2a1;
+}
+return str;
+};
+MochiKit.Text.truncate=function(str,_2a3,tail){
+if(str==null||str.length<=_2a3||_2a3<0){
+return str;
+}else{
+if(tail!=null){
+str=str.slice(0,Math.max(0,_2a3-tail.length));
+if(typeof (str)=="string"){
+return str+tail;
+}else{
+return MochiKit.Base.extend(str,tail);
+}
+}else{
+return str.slice(0,_2a3);
+}
+}
+};
+MochiKit.Text.split=function(str,_2a6,max){
+if(str==null||str.length==0){
+return str;
+}
+_2a6=_2a6||"\n";
+var bits=str.split(_2a6);
+if((typeof (max)=="undefined")||max>=bits.length-1){
+return bits;
+}
+bits.splice(max,bits.length,bits.slice(max,bits.length).join(_2a6));
+return bits;
+};
+MochiKit.Text.rsplit=function(str,_2aa,max){
+if(str==null||str.length==0){
+return str;
+}
+_2aa=_2aa||"\n";
+var bits=str.split(_2aa);
+if((typeof (max)=="undefined")||max>=bits.length-1){
+return bits;
+}
+bits.splice(0,bits.length-max,bits.slice(0,bits.length-max).join(_2aa));
+return bits;
+};
+MochiKit.Text.formatter=function(_2ad,_2ae){
+if(typeof (_2ae)=="undefined"){
+_2ae=MochiKit.Format.formatLocale();
+}else{
+if(typeof (_2ae)=="string"){
+_2ae=MochiKit.Format.formatLocale(_2ae);
+}
+}
+var _2af=MochiKit.Text._parsePattern(_2ad);
+return function(){
+var _2b0=MochiKit.Base.extend([],arguments);
+var res=[];
+for(var i=0;i<_2af.length;i++){
+if(typeof (_2af[i])=="string"){
+res.push(_2af[i]);
+}else{
+res.push(MochiKit.Text.formatValue(_2af[i],_2b0,_2ae));
+}
+}
+return res.join("");
+};
+};
+MochiKit.Text.format=function(_2b3){
+var func=MochiKit.Text.formatter(_2b3);
+return func.apply(this,MochiKit.Base.extend([],arguments,1));
+};
+MochiKit.Text.formatValue=function(spec,_2b6,_2b7){
+var self=MochiKit.Text;
+if(typeof (spec)==="string"){
+spec=self._parseFormatFlags(spec,0,spec.length-1);
+}
+for(var i=0;spec.path!=null&&i<spec.path.length;i++){
+if(_2b6!=null){
+_2b6=_2b6[spec.path[i]];
+}
+}
+if(typeof (_2b7)=="undefined"){
+_2b7=MochiKit.Format.formatLocale();
+}else{
+if(typeof (_2b7)=="string"){
+_2b7=MochiKit.Format.formatLocale(_2b7);
+}
+}
+var str="";
+if(spec.numeric){
+if(typeof (_2b6)!="number"||isNaN(_2b6)){
+str="";
+}else{
+if(_2b6===Number.POSITIVE_INFINITY){
+str="\u221e";
+}else{
+if(_2b6===Number.NEGATIVE_INFINITY){
+str="-\u221e";
+}else{
+var sign=(spec.sign==="-")?"":spec.sign;
+sign=(_2b6<0)?"-":sign;
+_2b6=Math.abs(_2b6);
+if(spec.format==="%"){
+str=self._truncToPercent(_2b6,spec.precision);
+}else{
+if(spec.format==="d"){
+str=MochiKit.Format.roundToFixed(_2b6,0);
+}else{
+if(spec.radix!=10){
+str=Math.floor(_2b6).toString(spec.radix);
+if(spec.format==="x"){
+str=str.toLowerCase();
+}else{
+if(spec.format==="X"){
+str=str.toUpperCase();
+}
+}
+}else{
+if(spec.precision>=0){
+str=MochiKit.Format.roundToFixed(_2b6,spec.precision);
+}else{
+str=_2b6.toString();
+}
+}
+}
+}
+if(spec.padding==="0"&&spec.format==="%"){
+str=self.padLeft(str,spec.width-sign.length-1,"0");
+}else{
+if(spec.padding=="0"){
+str=self.padLeft(str,spec.width-sign.length,"0");
+}
+}
+str=self._localizeNumber(str,_2b7,spec.grouping);
+str=sign+str;
+}
+}
+}
+if(str!==""&&spec.format==="%"){
+str=str+_2b7.percent;
+}
+}else{
+if(spec.format=="r"){
+str=MochiKit.Base.repr(_2b6);
+}else{
+str=(_2b6==null)?"null":_2b6.toString();
+}
+str=self.truncate(str,spec.precision);
+}
+if(spec.align=="<"){
+str=self.padRight(str,spec.width);
+}else{
+str=self.padLeft(str,spec.width);
+}
+return str;
+};
+MochiKit.Text._localizeNumber=function(num,_2bd,_2be){
+var _2bf=num.split(/\./);
+var _2c0=_2bf[0];
+var frac=(_2bf.length==1)?"":_2bf[1];
+var res=(frac.length>0)?_2bd.decimal:"";
+while(_2be&&frac.length>3){
+res=res+frac.substring(0,3)+_2bd.separator;
+frac=frac.substring(3);
+if(_2c0.charAt(0)=="0"){
+_2c0=_2c0.substring(1);
+}
+}
+if(frac.length>0){
+res+=frac;
+}
+while(_2be&&_2c0.length>3){
+var pos=_2c0.length-3;
+res=_2bd.separator+_2c0.substring(pos)+res;
+_2c0=_2c0.substring((_2c0.charAt(0)=="0")?1:0,pos);
+}
+return _2c0+res;
+};
+MochiKit.Text._parsePattern=function(_2c4){
+var self=MochiKit.Text;
+var _2c6=[];
+var _2c7=0;
+var pos=0;
+for(pos=0;pos<_2c4.length;pos++){
+if(_2c4.charAt(pos)=="{"){
+if(pos+1>=_2c4.length){
+var msg="unescaped { char, should be escaped as {{";
+throw new self.FormatPatternError(_2c4,pos,msg);
+}else{
+if(_2c4.charAt(pos+1)=="{"){
+_2c6.push(_2c4.substring(_2c7,pos+1));
+_2c7=pos+2;
+pos++;
+}else{
+if(_2c7<pos){
+_2c6.push(_2c4.substring(_2c7,pos));
+}
+_2c7=_2c4.indexOf("}",pos)+1;
+if(_2c7<=0){
+var msg="unmatched { char, not followed by a } char";
+throw new self.FormatPatternError(_2c4,pos,msg);
+}
+_2c6.push(self._parseFormat(_2c4,pos+1,_2c7-1));
+pos=_2c7-1;
+}
+}
+}else{
+if(_2c4.charAt(pos)=="}"){
+if(pos+1>=_2c4.length||_2c4.charAt(pos+1)!="}"){
+var msg="unescaped } char, should be escaped as }}";
+throw new self.FormatPatternError(_2c4,pos,msg);
+}
+_2c6.push(_2c4.substring(_2c7,pos+1));
+_2c7=pos+2;
+pos++;
+}
+}
+}
+if(_2c7<pos){
+_2c6.push(_2c4.substring(_2c7,pos));
+}
+return _2c6;
+};
+MochiKit.Text._parseFormat=function(_2ca,_2cb,_2cc){
+var self=MochiKit.Text;
+var text=_2ca.substring(_2cb,_2cc);
+var info;
+var pos=text.indexOf(":");
+if(pos==0){
+info=self._parseFormatFlags(_2ca,_2cb+1,_2cc);
+info.path=[];
+}else{
+if(pos>0){
+info=self._parseFormatFlags(_2ca,_2cb+pos+1,_2cc);
+info.path=text.substring(0,pos).split(".");
+}else{
+info=self._parseFormatFlags(_2ca,_2cc,_2cc);
+info.path=text.split(".");
+}
+}
+var _2d1=/^\d+$/;
+for(var i=0;i<info.path.length;i++){
+var e=info.path[i];
+e=e.replace(/^\s+/,"").replace(/\s+$/,"");
+if(e==""&&info.path.length==1){
+e=0;
+}else{
+if(e==""){
+var msg="format value path contains blanks";
+throw new self.FormatPatternError(_2ca,_2cb,msg);
+}else{
+if(_2d1.test(e)){
+e=parseInt(e);
+}
+}
+}
+info.path[i]=e;
+}
+if(info.path.length<0||typeof (info.path[0])!="number"){
+info.path.unshift(0);
+}
+return info;
+};
+MochiKit.Text._parseFormatFlags=function(_2d5,_2d6,_2d7){
+var self=MochiKit.Text;
+var info={numeric:false,format:"s",width:0,precision:-1,align:">",sign:"-",padding:" ",grouping:false};
+var _2da=_2d5.substring(_2d6,_2d7).replace(/\s+$/,"");
+while(_2da.length>0){
+switch(_2da.charAt(0)){
+case ">":
+case "<":
+info.align=_2da.charAt(0);
+_2da=_2da.substring(1);
+break;
+case "+":
+case "-":
+case " ":
+info.sign=_2da.charAt(0);
+_2da=_2da.substring(1);
+break;
+case ",":
+info.grouping=true;
+_2da=_2da.substring(1);
+break;
+case ".":
+var _2db=/^\d*/.exec(_2da.substring(1))[0];
+info.precision=parseInt(_2db);
+_2da=_2da.substring(1+_2db.length);
+break;
+case "0":
+info.padding=_2da.charAt(0);
+_2da=_2da.substring(1);
+break;
+case "1":
+case "2":
+case "3":
+case "4":
+case "5":
+case "6":
+case "7":
+case "8":
+case "9":
+var _2db=/^\d*/.exec(_2da)[0];
+info.width=parseInt(_2db);
+_2da=_2da.substring(_2db.length);
+break;
+case "s":
+case "r":
+info.format=_2da.charAt(0);
+_2da=_2da.substring(1);
+break;
+case "b":
+case "d":
+case "o":
+case "x":
+case "X":
+case "f":
+case "%":
+info.numeric=true;
+info.format=_2da.charAt(0);
+info.radix=10;
+if(info.format==="b"){
+info.radix=2;
+}else{
+if(info.format==="o"){
+info.radix=8;
+}else{
+if(info.format==="x"||info.format==="X"){
+info.radix=16;
+}
+}
+}
+_2da=_2da.substring(1);
+break;
+default:
+var msg="unsupported format flag: "+_2da.charAt(0);
+throw new self.FormatPatternError(_2d5,_2d6,msg);
+}
+}
+return info;
+};
+MochiKit.Text._truncToPercent=function(_2dd,_2de){
+var str;
+if(_2de>=0){
+str=MochiKit.Format.roundToFixed(_2dd,_2de+2);
+}else{
+str=(_2dd==null)?"0":_2dd.toString();
+}
+var arr=MochiKit.Text.split(str,".",2);
+var frac=MochiKit.Text.padRight(arr[1],2,"0");
+var _2e2=arr[0]+frac.substring(0,2);
+frac=frac.substring(2);
+while(/^0[0-9]/.test(_2e2)){
+_2e2=_2e2.substring(1);
+}
+return (frac.length<=0)?_2e2:_2e2+"."+frac;
+};
+MochiKit.Text.FormatPatternError=function(_2e3,pos,_2e5){
+this.pattern=_2e3;
+this.pos=pos;
+this.message=_2e5;
+};
+MochiKit.Text.FormatPatternError.prototype=new MochiKit.Base.NamedError("MochiKit.Text.FormatPatternError");
+if(MochiKit.__export__){
+formatter=MochiKit.Text.formatter;
+format=MochiKit.Text.format;
+formatValue=MochiKit.Text.formatValue;
+}
+MochiKit.Base.nameFunctions(MochiKit.Text);
+MochiKit.Base._exportSymbols(this,MochiKit.Text);
+MochiKit.Base._module("Async","1.5",["Base"]);
+MochiKit.Async.Deferred=function(_2e6){
+this.chain=[];
+this.id=this._nextId();
+this.fired=-1;
+this.paused=0;
+this.results=[null,null];
+this.canceller=_2e6;
+this.silentlyCancelled=false;
+this.chained=false;
+this.finalized=false;
+};
+MochiKit.Async.Deferred.prototype={repr:function(){
+var _2e7;
+if(this.fired==-1){
+_2e7="unfired";
+}else{
+if(this.fired===0){
+_2e7="success";
+}else{
+_2e7="error";
+}
+}
+return "Deferred("+this.id+", "+_2e7+")";
+},toString:MochiKit.Base.forwardCall("repr"),_nextId:MochiKit.Base.counter(),cancel:function(){
+var self=MochiKit.Async;
+if(this.fired==-1){
+if(this.canceller){
+this.canceller(this);
+}else{
+this.silentlyCancelled=true;
+}
+if(this.fired==-1){
+this.errback(new self.CancelledError(this));
+}
+}else{
+if((this.fired===0)&&(this.results[0] instanceof self.Deferred)){
+this.results[0].cancel();
+}
+}
+},_resback:function(res){
+this.fired=((res instanceof Error)?1:0);
+this.results[this.fired]=res;
+if(this.paused===0){
+this._fire();
+}
+},_check:function(){
+if(this.fired!=-1){
+if(!this.silentlyCancelled){
+throw new MochiKit.Async.AlreadyCalledError(this);
+}
+this.silentlyCancelled=false;
+return;
+}
+},callback:function(res){
+this._check();
+if(res instanceof MochiKit.Async.Deferred){
+throw new Error("Deferred instances can only be chained if they are the result of a callback");
+}
+this._resback(res);
+},errback:function(res){
+this._check();
+var self=MochiKit.Async;
+if(res instanceof self.Deferred){
+throw new Error("Deferred instances can only be chained if they are the result of a callback");
+}
+if(!(res instanceof Error)){
+res=new self.GenericError(res);
+}
+this._resback(res);
+},addBoth:function(fn){
+if(arguments.length>1){
+fn=MochiKit.Base.partial.apply(null,arguments);
+}
+return this.addCallbacks(fn,fn);
+},addCallback:function(fn){
+if(arguments.length>1){
+fn=MochiKit.Base.partial.apply(null,arguments);
+}
+return this.addCallbacks(fn,null);
+},addErrback:function(fn){
+if(arguments.length>1){
+fn=MochiKit.Base.partial.apply(null,arguments);
+}
+return this.addCallbacks(null,fn);
+},addCallbacks:function(cb,eb){
+if(this.chained){
+throw new Error("Chained Deferreds can not be re-used");
+}
+if(this.finalized){
+throw new Error("Finalized Deferreds can not be re-used");
+}
+this.chain.push([cb,eb]);
+if(this.fired>=0){
+this._fire();
+}
+return this;
+},setFinalizer:function(fn){
+if(this.chained){
+throw new Error("Chained Deferreds can not be re-used");
+}
+if(this.finalized){
+throw new Error("Finalized Deferreds can not be re-used");
+}
+if(arguments.length>1){
+fn=MochiKit.Base.partial.apply(null,arguments);
+}
+this._finalizer=fn;
+if(this.fired>=0){
+this._fire();
+}
+return this;
+},_fire:function(){
+var _2f3=this.chain;
+var _2f4=this.fired;
+var res=this.results[_2f4];
+var self=this;
+var cb=null;
+while(_2f3.length>0&&this.paused===0){
+var pair=_2f3.shift();
+var f=pair[_2f4];
+if(f===null){
+continue;
+}
+try{
+res=f(res);
+_2f4=((res instanceof Error)?1:0);
+if(res instanceof MochiKit.Async.Deferred){
+cb=function(res){
+self.paused--;
+self._resback(res);
+};
+this.paused++;
+}
+}
+catch(err){
+_2f4=1;
+if(!(err instanceof Error)){
+err=new MochiKit.Async.GenericError(err);
+}
+res=err;
+}
+}
+this.fired=_2f4;
+this.results[_2f4]=res;
+if(this.chain.length==0&&this.paused===0&&this._finalizer){
+this.finalized=true;
+this._finalizer(res);
+}
+if(cb&&this.paused){
+res.addBoth(cb);
+res.chained=true;
+}
+}};
+MochiKit.Base.update(MochiKit.Async,{evalJSONRequest:function(req){
+return MochiKit.Base.evalJSON(req.responseText);
+},succeed:function(_2fc){
+var d=new MochiKit.Async.Deferred();
+d.callback.apply(d,arguments);
+return d;
+},fail:function(_2fe){
+var d=new MochiKit.Async.Deferred();
+d.errback.apply(d,arguments);
+return d;
+},getXMLHttpRequest:function(){
+var self=arguments.callee;
+if(!self.XMLHttpRequest){
+var _301=[function(){
+return new XMLHttpRequest();
+},function(){
+return new ActiveXObject("Msxml2.XMLHTTP");
+},function(){
+return new ActiveXObject("Microsoft.XMLHTTP");
+},function(){
+return new ActiveXObject("Msxml2.XMLHTTP.4.0");
+},function(){
+throw new MochiKit.Async.BrowserComplianceError("Browser does not support XMLHttpRequest");
+}];
+for(var i=0;i<_301.length;i++){
+var func=_301[i];
+try{
+self.XMLHttpRequest=func;
+return func();
+}
+catch(e){
+}
+}
+}
+return self.XMLHttpRequest();
+},_xhr_onreadystatechange:function(d){
+var m=MochiKit.Base;
+if(this.readyState==4){
+try{
+this.onreadystatechange=null;
+}
+catch(e){
+try{
+this.onreadystatechange=m.noop;
+}
+catch(e){
+}
+}
+var _306=null;
+try{
+_306=this.status;
+if(!_306&&m.isNotEmpty(this.responseText)){
+_306=304;
+}
+}
+catch(e){
+}
+if(_306==200||_306==201||_306==204||_306==304||_306==1223){
+d.callback(this);
+}else{
+var err=new MochiKit.Async.XMLHttpRequestError(this,"Request failed");
+if(err.number){
+d.errback(err);
+}else{
+d.errback(err);
+}
+}
+}
+},_xhr_canceller:function(req){
+try{
+req.onreadystatechange=null;
+}
+catch(e){
+try{
+req.onreadystatechange=MochiKit.Base.noop;
+}
+catch(e){
+}
+}
+req.abort();
+},sendXMLHttpRequest:function(req,_30a){
+if(typeof (_30a)=="undefined"||_30a===null){
+_30a="";
+}
+var m=MochiKit.Base;
+var self=MochiKit.Async;
+var d=new self.Deferred(m.partial(self._xhr_canceller,req));
+try{
+req.onreadystatechange=m.bind(self._xhr_onreadystatechange,req,d);
+req.send(_30a);
+}
+catch(e){
+try{
+req.onreadystatechange=null;
+}
+catch(ignore){
+}
+d.errback(e);
+}
+return d;
+},doXHR:function(url,opts){
+var self=MochiKit.Async;
+return self.callLater(0,self._doXHR,url,opts);
+},_doXHR:function(url,opts){
+var m=MochiKit.Base;
+opts=m.update({method:"GET",sendContent:""},opts);
+var self=MochiKit.Async;
+var req=self.getXMLHttpRequest();
+if(opts.queryString){
+var qs=m.queryString(opts.queryString);
+if(qs){
+url+="?"+qs;
+}
+}
+if("username" in opts){
+req.open(opts.method,url,true,opts.username,opts.password);
+}else{
+req.open(opts.method,url,true);
+}
+if(req.overrideMimeType&&opts.mimeType){
+req.overrideMimeType(opts.mimeType);
+}
+req.setRequestHeader("X-Requested-With","XMLHttpRequest");
+if(opts.headers){
+var _317=opts.headers;
+if(!m.isArrayLike(_317)){
+_317=m.items(_317);
+}
+for(var i=0;i<_317.length;i++){
+var _319=_317[i];
+var name=_319[0];
+var _31b=_319[1];
+req.setRequestHeader(name,_31b);
+}
+}
+return self.sendXMLHttpRequest(req,opts.sendContent);
+},_buildURL:function(url){
+if(arguments.length>1){
+var m=MochiKit.Base;
+var qs=m.queryString.apply(null,m.extend(null,arguments,1));
+if(qs){
+return url+"?"+qs;
+}
+}
+return url;
+},doSimpleXMLHttpRequest:function(url){
+var self=MochiKit.Async;
+url=self._buildURL.apply(self,arguments);
+return self.doXHR(url);
+},loadJSONDoc:function(url){
+var self=MochiKit.Async;
+url=self._buildURL.apply(self,arguments);
+var d=self.doXHR(url,{"mimeType":"text/plain","headers":[["Accept","application/json"]]});
+d=d.addCallback(self.evalJSONRequest);
+return d;
+},wait:function(_324,_325){
+var d=new MochiKit.Async.Deferred();
+var cb=MochiKit.Base.bind("callback",d,_325);
+var _328=setTimeout(cb,Math.floor(_324*1000));
+d.canceller=function(){
+try{
+clearTimeout(_328);
+}
+catch(e){
+}
+};
+return d;
+},callLater:function(_329,func){
+var m=MochiKit.Base;
+var _32c=m.partial.apply(m,m.extend(null,arguments,1));
+return MochiKit.Async.wait(_329).addCallback(function(res){
+return _32c();
+});
+}});
+MochiKit.Async.DeferredLock=function(){
+this.waiting=[];
+this.locked=false;
+this.id=this._nextId();
+};
+MochiKit.Async.DeferredLock.prototype={__class__:MochiKit.Async.DeferredLock,acquire:function(){
+var d=new MochiKit.Async.Deferred();
+if(this.locked){
+this.waiting.push(d);
+}else{
+this.locked=true;
+d.callback(this);
+}
+return d;
+},release:function(){
+if(!this.locked){
+throw TypeError("Tried to release an unlocked DeferredLock");
+}
+this.locked=false;
+if(this.waiting.length>0){
+this.locked=true;
+this.waiting.shift().callback(this);
+}
+},_nextId:MochiKit.Base.counter(),repr:function(){
+var _32f;
+if(this.locked){
+_32f="locked, "+this.waiting.length+" waiting";
+}else{
+_32f="unlocked";
+}
+return "DeferredLock("+this.id+", "+_32f+")";
+},toString:MochiKit.Base.forwardCall("repr")};
+MochiKit.Async.DeferredList=function(list,_331,_332,_333,_334){
+MochiKit.Async.Deferred.apply(this,[_334]);
+this.list=list;
+var _335=[];
+this.resultList=_335;
+this.finishedCount=0;
+this.fireOnOneCallback=_331;
+this.fireOnOneErrback=_332;
+this.consumeErrors=_333;
+var cb=MochiKit.Base.bind(this._cbDeferred,this);
+for(var i=0;i<list.length;i++){
+var d=list[i];
+_335.push(undefined);
+d.addCallback(cb,i,true);
+d.addErrback(cb,i,false);
+}
+if(list.length===0&&!_331){
+this.callback(this.resultList);
+}
+};
+MochiKit.Async.DeferredList.prototype=new MochiKit.Async.Deferred();
+MochiKit.Async.DeferredList.prototype._cbDeferred=function(_339,_33a,_33b){
+this.resultList[_339]=[_33a,_33b];
+this.finishedCount+=1;
+if(this.fired==-1){
+if(_33a&&this.fireOnOneCallback){
+this.callback([_339,_33b]);
+}else{
+if(!_33a&&this.fireOnOneErrback){
+this.errback(_33b);
+}else{
+if(this.finishedCount==this.list.length){
+this.callback(this.resultList);
+}
+}
+}
+}
+if(!_33a&&this.consumeErrors){
+_33b=null;
+}
+return _33b;
+};
+MochiKit.Async.gatherResults=function(_33c){
+var d=new MochiKit.Async.DeferredList(_33c,false,true,false);
+d.addCallback(function(_33e){
+var ret=[];
+for(var i=0;i<_33e.length;i++){
+ret.push(_33e[i][1]);
+}
+return ret;
+});
+return d;
+};
+MochiKit.Async.maybeDeferred=function(func){
+var self=MochiKit.Async;
+var _343;
+try{
+var r=func.apply(null,MochiKit.Base.extend([],arguments,1));
+if(r instanceof self.Deferred){
+_343=r;
+}else{
+if(r instanceof Error){
+_343=self.fail(r);
+}else{
+_343=self.succeed(r);
+}
+}
+}
+catch(e){
+_343=self.fail(e);
+}
+return _343;
+};
+MochiKit.Async.__new__=function(){
+var m=MochiKit.Base;
+var ne=m.partial(m._newNamedError,this);
+ne("AlreadyCalledError",function(_347){
+this.deferred=_347;
+});
+ne("CancelledError",function(_348){
+this.deferred=_348;
+});
+ne("BrowserComplianceError",function(msg){
+this.message=msg;
+});
+ne("GenericError",function(msg){
+this.message=msg;
+});
+ne("XMLHttpRequestError",function(req,msg){
+this.req=req;
+this.message=msg;
+try{
+this.number=req.status;
+}
+catch(e){
+}
+});
+m.nameFunctions(this);
+};
+MochiKit.Async.__new__();
+MochiKit.Base._exportSymbols(this,MochiKit.Async);
+MochiKit.Base._module("DOM","1.5",["Base"]);
+MochiKit.Base.update(MochiKit.DOM,{currentWindow:function(){
+return MochiKit.DOM._window;
+},currentDocument:function(){
+return MochiKit.DOM._document;
+},withWindow:function(win,func){
+var self=MochiKit.DOM;
+var _350=self._document;
+var _351=self._window;
+var rval;
+try{
+self._window=win;
+self._document=win.document;
+rval=func();
+}
+catch(e){
+self._window=_351;
+self._document=_350;
+throw e;
+}
+self._window=_351;
+self._document=_350;
+return rval;
+},formContents:function(elem){
+var _354=[];
+var _355=[];
+var m=MochiKit.Base;
+var self=MochiKit.DOM;
+if(typeof (elem)=="undefined"||elem===null){
+elem=self._document.body;
+}else{
+elem=self.getElement(elem);
+}
+m.nodeWalk(elem,function(elem){
+var name=elem.name;
+if(m.isNotEmpty(name)){
+var _35a=elem.tagName.toUpperCase();
+if(_35a==="INPUT"&&(elem.type=="radio"||elem.type=="checkbox")&&!elem.checked){
+return null;
+}
+if(_35a==="SELECT"){
+if(elem.type=="select-one"){
+if(elem.selectedIndex>=0){
+var opt=elem.options[elem.selectedIndex];
+var v=opt.value;
+if(!v){
+var h=opt.outerHTML;
+if(h&&!h.match(/^[^>]+\svalue\s*=/i)){
+v=opt.text;
+}
+}
+_354.push(name);
+_355.push(v);
+return null;
+}
+_354.push(name);
+_355.push("");
+return null;
+}else{
+var opts=elem.options;
+if(!opts.length){
+_354.push(name);
+_355.push("");
+return null;
+}
+for(var i=0;i<opts.length;i++){
+var opt=opts[i];
+if(!opt.selected){
+continue;
+}
+var v=opt.value;
+if(!v){
+var h=opt.outerHTML;
+if(h&&!h.match(/^[^>]+\svalue\s*=/i)){
+v=opt.text;
+}
+}
+_354.push(name);
+_355.push(v);
+}
+return null;
+}
+}
+if(_35a==="FORM"||_35a==="P"||_35a==="SPAN"||_35a==="DIV"){
+return elem.childNodes;
+}
+_354.push(name);
+_355.push(elem.value||"");
+return null;
+}
+return elem.childNodes;
+});
+return [_354,_355];
+},withDocument:function(doc,func){
+var self=MochiKit.DOM;
+var _363=self._document;
+var rval;
+try{
+self._document=doc;
+rval=func();
+}
+catch(e){
+self._document=_363;
+throw e;
+}
+self._document=_363;
+return rval;
+},registerDOMConverter:function(name,_366,wrap,_368){
+MochiKit.DOM.domConverters.register(name,_366,wrap,_368);
+},coerceToDOM:function(node,ctx){
+var m=MochiKit.Base;
+var im=MochiKit.Iter;
+var self=MochiKit.DOM;
+if(im){
+var iter=im.iter;
+var _36f=im.repeat;
+}
+var map=m.map;
+var _371=self.domConverters;
+var _372=arguments.callee;
+var _373=m.NotFound;
+while(true){
+if(typeof (node)=="undefined"||node===null){
+return null;
+}
+if(typeof (node)=="function"&&typeof (node.length)=="number"&&!(node instanceof Function)){
+node=im?im.list(node):m.extend(null,node);
+}
+if(typeof (node.nodeType)!="undefined"&&node.nodeType>0){
+return node;
+}
+if(typeof (node)=="number"||typeof (node)=="boolean"){
+node=node.toString();
+}
+if(typeof (node)=="string"){
+return self._document.createTextNode(node);
+}
+if(typeof (node.__dom__)=="function"){
+node=node.__dom__(ctx);
+continue;
+}
+if(typeof (node.dom)=="function"){
+node=node.dom(ctx);
+continue;
+}
+if(typeof (node)=="function"){
+node=node.apply(ctx,[ctx]);
+continue;
+}
+if(im){
+var _374=null;
+try{
+_374=iter(node);
+}
+catch(e){
+}
+if(_374){
+return map(_372,_374,_36f(ctx));
+}
+}else{
+if(m.isArrayLike(node)){
+var func=function(n){
+return _372(n,ctx);
+};
+return map(func,node);
+}
+}
+try{
+node=_371.match(node,ctx);
+continue;
+}
+catch(e){
+if(e!=_373){
+throw e;
+}
+}
+return self._document.createTextNode(node.toString());
+}
+return undefined;
+},isChildNode:function(node,_378){
+var self=MochiKit.DOM;
+if(typeof (node)=="string"){
+node=self.getElement(node);
+}
+if(typeof (_378)=="string"){
+_378=self.getElement(_378);
+}
+if(typeof (node)=="undefined"||node===null){
+return false;
+}
+while(node!=null&&node!==self._document){
+if(node===_378){
+return true;
+}
+node=node.parentNode;
+}
+return false;
+},setNodeAttribute:function(node,attr,_37c){
+var o={};
+o[attr]=_37c;
+try{
+return MochiKit.DOM.updateNodeAttributes(node,o);
+}
+catch(e){
+}
+return null;
+},getNodeAttribute:function(node,attr){
+var self=MochiKit.DOM;
+var _381=self.attributeArray.renames[attr];
+var _382=self.attributeArray.ignoreAttr[attr];
+node=self.getElement(node);
+try{
+if(_381){
+return node[_381];
+}
+var _383=node.getAttribute(attr);
+if(_383!=_382){
+return _383;
+}
+}
+catch(e){
+}
+return null;
+},removeNodeAttribute:function(node,attr){
+var self=MochiKit.DOM;
+var _387=self.attributeArray.renames[attr];
+node=self.getElement(node);
+try{
+if(_387){
+return node[_387];
+}
+return node.removeAttribute(attr);
+}
+catch(e){
+}
+return null;
+},updateNodeAttributes:function(node,_389){
+var elem=node;
+var self=MochiKit.DOM;
+if(typeof (node)=="string"){
+elem=self.getElement(node);
+}
+if(_389){
+var _38c=MochiKit.Base.updatetree;
+if(self.attributeArray.compliant){
+for(var k in _389){
+var v=_389[k];
+if(typeof (v)=="object"&&typeof (elem[k])=="object"){
+if(k=="style"&&MochiKit.Style){
+MochiKit.Style.setStyle(elem,v);
+}else{
+_38c(elem[k],v);
+}
+}else{
+if(k.substring(0,2)=="on"){
+if(typeof (v)=="string"){
+v=new Function(v);
+}
+elem[k]=v;
+}else{
+elem.setAttribute(k,v);
+}
+}
+if(typeof (elem[k])=="string"&&elem[k]!=v){
+elem[k]=v;
+}
+}
+}else{
+var _38f=self.attributeArray.renames;
+for(var k in _389){
+v=_389[k];
+var _390=_38f[k];
+if(k=="style"&&typeof (v)=="string"){
+elem.style.cssText=v;
+}else{
+if(typeof (_390)=="string"){
+elem[_390]=v;
+}else{
+if(typeof (elem[k])=="object"&&typeof (v)=="object"){
+if(k=="style"&&MochiKit.Style){
+MochiKit.Style.setStyle(elem,v);
+}else{
+_38c(elem[k],v);
+}
+}else{
+if(k.substring(0,2)=="on"){
+if(typeof (v)=="string"){
+v=new Function(v);
+}
+elem[k]=v;
+}else{
+elem.setAttribute(k,v);
+}
+}
+}
+}
+if(typeof (elem[k])=="string"&&elem[k]!=v){
+elem[k]=v;
+}
+}
+}
+}
+return elem;
+},appendChildNodes:function(node){
+var elem=node;
+var self=MochiKit.DOM;
+if(typeof (node)=="string"){
+elem=self.getElement(node);
+}
+var _394=[self.coerceToDOM(MochiKit.Base.extend(null,arguments,1),elem)];
+var _395=MochiKit.Base.concat;
+while(_394.length){
+var n=_394.shift();
+if(typeof (n)=="undefined"||n===null){
+}else{
+if(typeof (n.nodeType)=="number"){
+elem.appendChild(n);
+}else{
+_394=_395(n,_394);
+}
+}
+}
+return elem;
+},insertSiblingNodesBefore:function(node){
+var elem=node;
+var self=MochiKit.DOM;
+if(typeof (node)=="string"){
+elem=self.getElement(node);
+}
+var _39a=[self.coerceToDOM(MochiKit.Base.extend(null,arguments,1),elem)];
+var _39b=elem.parentNode;
+var _39c=MochiKit.Base.concat;
+while(_39a.length){
+var n=_39a.shift();
+if(typeof (n)=="undefined"||n===null){
+}else{
+if(typeof (n.nodeType)=="number"){
+_39b.insertBefore(n,elem);
+}else{
+_39a=_39c(n,_39a);
+}
+}
+}
+return _39b;
+},insertSiblingNodesAfter:function(node){
+var elem=node;
+var self=MochiKit.DOM;
+if(typeof (node)=="string"){
+elem=self.getElement(node);
+}
+var _3a1=[self.coerceToDOM(MochiKit.Base.extend(null,arguments,1),elem)];
+if(elem.nextSibling){
+return self.insertSiblingNodesBefore(elem.nextSibling,_3a1);
+}else{
+return self.appendChildNodes(elem.parentNode,_3a1);
+}
+},replaceChildNodes:function(node){
+var elem=node;
+var self=MochiKit.DOM;
+if(typeof (node)=="string"){
+elem=self.getElement(node);
+arguments[0]=elem;
+}
+var _3a5;
+while((_3a5=elem.firstChild)){
+elem.removeChild(_3a5);
+}
+if(arguments.length<2){
+return elem;
+}else{
+return self.appendChildNodes.apply(this,arguments);
+}
+},createDOM:function(name,_3a7){
+var elem;
+var self=MochiKit.DOM;
+var m=MochiKit.Base;
+if(typeof (_3a7)=="string"||typeof (_3a7)=="number"){
+var args=m.extend([name,null],arguments,1);
+return arguments.callee.apply(this,args);
+}
+if(typeof (name)=="string"){
+var _3ac=self._xhtml;
+if(_3a7&&!self.attributeArray.compliant){
+var _3ad="";
+if("name" in _3a7){
+_3ad+=" name=\""+self.escapeHTML(_3a7.name)+"\"";
+}
+if(name=="input"&&"type" in _3a7){
+_3ad+=" type=\""+self.escapeHTML(_3a7.type)+"\"";
+}
+if(_3ad){
+name="<"+name+_3ad+">";
+_3ac=false;
+}
+}
+var d=self._document;
+if(_3ac&&d===document){
+elem=d.createElementNS("http://www.w3.org/1999/xhtml",name);
+}else{
+elem=d.createElement(name);
+}
+}else{
+elem=name;
+}
+if(_3a7){
+self.updateNodeAttributes(elem,_3a7);
+}
+if(arguments.length<=2){
+return elem;
+}else{
+var args=m.extend([elem],arguments,2);
+return self.appendChildNodes.apply(this,args);
+}
+},createDOMFunc:function(){
+var m=MochiKit.Base;
+return m.partial.apply(this,m.extend([MochiKit.DOM.createDOM],arguments));
+},removeElement:function(elem){
+var self=MochiKit.DOM;
+if(typeof (elem)=="string"){
+elem=self.getElement(elem);
+}
+var e=self.coerceToDOM(elem);
+e.parentNode.removeChild(e);
+return e;
+},swapDOM:function(dest,src){
+var self=MochiKit.DOM;
+dest=self.getElement(dest);
+var _3b6=dest.parentNode;
+if(src){
+if(typeof (src)=="string"){
+src=self.getElement(src);
+}
+src=self.coerceToDOM(src,_3b6);
+_3b6.replaceChild(src,dest);
+}else{
+_3b6.removeChild(dest);
+}
+return src;
+},getElement:function(id){
+var self=MochiKit.DOM;
+if(arguments.length==1){
+return ((typeof (id)=="string")?self._document.getElementById(id):id);
+}else{
+return MochiKit.Base.map(self.getElement,arguments);
+}
+},getElementsByTagAndClassName:function(_3b9,_3ba,_3bb){
+var self=MochiKit.DOM;
+if(typeof (_3b9)=="undefined"||_3b9===null){
+_3b9="*";
+}
+if(typeof (_3bb)=="undefined"||_3bb===null){
+_3bb=self._document;
+}
+_3bb=self.getElement(_3bb);
+if(_3bb==null){
+return [];
+}
+var _3bd=(_3bb.getElementsByTagName(_3b9)||self._document.all);
+if(typeof (_3ba)=="undefined"||_3ba===null){
+return MochiKit.Base.extend(null,_3bd);
+}
+var _3be=[];
+for(var i=0;i<_3bd.length;i++){
+var _3c0=_3bd[i];
+var cls=_3c0.className;
+if(typeof (cls)!="string"){
+cls=_3c0.getAttribute("class");
+}
+if(typeof (cls)=="string"){
+var _3c2=cls.split(" ");
+for(var j=0;j<_3c2.length;j++){
+if(_3c2[j]==_3ba){
+_3be.push(_3c0);
+break;
+}
+}
+}
+}
+return _3be;
+},_newCallStack:function(path,once){
+var rval=function(){
+var _3c7=arguments.callee.callStack;
+for(var i=0;i<_3c7.length;i++){
+if(_3c7[i].apply(this,arguments)===false){
+break;
+}
+}
+if(once){
+try{
+this[path]=null;
+}
+catch(e){
+}
+}
+};
+rval.callStack=[];
+return rval;
+},addToCallStack:function(_3c9,path,func,once){
+var self=MochiKit.DOM;
+var _3ce=_3c9[path];
+var _3cf=_3ce;
+if(!(typeof (_3ce)=="function"&&typeof (_3ce.callStack)=="object"&&_3ce.callStack!==null)){
+_3cf=self._newCallStack(path,once);
+if(typeof (_3ce)=="function"){
+_3cf.callStack.push(_3ce);
+}
+_3c9[path]=_3cf;
+}
+_3cf.callStack.push(func);
+},addLoadEvent:function(func){
+var self=MochiKit.DOM;
+self.addToCallStack(self._window,"onload",func,true);
+},focusOnLoad:function(_3d2){
+var self=MochiKit.DOM;
+self.addLoadEvent(function(){
+_3d2=self.getElement(_3d2);
+if(_3d2){
+_3d2.focus();
+}
+});
+},setElementClass:function(_3d4,_3d5){
+var self=MochiKit.DOM;
+var obj=self.getElement(_3d4);
+if(self.attributeArray.compliant){
+obj.setAttribute("class",_3d5);
+}else{
+obj.setAttribute("className",_3d5);
+}
+},toggleElementClass:function(_3d8){
+var self=MochiKit.DOM;
+for(var i=1;i<arguments.length;i++){
+var obj=self.getElement(arguments[i]);
+if(!self.addElementClass(obj,_3d8)){
+self.removeElementClass(obj,_3d8);
+}
+}
+},addElementClass:function(_3dc,_3dd){
+var self=MochiKit.DOM;
+var obj=self.getElement(_3dc);
+var cls=obj.className;
+if(typeof (cls)!="string"){
+cls=obj.getAttribute("class");
+}
+if(typeof (cls)!="string"||cls.length===0){
+self.setElementClass(obj,_3dd);
+return true;
+}
+if(cls==_3dd){
+return false;
+}
+var _3e1=cls.split(" ");
+for(var i=0;i<_3e1.length;i++){
+if(_3e1[i]==_3dd){
+return false;
+}
+}
+self.setElementClass(obj,cls+" "+_3dd);
+return true;
+},removeElementClass:function(_3e3,_3e4){
+var self=MochiKit.DOM;
+var obj=self.getElement(_3e3);
+var cls=obj.className;
+if(typeof (cls)!="string"){
+cls=obj.getAttribute("class");
+}
+if(typeof (cls)!="string"||cls.length===0){
+return false;
+}
+if(cls==_3e4){
+self.setElementClass(obj,"");
+return true;
+}
+var _3e8=cls.split(" ");
+for(var i=0;i<_3e8.length;i++){
+if(_3e8[i]==_3e4){
+_3e8.splice(i,1);
+self.setElementClass(obj,_3e8.join(" "));
+return true;
+}
+}
+return false;
+},swapElementClass:function(_3ea,_3eb,_3ec){
+var obj=MochiKit.DOM.getElement(_3ea);
+var res=MochiKit.DOM.removeElementClass(obj,_3eb);
+if(res){
+MochiKit.DOM.addElementClass(obj,_3ec);
+}
+return res;
+},hasElementClass:function(_3ef,_3f0){
+var obj=MochiKit.DOM.getElement(_3ef);
+if(obj==null){
+return false;
+}
+var cls=obj.className;
+if(typeof (cls)!="string"&&typeof (obj.getAttribute)=="function"){
+cls=obj.getAttribute("class");
+}
+if(typeof (cls)!="string"){
+return false;
+}
+var _3f3=cls.split(" ");
+for(var i=1;i<arguments.length;i++){
+var good=false;
+for(var j=0;j<_3f3.length;j++){
+if(_3f3[j]==arguments[i]){
+good=true;
+break;
+}
+}
+if(!good){
+return false;
+}
+}
+return true;
+},escapeHTML:function(s){
+return s.replace(/&/g,"&amp;").replace(/"/g,"&quot;").replace(/</g,"&lt;").replace(/>/g,"&gt;");
+},toHTML:function(dom){
+return MochiKit.DOM.emitHTML(dom).join("");
+},emitHTML:function(dom,lst){
+if(typeof (lst)=="undefined"||lst===null){
+lst=[];
+}
+var _3fb=[dom];
+var self=MochiKit.DOM;
+var _3fd=self.escapeHTML;
+var _3fe=self.attributeArray;
+while(_3fb.length){
+dom=_3fb.pop();
+if(typeof (dom)=="string"){
+lst.push(dom);
+}else{
+if(dom.nodeType==1){
+lst.push("<"+dom.tagName.toLowerCase());
+var _3ff=[];
+var _400=_3fe(dom);
+for(var i=0;i<_400.length;i++){
+var a=_400[i];
+_3ff.push([" ",a.name,"=\"",_3fd(a.value),"\""]);
+}
+_3ff.sort();
+for(i=0;i<_3ff.length;i++){
+var _403=_3ff[i];
+for(var j=0;j<_403.length;j++){
+lst.push(_403[j]);
+}
+}
+if(dom.hasChildNodes()){
+lst.push(">");
+_3fb.push("</"+dom.tagName.toLowerCase()+">");
+var _405=dom.childNodes;
+for(i=_405.length-1;i>=0;i--){
+_3fb.push(_405[i]);
+}
+}else{
+lst.push("/>");
+}
+}else{
+if(dom.nodeType==3){
+lst.push(_3fd(dom.nodeValue));
+}
+}
+}
+}
+return lst;
+},scrapeText:function(node,_407){
+var rval=[];
+(function(node){
+var cn=node.childNodes;
+if(cn){
+for(var i=0;i<cn.length;i++){
+arguments.callee.call(this,cn[i]);
+}
+}
+var _40c=node.nodeValue;
+if(typeof (_40c)=="string"){
+rval.push(_40c);
+}
+})(MochiKit.DOM.getElement(node));
+if(_407){
+return rval;
+}else{
+return rval.join("");
+}
+},removeEmptyTextNodes:function(_40d){
+_40d=MochiKit.DOM.getElement(_40d);
+for(var i=0;i<_40d.childNodes.length;i++){
+var node=_40d.childNodes[i];
+if(node.nodeType==3&&!/\S/.test(node.nodeValue)){
+node.parentNode.removeChild(node);
+}
+}
+},getFirstElementByTagAndClassName:function(_410,_411,_412){
+var self=MochiKit.DOM;
+if(typeof (_410)=="undefined"||_410===null){
+_410="*";
+}
+if(typeof (_412)=="undefined"||_412===null){
+_412=self._document;
+}
+_412=self.getElement(_412);
+if(_412==null){
+return null;
+}
+var _414=(_412.getElementsByTagName(_410)||self._document.all);
+if(_414.length<=0){
+return null;
+}else{
+if(typeof (_411)=="undefined"||_411===null){
+return _414[0];
+}
+}
+for(var i=0;i<_414.length;i++){
+var _416=_414[i];
+var cls=_416.className;
+if(typeof (cls)!="string"){
+cls=_416.getAttribute("class");
+}
+if(typeof (cls)=="string"){
+var _418=cls.split(" ");
+for(var j=0;j<_418.length;j++){
+if(_418[j]==_411){
+return _416;
+}
+}
+}
+}
+return null;
+},getFirstParentByTagAndClassName:function(elem,_41b,_41c){
+var self=MochiKit.DOM;
+elem=self.getElement(elem);
+if(typeof (_41b)=="undefined"||_41b===null){
+_41b="*";
+}else{
+_41b=_41b.toUpperCase();
+}
+if(typeof (_41c)=="undefined"||_41c===null){
+_41c=null;
+}
+if(elem){
+elem=elem.parentNode;
+}
+while(elem&&elem.tagName){
+var _41e=elem.tagName.toUpperCase();
+if((_41b==="*"||_41b==_41e)&&(_41c===null||self.hasElementClass(elem,_41c))){
+return elem;
+}
+elem=elem.parentNode;
+}
+return null;
+},__new__:function(win){
+var m=MochiKit.Base;
+if(typeof (document)!="undefined"){
+this._document=document;
+var _421="http://www.mozilla.org/keymaster/gatekeeper/there.is.only.xul";
+this._xhtml=(document.documentElement&&document.createElementNS&&document.documentElement.namespaceURI===_421);
+}else{
+if(MochiKit.MockDOM){
+this._document=MochiKit.MockDOM.document;
+}
+}
+this._window=win;
+this.domConverters=new m.AdapterRegistry();
+var _422=this._document.createElement("span");
+var _423;
+if(_422&&_422.attributes&&_422.attributes.length>0){
+var _424=m.filter;
+_423=function(node){
+return _424(_423.ignoreAttrFilter,node.attributes);
+};
+_423.ignoreAttr={};
+var _426=_422.attributes;
+var _427=_423.ignoreAttr;
+for(var i=0;i<_426.length;i++){
+var a=_426[i];
+_427[a.name]=a.value;
+}
+_423.ignoreAttrFilter=function(a){
+return (_423.ignoreAttr[a.name]!=a.value);
+};
+_423.compliant=false;
+_423.renames={"class":"className","checked":"defaultChecked","usemap":"useMap","for":"htmlFor","readonly":"readOnly","colspan":"colSpan","bgcolor":"bgColor","cellspacing":"cellSpacing","cellpadding":"cellPadding"};
+}else{
+_423=function(node){
+return node.attributes;
+};
+_423.compliant=true;
+_423.ignoreAttr={};
+_423.renames={};
+}
+_423.__export__=false;
+this.attributeArray=_423;
+m._deprecated(this,"computedStyle","MochiKit.Style.getStyle","1.4",true);
+m._deprecated(this,"elementDimensions","MochiKit.Style.getElementDimensions","1.4");
+m._deprecated(this,"elementPosition","MochiKit.Style.getElementPosition","1.4");
+m._deprecated(this,"getViewportDimensions","MochiKit.Style.getViewportDimensions","1.4");
+m._deprecated(this,"hideElement","MochiKit.Style.hideElement","1.4");
+m._deprecated(this,"makeClipping","MochiKit.Style.makeClipping","1.4.1");
+m._deprecated(this,"makePositioned","MochiKit.Style.makePositioned","1.4.1");
+m._deprecated(this,"setElementDimensions","MochiKit.Style.setElementDimensions","1.4");
+m._deprecated(this,"setElementPosition","MochiKit.Style.setElementPosition","1.4");
+m._deprecated(this,"setDisplayForElement","MochiKit.Style.setDisplayForElement","1.4");
+m._deprecated(this,"setOpacity","MochiKit.Style.setOpacity","1.4");
+m._deprecated(this,"showElement","MochiKit.Style.showElement","1.4");
+m._deprecated(this,"undoClipping","MochiKit.Style.undoClipping","1.4.1");
+m._deprecated(this,"undoPositioned","MochiKit.Style.undoPositioned","1.4.1");
+m._deprecated(this,"Coordinates","MochiKit.Style.Coordinates","1.4");
+m._deprecated(this,"Dimensions","MochiKit.Style.Dimensions","1.4");
+var _42c=this.createDOMFunc;
+this.UL=_42c("ul");
+this.OL=_42c("ol");
+this.LI=_42c("li");
+this.DL=_42c("dl");
+this.DT=_42c("dt");
+this.DD=_42c("dd");
+this.TD=_42c("td");
+this.TR=_42c("tr");
+this.TBODY=_42c("tbody");
+this.THEAD=_42c("thead");
+this.TFOOT=_42c("tfoot");
+this.TABLE=_42c("table");
+this.TH=_42c("th");
+this.INPUT=_42c("input");
+this.SPAN=_42c("span");
+this.A=_42c("a");
+this.DIV=_42c("div");
+this.IMG=_42c("img");
+this.BUTTON=_42c("button");
+this.TT=_42c("tt");
+this.PRE=_42c("pre");
+this.H1=_42c("h1");
+this.H2=_42c("h2");
+this.H3=_42c("h3");
+this.H4=_42c("h4");
+this.H5=_42c("h5");
+this.H6=_42c("h6");
+this.BR=_42c("br");
+this.HR=_42c("hr");
+this.LABEL=_42c("label");
+this.TEXTAREA=_42c("textarea");
+this.FORM=_42c("form");
+this.P=_42c("p");
+this.SELECT=_42c("select");
+this.OPTION=_42c("option");
+this.OPTGROUP=_42c("optgroup");
+this.LEGEND=_42c("legend");
+this.FIELDSET=_42c("fieldset");
+this.STRONG=_42c("strong");
+this.CANVAS=_42c("canvas");
+this.$=this.getElement;
+m.nameFunctions(this);
+}});
+MochiKit.DOM.__new__(((typeof (window)=="undefined")?this:window));
+if(MochiKit.__export__){
+withWindow=MochiKit.DOM.withWindow;
+withDocument=MochiKit.DOM.withDocument;
+}
+MochiKit.Base._exportSymbols(this,MochiKit.DOM);
+MochiKit.Base._module("Selector","1.5",["Base","DOM","Iter"]);
+MochiKit.Selector.Selector=function(_42d){
+this.params={classNames:[],pseudoClassNames:[]};
+this.expression=_42d.toString().replace(/(^\s+|\s+$)/g,"");
+this.parseExpression();
+this.compileMatcher();
+};
+MochiKit.Selector.Selector.prototype={__class__:MochiKit.Selector.Selector,parseExpression:function(){
+function abort(_42e){
+throw "Parse error in selector: "+_42e;
+}
+if(this.expression==""){
+abort("empty expression");
+}
+var repr=MochiKit.Base.repr;
+var _430=this.params;
+var expr=this.expression;
+var _432,_433,_434,rest;
+while(_432=expr.match(/^(.*)\[([a-z0-9_:-]+?)(?:([~\|!^$*]?=)(?:"([^"]*)"|([^\]\s]*)))?\]$/i)){
+_430.attributes=_430.attributes||[];
+_430.attributes.push({name:_432[2],operator:_432[3],value:_432[4]||_432[5]||""});
+expr=_432[1];
+}
+if(expr=="*"){
+return this.params.wildcard=true;
+}
+while(_432=expr.match(/^([^a-z0-9_-])?([a-z0-9_-]+(?:\([^)]*\))?)(.*)/i)){
+_433=_432[1];
+_434=_432[2];
+rest=_432[3];
+switch(_433){
+case "#":
+_430.id=_434;
+break;
+case ".":
+_430.classNames.push(_434);
+break;
+case ":":
+_430.pseudoClassNames.push(_434);
+break;
+case "":
+case undefined:
+_430.tagName=_434.toUpperCase();
+break;
+default:
+abort(repr(expr));
+}
+expr=rest;
+}
+if(expr.length>0){
+abort(repr(expr));
+}
+},buildMatchExpression:function(){
+var repr=MochiKit.Base.repr;
+var _437=this.params;
+var _438=[];
+var _439,i;
+function childElements(_43b){
+return "MochiKit.Base.filter(function (node) { return node.nodeType == 1; }, "+_43b+".childNodes)";
+}
+if(_437.wildcard){
+_438.push("true");
+}
+if(_439=_437.id){
+_438.push("element.id == "+repr(_439));
+}
+if(_439=_437.tagName){
+_438.push("element.tagName.toUpperCase() == "+repr(_439));
+}
+if((_439=_437.classNames).length>0){
+for(i=0;i<_439.length;i++){
+_438.push("MochiKit.DOM.hasElementClass(element, "+repr(_439[i])+")");
+}
+}
+if((_439=_437.pseudoClassNames).length>0){
+for(i=0;i<_439.length;i++){
+var _43c=_439[i].match(/^([^(]+)(?:\((.*)\))?$/);
+var _43d=_43c[1];
+var _43e=_43c[2];
+switch(_43d){
+case "root":
+_438.push("element.nodeType == 9 || element === element.ownerDocument.documentElement");
+break;
+case "nth-child":
+case "nth-last-child":
+case "nth-of-type":
+case "nth-last-of-type":
+_43c=_43e.match(/^((?:(\d+)n\+)?(\d+)|odd|even)$/);
+if(!_43c){
+throw "Invalid argument to pseudo element nth-child: "+_43e;
+}
+var a,b;
+if(_43c[0]=="odd"){
+a=2;
+b=1;
+}else{
+if(_43c[0]=="even"){
+a=2;
+b=0;
+}else{
+a=_43c[2]&&parseInt(_43c)||null;
+b=parseInt(_43c[3]);
+}
+}
+_438.push("this.nthChild(element,"+a+","+b+","+!!_43d.match("^nth-last")+","+!!_43d.match("of-type$")+")");
+break;
+case "first-child":
+_438.push("this.nthChild(element, null, 1)");
+break;
+case "last-child":
+_438.push("this.nthChild(element, null, 1, true)");
+break;
+case "first-of-type":
+_438.push("this.nthChild(element, null, 1, false, true)");
+break;
+case "last-of-type":
+_438.push("this.nthChild(element, null, 1, true, true)");
+break;
+case "only-child":
+_438.push(childElements("element.parentNode")+".length == 1");
+break;
+case "only-of-type":
+_438.push("MochiKit.Base.filter(function (node) { return node.tagName == element.tagName; }, "+childElements("element.parentNode")+").length == 1");
+break;
+case "empty":
+_438.push("element.childNodes.length == 0");
+break;
+case "enabled":
+_438.push("(this.isUIElement(element) && element.disabled === false)");
+break;
+case "disabled":
+_438.push("(this.isUIElement(element) && element.disabled === true)");
+break;
+case "checked":
+_438.push("(this.isUIElement(element) && element.checked === true)");
+break;
+case "not":
+var _441=new MochiKit.Selector.Selector(_43e);
+_438.push("!( "+_441.buildMatchExpression()+")");
+break;
+}
+}
+}
+if(_439=_437.attributes){
+MochiKit.Base.map(function(_442){
+var _443="MochiKit.DOM.getNodeAttribute(element, "+repr(_442.name)+")";
+var _444=function(_445){
+return _443+".split("+repr(_445)+")";
+};
+_438.push(_443+" != null");
+switch(_442.operator){
+case "=":
+_438.push(_443+" == "+repr(_442.value));
+break;
+case "~=":
+_438.push("MochiKit.Base.findValue("+_444(" ")+", "+repr(_442.value)+") > -1");
+break;
+case "^=":
+_438.push(_443+".substring(0, "+_442.value.length+") == "+repr(_442.value));
+break;
+case "$=":
+_438.push(_443+".substring("+_443+".length - "+_442.value.length+") == "+repr(_442.value));
+break;
+case "*=":
+_438.push(_443+".match("+repr(_442.value)+")");
+break;
+case "|=":
+_438.push(_444("-")+"[0].toUpperCase() == "+repr(_442.value.toUpperCase()));
+break;
+case "!=":
+_438.push(_443+" != "+repr(_442.value));
+break;
+case "":
+case undefined:
+break;
+default:
+throw "Unknown operator "+_442.operator+" in selector";
+}
+},_439);
+}
+return _438.join(" && ");
+},compileMatcher:function(){
+var code="return (!element.tagName) ? false : "+this.buildMatchExpression()+";";
+this.match=new Function("element",code);
+},nthChild:function(_447,a,b,_44a,_44b){
+var _44c=MochiKit.Base.filter(function(node){
+return node.nodeType==1;
+},_447.parentNode.childNodes);
+if(_44b){
+_44c=MochiKit.Base.filter(function(node){
+return node.tagName==_447.tagName;
+},_44c);
+}
+if(_44a){
+_44c=MochiKit.Iter.reversed(_44c);
+}
+if(a){
+var _44f=MochiKit.Base.findIdentical(_44c,_447);
+return ((_44f+1-b)/a)%1==0;
+}else{
+return b==MochiKit.Base.findIdentical(_44c,_447)+1;
+}
+},isUIElement:function(_450){
+return MochiKit.Base.findValue(["input","button","select","option","textarea","object"],_450.tagName.toLowerCase())>-1;
+},findElements:function(_451,axis){
+var _453;
+if(axis==undefined){
+axis="";
+}
+function inScope(_454,_455){
+if(axis==""){
+return MochiKit.DOM.isChildNode(_454,_455);
+}else{
+if(axis==">"){
+return _454.parentNode===_455;
+}else{
+if(axis=="+"){
+return _454===nextSiblingElement(_455);
+}else{
+if(axis=="~"){
+var _456=_455;
+while(_456=nextSiblingElement(_456)){
+if(_454===_456){
+return true;
+}
+}
+return false;
+}else{
+throw "Invalid axis: "+axis;
+}
+}
+}
+}
+}
+if(_453=MochiKit.DOM.getElement(this.params.id)){
+if(this.match(_453)){
+if(!_451||inScope(_453,_451)){
+return [_453];
+}
+}
+}
+function nextSiblingElement(node){
+node=node.nextSibling;
+while(node&&node.nodeType!=1){
+node=node.nextSibling;
+}
+return node;
+}
+if(axis==""){
+_451=(_451||MochiKit.DOM.currentDocument()).getElementsByTagName(this.params.tagName||"*");
+}else{
+if(axis==">"){
+if(!_451){
+throw "> combinator not allowed without preceeding expression";
+}
+_451=MochiKit.Base.filter(function(node){
+return node.nodeType==1;
+},_451.childNodes);
+}else{
+if(axis=="+"){
+if(!_451){
+throw "+ combinator not allowed without preceeding expression";
+}
+_451=nextSiblingElement(_451)&&[nextSiblingElement(_451)];
+}else{
+if(axis=="~"){
+if(!_451){
+throw "~ combinator not allowed without preceeding expression";
+}
+var _459=[];
+while(nextSiblingElement(_451)){
+_451=nextSiblingElement(_451);
+_459.push(_451);
+}
+_451=_459;
+}
+}
+}
+}
+if(!_451){
+return [];
+}
+var _45a=MochiKit.Base.filter(MochiKit.Base.bind(function(_45b){
+return this.match(_45b);
+},this),_451);
+return _45a;
+},repr:function(){
+return "Selector("+this.expression+")";
+},toString:MochiKit.Base.forwardCall("repr")};
+MochiKit.Base.update(MochiKit.Selector,{findChildElements:function(_45c,_45d){
+_45c=MochiKit.DOM.getElement(_45c);
+var uniq=function(arr){
+var res=[];
+for(var i=0;i<arr.length;i++){
+if(MochiKit.Base.findIdentical(res,arr[i])<0){
+res.push(arr[i]);
+}
+}
+return res;
+};
+return MochiKit.Base.flattenArray(MochiKit.Base.map(function(_462){
+var _463="";
+var _464=function(_465,expr){
+var _467=expr.match(/^[>+~]$/);
+if(_467){
+_463=_467[0];
+return _465;
+}else{
+var _468=new MochiKit.Selector.Selector(expr);
+var _469=MochiKit.Iter.reduce(function(_46a,_46b){
+return MochiKit.Base.extend(_46a,_468.findElements(_46b||_45c,_463));
+},_465,[]);
+_463="";
+return _469;
+}
+};
+var _46c=_462.replace(/(^\s+|\s+$)/g,"").split(/\s+/);
+return uniq(MochiKit.Iter.reduce(_464,_46c,[null]));
+},_45d));
+},findDocElements:function(){
+return MochiKit.Selector.findChildElements(MochiKit.DOM.currentDocument(),arguments);
+},__new__:function(){
+this.$$=this.findDocElements;
+MochiKit.Base.nameFunctions(this);
+}});
+MochiKit.Selector.__new__();
+MochiKit.Base._exportSymbols(this,MochiKit.Selector);
+MochiKit.Base._module("Style","1.5",["Base","DOM"]);
+MochiKit.Style.Dimensions=function(w,h){
+if(!(this instanceof MochiKit.Style.Dimensions)){
+return new MochiKit.Style.Dimensions(w,h);
+}
+this.w=w;
+this.h=h;
+};
+MochiKit.Style.Dimensions.prototype.__repr__=function(){
+var repr=MochiKit.Base.repr;
+return "{w: "+repr(this.w)+", h: "+repr(this.h)+"}";
+};
+MochiKit.Style.Dimensions.prototype.toString=function(){
+return this.__repr__();
+};
+MochiKit.Style.Coordinates=function(x,y){
+if(!(this instanceof MochiKit.Style.Coordinates)){
+return new MochiKit.Style.Coordinates(x,y);
+}
+this.x=x;
+this.y=y;
+};
+MochiKit.Style.Coordinates.prototype.__repr__=function(){
+var repr=MochiKit.Base.repr;
+return "{x: "+repr(this.x)+", y: "+repr(this.y)+"}";
+};
+MochiKit.Style.Coordinates.prototype.toString=function(){
+return this.__repr__();
+};
+MochiKit.Base.update(MochiKit.Style,{getStyle:function(elem,_474){
+var dom=MochiKit.DOM;
+var d=dom._document;
+elem=dom.getElement(elem);
+_474=MochiKit.Base.camelize(_474);
+if(!elem||elem==d){
+return undefined;
+}
+if(_474=="opacity"&&typeof (elem.filters)!="undefined"){
+var _477=(MochiKit.Style.getStyle(elem,"filter")||"").match(/alpha\(opacity=(.*)\)/);
+if(_477&&_477[1]){
+return parseFloat(_477[1])/100;
+}
+return 1;
+}
+if(_474=="float"||_474=="cssFloat"||_474=="styleFloat"){
+if(elem.style["float"]){
+return elem.style["float"];
+}else{
+if(elem.style.cssFloat){
+return elem.style.cssFloat;
+}else{
+if(elem.style.styleFloat){
+return elem.style.styleFloat;
+}else{
+return "none";
+}
+}
+}
+}
+var _478=elem.style?elem.style[_474]:null;
+if(!_478){
+if(d.defaultView&&d.defaultView.getComputedStyle){
+var css=d.defaultView.getComputedStyle(elem,null);
+_474=_474.replace(/([A-Z])/g,"-$1").toLowerCase();
+_478=css?css.getPropertyValue(_474):null;
+}else{
+if(elem.currentStyle){
+_478=elem.currentStyle[_474];
+if(/^\d/.test(_478)&&!/px$/.test(_478)&&_474!="fontWeight"){
+var left=elem.style.left;
+var _47b=elem.runtimeStyle.left;
+elem.runtimeStyle.left=elem.currentStyle.left;
+elem.style.left=_478||0;
+_478=elem.style.pixelLeft+"px";
+elem.style.left=left;
+elem.runtimeStyle.left=_47b;
+}
+}
+}
+}
+if(_474=="opacity"){
+_478=parseFloat(_478);
+}
+if(/Opera/.test(navigator.userAgent)&&(MochiKit.Base.findValue(["left","top","right","bottom"],_474)!=-1)){
+if(MochiKit.Style.getStyle(elem,"position")=="static"){
+_478="auto";
+}
+}
+return _478=="auto"?null:_478;
+},setStyle:function(elem,_47d){
+elem=MochiKit.DOM.getElement(elem);
+for(var name in _47d){
+switch(name){
+case "opacity":
+MochiKit.Style.setOpacity(elem,_47d[name]);
+break;
+case "float":
+case "cssFloat":
+case "styleFloat":
+if(typeof (elem.style["float"])!="undefined"){
+elem.style["float"]=_47d[name];
+}else{
+if(typeof (elem.style.cssFloat)!="undefined"){
+elem.style.cssFloat=_47d[name];
+}else{
+elem.style.styleFloat=_47d[name];
+}
+}
+break;
+default:
+elem.style[MochiKit.Base.camelize(name)]=_47d[name];
+}
+}
+},setOpacity:function(elem,o){
+elem=MochiKit.DOM.getElement(elem);
+var self=MochiKit.Style;
+if(o==1){
+var _482=/Gecko/.test(navigator.userAgent)&&!(/Konqueror|AppleWebKit|KHTML/.test(navigator.userAgent));
+elem.style["opacity"]=_482?0.999999:1;
+if(/MSIE/.test(navigator.userAgent)){
+elem.style["filter"]=self.getStyle(elem,"filter").replace(/alpha\([^\)]*\)/gi,"");
+}
+}else{
+if(o<0.00001){
+o=0;
+}
+elem.style["opacity"]=o;
+if(/MSIE/.test(navigator.userAgent)){
+elem.style["filter"]=self.getStyle(elem,"filter").replace(/alpha\([^\)]*\)/gi,"")+"alpha(opacity="+o*100+")";
+}
+}
+},getElementPosition:function(elem,_484){
+var self=MochiKit.Style;
+var dom=MochiKit.DOM;
+var _487=function(o){
+return o!=null&&o.nodeType==null&&typeof (o.x)=="number"&&typeof (o.y)=="number";
+};
+if(typeof (elem)=="string"){
+elem=dom.getElement(elem);
+}
+if(elem==null||(!_487(elem)&&self.getStyle(elem,"display")=="none")){
+return undefined;
+}
+var c=new self.Coordinates(0,0);
+var box=null;
+var _48b=null;
+var d=MochiKit.DOM._document;
+var de=d.documentElement;
+var b=d.body;
+if(!elem.parentNode&&elem.x&&elem.y){
+c.x+=elem.x||0;
+c.y+=elem.y||0;
+}else{
+if(elem.getBoundingClientRect){
+box=elem.getBoundingClientRect();
+c.x+=box.left+(de.scrollLeft||b.scrollLeft)-(de.clientLeft||0);
+c.y+=box.top+(de.scrollTop||b.scrollTop)-(de.clientTop||0);
+}else{
+if(elem.offsetParent){
+c.x+=elem.offsetLeft;
+c.y+=elem.offsetTop;
+_48b=elem.offsetParent;
+if(_48b!=elem){
+while(_48b){
+c.x+=parseInt(_48b.style.borderLeftWidth)||0;
+c.y+=parseInt(_48b.style.borderTopWidth)||0;
+c.x+=_48b.offsetLeft;
+c.y+=_48b.offsetTop;
+_48b=_48b.offsetParent;
+}
+}
+var ua=navigator.userAgent.toLowerCase();
+if((typeof (opera)!="undefined"&&parseFloat(opera.version())<9)||(ua.indexOf("AppleWebKit")!=-1&&self.getStyle(elem,"position")=="absolute")){
+c.x-=b.offsetLeft;
+c.y-=b.offsetTop;
+}
+if(elem.parentNode){
+_48b=elem.parentNode;
+}else{
+_48b=null;
+}
+while(_48b){
+var _490=_48b.tagName.toUpperCase();
+if(_490==="BODY"||_490==="HTML"){
+break;
+}
+var disp=self.getStyle(_48b,"display");
+if(disp.search(/^inline|table-row.*$/i)){
+c.x-=_48b.scrollLeft;
+c.y-=_48b.scrollTop;
+}
+if(_48b.parentNode){
+_48b=_48b.parentNode;
+}else{
+_48b=null;
+}
+}
+}
+}
+}
+if(_484){
+_484=arguments.callee(_484);
+if(_484){
+c.x-=(_484.x||0);
+c.y-=(_484.y||0);
+}
+}
+return c;
+},setElementPosition:function(elem,_493,_494){
+elem=MochiKit.DOM.getElement(elem);
+if(typeof (_494)=="undefined"){
+_494="px";
+}
+var _495={};
+var _496=MochiKit.Base.isUndefinedOrNull;
+if(!_496(_493.x)){
+_495["left"]=_493.x+_494;
+}
+if(!_496(_493.y)){
+_495["top"]=_493.y+_494;
+}
+MochiKit.DOM.updateNodeAttributes(elem,{"style":_495});
+},makePositioned:function(_497){
+_497=MochiKit.DOM.getElement(_497);
+var pos=MochiKit.Style.getStyle(_497,"position");
+if(pos=="static"||!pos){
+_497.style.position="relative";
+if(/Opera/.test(navigator.userAgent)){
+_497.style.top=0;
+_497.style.left=0;
+}
+}
+},undoPositioned:function(_499){
+_499=MochiKit.DOM.getElement(_499);
+if(_499.style.position=="relative"){
+_499.style.position=_499.style.top=_499.style.left=_499.style.bottom=_499.style.right="";
+}
+},makeClipping:function(_49a){
+_49a=MochiKit.DOM.getElement(_49a);
+var s=_49a.style;
+var _49c={"overflow":s.overflow,"overflow-x":s.overflowX,"overflow-y":s.overflowY};
+if((MochiKit.Style.getStyle(_49a,"overflow")||"visible")!="hidden"){
+_49a.style.overflow="hidden";
+_49a.style.overflowX="hidden";
+_49a.style.overflowY="hidden";
+}
+return _49c;
+},undoClipping:function(_49d,_49e){
+_49d=MochiKit.DOM.getElement(_49d);
+if(typeof (_49e)=="string"){
+_49d.style.overflow=_49e;
+}else{
+if(_49e!=null){
+_49d.style.overflow=_49e["overflow"];
+_49d.style.overflowX=_49e["overflow-x"];
+_49d.style.overflowY=_49e["overflow-y"];
+}
+}
+},getElementDimensions:function(elem,_4a0){
+var self=MochiKit.Style;
+var dom=MochiKit.DOM;
+if(typeof (elem.w)=="number"||typeof (elem.h)=="number"){
+return new self.Dimensions(elem.w||0,elem.h||0);
+}
+elem=dom.getElement(elem);
+if(!elem){
+return undefined;
+}
+var disp=self.getStyle(elem,"display");
+if(disp=="none"||disp==""||typeof (disp)=="undefined"){
+var s=elem.style;
+var _4a5=s.visibility;
+var _4a6=s.position;
+var _4a7=s.display;
+s.visibility="hidden";
+s.position="absolute";
+s.display=self._getDefaultDisplay(elem);
+var _4a8=elem.offsetWidth;
+var _4a9=elem.offsetHeight;
+s.display=_4a7;
+s.position=_4a6;
+s.visibility=_4a5;
+}else{
+_4a8=elem.offsetWidth||0;
+_4a9=elem.offsetHeight||0;
+}
+if(_4a0){
+var _4aa="colSpan" in elem&&"rowSpan" in elem;
+var _4ab=(_4aa&&elem.parentNode&&self.getStyle(elem.parentNode,"borderCollapse")=="collapse");
+if(_4ab){
+if(/MSIE/.test(navigator.userAgent)){
+var _4ac=elem.previousSibling?0.5:1;
+var _4ad=elem.nextSibling?0.5:1;
+}else{
+var _4ac=0.5;
+var _4ad=0.5;
+}
+}else{
+var _4ac=1;
+var _4ad=1;
+}
+_4a8-=Math.round((parseFloat(self.getStyle(elem,"paddingLeft"))||0)+(parseFloat(self.getStyle(elem,"paddingRight"))||0)+_4ac*(parseFloat(self.getStyle(elem,"borderLeftWidth"))||0)+_4ad*(parseFloat(self.getStyle(elem,"borderRightWidth"))||0));
+if(_4aa){
+if(/Gecko|Opera/.test(navigator.userAgent)&&!/Konqueror|AppleWebKit|KHTML/.test(navigator.userAgent)){
+var _4ae=0;
+}else{
+if(/MSIE/.test(navigator.userAgent)){
+var _4ae=1;
+}else{
+var _4ae=_4ab?0.5:1;
+}
+}
+}else{
+var _4ae=1;
+}
+_4a9-=Math.round((parseFloat(self.getStyle(elem,"paddingTop"))||0)+(parseFloat(self.getStyle(elem,"paddingBottom"))||0)+_4ae*((parseFloat(self.getStyle(elem,"borderTopWidth"))||0)+(parseFloat(self.getStyle(elem,"borderBottomWidth"))||0)));
+}
+return new self.Dimensions(_4a8,_4a9);
+},setElementDimensions:function(elem,_4b0,_4b1){
+elem=MochiKit.DOM.getElement(elem);
+if(typeof (_4b1)=="undefined"){
+_4b1="px";
+}
+var _4b2={};
+var _4b3=MochiKit.Base.isUndefinedOrNull;
+if(!_4b3(_4b0.w)){
+_4b2["width"]=_4b0.w+_4b1;
+}
+if(!_4b3(_4b0.h)){
+_4b2["height"]=_4b0.h+_4b1;
+}
+MochiKit.DOM.updateNodeAttributes(elem,{"style":_4b2});
+},_getDefaultDisplay:function(elem){
+var self=MochiKit.Style;
+var dom=MochiKit.DOM;
+elem=dom.getElement(elem);
+if(!elem){
+return undefined;
+}
+var _4b7=elem.tagName.toUpperCase();
+return self._defaultDisplay[_4b7]||"block";
+},setDisplayForElement:function(_4b8,_4b9){
+var _4ba=MochiKit.Base.extend(null,arguments,1);
+var _4bb=MochiKit.DOM.getElement;
+for(var i=0;i<_4ba.length;i++){
+_4b9=_4bb(_4ba[i]);
+if(_4b9){
+_4b9.style.display=_4b8;
+}
+}
+},getViewportDimensions:function(){
+var d=new MochiKit.Style.Dimensions();
+var w=MochiKit.DOM._window;
+var b=MochiKit.DOM._document.body;
+if(w.innerWidth){
+d.w=w.innerWidth;
+d.h=w.innerHeight;
+}else{
+if(b&&b.parentElement&&b.parentElement.clientWidth){
+d.w=b.parentElement.clientWidth;
+d.h=b.parentElement.clientHeight;
+}else{
+if(b&&b.clientWidth){
+d.w=b.clientWidth;
+d.h=b.clientHeight;
+}
+}
+}
+return d;
+},getViewportPosition:function(){
+var c=new MochiKit.Style.Coordinates(0,0);
+var d=MochiKit.DOM._document;
+var de=d.documentElement;
+var db=d.body;
+if(de&&(de.scrollTop||de.scrollLeft)){
+c.x=de.scrollLeft;
+c.y=de.scrollTop;
+}else{
+if(db){
+c.x=db.scrollLeft;
+c.y=db.scrollTop;
+}
+}
+return c;
+},__new__:function(){
+var m=MochiKit.Base;
+var _4c5=["A","ABBR","ACRONYM","B","BASEFONT","BDO","BIG","BR","CITE","CODE","DFN","EM","FONT","I","IMG","KBD","LABEL","Q","S","SAMP","SMALL","SPAN","STRIKE","STRONG","SUB","SUP","TEXTAREA","TT","U","VAR"];
+this._defaultDisplay={"TABLE":"table","THEAD":"table-header-group","TBODY":"table-row-group","TFOOT":"table-footer-group","COLGROUP":"table-column-group","COL":"table-column","TR":"table-row","TD":"table-cell","TH":"table-cell","CAPTION":"table-caption","LI":"list-item","INPUT":"inline-block","SELECT":"inline-block"};
+if(/MSIE/.test(navigator.userAgent)){
+for(var k in this._defaultDisplay){
+var v=this._defaultDisplay[k];
+if(v.indexOf("table")==0){
+this._defaultDisplay[k]="block";
+}
+}
+}
+for(var i=0;i<_4c5.length;i++){
+this._defaultDisplay[_4c5[i]]="inline";
+}
+m._deprecated(this,"elementPosition","MochiKit.Style.getElementPosition","1.3",true);
+m._deprecated(this,"elementDimensions","MochiKit.Style.getElementDimensions","1.3",true);
+this.hideElement=m.partial(this.setDisplayForElement,"none");
+this.showElement=m.partial(this.setDisplayForElement,"block");
+m.nameFunctions(this);
+}});
+MochiKit.Style.__new__();
+MochiKit.Base._exportSymbols(this,MochiKit.Style);
+MochiKit.Base._module("LoggingPane","1.5",["Base","Logging"]);
+MochiKit.LoggingPane.createLoggingPane=function(_4c9){
+var m=MochiKit.LoggingPane;
+_4c9=!(!_4c9);
+if(m._loggingPane&&m._loggingPane.inline!=_4c9){
+m._loggingPane.closePane();
+m._loggingPane=null;
+}
+if(!m._loggingPane||m._loggingPane.closed){
+m._loggingPane=new m.LoggingPane(_4c9,MochiKit.Logging.logger);
+}
+return m._loggingPane;
+};
+MochiKit.LoggingPane.LoggingPane=function(_4cb,_4cc){
+if(typeof (_4cc)=="undefined"||_4cc===null){
+_4cc=MochiKit.Logging.logger;
+}
+this.logger=_4cc;
+var _4cd=MochiKit.Base.update;
+var _4ce=MochiKit.Base.updatetree;
+var bind=MochiKit.Base.bind;
+var _4d0=MochiKit.Base.clone;
+var win=window;
+var uid="_MochiKit_LoggingPane";
+if(typeof (MochiKit.DOM)!="undefined"){
+win=MochiKit.DOM.currentWindow();
+}
+if(!_4cb){
+var url=win.location.href.split("?")[0].replace(/[#:\/.><&%-]/g,"_");
+var name=uid+"_"+url;
+var nwin=win.open("",name,"dependent,resizable,height=200");
+if(!nwin){
+alert("Not able to open debugging window due to pop-up blocking.");
+return undefined;
+}
+nwin.document.write("<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0 Transitional//EN\" "+"\"http://www.w3.org/TR/html4/loose.dtd\">"+"<html><head><title>[MochiKit.LoggingPane]</title></head>"+"<body></body></html>");
+nwin.document.close();
+nwin.document.title+=" "+win.document.title;
+win=nwin;
+}
+var doc=win.document;
+this.doc=doc;
+var _4d7=doc.getElementById(uid);
+var _4d8=!!_4d7;
+if(_4d7&&typeof (_4d7.loggingPane)!="undefined"){
+_4d7.loggingPane.logger=this.logger;
+_4d7.loggingPane.buildAndApplyFilter();
+return _4d7.loggingPane;
+}
+if(_4d8){
+var _4d9;
+while((_4d9=_4d7.firstChild)){
+_4d7.removeChild(_4d9);
+}
+}else{
+_4d7=doc.createElement("div");
+_4d7.id=uid;
+}
+_4d7.loggingPane=this;
+var _4da=doc.createElement("input");
+var _4db=doc.createElement("input");
+var _4dc=doc.createElement("button");
+var _4dd=doc.createElement("button");
+var _4de=doc.createElement("button");
+var _4df=doc.createElement("button");
+var _4e0=doc.createElement("div");
+var _4e1=doc.createElement("div");
+var _4e2=uid+"_Listener";
+this.colorTable=_4d0(this.colorTable);
+var _4e3=[];
+var _4e4=null;
+var _4e5=function(msg){
+var _4e7=msg.level;
+if(typeof (_4e7)=="number"){
+_4e7=MochiKit.Logging.LogLevel[_4e7];
+}
+return _4e7;
+};
+var _4e8=function(msg){
+return msg.info.join(" ");
+};
+var _4ea=bind(function(msg){
+var _4ec=_4e5(msg);
+var text=_4e8(msg);
+var c=this.colorTable[_4ec];
+var p=doc.createElement("span");
+p.className="MochiKit-LogMessage MochiKit-LogLevel-"+_4ec;
+p.style.cssText="margin: 0px; white-space: -moz-pre-wrap; white-space: -o-pre-wrap; white-space: pre-wrap; white-space: pre-line; word-wrap: break-word; wrap-option: emergency; color: "+c;
+p.appendChild(doc.createTextNode(_4ec+": "+text));
+_4e1.appendChild(p);
+_4e1.appendChild(doc.createElement("br"));
+if(_4e0.offsetHeight>_4e0.scrollHeight){
+_4e0.scrollTop=0;
+}else{
+_4e0.scrollTop=_4e0.scrollHeight;
+}
+},this);
+var _4f0=function(msg){
+_4e3[_4e3.length]=msg;
+_4ea(msg);
+};
+var _4f2=function(){
+var _4f3,_4f4;
+try{
+_4f3=new RegExp(_4da.value);
+_4f4=new RegExp(_4db.value);
+}
+catch(e){
+logDebug("Error in filter regex: "+e.message);
+return null;
+}
+return function(msg){
+return (_4f3.test(_4e5(msg))&&_4f4.test(_4e8(msg)));
+};
+};
+var _4f6=function(){
+while(_4e1.firstChild){
+_4e1.removeChild(_4e1.firstChild);
+}
+};
+var _4f7=function(){
+_4e3=[];
+_4f6();
+};
+var _4f8=bind(function(){
+if(this.closed){
+return;
+}
+this.closed=true;
+if(MochiKit.LoggingPane._loggingPane==this){
+MochiKit.LoggingPane._loggingPane=null;
+}
+this.logger.removeListener(_4e2);
+try{
+try{
+_4d7.loggingPane=null;
+}
+catch(e){
+logFatal("Bookmarklet was closed incorrectly.");
+}
+if(_4cb){
+_4d7.parentNode.removeChild(_4d7);
+}else{
+this.win.close();
+}
+}
+catch(e){
+}
+},this);
+var _4f9=function(){
+_4f6();
+for(var i=0;i<_4e3.length;i++){
+var msg=_4e3[i];
+if(_4e4===null||_4e4(msg)){
+_4ea(msg);
+}
+}
+};
+this.buildAndApplyFilter=function(){
+_4e4=_4f2();
+_4f9();
+this.logger.removeListener(_4e2);
+this.logger.addListener(_4e2,_4e4,_4f0);
+};
+var _4fc=bind(function(){
+_4e3=this.logger.getMessages();
+_4f9();
+},this);
+var _4fd=bind(function(_4fe){
+_4fe=_4fe||window.event;
+key=_4fe.which||_4fe.keyCode;
+if(key==13){
+this.buildAndApplyFilter();
+}
+},this);
+var _4ff="display: block; z-index: 1000; left: 0px; bottom: 0px; position: fixed; width: 100%; background-color: white; font: "+this.logFont;
+if(_4cb){
+_4ff+="; height: 10em; border-top: 2px solid black";
+}else{
+_4ff+="; height: 100%;";
+}
+_4d7.style.cssText=_4ff;
+if(!_4d8){
+doc.body.appendChild(_4d7);
+}
+_4ff={"cssText":"width: 33%; display: inline; font: "+this.logFont};
+_4ce(_4da,{"value":"FATAL|ERROR|WARNING|INFO|DEBUG","onkeypress":_4fd,"style":_4ff});
+_4d7.appendChild(_4da);
+_4ce(_4db,{"value":".*","onkeypress":_4fd,"style":_4ff});
+_4d7.appendChild(_4db);
+_4ff="width: 8%; display:inline; font: "+this.logFont;
+_4dc.appendChild(doc.createTextNode("Filter"));
+_4dc.onclick=bind("buildAndApplyFilter",this);
+_4dc.style.cssText=_4ff;
+_4d7.appendChild(_4dc);
+_4dd.appendChild(doc.createTextNode("Load"));
+_4dd.onclick=_4fc;
+_4dd.style.cssText=_4ff;
+_4d7.appendChild(_4dd);
+_4de.appendChild(doc.createTextNode("Clear"));
+_4de.onclick=_4f7;
+_4de.style.cssText=_4ff;
+_4d7.appendChild(_4de);
+_4df.appendChild(doc.createTextNode("Close"));
+_4df.onclick=_4f8;
+_4df.style.cssText=_4ff;
+_4d7.appendChild(_4df);
+_4e0.style.cssText="overflow: auto; width: 100%";
+_4e1.style.cssText="width: 100%; height: "+(_4cb?"8em":"100%");
+_4e0.appendChild(_4e1);
+_4d7.appendChild(_4e0);
+this.buildAndApplyFilter();
+_4fc();
+if(_4cb){
+this.win=undefined;
+}else{
+this.win=win;
+}
+this.inline=_4cb;
+this.closePane=_4f8;
+this.closed=false;
+return this;
+};
+MochiKit.LoggingPane.LoggingPane.prototype={"logFont":"8pt Verdana,sans-serif","colorTable":{"ERROR":"red","FATAL":"darkred","WARNING":"blue","INFO":"black","DEBUG":"green"}};
+MochiKit.LoggingPane.__new__=function(){
+MochiKit.Base.nameFunctions(this);
+MochiKit.LoggingPane._loggingPane=null;
+};
+MochiKit.LoggingPane.__new__();
+MochiKit.Base._exportSymbols(this,MochiKit.LoggingPane);
+MochiKit.Base._module("Color","1.5",["Base","DOM","Style"]);
+MochiKit.Color.Color=function(red,_501,blue,_503){
+if(typeof (_503)=="undefined"||_503===null){
+_503=1;
+}
+this.rgb={r:red,g:_501,b:blue,a:_503};
+};
+MochiKit.Color.Color.prototype={__class__:MochiKit.Color.Color,colorWithAlpha:function(_504){
+var rgb=this.rgb;
+var m=MochiKit.Color;
+return m.Color.fromRGB(rgb.r,rgb.g,rgb.b,_504);
+},colorWithHue:function(hue){
+var hsl=this.asHSL();
+hsl.h=hue;
+var m=MochiKit.Color;
+return m.Color.fromHSL(hsl);
+},colorWithSaturation:function(_50a){
+var hsl=this.asHSL();
+hsl.s=_50a;
+var m=MochiKit.Color;
+return m.Color.fromHSL(hsl);
+},colorWithLightness:function(_50d){
+var hsl=this.asHSL();
+hsl.l=_50d;
+var m=MochiKit.Color;
+return m.Color.fromHSL(hsl);
+},darkerColorWithLevel:function(_510){
+var hsl=this.asHSL();
+hsl.l=Math.max(hsl.l-_510,0);
+var m=MochiKit.Color;
+return m.Color.fromHSL(hsl);
+},lighterColorWithLevel:function(_513){
+var hsl=this.asHSL();
+hsl.l=Math.min(hsl.l+_513,1);
+var m=MochiKit.Color;
+return m.Color.fromHSL(hsl);
+},blendedColor:function(_516,_517){
+if(typeof (_517)=="undefined"||_517===null){
+_517=0.5;
+}
+var sf=1-_517;
+var s=this.rgb;
+var d=_516.rgb;
+var df=_517;
+return MochiKit.Color.Color.fromRGB((s.r*sf)+(d.r*df),(s.g*sf)+(d.g*df),(s.b*sf)+(d.b*df),(s.a*sf)+(d.a*df));
+},compareRGB:function(_51c){
+var a=this.asRGB();
+var b=_51c.asRGB();
+return MochiKit.Base.compare([a.r,a.g,a.b,a.a],[b.r,b.g,b.b,b.a]);
+},isLight:function(){
+return this.asHSL().l>0.5;
+},isDark:function(){
+return (!this.isLight());
+},toHSLString:function(){
+var c=this.asHSL();
+var ccc=MochiKit.Color.clampColorComponent;
+var rval=this._hslString;
+if(!rval){
+var mid=(ccc(c.h,360).toFixed(0)+","+ccc(c.s,100).toPrecision(4)+"%"+","+ccc(c.l,100).toPrecision(4)+"%");
+var a=c.a;
+if(a>=1){
+a=1;
+rval="hsl("+mid+")";
+}else{
+if(a<=0){
+a=0;
+}
+rval="hsla("+mid+","+a+")";
+}
+this._hslString=rval;
+}
+return rval;
+},toRGBString:function(){
+var c=this.rgb;
+var ccc=MochiKit.Color.clampColorComponent;
+var rval=this._rgbString;
+if(!rval){
+var mid=(ccc(c.r,255).toFixed(0)+","+ccc(c.g,255).toFixed(0)+","+ccc(c.b,255).toFixed(0));
+if(c.a!=1){
+rval="rgba("+mid+","+c.a+")";
+}else{
+rval="rgb("+mid+")";
+}
+this._rgbString=rval;
+}
+return rval;
+},asRGB:function(){
+return MochiKit.Base.clone(this.rgb);
+},toHexString:function(){
+var m=MochiKit.Color;
+var c=this.rgb;
+var ccc=MochiKit.Color.clampColorComponent;
+var rval=this._hexString;
+if(!rval){
+rval=("#"+m.toColorPart(ccc(c.r,255))+m.toColorPart(ccc(c.g,255))+m.toColorPart(ccc(c.b,255)));
+this._hexString=rval;
+}
+return rval;
+},asHSV:function(){
+var hsv=this.hsv;
+var c=this.rgb;
+if(typeof (hsv)=="undefined"||hsv===null){
+hsv=MochiKit.Color.rgbToHSV(this.rgb);
+this.hsv=hsv;
+}
+return MochiKit.Base.clone(hsv);
+},asHSL:function(){
+var hsl=this.hsl;
+var c=this.rgb;
+if(typeof (hsl)=="undefined"||hsl===null){
+hsl=MochiKit.Color.rgbToHSL(this.rgb);
+this.hsl=hsl;
+}
+return MochiKit.Base.clone(hsl);
+},toString:function(){
+return this.toRGBString();
+},repr:function(){
+var c=this.rgb;
+var col=[c.r,c.g,c.b,c.a];
+return this.__class__.NAME+"("+col.join(", ")+")";
+}};
+MochiKit.Base.update(MochiKit.Color.Color,{fromRGB:function(red,_533,blue,_535){
+var _536=MochiKit.Color.Color;
+if(arguments.length==1){
+var rgb=red;
+red=rgb.r;
+_533=rgb.g;
+blue=rgb.b;
+if(typeof (rgb.a)=="undefined"){
+_535=undefined;
+}else{
+_535=rgb.a;
+}
+}
+return new _536(red,_533,blue,_535);
+},fromHSL:function(hue,_539,_53a,_53b){
+var m=MochiKit.Color;
+return m.Color.fromRGB(m.hslToRGB.apply(m,arguments));
+},fromHSV:function(hue,_53e,_53f,_540){
+var m=MochiKit.Color;
+return m.Color.fromRGB(m.hsvToRGB.apply(m,arguments));
+},fromName:function(name){
+var _543=MochiKit.Color.Color;
+if(name.charAt(0)=="\""){
+name=name.substr(1,name.length-2);
+}
+var _544=_543._namedColors[name.toLowerCase()];
+if(typeof (_544)=="string"){
+return _543.fromHexString(_544);
+}else{
+if(name=="transparent"){
+return _543.transparentColor();
+}
+}
+return null;
+},fromString:function(_545){
+var self=MochiKit.Color.Color;
+var _547=_545.substr(0,3);
+if(_547=="rgb"){
+return self.fromRGBString(_545);
+}else{
+if(_547=="hsl"){
+return self.fromHSLString(_545);
+}else{
+if(_545.charAt(0)=="#"){
+return self.fromHexString(_545);
+}
+}
+}
+return self.fromName(_545);
+},fromHexString:function(_548){
+if(_548.charAt(0)=="#"){
+_548=_548.substring(1);
+}
+var _549=[];
+var i,hex;
+if(_548.length==3){
+for(i=0;i<3;i++){
+hex=_548.substr(i,1);
+_549.push(parseInt(hex+hex,16)/255);
+}
+}else{
+for(i=0;i<6;i+=2){
+hex=_548.substr(i,2);
+_549.push(parseInt(hex,16)/255);
+}
+}
+var _54c=MochiKit.Color.Color;
+return _54c.fromRGB.apply(_54c,_549);
+},_fromColorString:function(pre,_54e,_54f,_550){
+if(_550.indexOf(pre)===0){
+_550=_550.substring(_550.indexOf("(",3)+1,_550.length-1);
+}
+var _551=_550.split(/\s*,\s*/);
+var _552=[];
+for(var i=0;i<_551.length;i++){
+var c=_551[i];
+var val;
+var _556=c.substring(c.length-3);
+if(c.charAt(c.length-1)=="%"){
+val=0.01*parseFloat(c.substring(0,c.length-1));
+}else{
+if(_556=="deg"){
+val=parseFloat(c)/360;
+}else{
+if(_556=="rad"){
+val=parseFloat(c)/(Math.PI*2);
+}else{
+val=_54f[i]*parseFloat(c);
+}
+}
+}
+_552.push(val);
+}
+return this[_54e].apply(this,_552);
+},fromComputedStyle:function(elem,_558){
+var d=MochiKit.DOM;
+var cls=MochiKit.Color.Color;
+for(elem=d.getElement(elem);elem;elem=elem.parentNode){
+var _55b=MochiKit.Style.getStyle.apply(d,arguments);
+if(!_55b){
+continue;
+}
+var _55c=cls.fromString(_55b);
+if(!_55c){
+break;
+}
+if(_55c.asRGB().a>0){
+return _55c;
+}
+}
+return null;
+},fromBackground:function(elem){
+var cls=MochiKit.Color.Color;
+return cls.fromComputedStyle(elem,"backgroundColor","background-color")||cls.whiteColor();
+},fromText:function(elem){
+var cls=MochiKit.Color.Color;
+return cls.fromComputedStyle(elem,"color","color")||cls.blackColor();
+},namedColors:function(){
+return MochiKit.Base.clone(MochiKit.Color.Color._namedColors);
+}});
+MochiKit.Base.update(MochiKit.Color,{clampColorComponent:function(v,_562){
+v*=_562;
+if(v<0){
+return 0;
+}else{
+if(v>_562){
+return _562;
+}else{
+return v;
+}
+}
+},_hslValue:function(n1,n2,hue){
+if(hue>6){
+hue-=6;
+}else{
+if(hue<0){
+hue+=6;
+}
+}
+var val;
+if(hue<1){
+val=n1+(n2-n1)*hue;
+}else{
+if(hue<3){
+val=n2;
+}else{
+if(hue<4){
+val=n1+(n2-n1)*(4-hue);
+}else{
+val=n1;
+}
+}
+}
+return val;
+},hsvToRGB:function(hue,_568,_569,_56a){
+if(arguments.length==1){
+var hsv=hue;
+hue=hsv.h;
+_568=hsv.s;
+_569=hsv.v;
+_56a=hsv.a;
+}
+var red;
+var _56d;
+var blue;
+if(_568===0){
+red=_569;
+_56d=_569;
+blue=_569;
+}else{
+var i=Math.floor(hue*6);
+var f=(hue*6)-i;
+var p=_569*(1-_568);
+var q=_569*(1-(_568*f));
+var t=_569*(1-(_568*(1-f)));
+switch(i){
+case 1:
+red=q;
+_56d=_569;
+blue=p;
+break;
+case 2:
+red=p;
+_56d=_569;
+blue=t;
+break;
+case 3:
+red=p;
+_56d=q;
+blue=_569;
+break;
+case 4:
+red=t;
+_56d=p;
+blue=_569;
+break;
+case 5:
+red=_569;
+_56d=p;
+blue=q;
+break;
+case 6:
+case 0:
+red=_569;
+_56d=t;
+blue=p;
+break;
+}
+}
+return {r:red,g:_56d,b:blue,a:_56a};
+},hslToRGB:function(hue,_575,_576,_577){
+if(arguments.length==1){
+var hsl=hue;
+hue=hsl.h;
+_575=hsl.s;
+_576=hsl.l;
+_577=hsl.a;
+}
+var red;
+var _57a;
+var blue;
+if(_575===0){
+red=_576;
+_57a=_576;
+blue=_576;
+}else{
+var m2;
+if(_576<=0.5){
+m2=_576*(1+_575);
+}else{
+m2=_576+_575-(_576*_575);
+}
+var m1=(2*_576)-m2;
+var f=MochiKit.Color._hslValue;
+var h6=hue*6;
+red=f(m1,m2,h6+2);
+_57a=f(m1,m2,h6);
+blue=f(m1,m2,h6-2);
+}
+return {r:red,g:_57a,b:blue,a:_577};
+},rgbToHSV:function(red,_581,blue,_583){
+if(arguments.length==1){
+var rgb=red;
+red=rgb.r;
+_581=rgb.g;
+blue=rgb.b;
+_583=rgb.a;
+}
+var max=Math.max(Math.max(red,_581),blue);
+var min=Math.min(Math.min(red,_581),blue);
+var hue;
+var _588;
+var _589=max;
+if(min==max){
+hue=0;
+_588=0;
+}else{
+var _58a=(max-min);
+_588=_58a/max;
+if(red==max){
+hue=(_581-blue)/_58a;
+}else{
+if(_581==max){
+hue=2+((blue-red)/_58a);
+}else{
+hue=4+((red-_581)/_58a);
+}
+}
+hue/=6;
+if(hue<0){
+hue+=1;
+}
+if(hue>1){
+hue-=1;
+}
+}
+return {h:hue,s:_588,v:_589,a:_583};
+},rgbToHSL:function(red,_58c,blue,_58e){
+if(arguments.length==1){
+var rgb=red;
+red=rgb.r;
+_58c=rgb.g;
+blue=rgb.b;
+_58e=rgb.a;
+}
+var max=Math.max(red,Math.max(_58c,blue));
+var min=Math.min(red,Math.min(_58c,blue));
+var hue;
+var _593;
+var _594=(max+min)/2;
+var _595=max-min;
+if(_595===0){
+hue=0;
+_593=0;
+}else{
+if(_594<=0.5){
+_593=_595/(max+min);
+}else{
+_593=_595/(2-max-min);
+}
+if(red==max){
+hue=(_58c-blue)/_595;
+}else{
+if(_58c==max){
+hue=2+((blue-red)/_595);
+}else{
+hue=4+((red-_58c)/_595);
+}
+}
+hue/=6;
+if(hue<0){
+hue+=1;
+}
+if(hue>1){
+hue-=1;
+}
+}
+return {h:hue,s:_593,l:_594,a:_58e};
+},toColorPart:function(num){
+num=Math.round(num);
+var _597=num.toString(16);
+if(num<16){
+return "0"+_597;
+}
+return _597;
+},__new__:function(){
+var m=MochiKit.Base;
+this.Color.fromRGBString=m.bind(this.Color._fromColorString,this.Color,"rgb","fromRGB",[1/255,1/255,1/255,1]);
+this.Color.fromHSLString=m.bind(this.Color._fromColorString,this.Color,"hsl","fromHSL",[1/360,0.01,0.01,1]);
+var _599=1/3;
+var _59a={black:[0,0,0],blue:[0,0,1],brown:[0.6,0.4,0.2],cyan:[0,1,1],darkGray:[_599,_599,_599],gray:[0.5,0.5,0.5],green:[0,1,0],lightGray:[2*_599,2*_599,2*_599],magenta:[1,0,1],orange:[1,0.5,0],purple:[0.5,0,0.5],red:[1,0,0],transparent:[0,0,0,0],white:[1,1,1],yellow:[1,1,0]};
+for(var k in _59a){
+var name=k+"Color";
+var _59d=this.Color.fromRGB.apply(this.Color,_59a[k]);
+this.Color[name]=m.partial(m.operator.identity,_59d);
+}
+var _59e=function(){
+for(var i=0;i<arguments.length;i++){
+if(!(arguments[i] instanceof MochiKit.Color.Color)){
+return false;
+}
+}
+return true;
+};
+var _5a0=function(a,b){
+return a.compareRGB(b);
+};
+m.nameFunctions(this);
+m.registerComparator(this.Color.NAME,_59e,_5a0);
+}});
+MochiKit.Color.__new__();
+MochiKit.Color.Color._namedColors={aliceblue:"#f0f8ff",antiquewhite:"#faebd7",aqua:"#00ffff",aquamarine:"#7fffd4",azure:"#f0ffff",beige:"#f5f5dc",bisque:"#ffe4c4",black:"#000000",blanchedalmond:"#ffebcd",blue:"#0000ff",blueviolet:"#8a2be2",brown:"#a52a2a",burlywood:"#deb887",cadetblue:"#5f9ea0",chartreuse:"#7fff00",chocolate:"#d2691e",coral:"#ff7f50",cornflowerblue:"#6495ed",cornsilk:"#fff8dc",crimson:"#dc143c",cyan:"#00ffff",darkblue:"#00008b",darkcyan:"#008b8b",darkgoldenrod:"#b8860b",darkgray:"#a9a9a9",darkgreen:"#006400",darkgrey:"#a9a9a9",darkkhaki:"#bdb76b",darkmagenta:"#8b008b",darkolivegreen:"#556b2f",darkorange:"#ff8c00",darkorchid:"#9932cc",darkred:"#8b0000",darksalmon:"#e9967a",darkseagreen:"#8fbc8f",darkslateblue:"#483d8b",darkslategray:"#2f4f4f",darkslategrey:"#2f4f4f",darkturquoise:"#00ced1",darkviolet:"#9400d3",deeppink:"#ff1493",deepskyblue:"#00bfff",dimgray:"#696969",dimgrey:"#696969",dodgerblue:"#1e90ff",firebrick:"#b22222",floralwhite:"#fffaf0",forestgreen:"#228b22",fuchsia:"#ff00ff",gainsboro:"#dcdcdc",ghostwhite:"#f8f8ff",gold:"#ffd700",goldenrod:"#daa520",gray:"#808080",green:"#008000",greenyellow:"#adff2f",grey:"#808080",honeydew:"#f0fff0",hotpink:"#ff69b4",indianred:"#cd5c5c",indigo:"#4b0082",ivory:"#fffff0",khaki:"#f0e68c",lavender:"#e6e6fa",lavenderblush:"#fff0f5",lawngreen:"#7cfc00",lemonchiffon:"#fffacd",lightblue:"#add8e6",lightcoral:"#f08080",lightcyan:"#e0ffff",lightgoldenrodyellow:"#fafad2",lightgray:"#d3d3d3",lightgreen:"#90ee90",lightgrey:"#d3d3d3",lightpink:"#ffb6c1",lightsalmon:"#ffa07a",lightseagreen:"#20b2aa",lightskyblue:"#87cefa",lightslategray:"#778899",lightslategrey:"#778899",lightsteelblue:"#b0c4de",lightyellow:"#ffffe0",lime:"#00ff00",limegreen:"#32cd32",linen:"#faf0e6",magenta:"#ff00ff",maroon:"#800000",mediumaquamarine:"#66cdaa",mediumblue:"#0000cd",mediumorchid:"#ba55d3",mediumpurple:"#9370db",mediumseagreen:"#3cb371",mediumslateblue:"#7b68ee",mediumspringgreen:"#00fa9a",mediumturquoise:"#48d1cc",mediumvioletred:"#c71585",midnightblue:"#191970",mintcream:"#f5fffa",mistyrose:"#ffe4e1",moccasin:"#ffe4b5",navajowhite:"#ffdead",navy:"#000080",oldlace:"#fdf5e6",olive:"#808000",olivedrab:"#6b8e23",orange:"#ffa500",orangered:"#ff4500",orchid:"#da70d6",palegoldenrod:"#eee8aa",palegreen:"#98fb98",paleturquoise:"#afeeee",palevioletred:"#db7093",papayawhip:"#ffefd5",peachpuff:"#ffdab9",peru:"#cd853f",pink:"#ffc0cb",plum:"#dda0dd",powderblue:"#b0e0e6",purple:"#800080",red:"#ff0000",rosybrown:"#bc8f8f",royalblue:"#4169e1",saddlebrown:"#8b4513",salmon:"#fa8072",sandybrown:"#f4a460",seagreen:"#2e8b57",seashell:"#fff5ee",sienna:"#a0522d",silver:"#c0c0c0",skyblue:"#87ceeb",slateblue:"#6a5acd",slategray:"#708090",slategrey:"#708090",snow:"#fffafa",springgreen:"#00ff7f",steelblue:"#4682b4",tan:"#d2b48c",teal:"#008080",thistle:"#d8bfd8",tomato:"#ff6347",turquoise:"#40e0d0",violet:"#ee82ee",wheat:"#f5deb3",white:"#ffffff",whitesmoke:"#f5f5f5",yellow:"#ffff00",yellowgreen:"#9acd32"};
+MochiKit.Base._exportSymbols(this,MochiKit.Color);
+MochiKit.Base._module("Signal","1.5",["Base","DOM","Style"]);
+MochiKit.Signal._observers=[];
+MochiKit.Signal.Event=function(src,e){
+this._event=e||window.event;
+this._src=src;
+};
+MochiKit.Signal.Event.__export__=false;
+MochiKit.Base.update(MochiKit.Signal.Event.prototype,{__repr__:function(){
+var repr=MochiKit.Base.repr;
+var str="{event(): "+repr(this.event())+", src(): "+repr(this.src())+", type(): "+repr(this.type())+", target(): "+repr(this.target());
+if(this.type()&&this.type().indexOf("key")===0||this.type().indexOf("mouse")===0||this.type().indexOf("click")!=-1||this.type()=="contextmenu"){
+str+=", modifier(): "+"{alt: "+repr(this.modifier().alt)+", ctrl: "+repr(this.modifier().ctrl)+", meta: "+repr(this.modifier().meta)+", shift: "+repr(this.modifier().shift)+", any: "+repr(this.modifier().any)+"}";
+}
+if(this.type()&&this.type().indexOf("key")===0){
+str+=", key(): {code: "+repr(this.key().code)+", string: "+repr(this.key().string)+"}";
+}
+if(this.type()&&(this.type().indexOf("mouse")===0||this.type().indexOf("click")!=-1||this.type()=="contextmenu")){
+str+=", mouse(): {page: "+repr(this.mouse().page)+", client: "+repr(this.mouse().client);
+if(this.type()!="mousemove"&&this.type()!="mousewheel"){
+str+=", button: {left: "+repr(this.mouse().button.left)+", middle: "+repr(this.mouse().button.middle)+", right: "+repr(this.mouse().button.right)+"}";
+}
+if(this.type()=="mousewheel"){
+str+=", wheel: "+repr(this.mouse().wheel);
+}
+str+="}";
+}
+if(this.type()=="mouseover"||this.type()=="mouseout"||this.type()=="mouseenter"||this.type()=="mouseleave"){
+str+=", relatedTarget(): "+repr(this.relatedTarget());
+}
+str+="}";
+return str;
+},toString:function(){
+return this.__repr__();
+},src:function(){
+return this._src;
+},event:function(){
+return this._event;
+},type:function(){
+if(this._event.type==="DOMMouseScroll"){
+return "mousewheel";
+}else{
+return this._event.type||undefined;
+}
+},target:function(){
+return this._event.target||this._event.srcElement;
+},_relatedTarget:null,relatedTarget:function(){
+if(this._relatedTarget!==null){
+return this._relatedTarget;
+}
+var elem=null;
+if(this.type()=="mouseover"||this.type()=="mouseenter"){
+elem=(this._event.relatedTarget||this._event.fromElement);
+}else{
+if(this.type()=="mouseout"||this.type()=="mouseleave"){
+elem=(this._event.relatedTarget||this._event.toElement);
+}
+}
+try{
+if(elem!==null&&elem.nodeType!==null){
+this._relatedTarget=elem;
+return elem;
+}
+}
+catch(ignore){
+}
+return undefined;
+},_modifier:null,modifier:function(){
+if(this._modifier!==null){
+return this._modifier;
+}
+var m={};
+m.alt=this._event.altKey;
+m.ctrl=this._event.ctrlKey;
+m.meta=this._event.metaKey||false;
+m.shift=this._event.shiftKey;
+m.any=m.alt||m.ctrl||m.shift||m.meta;
+this._modifier=m;
+return m;
+},_key:null,key:function(){
+if(this._key!==null){
+return this._key;
+}
+var k={};
+if(this.type()&&this.type().indexOf("key")===0){
+if(this.type()=="keydown"||this.type()=="keyup"){
+k.code=this._event.keyCode;
+k.string=(MochiKit.Signal._specialKeys[k.code]||"KEY_UNKNOWN");
+this._key=k;
+return k;
+}else{
+if(this.type()=="keypress"){
+k.code=0;
+k.string="";
+if(typeof (this._event.charCode)!="undefined"&&this._event.charCode!==0&&!MochiKit.Signal._specialMacKeys[this._event.charCode]){
+k.code=this._event.charCode;
+k.string=String.fromCharCode(k.code);
+}else{
+if(this._event.keyCode&&typeof (this._event.charCode)=="undefined"){
+k.code=this._event.keyCode;
+k.string=String.fromCharCode(k.code);
+}
+}
+this._key=k;
+return k;
+}
+}
+}
+return undefined;
+},_mouse:null,mouse:function(){
+if(this._mouse!==null){
+return this._mouse;
+}
+var m={};
+var e=this._event;
+if(this.type()&&(this.type().indexOf("mouse")===0||this.type().indexOf("drag")===0||this.type().indexOf("click")!=-1||this.type()=="contextmenu")){
+m.client=new MochiKit.Style.Coordinates(0,0);
+if(e.clientX||e.clientY){
+m.client.x=(!e.clientX||e.clientX<0)?0:e.clientX;
+m.client.y=(!e.clientY||e.clientY<0)?0:e.clientY;
+}
+m.page=new MochiKit.Style.Coordinates(0,0);
+if(e.pageX||e.pageY){
+m.page.x=(!e.pageX||e.pageX<0)?0:e.pageX;
+m.page.y=(!e.pageY||e.pageY<0)?0:e.pageY;
+}else{
+var de=MochiKit.DOM._document.documentElement;
+var b=MochiKit.DOM._document.body;
+m.page.x=e.clientX+(de.scrollLeft||b.scrollLeft)-(de.clientLeft||0);
+m.page.y=e.clientY+(de.scrollTop||b.scrollTop)-(de.clientTop||0);
+}
+if(this.type()!="mousemove"&&this.type()!="mousewheel"){
+m.button={};
+m.button.left=false;
+m.button.right=false;
+m.button.middle=false;
+if(e.which){
+m.button.left=(e.which==1);
+m.button.middle=(e.which==2);
+m.button.right=(e.which==3);
+}else{
+m.button.left=!!(e.button&1);
+m.button.right=!!(e.button&2);
+m.button.middle=!!(e.button&4);
+}
+}
+if(this.type()=="mousewheel"){
+m.wheel=new MochiKit.Style.Coordinates(0,0);
+if(e.wheelDeltaX||e.wheelDeltaY){
+m.wheel.x=e.wheelDeltaX/-40||0;
+m.wheel.y=e.wheelDeltaY/-40||0;
+}else{
+if(e.wheelDelta){
+m.wheel.y=e.wheelDelta/-40;
+}else{
+m.wheel.y=e.detail||0;
+}
+}
+}
+this._mouse=m;
+return m;
+}
+return undefined;
+},stop:function(){
+this.stopPropagation();
+this.preventDefault();
+},stopPropagation:function(){
+if(this._event.stopPropagation){
+this._event.stopPropagation();
+}else{
+this._event.cancelBubble=true;
+}
+},preventDefault:function(){
+if(this._event.preventDefault){
+this._event.preventDefault();
+}else{
+if(this._confirmUnload===null){
+this._event.returnValue=false;
+}
+}
+},_confirmUnload:null,confirmUnload:function(msg){
+if(this.type()=="beforeunload"){
+this._confirmUnload=msg;
+this._event.returnValue=msg;
+}
+}});
+MochiKit.Signal._specialMacKeys={3:"KEY_ENTER",63289:"KEY_NUM_PAD_CLEAR",63276:"KEY_PAGE_UP",63277:"KEY_PAGE_DOWN",63275:"KEY_END",63273:"KEY_HOME",63234:"KEY_ARROW_LEFT",63232:"KEY_ARROW_UP",63235:"KEY_ARROW_RIGHT",63233:"KEY_ARROW_DOWN",63302:"KEY_INSERT",63272:"KEY_DELETE"};
+(function(){
+var _5af=MochiKit.Signal._specialMacKeys;
+for(var i=63236;i<=63242;i++){
+_5af[i]="KEY_F"+(i-63236+1);
+}
+})();
+MochiKit.Signal._specialKeys={8:"KEY_BACKSPACE",9:"KEY_TAB",12:"KEY_NUM_PAD_CLEAR",13:"KEY_ENTER",16:"KEY_SHIFT",17:"KEY_CTRL",18:"KEY_ALT",19:"KEY_PAUSE",20:"KEY_CAPS_LOCK",27:"KEY_ESCAPE",32:"KEY_SPACEBAR",33:"KEY_PAGE_UP",34:"KEY_PAGE_DOWN",35:"KEY_END",36:"KEY_HOME",37:"KEY_ARROW_LEFT",38:"KEY_ARROW_UP",39:"KEY_ARROW_RIGHT",40:"KEY_ARROW_DOWN",44:"KEY_PRINT_SCREEN",45:"KEY_INSERT",46:"KEY_DELETE",59:"KEY_SEMICOLON",91:"KEY_WINDOWS_LEFT",92:"KEY_WINDOWS_RIGHT",93:"KEY_SELECT",106:"KEY_NUM_PAD_ASTERISK",107:"KEY_NUM_PAD_PLUS_SIGN",109:"KEY_NUM_PAD_HYPHEN-MINUS",110:"KEY_NUM_PAD_FULL_STOP",111:"KEY_NUM_PAD_SOLIDUS",144:"KEY_NUM_LOCK",145:"KEY_SCROLL_LOCK",186:"KEY_SEMICOLON",187:"KEY_EQUALS_SIGN",188:"KEY_COMMA",189:"KEY_HYPHEN-MINUS",190:"KEY_FULL_STOP",191:"KEY_SOLIDUS",192:"KEY_GRAVE_ACCENT",219:"KEY_LEFT_SQUARE_BRACKET",220:"KEY_REVERSE_SOLIDUS",221:"KEY_RIGHT_SQUARE_BRACKET",222:"KEY_APOSTROPHE"};
+(function(){
+var _5b1=MochiKit.Signal._specialKeys;
+for(var i=48;i<=57;i++){
+_5b1[i]="KEY_"+(i-48);
+}
+for(i=65;i<=90;i++){
+_5b1[i]="KEY_"+String.fromCharCode(i);
+}
+for(i=96;i<=105;i++){
+_5b1[i]="KEY_NUM_PAD_"+(i-96);
+}
+for(i=112;i<=123;i++){
+_5b1[i]="KEY_F"+(i-112+1);
+}
+})();
+MochiKit.Signal.Ident=function(_5b3){
+this.source=_5b3.source;
+this.signal=_5b3.signal;
+this.listener=_5b3.listener;
+this.isDOM=_5b3.isDOM;
+this.objOrFunc=_5b3.objOrFunc;
+this.funcOrStr=_5b3.funcOrStr;
+this.connected=_5b3.connected;
+};
+MochiKit.Signal.Ident.__export__=false;
+MochiKit.Signal.Ident.prototype={};
+MochiKit.Base.update(MochiKit.Signal,{_unloadCache:function(){
+var self=MochiKit.Signal;
+var _5b5=self._observers;
+for(var i=0;i<_5b5.length;i++){
+if(_5b5[i].signal!=="onload"&&_5b5[i].signal!=="onunload"){
+self._disconnect(_5b5[i]);
+}
+}
+},_listener:function(src,sig,func,obj,_5bb){
+var self=MochiKit.Signal;
+var E=self.Event;
+if(!_5bb){
+if(typeof (func.im_self)=="undefined"){
+return MochiKit.Base.bindLate(func,obj);
+}else{
+return func;
+}
+}
+obj=obj||src;
+if(typeof (func)=="string"){
+if(sig==="onload"||sig==="onunload"){
+return function(_5be){
+obj[func].apply(obj,[new E(src,_5be)]);
+var _5bf=new MochiKit.Signal.Ident({source:src,signal:sig,objOrFunc:obj,funcOrStr:func});
+MochiKit.Signal._disconnect(_5bf);
+};
+}else{
+return function(_5c0){
+obj[func].apply(obj,[new E(src,_5c0)]);
+};
+}
+}else{
+if(sig==="onload"||sig==="onunload"){
+return function(_5c1){
+func.apply(obj,[new E(src,_5c1)]);
+var _5c2=new MochiKit.Signal.Ident({source:src,signal:sig,objOrFunc:func});
+MochiKit.Signal._disconnect(_5c2);
+};
+}else{
+return function(_5c3){
+func.apply(obj,[new E(src,_5c3)]);
+};
+}
+}
+},_browserAlreadyHasMouseEnterAndLeave:function(){
+return /MSIE/.test(navigator.userAgent);
+},_browserLacksMouseWheelEvent:function(){
+return /Gecko\//.test(navigator.userAgent);
+},_mouseEnterListener:function(src,sig,func,obj){
+var E=MochiKit.Signal.Event;
+return function(_5c9){
+var e=new E(src,_5c9);
+try{
+e.relatedTarget().nodeName;
+}
+catch(err){
+return;
+}
+e.stop();
+if(MochiKit.DOM.isChildNode(e.relatedTarget(),src)){
+return;
+}
+e.type=function(){
+return sig;
+};
+if(typeof (func)=="string"){
+return obj[func].apply(obj,[e]);
+}else{
+return func.apply(obj,[e]);
+}
+};
+},_getDestPair:function(_5cb,_5cc){
+var obj=null;
+var func=null;
+if(typeof (_5cc)!="undefined"){
+obj=_5cb;
+func=_5cc;
+if(typeof (_5cc)=="string"){
+if(typeof (_5cb[_5cc])!="function"){
+throw new Error("'funcOrStr' must be a function on 'objOrFunc'");
+}
+}else{
+if(typeof (_5cc)!="function"){
+throw new Error("'funcOrStr' must be a function or string");
+}
+}
+}else{
+if(typeof (_5cb)!="function"){
+throw new Error("'objOrFunc' must be a function if 'funcOrStr' is not given");
+}else{
+func=_5cb;
+}
+}
+return [obj,func];
+},connect:function(src,sig,_5d1,_5d2){
+if(typeof (src)=="string"){
+src=MochiKit.DOM.getElement(src);
+}
+var self=MochiKit.Signal;
+if(typeof (sig)!="string"){
+throw new Error("'sig' must be a string");
+}
+var _5d4=self._getDestPair(_5d1,_5d2);
+var obj=_5d4[0];
+var func=_5d4[1];
+if(typeof (obj)=="undefined"||obj===null){
+obj=src;
+}
+var _5d7=!!(src.addEventListener||src.attachEvent);
+if(_5d7&&(sig==="onmouseenter"||sig==="onmouseleave")&&!self._browserAlreadyHasMouseEnterAndLeave()){
+var _5d8=self._mouseEnterListener(src,sig.substr(2),func,obj);
+if(sig==="onmouseenter"){
+sig="onmouseover";
+}else{
+sig="onmouseout";
+}
+}else{
+if(_5d7&&sig=="onmousewheel"&&self._browserLacksMouseWheelEvent()){
+var _5d8=self._listener(src,sig,func,obj,_5d7);
+sig="onDOMMouseScroll";
+}else{
+var _5d8=self._listener(src,sig,func,obj,_5d7);
+}
+}
+if(src.addEventListener){
+src.addEventListener(sig.substr(2),_5d8,false);
+}else{
+if(src.attachEvent){
+src.attachEvent(sig,_5d8);
+}
+}
+var _5d9=new MochiKit.Signal.Ident({source:src,signal:sig,listener:_5d8,isDOM:_5d7,objOrFunc:_5d1,funcOrStr:_5d2,connected:true});
+self._observers.push(_5d9);
+if(!_5d7&&typeof (src.__connect__)=="function"){
+var args=MochiKit.Base.extend([_5d9],arguments,1);
+src.__connect__.apply(src,args);
+}
+return _5d9;
+},_disconnect:function(_5db){
+if(!_5db.connected){
+return;
+}
+_5db.connected=false;
+var src=_5db.source;
+var sig=_5db.signal;
+var _5de=_5db.listener;
+if(!_5db.isDOM){
+if(typeof (src.__disconnect__)=="function"){
+src.__disconnect__(_5db,sig,_5db.objOrFunc,_5db.funcOrStr);
+}
+return;
+}
+if(src.removeEventListener){
+src.removeEventListener(sig.substr(2),_5de,false);
+}else{
+if(src.detachEvent){
+src.detachEvent(sig,_5de);
+}else{
+throw new Error("'src' must be a DOM element");
+}
+}
+},disconnect:function(_5df){
+var self=MochiKit.Signal;
+var _5e1=self._observers;
+var m=MochiKit.Base;
+if(arguments.length>1){
+var src=arguments[0];
+if(typeof (src)=="string"){
+src=MochiKit.DOM.getElement(src);
+}
+var sig=arguments[1];
+var obj=arguments[2];
+var func=arguments[3];
+for(var i=_5e1.length-1;i>=0;i--){
+var o=_5e1[i];
+if(o.source===src&&o.signal===sig&&o.objOrFunc===obj&&o.funcOrStr===func){
+self._disconnect(o);
+if(self._lock===0){
+_5e1.splice(i,1);
+}else{
+self._dirty=true;
+}
+return true;
+}
+}
+}else{
+var idx=m.findIdentical(_5e1,_5df);
+if(idx>=0){
+self._disconnect(_5df);
+if(self._lock===0){
+_5e1.splice(idx,1);
+}else{
+self._dirty=true;
+}
+return true;
+}
+}
+return false;
+},disconnectAllTo:function(_5ea,_5eb){
+var self=MochiKit.Signal;
+var _5ed=self._observers;
+var _5ee=self._disconnect;
+var lock=self._lock;
+var _5f0=self._dirty;
+if(typeof (_5eb)==="undefined"){
+_5eb=null;
+}
+for(var i=_5ed.length-1;i>=0;i--){
+var _5f2=_5ed[i];
+if(_5f2.objOrFunc===_5ea&&(_5eb===null||_5f2.funcOrStr===_5eb)){
+_5ee(_5f2);
+if(lock===0){
+_5ed.splice(i,1);
+}else{
+_5f0=true;
+}
+}
+}
+self._dirty=_5f0;
+},disconnectAll:function(src,sig){
+if(typeof (src)=="string"){
+src=MochiKit.DOM.getElement(src);
+}
+var m=MochiKit.Base;
+var _5f6=m.flattenArguments(m.extend(null,arguments,1));
+var self=MochiKit.Signal;
+var _5f8=self._disconnect;
+var _5f9=self._observers;
+var i,_5fb;
+var lock=self._lock;
+var _5fd=self._dirty;
+if(_5f6.length===0){
+for(i=_5f9.length-1;i>=0;i--){
+_5fb=_5f9[i];
+if(_5fb.source===src){
+_5f8(_5fb);
+if(lock===0){
+_5f9.splice(i,1);
+}else{
+_5fd=true;
+}
+}
+}
+}else{
+var sigs={};
+for(i=0;i<_5f6.length;i++){
+sigs[_5f6[i]]=true;
+}
+for(i=_5f9.length-1;i>=0;i--){
+_5fb=_5f9[i];
+if(_5fb.source===src&&_5fb.signal in sigs){
+_5f8(_5fb);
+if(lock===0){
+_5f9.splice(i,1);
+}else{
+_5fd=true;
+}
+}
+}
+}
+self._dirty=_5fd;
+},signal:function(src,sig){
+var self=MochiKit.Signal;
+var _602=self._observers;
+if(typeof (src)=="string"){
+src=MochiKit.DOM.getElement(src);
+}
+var args=MochiKit.Base.extend(null,arguments,2);
+var _604=[];
+self._lock++;
+for(var i=0;i<_602.length;i++){
+var _606=_602[i];
+if(_606.source===src&&_606.signal===sig&&_606.connected){
+try{
+if(_606.isDOM&&_606.funcOrStr!=null){
+var obj=_606.objOrFunc;
+obj[_606.funcOrStr].apply(obj,args);
+}else{
+if(_606.isDOM){
+_606.objOrFunc.apply(src,args);
+}else{
+_606.listener.apply(src,args);
+}
+}
+}
+catch(e){
+_604.push(e);
+}
+}
+}
+self._lock--;
+if(self._lock===0&&self._dirty){
+self._dirty=false;
+for(var i=_602.length-1;i>=0;i--){
+if(!_602[i].connected){
+_602.splice(i,1);
+}
+}
+}
+if(_604.length==1){
+throw _604[0];
+}else{
+if(_604.length>1){
+var e=new Error("Multiple errors thrown in handling 'sig', see errors property");
+e.errors=_604;
+throw e;
+}
+}
+}});
+MochiKit.Signal.__new__=function(win){
+var m=MochiKit.Base;
+this._document=document;
+this._window=win;
+this._lock=0;
+this._dirty=false;
+try{
+this.connect(window,"onunload",this._unloadCache);
+}
+catch(e){
+}
+m.nameFunctions(this);
+};
+MochiKit.Signal.__new__(this);
+if(MochiKit.__export__){
+connect=MochiKit.Signal.connect;
+disconnect=MochiKit.Signal.disconnect;
+disconnectAll=MochiKit.Signal.disconnectAll;
+signal=MochiKit.Signal.signal;
+}
+MochiKit.Base._exportSymbols(this,MochiKit.Signal);
+MochiKit.Base._module("Position","1.5",["Base","DOM","Style"]);
+MochiKit.Base.update(MochiKit.Position,{__export__:false,includeScrollOffsets:false,prepare:function(){
+var _60b=window.pageXOffset||document.documentElement.scrollLeft||document.body.scrollLeft||0;
+var _60c=window.pageYOffset||document.documentElement.scrollTop||document.body.scrollTop||0;
+this.windowOffset=new MochiKit.Style.Coordinates(_60b,_60c);
+},cumulativeOffset:function(_60d){
+var _60e=0;
+var _60f=0;
+do{
+_60e+=_60d.offsetTop||0;
+_60f+=_60d.offsetLeft||0;
+_60d=_60d.offsetParent;
+}while(_60d);
+return new MochiKit.Style.Coordinates(_60f,_60e);
+},realOffset:function(_610){
+var _611=0;
+var _612=0;
+do{
+_611+=_610.scrollTop||0;
+_612+=_610.scrollLeft||0;
+_610=_610.parentNode;
+}while(_610);
+return new MochiKit.Style.Coordinates(_612,_611);
+},within:function(_613,x,y){
+if(this.includeScrollOffsets){
+return this.withinIncludingScrolloffsets(_613,x,y);
+}
+this.xcomp=x;
+this.ycomp=y;
+this.offset=this.cumulativeOffset(_613);
+if(_613.style.position=="fixed"){
+this.offset.x+=this.windowOffset.x;
+this.offset.y+=this.windowOffset.y;
+}
+return (y>=this.offset.y&&y<this.offset.y+_613.offsetHeight&&x>=this.offset.x&&x<this.offset.x+_613.offsetWidth);
+},withinIncludingScrolloffsets:function(_616,x,y){
+var _619=this.realOffset(_616);
+this.xcomp=x+_619.x-this.windowOffset.x;
+this.ycomp=y+_619.y-this.windowOffset.y;
+this.offset=this.cumulativeOffset(_616);
+return (this.ycomp>=this.offset.y&&this.ycomp<this.offset.y+_616.offsetHeight&&this.xcomp>=this.offset.x&&this.xcomp<this.offset.x+_616.offsetWidth);
+},overlap:function(mode,_61b){
+if(!mode){
+return 0;
+}
+if(mode=="vertical"){
+return ((this.offset.y+_61b.offsetHeight)-this.ycomp)/_61b.offsetHeight;
+}
+if(mode=="horizontal"){
+return ((this.offset.x+_61b.offsetWidth)-this.xcomp)/_61b.offsetWidth;
+}
+},absolutize:function(_61c){
+_61c=MochiKit.DOM.getElement(_61c);
+if(_61c.style.position=="absolute"){
+return;
+}
+MochiKit.Position.prepare();
+var _61d=MochiKit.Position.positionedOffset(_61c);
+var _61e=_61c.clientWidth;
+var _61f=_61c.clientHeight;
+var _620={"position":_61c.style.position,"left":_61d.x-parseFloat(_61c.style.left||0),"top":_61d.y-parseFloat(_61c.style.top||0),"width":_61c.style.width,"height":_61c.style.height};
+_61c.style.position="absolute";
+_61c.style.top=_61d.y+"px";
+_61c.style.left=_61d.x+"px";
+_61c.style.width=_61e+"px";
+_61c.style.height=_61f+"px";
+return _620;
+},positionedOffset:function(_621){
+var _622=0,_623=0;
+do{
+_622+=_621.offsetTop||0;
+_623+=_621.offsetLeft||0;
+_621=_621.offsetParent;
+if(_621){
+var p=MochiKit.Style.getStyle(_621,"position");
+if(p=="relative"||p=="absolute"){
+break;
+}
+}
+}while(_621);
+return new MochiKit.Style.Coordinates(_623,_622);
+},relativize:function(_625,_626){
+_625=MochiKit.DOM.getElement(_625);
+if(_625.style.position=="relative"){
+return;
+}
+MochiKit.Position.prepare();
+var top=parseFloat(_625.style.top||0)-(_626["top"]||0);
+var left=parseFloat(_625.style.left||0)-(_626["left"]||0);
+_625.style.position=_626["position"];
+_625.style.top=top+"px";
+_625.style.left=left+"px";
+_625.style.width=_626["width"];
+_625.style.height=_626["height"];
+},clone:function(_629,_62a){
+_629=MochiKit.DOM.getElement(_629);
+_62a=MochiKit.DOM.getElement(_62a);
+_62a.style.position="absolute";
+var _62b=this.cumulativeOffset(_629);
+_62a.style.top=_62b.y+"px";
+_62a.style.left=_62b.x+"px";
+_62a.style.width=_629.offsetWidth+"px";
+_62a.style.height=_629.offsetHeight+"px";
+},page:function(_62c){
+var _62d=0;
+var _62e=0;
+var _62f=_62c;
+do{
+_62d+=_62f.offsetTop||0;
+_62e+=_62f.offsetLeft||0;
+if(_62f.offsetParent==document.body&&MochiKit.Style.getStyle(_62f,"position")=="absolute"){
+break;
+}
+}while(_62f=_62f.offsetParent);
+_62f=_62c;
+do{
+_62d-=_62f.scrollTop||0;
+_62e-=_62f.scrollLeft||0;
+}while(_62f=_62f.parentNode);
+return new MochiKit.Style.Coordinates(_62e,_62d);
+}});
+MochiKit.Position.__new__=function(win){
+MochiKit.Base.nameFunctions(this);
+};
+MochiKit.Position.__new__(this);
+MochiKit.Base._exportSymbols(this,MochiKit.Position);
+MochiKit.Base._module("Visual","1.5",["Base","DOM","Style","Color","Position"]);
+MochiKit.Visual._RoundCorners=function(e,_632){
+e=MochiKit.DOM.getElement(e);
+this._setOptions(_632);
+if(this.options.__unstable__wrapElement){
+e=this._doWrap(e);
+}
+var _633=this.options.color;
+var C=MochiKit.Color.Color;
+if(this.options.color==="fromElement"){
+_633=C.fromBackground(e);
+}else{
+if(!(_633 instanceof C)){
+_633=C.fromString(_633);
+}
+}
+this.isTransparent=(_633.asRGB().a<=0);
+var _635=this.options.bgColor;
+if(this.options.bgColor==="fromParent"){
+_635=C.fromBackground(e.offsetParent);
+}else{
+if(!(_635 instanceof C)){
+_635=C.fromString(_635);
+}
+}
+this._roundCornersImpl(e,_633,_635);
+};
+MochiKit.Visual._RoundCorners.prototype={_doWrap:function(e){
+var _637=e.parentNode;
+var doc=MochiKit.DOM.currentDocument();
+if(typeof (doc.defaultView)==="undefined"||doc.defaultView===null){
+return e;
+}
+var _639=doc.defaultView.getComputedStyle(e,null);
+if(typeof (_639)==="undefined"||_639===null){
+return e;
+}
+var _63a=MochiKit.DOM.DIV({"style":{display:"block",marginTop:_639.getPropertyValue("padding-top"),marginRight:_639.getPropertyValue("padding-right"),marginBottom:_639.getPropertyValue("padding-bottom"),marginLeft:_639.getPropertyValue("padding-left"),padding:"0px"}});
+_63a.innerHTML=e.innerHTML;
+e.innerHTML="";
+e.appendChild(_63a);
+return e;
+},_roundCornersImpl:function(e,_63c,_63d){
+if(this.options.border){
+this._renderBorder(e,_63d);
+}
+if(this._isTopRounded()){
+this._roundTopCorners(e,_63c,_63d);
+}
+if(this._isBottomRounded()){
+this._roundBottomCorners(e,_63c,_63d);
+}
+},_renderBorder:function(el,_63f){
+var _640="1px solid "+this._borderColor(_63f);
+var _641="border-left: "+_640;
+var _642="border-right: "+_640;
+var _643="style='"+_641+";"+_642+"'";
+el.innerHTML="<div "+_643+">"+el.innerHTML+"</div>";
+},_roundTopCorners:function(el,_645,_646){
+var _647=this._createCorner(_646);
+for(var i=0;i<this.options.numSlices;i++){
+_647.appendChild(this._createCornerSlice(_645,_646,i,"top"));
+}
+el.style.paddingTop=0;
+el.insertBefore(_647,el.firstChild);
+},_roundBottomCorners:function(el,_64a,_64b){
+var _64c=this._createCorner(_64b);
+for(var i=(this.options.numSlices-1);i>=0;i--){
+_64c.appendChild(this._createCornerSlice(_64a,_64b,i,"bottom"));
+}
+el.style.paddingBottom=0;
+el.appendChild(_64c);
+},_createCorner:function(_64e){
+var dom=MochiKit.DOM;
+return dom.DIV({style:{backgroundColor:_64e.toString()}});
+},_createCornerSlice:function(_650,_651,n,_653){
+var _654=MochiKit.DOM.SPAN();
+var _655=_654.style;
+_655.backgroundColor=_650.toString();
+_655.display="block";
+_655.height="1px";
+_655.overflow="hidden";
+_655.fontSize="1px";
+var _656=this._borderColor(_650,_651);
+if(this.options.border&&n===0){
+_655.borderTopStyle="solid";
+_655.borderTopWidth="1px";
+_655.borderLeftWidth="0px";
+_655.borderRightWidth="0px";
+_655.borderBottomWidth="0px";
+_655.height="0px";
+_655.borderColor=_656.toString();
+}else{
+if(_656){
+_655.borderColor=_656.toString();
+_655.borderStyle="solid";
+_655.borderWidth="0px 1px";
+}
+}
+if(!this.options.compact&&(n==(this.options.numSlices-1))){
+_655.height="2px";
+}
+this._setMargin(_654,n,_653);
+this._setBorder(_654,n,_653);
+return _654;
+},_setOptions:function(_657){
+this.options={corners:"all",color:"fromElement",bgColor:"fromParent",blend:true,border:false,compact:false,__unstable__wrapElement:false};
+MochiKit.Base.update(this.options,_657);
+this.options.numSlices=(this.options.compact?2:4);
+},_whichSideTop:function(){
+var _658=this.options.corners;
+if(this._hasString(_658,"all","top")){
+return "";
+}
+var _659=(_658.indexOf("tl")!=-1);
+var _65a=(_658.indexOf("tr")!=-1);
+if(_659&&_65a){
+return "";
+}
+if(_659){
+return "left";
+}
+if(_65a){
+return "right";
+}
+return "";
+},_whichSideBottom:function(){
+var _65b=this.options.corners;
+if(this._hasString(_65b,"all","bottom")){
+return "";
+}
+var _65c=(_65b.indexOf("bl")!=-1);
+var _65d=(_65b.indexOf("br")!=-1);
+if(_65c&&_65d){
+return "";
+}
+if(_65c){
+return "left";
+}
+if(_65d){
+return "right";
+}
+return "";
+},_borderColor:function(_65e,_65f){
+if(_65e=="transparent"){
+return _65f;
+}else{
+if(this.options.border){
+return this.options.border;
+}else{
+if(this.options.blend){
+return _65f.blendedColor(_65e);
+}
+}
+}
+return "";
+},_setMargin:function(el,n,_662){
+var _663=this._marginSize(n)+"px";
+var _664=(_662=="top"?this._whichSideTop():this._whichSideBottom());
+var _665=el.style;
+if(_664=="left"){
+_665.marginLeft=_663;
+_665.marginRight="0px";
+}else{
+if(_664=="right"){
+_665.marginRight=_663;
+_665.marginLeft="0px";
+}else{
+_665.marginLeft=_663;
+_665.marginRight=_663;
+}
+}
+},_setBorder:function(el,n,_668){
+var _669=this._borderSize(n)+"px";
+var _66a=(_668=="top"?this._whichSideTop():this._whichSideBottom());
+var _66b=el.style;
+if(_66a=="left"){
+_66b.borderLeftWidth=_669;
+_66b.borderRightWidth="0px";
+}else{
+if(_66a=="right"){
+_66b.borderRightWidth=_669;
+_66b.borderLeftWidth="0px";
+}else{
+_66b.borderLeftWidth=_669;
+_66b.borderRightWidth=_669;
+}
+}
+},_marginSize:function(n){
+if(this.isTransparent){
+return 0;
+}
+var o=this.options;
+if(o.compact&&o.blend){
+var _66e=[1,0];
+return _66e[n];
+}else{
+if(o.compact){
+var _66f=[2,1];
+return _66f[n];
+}else{
+if(o.blend){
+var _670=[3,2,1,0];
+return _670[n];
+}else{
+var _671=[5,3,2,1];
+return _671[n];
+}
+}
+}
+},_borderSize:function(n){
+var o=this.options;
+var _674;
+if(o.compact&&(o.blend||this.isTransparent)){
+return 1;
+}else{
+if(o.compact){
+_674=[1,0];
+}else{
+if(o.blend){
+_674=[2,1,1,1];
+}else{
+if(o.border){
+_674=[0,2,0,0];
+}else{
+if(this.isTransparent){
+_674=[5,3,2,1];
+}else{
+return 0;
+}
+}
+}
+}
+}
+return _674[n];
+},_hasString:function(str){
+for(var i=1;i<arguments.length;i++){
+if(str.indexOf(arguments[i])!=-1){
+return true;
+}
+}
+return false;
+},_isTopRounded:function(){
+return this._hasString(this.options.corners,"all","top","tl","tr");
+},_isBottomRounded:function(){
+return this._hasString(this.options.corners,"all","bottom","bl","br");
+},_hasSingleTextChild:function(el){
+return (el.childNodes.length==1&&el.childNodes[0].nodeType==3);
+}};
+MochiKit.Visual.roundElement=function(e,_679){
+new MochiKit.Visual._RoundCorners(e,_679);
+};
+MochiKit.Visual.roundClass=function(_67a,_67b,_67c){
+var _67d=MochiKit.DOM.getElementsByTagAndClassName(_67a,_67b);
+for(var i=0;i<_67d.length;i++){
+MochiKit.Visual.roundElement(_67d[i],_67c);
+}
+};
+MochiKit.Visual.tagifyText=function(_67f,_680){
+_680=_680||"position:relative";
+if(/MSIE/.test(navigator.userAgent)){
+_680+=";zoom:1";
+}
+_67f=MochiKit.DOM.getElement(_67f);
+var ma=MochiKit.Base.map;
+ma(function(_682){
+if(_682.nodeType==3){
+ma(function(_683){
+_67f.insertBefore(MochiKit.DOM.SPAN({style:_680},_683==" "?String.fromCharCode(160):_683),_682);
+},_682.nodeValue.split(""));
+MochiKit.DOM.removeElement(_682);
+}
+},_67f.childNodes);
+};
+MochiKit.Visual._forceRerendering=function(_684){
+try{
+_684=MochiKit.DOM.getElement(_684);
+var n=document.createTextNode(" ");
+_684.appendChild(n);
+_684.removeChild(n);
+}
+catch(e){
+}
+};
+MochiKit.Visual.multiple=function(_686,_687,_688){
+_688=MochiKit.Base.update({speed:0.1,delay:0},_688);
+var _689=_688.delay;
+var _68a=0;
+MochiKit.Base.map(function(_68b){
+_688.delay=_68a*_688.speed+_689;
+new _687(_68b,_688);
+_68a+=1;
+},_686);
+};
+MochiKit.Visual.PAIRS={"slide":["slideDown","slideUp"],"blind":["blindDown","blindUp"],"appear":["appear","fade"],"size":["grow","shrink"]};
+MochiKit.Visual.toggle=function(_68c,_68d,_68e){
+_68c=MochiKit.DOM.getElement(_68c);
+_68d=(_68d||"appear").toLowerCase();
+_68e=MochiKit.Base.update({queue:{position:"end",scope:(_68c.id||"global"),limit:1}},_68e);
+var v=MochiKit.Visual;
+v[MochiKit.Style.getStyle(_68c,"display")!="none"?v.PAIRS[_68d][1]:v.PAIRS[_68d][0]](_68c,_68e);
+};
+MochiKit.Visual.Transitions={__export__:false};
+MochiKit.Visual.Transitions.linear=function(pos){
+return pos;
+};
+MochiKit.Visual.Transitions.sinoidal=function(pos){
+return 0.5-Math.cos(pos*Math.PI)/2;
+};
+MochiKit.Visual.Transitions.reverse=function(pos){
+return 1-pos;
+};
+MochiKit.Visual.Transitions.flicker=function(pos){
+return 0.25-Math.cos(pos*Math.PI)/4+Math.random()/2;
+};
+MochiKit.Visual.Transitions.wobble=function(pos){
+return 0.5-Math.cos(9*pos*Math.PI)/2;
+};
+MochiKit.Visual.Transitions.pulse=function(pos,_696){
+if(_696){
+pos*=2*_696;
+}else{
+pos*=10;
+}
+var _697=pos-Math.floor(pos);
+return (Math.floor(pos)%2==0)?_697:1-_697;
+};
+MochiKit.Visual.Transitions.parabolic=function(pos){
+return pos*pos;
+};
+MochiKit.Visual.Transitions.spring=function(pos){
+return 1-(Math.cos(pos*2.5*Math.PI)*Math.exp(-pos*6));
+};
+MochiKit.Visual.Transitions.none=function(pos){
+return 0;
+};
+MochiKit.Visual.Transitions.full=function(pos){
+return 1;
+};
+MochiKit.Visual.ScopedQueue=function(){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls();
+}
+this.__init__();
+};
+MochiKit.Visual.ScopedQueue.__export__=false;
+MochiKit.Base.update(MochiKit.Visual.ScopedQueue.prototype,{__init__:function(){
+this.effects=[];
+this.interval=null;
+},add:function(_69d){
+var _69e=new Date().getTime();
+var _69f=(typeof (_69d.options.queue)=="string")?_69d.options.queue:_69d.options.queue.position;
+var ma=MochiKit.Base.map;
+switch(_69f){
+case "front":
+ma(function(e){
+if(e.state=="idle"){
+e.startOn+=_69d.finishOn;
+e.finishOn+=_69d.finishOn;
+}
+},this.effects);
+break;
+case "end":
+var _6a2;
+ma(function(e){
+var i=e.finishOn;
+if(i>=(_6a2||i)){
+_6a2=i;
+}
+},this.effects);
+_69e=_6a2||_69e;
+break;
+case "break":
+ma(function(e){
+e.finalize();
+},this.effects);
+break;
+case "replace":
+ma(function(e){
+e.cancel();
+},this.effects);
+break;
+}
+_69d.startOn+=_69e;
+_69d.finishOn+=_69e;
+if(!_69d.options.queue.limit||this.effects.length<_69d.options.queue.limit){
+this.effects.push(_69d);
+}
+if(!this.interval){
+this.interval=this.startLoop(MochiKit.Base.bind(this.loop,this),40);
+}
+},startLoop:function(func,_6a8){
+return setInterval(func,_6a8);
+},remove:function(_6a9){
+this.effects=MochiKit.Base.filter(function(e){
+return e!=_6a9;
+},this.effects);
+if(!this.effects.length){
+this.stopLoop(this.interval);
+this.interval=null;
+}
+},stopLoop:function(_6ab){
+clearInterval(_6ab);
+},loop:function(){
+var _6ac=new Date().getTime();
+MochiKit.Base.map(function(_6ad){
+_6ad.loop(_6ac);
+},this.effects);
+}});
+MochiKit.Visual.Queues={__export__:false,instances:{},get:function(_6ae){
+if(typeof (_6ae)!="string"){
+return _6ae;
+}
+if(!this.instances[_6ae]){
+this.instances[_6ae]=new MochiKit.Visual.ScopedQueue();
+}
+return this.instances[_6ae];
+}};
+MochiKit.Visual.Queue=MochiKit.Visual.Queues.get("global");
+MochiKit.Visual.Queue.__export__=false;
+MochiKit.Visual.DefaultOptions={__export__:false,transition:MochiKit.Visual.Transitions.sinoidal,duration:1,fps:25,sync:false,from:0,to:1,delay:0,queue:"parallel"};
+MochiKit.Visual.Base=function(){
+};
+MochiKit.Visual.Base.prototype={__class__:MochiKit.Visual.Base,start:function(_6af){
+var v=MochiKit.Visual;
+this.options=MochiKit.Base.setdefault(_6af,v.DefaultOptions);
+this.currentFrame=0;
+this.state="idle";
+this.startOn=this.options.delay*1000;
+this.finishOn=this.startOn+(this.options.duration*1000);
+this.event("beforeStart");
+if(!this.options.sync){
+v.Queues.get(typeof (this.options.queue)=="string"?"global":this.options.queue.scope).add(this);
+}
+},loop:function(_6b1){
+if(_6b1>=this.startOn){
+if(_6b1>=this.finishOn){
+return this.finalize();
+}
+var pos=(_6b1-this.startOn)/(this.finishOn-this.startOn);
+var _6b3=Math.round(pos*this.options.fps*this.options.duration);
+if(_6b3>this.currentFrame){
+this.render(pos);
+this.currentFrame=_6b3;
+}
+}
+},render:function(pos){
+if(this.state=="idle"){
+this.state="running";
+this.event("beforeSetup");
+this.setup();
+this.event("afterSetup");
+}
+if(this.state=="running"){
+var _6b5=this.options.transition;
+if(typeof (_6b5)=="string"){
+_6b5=MochiKit.Visual.Transitions[_6b5];
+}
+if(typeof (_6b5)=="function"){
+pos=_6b5(pos);
+}
+pos*=(this.options.to-this.options.from);
+pos+=this.options.from;
+this.event("beforeUpdate");
+this.update(pos);
+this.event("afterUpdate");
+}
+},cancel:function(){
+if(!this.options.sync){
+MochiKit.Visual.Queues.get(typeof (this.options.queue)=="string"?"global":this.options.queue.scope).remove(this);
+}
+this.state="finished";
+},finalize:function(){
+this.render(1);
+this.cancel();
+this.event("beforeFinish");
+this.finish();
+this.event("afterFinish");
+},setup:function(){
+},finish:function(){
+},update:function(_6b6){
+},event:function(_6b7){
+if(this.options[_6b7+"Internal"]){
+this.options[_6b7+"Internal"](this);
+}
+if(this.options[_6b7]){
+this.options[_6b7](this);
+}
+},repr:function(){
+return "["+this.__class__.NAME+", options:"+MochiKit.Base.repr(this.options)+"]";
+}};
+MochiKit.Visual.Parallel=function(_6b8,_6b9){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_6b8,_6b9);
+}
+this.__init__(_6b8,_6b9);
+};
+MochiKit.Visual.Parallel.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.Parallel.prototype,{__class__:MochiKit.Visual.Parallel,__init__:function(_6bb,_6bc){
+this.effects=_6bb||[];
+this.start(_6bc);
+},update:function(_6bd){
+MochiKit.Base.map(function(_6be){
+_6be.render(_6bd);
+},this.effects);
+},finish:function(){
+MochiKit.Base.map(function(_6bf){
+_6bf.finalize();
+},this.effects);
+}});
+MochiKit.Visual.Sequence=function(_6c0,_6c1){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_6c0,_6c1);
+}
+this.__init__(_6c0,_6c1);
+};
+MochiKit.Visual.Sequence.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.Sequence.prototype,{__class__:MochiKit.Visual.Sequence,__init__:function(_6c3,_6c4){
+var defs={transition:MochiKit.Visual.Transitions.linear,duration:0};
+this.effects=_6c3||[];
+MochiKit.Base.map(function(_6c6){
+defs.duration+=_6c6.options.duration;
+},this.effects);
+MochiKit.Base.setdefault(_6c4,defs);
+this.start(_6c4);
+},update:function(_6c7){
+var time=_6c7*this.options.duration;
+for(var i=0;i<this.effects.length;i++){
+var _6ca=this.effects[i];
+if(time<=_6ca.options.duration){
+_6ca.render(time/_6ca.options.duration);
+break;
+}else{
+time-=_6ca.options.duration;
+}
+}
+},finish:function(){
+MochiKit.Base.map(function(_6cb){
+_6cb.finalize();
+},this.effects);
+}});
+MochiKit.Visual.Opacity=function(_6cc,_6cd){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_6cc,_6cd);
+}
+this.__init__(_6cc,_6cd);
+};
+MochiKit.Visual.Opacity.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.Opacity.prototype,{__class__:MochiKit.Visual.Opacity,__init__:function(_6cf,_6d0){
+var b=MochiKit.Base;
+var s=MochiKit.Style;
+this.element=MochiKit.DOM.getElement(_6cf);
+if(this.element.currentStyle&&(!this.element.currentStyle.hasLayout)){
+s.setStyle(this.element,{zoom:1});
+}
+_6d0=b.update({from:s.getStyle(this.element,"opacity")||0,to:1},_6d0);
+this.start(_6d0);
+},update:function(_6d3){
+MochiKit.Style.setStyle(this.element,{"opacity":_6d3});
+}});
+MochiKit.Visual.Move=function(_6d4,_6d5){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_6d4,_6d5);
+}
+this.__init__(_6d4,_6d5);
+};
+MochiKit.Visual.Move.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.Move.prototype,{__class__:MochiKit.Visual.Move,__init__:function(_6d7,_6d8){
+this.element=MochiKit.DOM.getElement(_6d7);
+_6d8=MochiKit.Base.update({x:0,y:0,mode:"relative"},_6d8);
+this.start(_6d8);
+},setup:function(){
+MochiKit.Style.makePositioned(this.element);
+var s=this.element.style;
+var _6da=s.visibility;
+var _6db=s.display;
+if(_6db=="none"){
+s.visibility="hidden";
+s.display="";
+}
+this.originalLeft=parseFloat(MochiKit.Style.getStyle(this.element,"left")||"0");
+this.originalTop=parseFloat(MochiKit.Style.getStyle(this.element,"top")||"0");
+if(this.options.mode=="absolute"){
+this.options.x-=this.originalLeft;
+this.options.y-=this.originalTop;
+}
+if(_6db=="none"){
+s.visibility=_6da;
+s.display=_6db;
+}
+},update:function(_6dc){
+MochiKit.Style.setStyle(this.element,{left:Math.round(this.options.x*_6dc+this.originalLeft)+"px",top:Math.round(this.options.y*_6dc+this.originalTop)+"px"});
+}});
+MochiKit.Visual.Scale=function(_6dd,_6de,_6df){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_6dd,_6de,_6df);
+}
+this.__init__(_6dd,_6de,_6df);
+};
+MochiKit.Visual.Scale.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.Scale.prototype,{__class__:MochiKit.Visual.Scale,__init__:function(_6e1,_6e2,_6e3){
+this.element=MochiKit.DOM.getElement(_6e1);
+_6e3=MochiKit.Base.update({scaleX:true,scaleY:true,scaleContent:true,scaleFromCenter:false,scaleMode:"box",scaleFrom:100,scaleTo:_6e2},_6e3);
+this.start(_6e3);
+},setup:function(){
+this.restoreAfterFinish=this.options.restoreAfterFinish||false;
+this.elementPositioning=MochiKit.Style.getStyle(this.element,"position");
+var ma=MochiKit.Base.map;
+var b=MochiKit.Base.bind;
+this.originalStyle={};
+ma(b(function(k){
+this.originalStyle[k]=this.element.style[k];
+},this),["top","left","width","height","fontSize"]);
+this.originalTop=this.element.offsetTop;
+this.originalLeft=this.element.offsetLeft;
+var _6e7=MochiKit.Style.getStyle(this.element,"font-size")||"100%";
+ma(b(function(_6e8){
+if(_6e7.indexOf(_6e8)>0){
+this.fontSize=parseFloat(_6e7);
+this.fontSizeType=_6e8;
+}
+},this),["em","px","%"]);
+this.factor=(this.options.scaleTo-this.options.scaleFrom)/100;
+if(/^content/.test(this.options.scaleMode)){
+this.dims=[this.element.scrollHeight,this.element.scrollWidth];
+}else{
+if(this.options.scaleMode=="box"){
+this.dims=[this.element.offsetHeight,this.element.offsetWidth];
+}else{
+this.dims=[this.options.scaleMode.originalHeight,this.options.scaleMode.originalWidth];
+}
+}
+},update:function(_6e9){
+var _6ea=(this.options.scaleFrom/100)+(this.factor*_6e9);
+if(this.options.scaleContent&&this.fontSize){
+MochiKit.Style.setStyle(this.element,{fontSize:this.fontSize*_6ea+this.fontSizeType});
+}
+this.setDimensions(this.dims[0]*_6ea,this.dims[1]*_6ea);
+},finish:function(){
+if(this.restoreAfterFinish){
+MochiKit.Style.setStyle(this.element,this.originalStyle);
+}
+},setDimensions:function(_6eb,_6ec){
+var d={};
+var r=Math.round;
+if(/MSIE/.test(navigator.userAgent)){
+r=Math.ceil;
+}
+if(this.options.scaleX){
+d.width=r(_6ec)+"px";
+}
+if(this.options.scaleY){
+d.height=r(_6eb)+"px";
+}
+if(this.options.scaleFromCenter){
+var topd=(_6eb-this.dims[0])/2;
+var _6f0=(_6ec-this.dims[1])/2;
+if(this.elementPositioning=="absolute"){
+if(this.options.scaleY){
+d.top=this.originalTop-topd+"px";
+}
+if(this.options.scaleX){
+d.left=this.originalLeft-_6f0+"px";
+}
+}else{
+if(this.options.scaleY){
+d.top=-topd+"px";
+}
+if(this.options.scaleX){
+d.left=-_6f0+"px";
+}
+}
+}
+MochiKit.Style.setStyle(this.element,d);
+}});
+MochiKit.Visual.Highlight=function(_6f1,_6f2){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_6f1,_6f2);
+}
+this.__init__(_6f1,_6f2);
+};
+MochiKit.Visual.Highlight.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.Highlight.prototype,{__class__:MochiKit.Visual.Highlight,__init__:function(_6f4,_6f5){
+this.element=MochiKit.DOM.getElement(_6f4);
+_6f5=MochiKit.Base.update({startcolor:"#ffff99"},_6f5);
+this.start(_6f5);
+},setup:function(){
+var b=MochiKit.Base;
+var s=MochiKit.Style;
+if(s.getStyle(this.element,"display")=="none"){
+this.cancel();
+return;
+}
+this.oldStyle={backgroundImage:s.getStyle(this.element,"background-image")};
+s.setStyle(this.element,{backgroundImage:"none"});
+if(!this.options.endcolor){
+this.options.endcolor=MochiKit.Color.Color.fromBackground(this.element).toHexString();
+}
+if(b.isUndefinedOrNull(this.options.restorecolor)){
+this.options.restorecolor=s.getStyle(this.element,"background-color");
+}
+this._base=b.map(b.bind(function(i){
+return parseInt(this.options.startcolor.slice(i*2+1,i*2+3),16);
+},this),[0,1,2]);
+this._delta=b.map(b.bind(function(i){
+return parseInt(this.options.endcolor.slice(i*2+1,i*2+3),16)-this._base[i];
+},this),[0,1,2]);
+},update:function(_6fa){
+var m="#";
+MochiKit.Base.map(MochiKit.Base.bind(function(i){
+m+=MochiKit.Color.toColorPart(Math.round(this._base[i]+this._delta[i]*_6fa));
+},this),[0,1,2]);
+MochiKit.Style.setStyle(this.element,{backgroundColor:m});
+},finish:function(){
+MochiKit.Style.setStyle(this.element,MochiKit.Base.update(this.oldStyle,{backgroundColor:this.options.restorecolor}));
+}});
+MochiKit.Visual.ScrollTo=function(_6fd,_6fe){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_6fd,_6fe);
+}
+this.__init__(_6fd,_6fe);
+};
+MochiKit.Visual.ScrollTo.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.ScrollTo.prototype,{__class__:MochiKit.Visual.ScrollTo,__init__:function(_700,_701){
+this.element=MochiKit.DOM.getElement(_700);
+this.start(_701);
+},setup:function(){
+var p=MochiKit.Position;
+p.prepare();
+var _703=p.cumulativeOffset(this.element);
+if(this.options.offset){
+_703.y+=this.options.offset;
+}
+var max;
+if(window.innerHeight){
+max=window.innerHeight-window.height;
+}else{
+if(document.documentElement&&document.documentElement.clientHeight){
+max=document.documentElement.clientHeight-document.body.scrollHeight;
+}else{
+if(document.body){
+max=document.body.clientHeight-document.body.scrollHeight;
+}
+}
+}
+this.scrollStart=p.windowOffset.y;
+this.delta=(_703.y>max?max:_703.y)-this.scrollStart;
+},update:function(_705){
+var p=MochiKit.Position;
+p.prepare();
+window.scrollTo(p.windowOffset.x,this.scrollStart+(_705*this.delta));
+}});
+MochiKit.Visual._CSS_LENGTH=/^(([\+\-]?[0-9\.]+)(em|ex|px|in|cm|mm|pt|pc|\%))|0$/;
+MochiKit.Visual.Morph=function(_707,_708){
+var cls=arguments.callee;
+if(!(this instanceof cls)){
+return new cls(_707,_708);
+}
+this.__init__(_707,_708);
+};
+MochiKit.Visual.Morph.prototype=new MochiKit.Visual.Base();
+MochiKit.Base.update(MochiKit.Visual.Morph.prototype,{__class__:MochiKit.Visual.Morph,__init__:function(_70a,_70b){
+this.element=MochiKit.DOM.getElement(_70a);
+this.start(_70b);
+},setup:function(){
+var b=MochiKit.Base;
+var _70d=this.options.style;
+this.styleStart={};
+this.styleEnd={};
+this.units={};
+var _70e,unit;
+for(var s in _70d){
+_70e=_70d[s];
+s=b.camelize(s);
+if(MochiKit.Visual._CSS_LENGTH.test(_70e)){
+var _711=_70e.match(/^([\+\-]?[0-9\.]+)(.*)$/);
+_70e=parseFloat(_711[1]);
+unit=(_711.length==3)?_711[2]:null;
+this.styleEnd[s]=_70e;
+this.units[s]=unit;
+_70e=MochiKit.Style.getStyle(this.element,s);
+_711=_70e.match(/^([\+\-]?[0-9\.]+)(.*)$/);
+_70e=parseFloat(_711[1]);
+this.styleStart[s]=_70e;
+}else{
+if(/[Cc]olor$/.test(s)){
+var c=MochiKit.Color.Color;
+_70e=c.fromString(_70e);
+if(_70e){
+this.units[s]="color";
+this.styleEnd[s]=_70e.toHexString();
+_70e=MochiKit.Style.getStyle(this.element,s);
+this.styleStart[s]=c.fromString(_70e).toHexString();
+this.styleStart[s]=b.map(b.bind(function(i){
+return parseInt(this.styleStart[s].slice(i*2+1,i*2+3),16);
+},this),[0,1,2]);
+this.styleEnd[s]=b.map(b.bind(function(i){
+return parseInt(this.styleEnd[s].slice(i*2+1,i*2+3),16);
+},this),[0,1,2]);
+}
+}else{
+this.element.style[s]=_70e;
+}
+}
+}
+},update:function(_715){
+var _716;
+for(var s in this.styleStart){
+if(this.units[s]=="color"){
+var m="#";
+var _719=this.styleStart[s];
+var end=this.styleEnd[s];
+MochiKit.Base.map(MochiKit.Base.bind(function(i){
+m+=MochiKit.Color.toColorPart(Math.round(_719[i]+(end[i]-_719[i])*_715));
+},this),[0,1,2]);
+this.element.style[s]=m;
+}else{
+_716=this.styleStart[s]+Math.round((this.styleEnd[s]-this.styleStart[s])*_715*1000)/1000+this.units[s];
+this.element.style[s]=_716;
+}
+}
+}});
+MochiKit.Visual.fade=function(_71c,_71d){
+var s=MochiKit.Style;
+var _71f=s.getStyle(_71c,"opacity");
+_71d=MochiKit.Base.update({from:s.getStyle(_71c,"opacity")||1,to:0,afterFinishInternal:function(_720){
+if(_720.options.to!==0){
+return;
+}
+s.hideElement(_720.element);
+s.setStyle(_720.element,{"opacity":_71f});
+}},_71d);
+return new MochiKit.Visual.Opacity(_71c,_71d);
+};
+MochiKit.Visual.appear=function(_721,_722){
+var s=MochiKit.Style;
+var v=MochiKit.Visual;
+_722=MochiKit.Base.update({from:(s.getStyle(_721,"display")=="none"?0:s.getStyle(_721,"opacity")||0),to:1,afterFinishInternal:function(_725){
+v._forceRerendering(_725.element);
+},beforeSetupInternal:function(_726){
+s.setStyle(_726.element,{"opacity":_726.options.from});
+s.showElement(_726.element);
+}},_722);
+return new v.Opacity(_721,_722);
+};
+MochiKit.Visual.puff=function(_727,_728){
+var s=MochiKit.Style;
+var v=MochiKit.Visual;
+_727=MochiKit.DOM.getElement(_727);
+var _72b=MochiKit.Style.getElementDimensions(_727,true);
+var _72c={position:s.getStyle(_727,"position"),top:_727.style.top,left:_727.style.left,width:_727.style.width,height:_727.style.height,opacity:s.getStyle(_727,"opacity")};
+_728=MochiKit.Base.update({beforeSetupInternal:function(_72d){
+MochiKit.Position.absolutize(_72d.effects[0].element);
+},afterFinishInternal:function(_72e){
+s.hideElement(_72e.effects[0].element);
+s.setStyle(_72e.effects[0].element,_72c);
+},scaleContent:true,scaleFromCenter:true},_728);
+return new v.Parallel([new v.Scale(_727,200,{sync:true,scaleFromCenter:_728.scaleFromCenter,scaleMode:{originalHeight:_72b.h,originalWidth:_72b.w},scaleContent:_728.scaleContent,restoreAfterFinish:true}),new v.Opacity(_727,{sync:true,to:0})],_728);
+};
+MochiKit.Visual.blindUp=function(_72f,_730){
+var d=MochiKit.DOM;
+var s=MochiKit.Style;
+_72f=d.getElement(_72f);
+var _733=s.getElementDimensions(_72f,true);
+var _734=s.makeClipping(_72f);
+_730=MochiKit.Base.update({scaleContent:false,scaleX:false,scaleMode:{originalHeight:_733.h,originalWidth:_733.w},restoreAfterFinish:true,afterFinishInternal:function(_735){
+s.hideElement(_735.element);
+s.undoClipping(_735.element,_734);
+}},_730);
+return new MochiKit.Visual.Scale(_72f,0,_730);
+};
+MochiKit.Visual.blindDown=function(_736,_737){
+var d=MochiKit.DOM;
+var s=MochiKit.Style;
+_736=d.getElement(_736);
+var _73a=s.getElementDimensions(_736,true);
+var _73b;
+_737=MochiKit.Base.update({scaleContent:false,scaleX:false,scaleFrom:0,scaleMode:{originalHeight:_73a.h,originalWidth:_73a.w},restoreAfterFinish:true,afterSetupInternal:function(_73c){
+_73b=s.makeClipping(_73c.element);
+s.setStyle(_73c.element,{height:"0px"});
+s.showElement(_73c.element);
+},afterFinishInternal:function(_73d){
+s.undoClipping(_73d.element,_73b);
+}},_737);
+return new MochiKit.Visual.Scale(_736,100,_737);
+};
+MochiKit.Visual.switchOff=function(_73e,_73f){
+var d=MochiKit.DOM;
+var s=MochiKit.Style;
+_73e=d.getElement(_73e);
+var _742=s.getElementDimensions(_73e,true);
+var _743=s.getStyle(_73e,"opacity");
+var _744;
+_73f=MochiKit.Base.update({duration:0.7,restoreAfterFinish:true,beforeSetupInternal:function(_745){
+s.makePositioned(_73e);
+_744=s.makeClipping(_73e);
+},afterFinishInternal:function(_746){
+s.hideElement(_73e);
+s.undoClipping(_73e,_744);
+s.undoPositioned(_73e);
+s.setStyle(_73e,{"opacity":_743});
+}},_73f);
+var v=MochiKit.Visual;
+return new v.Sequence([new v.appear(_73e,{sync:true,duration:0.57*_73f.duration,from:0,transition:v.Transitions.flicker}),new v.Scale(_73e,1,{sync:true,duration:0.43*_73f.duration,scaleFromCenter:true,scaleX:false,scaleMode:{originalHeight:_742.h,originalWidth:_742.w},scaleContent:false,restoreAfterFinish:true})],_73f);
+};
+MochiKit.Visual.dropOut=function(_748,_749){
+var d=MochiKit.DOM;
+var s=MochiKit.Style;
+_748=d.getElement(_748);
+var _74c={top:s.getStyle(_748,"top"),left:s.getStyle(_748,"left"),opacity:s.getStyle(_748,"opacity")};
+_749=MochiKit.Base.update({duration:0.5,distance:100,beforeSetupInternal:function(_74d){
+s.makePositioned(_74d.effects[0].element);
+},afterFinishInternal:function(_74e){
+s.hideElement(_74e.effects[0].element);
+s.undoPositioned(_74e.effects[0].element);
+s.setStyle(_74e.effects[0].element,_74c);
+}},_749);
+var v=MochiKit.Visual;
+return new v.Parallel([new v.Move(_748,{x:0,y:_749.distance,sync:true}),new v.Opacity(_748,{sync:true,to:0})],_749);
+};
+MochiKit.Visual.shake=function(_750,_751){
+var d=MochiKit.DOM;
+var v=MochiKit.Visual;
+var s=MochiKit.Style;
+_750=d.getElement(_750);
+var _755={top:s.getStyle(_750,"top"),left:s.getStyle(_750,"left")};
+_751=MochiKit.Base.update({duration:0.5,afterFinishInternal:function(_756){
+s.undoPositioned(_750);
+s.setStyle(_750,_755);
+}},_751);
+return new v.Sequence([new v.Move(_750,{sync:true,duration:0.1*_751.duration,x:20,y:0}),new v.Move(_750,{sync:true,duration:0.2*_751.duration,x:-40,y:0}),new v.Move(_750,{sync:true,duration:0.2*_751.duration,x:40,y:0}),new v.Move(_750,{sync:true,duration:0.2*_751.duration,x:-40,y:0}),new v.Move(_750,{sync:true,duration:0.2*_751.duration,x:40,y:0}),new v.Move(_750,{sync:true,duration:0.1*_751.duration,x:-20,y:0})],_751);
+};
+MochiKit.Visual.slideDown=function(_757,_758){
+var d=MochiKit.DOM;
+var b=MochiKit.Base;
+var s=MochiKit.Style;
+_757=d.getElement(_757);
+if(!_757.firstChild){
+throw new Error("MochiKit.Visual.slideDown must be used on a element with a child");
+}
+d.removeEmptyTextNodes(_757);
+var _75c=s.getStyle(_757.firstChild,"bottom")||0;
+var _75d=s.getElementDimensions(_757,true);
+var _75e;
+_758=b.update({scaleContent:false,scaleX:false,scaleFrom:0,scaleMode:{originalHeight:_75d.h,originalWidth:_75d.w},restoreAfterFinish:true,afterSetupInternal:function(_75f){
+s.makePositioned(_75f.element);
+s.makePositioned(_75f.element.firstChild);
+if(/Opera/.test(navigator.userAgent)){
+s.setStyle(_75f.element,{top:""});
+}
+_75e=s.makeClipping(_75f.element);
+s.setStyle(_75f.element,{height:"0px"});
+s.showElement(_75f.element);
+},afterUpdateInternal:function(_760){
+var _761=s.getElementDimensions(_760.element,true);
+s.setStyle(_760.element.firstChild,{bottom:(_760.dims[0]-_761.h)+"px"});
+},afterFinishInternal:function(_762){
+s.undoClipping(_762.element,_75e);
+if(/MSIE/.test(navigator.userAgent)){
+s.undoPositioned(_762.element);
+s.undoPositioned(_762.element.firstChild);
+}else{
+s.undoPositioned(_762.element.firstChild);
+s.undoPositioned(_762.element);
+}
+s.setStyle(_762.element.firstChild,{bottom:_75c});
+}},_758);
+return new MochiKit.Visual.Scale(_757,100,_758);
+};
+MochiKit.Visual.slideUp=function(_763,_764){
+var d=MochiKit.DOM;
+var b=MochiKit.Base;
+var s=MochiKit.Style;
+_763=d.getElement(_763);
+if(!_763.firstChild){
+throw new Error("MochiKit.Visual.slideUp must be used on a element with a child");
+}
+d.removeEmptyTextNodes(_763);
+var _768=s.getStyle(_763.firstChild,"bottom");
+var _769=s.getElementDimensions(_763,true);
+var _76a;
+_764=b.update({scaleContent:false,scaleX:false,scaleMode:{originalHeight:_769.h,originalWidth:_769.w},scaleFrom:100,restoreAfterFinish:true,beforeStartInternal:function(_76b){
+s.makePositioned(_76b.element);
+s.makePositioned(_76b.element.firstChild);
+if(/Opera/.test(navigator.userAgent)){
+s.setStyle(_76b.element,{top:""});
+}
+_76a=s.makeClipping(_76b.element);
+s.showElement(_76b.element);
+},afterUpdateInternal:function(_76c){
+var _76d=s.getElementDimensions(_76c.element,true);
+s.setStyle(_76c.element.firstChild,{bottom:(_76c.dims[0]-_76d.h)+"px"});
+},afterFinishInternal:function(_76e){
+s.hideElement(_76e.element);
+s.undoClipping(_76e.element,_76a);
+s.undoPositioned(_76e.element.firstChild);
+s.undoPositioned(_76e.element);
+s.setStyle(_76e.element.firstChild,{bottom:_768});
+}},_764);
+return new MochiKit.Visual.Scale(_763,0,_764);
+};
+MochiKit.Visual.squish=function(_76f,_770){
+var d=MochiKit.DOM;
+var b=MochiKit.Base;
+var s=MochiKit.Style;
+var _774=s.getElementDimensions(_76f,true);
+var _775;
+_770=b.update({restoreAfterFinish:true,scaleMode:{originalHeight:_774.w,originalWidth:_774.h},beforeSetupInternal:function(_776){
+_775=s.makeClipping(_776.element);
+},afterFinishInternal:function(_777){
+s.hideElement(_777.element);
+s.undoClipping(_777.element,_775);
+}},_770);
+return new MochiKit.Visual.Scale(_76f,/Opera/.test(navigator.userAgent)?1:0,_770);
+};
+MochiKit.Visual.grow=function(_778,_779){
+var d=MochiKit.DOM;
+var v=MochiKit.Visual;
+var s=MochiKit.Style;
+_778=d.getElement(_778);
+_779=MochiKit.Base.update({direction:"center",moveTransition:v.Transitions.sinoidal,scaleTransition:v.Transitions.sinoidal,opacityTransition:v.Transitions.full,scaleContent:true,scaleFromCenter:false},_779);
+var _77d={top:_778.style.top,left:_778.style.left,height:_778.style.height,width:_778.style.width,opacity:s.getStyle(_778,"opacity")};
+var dims=s.getElementDimensions(_778,true);
+var _77f,_780;
+var _781,_782;
+switch(_779.direction){
+case "top-left":
+_77f=_780=_781=_782=0;
+break;
+case "top-right":
+_77f=dims.w;
+_780=_782=0;
+_781=-dims.w;
+break;
+case "bottom-left":
+_77f=_781=0;
+_780=dims.h;
+_782=-dims.h;
+break;
+case "bottom-right":
+_77f=dims.w;
+_780=dims.h;
+_781=-dims.w;
+_782=-dims.h;
+break;
+case "center":
+_77f=dims.w/2;
+_780=dims.h/2;
+_781=-dims.w/2;
+_782=-dims.h/2;
+break;
+}
+var _783=MochiKit.Base.update({beforeSetupInternal:function(_784){
+s.setStyle(_784.effects[0].element,{height:"0px"});
+s.showElement(_784.effects[0].element);
+},afterFinishInternal:function(_785){
+s.undoClipping(_785.effects[0].element);
+s.undoPositioned(_785.effects[0].element);
+s.setStyle(_785.effects[0].element,_77d);
+}},_779);
+return new v.Move(_778,{x:_77f,y:_780,duration:0.01,beforeSetupInternal:function(_786){
+s.hideElement(_786.element);
+s.makeClipping(_786.element);
+s.makePositioned(_786.element);
+},afterFinishInternal:function(_787){
+new v.Parallel([new v.Opacity(_787.element,{sync:true,to:1,from:0,transition:_779.opacityTransition}),new v.Move(_787.element,{x:_781,y:_782,sync:true,transition:_779.moveTransition}),new v.Scale(_787.element,100,{scaleMode:{originalHeight:dims.h,originalWidth:dims.w},sync:true,scaleFrom:/Opera/.test(navigator.userAgent)?1:0,transition:_779.scaleTransition,scaleContent:_779.scaleContent,scaleFromCenter:_779.scaleFromCenter,restoreAfterFinish:true})],_783);
+}});
+};
+MochiKit.Visual.shrink=function(_788,_789){
+var d=MochiKit.DOM;
+var v=MochiKit.Visual;
+var s=MochiKit.Style;
+_788=d.getElement(_788);
+_789=MochiKit.Base.update({direction:"center",moveTransition:v.Transitions.sinoidal,scaleTransition:v.Transitions.sinoidal,opacityTransition:v.Transitions.none,scaleContent:true,scaleFromCenter:false},_789);
+var _78d={top:_788.style.top,left:_788.style.left,height:_788.style.height,width:_788.style.width,opacity:s.getStyle(_788,"opacity")};
+var dims=s.getElementDimensions(_788,true);
+var _78f,_790;
+switch(_789.direction){
+case "top-left":
+_78f=_790=0;
+break;
+case "top-right":
+_78f=dims.w;
+_790=0;
+break;
+case "bottom-left":
+_78f=0;
+_790=dims.h;
+break;
+case "bottom-right":
+_78f=dims.w;
+_790=dims.h;
+break;
+case "center":
+_78f=dims.w/2;
+_790=dims.h/2;
+break;
+}
+var _791;
+var _792=MochiKit.Base.update({beforeStartInternal:function(_793){
+s.makePositioned(_793.effects[0].element);
+_791=s.makeClipping(_793.effects[0].element);
+},afterFinishInternal:function(_794){
+s.hideElement(_794.effects[0].element);
+s.undoClipping(_794.effects[0].element,_791);
+s.undoPositioned(_794.effects[0].element);
+s.setStyle(_794.effects[0].element,_78d);
+}},_789);
+return new v.Parallel([new v.Opacity(_788,{sync:true,to:0,from:1,transition:_789.opacityTransition}),new v.Scale(_788,/Opera/.test(navigator.userAgent)?1:0,{scaleMode:{originalHeight:dims.h,originalWidth:dims.w},sync:true,transition:_789.scaleTransition,scaleContent:_789.scaleContent,scaleFromCenter:_789.scaleFromCenter,restoreAfterFinish:true}),new v.Move(_788,{x:_78f,y:_790,sync:true,transition:_789.moveTransition})],_792);
+};
+MochiKit.Visual.pulsate=function(_795,_796){
+var d=MochiKit.DOM;
+var v=MochiKit.Visual;
+var b=MochiKit.Base;
+var _79a=MochiKit.Style.getStyle(_795,"opacity");
+_796=b.update({duration:3,from:0,afterFinishInternal:function(_79b){
+MochiKit.Style.setStyle(_79b.element,{"opacity":_79a});
+}},_796);
+var _79c=_796.transition||v.Transitions.sinoidal;
+_796.transition=function(pos){
+return _79c(1-v.Transitions.pulse(pos,_796.pulses));
+};
+return new v.Opacity(_795,_796);
+};
+MochiKit.Visual.fold=function(_79e,_79f){
+var d=MochiKit.DOM;
+var v=MochiKit.Visual;
+var s=MochiKit.Style;
+_79e=d.getElement(_79e);
+var _7a3=s.getElementDimensions(_79e,true);
+var _7a4={top:_79e.style.top,left:_79e.style.left,width:_79e.style.width,height:_79e.style.height};
+var _7a5=s.makeClipping(_79e);
+_79f=MochiKit.Base.update({scaleContent:false,scaleX:false,scaleMode:{originalHeight:_7a3.h,originalWidth:_7a3.w},afterFinishInternal:function(_7a6){
+new v.Scale(_79e,1,{scaleContent:false,scaleY:false,scaleMode:{originalHeight:_7a3.h,originalWidth:_7a3.w},afterFinishInternal:function(_7a7){
+s.hideElement(_7a7.element);
+s.undoClipping(_7a7.element,_7a5);
+s.setStyle(_7a7.element,_7a4);
+}});
+}},_79f);
+return new v.Scale(_79e,5,_79f);
+};
+MochiKit.Base.nameFunctions(MochiKit.Visual);
+MochiKit.Base._exportSymbols(this,MochiKit.Visual);
+if(typeof (MochiKit)=="undefined"){
+MochiKit={};
+}
+if(typeof (MochiKit.MochiKit)=="undefined"){
+MochiKit.MochiKit={};
+}
+MochiKit.MochiKit.NAME="MochiKit.MochiKit";
+MochiKit.MochiKit.VERSION="1.5";
+MochiKit.MochiKit.__repr__=function(){
+return "["+this.NAME+" "+this.VERSION+"]";
+};
+MochiKit.MochiKit.toString=function(){
+return this.__repr__();
+};
+MochiKit.MochiKit.SUBMODULES=["Base","Iter","Logging","DateTime","Format","Text","Async","DOM","Selector","Style","LoggingPane","Color","Signal","Position","Visual","DragAndDrop","Sortable"];
+(function(){
+if(typeof (document)=="undefined"){
+return;
+}
+var _874=document.getElementsByTagName("script");
+var _875="http://www.w3.org/1999/xhtml";
+var _876="http://www.w3.org/2000/svg";
+var _877="http://www.w3.org/1999/xlink";
+var _878="http://www.mozilla.org/keymaster/gatekeeper/there.is.only.xul";
+var base=null;
+var _87a=null;
+var _87b={};
+var i;
+var src;
+for(i=0;i<_874.length;i++){
+src=null;
+switch(_874[i].namespaceURI){
+case _876:
+src=_874[i].getAttributeNS(_877,"href");
+break;
+default:
+src=_874[i].getAttribute("src");
+break;
+}
+if(!src){
+continue;
+}
+_87b[src]=true;
+if(src.match(/MochiKit.js(\?.*)?$/)){
+base=src.substring(0,src.lastIndexOf("MochiKit.js"));
+_87a=_874[i];
+}
+}
+if(base===null){
+return;
+}
+var _87e=MochiKit.MochiKit.SUBMODULES;
+for(var i=0;i<_87e.length;i++){
+if(MochiKit[_87e[i]]){
+continue;
+}
+var uri=base+_87e[i]+".js";
+if(uri in _87b){
+continue;
+}
+if(_87a.namespaceURI==_876||_87a.namespaceURI==_878){
+var s=document.createElementNS(_87a.namespaceURI,"script");
+s.setAttribute("id","MochiKit_"+base+_87e[i]);
+if(_87a.namespaceURI==_876){
+s.setAttributeNS(_877,"href",uri);
+}else{
+s.setAttribute("src",uri);
+}
+s.setAttribute("type","application/x-javascript");
+_87a.parentNode.appendChild(s);
+}else{
+document.write("<"+_87a.nodeName+" src=\""+uri+"\" type=\"text/javascript\"></script>");
+}
+}
+})();
+
+
+
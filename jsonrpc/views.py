@@ -1,20 +1,94 @@
+import hashlib
+import os
+import threading
+from jsonrpc._compress import ENCODINGS, compress, choose_encoding
 from jsonrpc._json import dumps
-from django.http import HttpResponse
-from django.shortcuts import render_to_response
+from django.http import HttpResponse, HttpResponseNotModified
+from django.shortcuts import render
+from django.utils.cache import patch_vary_headers
 from jsonrpc.site import jsonrpc_site
-from jsonrpc import mochikit
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'static', 'jsonrpc')
+ASSETS = ('mochikit.js', 'interpreter.js')
+# asset URLs carry a version, so browsers may keep them for a year
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+_assets = {}
+_assets_lock = threading.Lock()
+_context = [None, None]  # description ETag, template context
+
+
+def load_asset(name):
+    """
+    Returns the asset ``name`` from the static directory, as a dict mapping
+    each content encoding to the body and ETag of that representation. Every
+    asset is read and compressed once per process, on first use.
+    """
+    asset = _assets.get(name)
+    if asset is None:
+        with _assets_lock:
+            asset = _assets.get(name)
+            if asset is None:
+                with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+                    data = f.read()
+                digest = hashlib.sha1(data).hexdigest()
+                asset = {'identity': (data, '"%s"' % digest)}
+                for encoding in ENCODINGS:
+                    asset[encoding] = (compress(data, encoding, best=True),
+                                       '"%s-%s"' % (digest, encoding))
+                _assets[name] = asset
+    return asset
+
+
+def asset_version(name):
+    "A short digest of the asset ``name``, its URLs change along with it"
+    return load_asset(name)['identity'][1][1:9]
+
+
+def serve_asset(request, name):
+    """
+    Sends the asset ``name``, brotli or gzip compressed when the client
+    accepts it, with a long lived `Cache-Control` and an ETag.
+    """
+    asset = load_asset(name)
+    encoding = choose_encoding(
+        request.META.get('HTTP_ACCEPT_ENCODING')) or 'identity'
+    body, etag = asset[encoding]
+
+    if jsonrpc_site.not_modified(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/x-javascript')
+        response['Content-Length'] = str(len(body))
+        if encoding != 'identity':
+            response['Content-Encoding'] = encoding
+    response['ETag'] = etag
+    response['Cache-Control'] = 'public, max-age=%d' % ASSET_MAX_AGE
+    patch_vary_headers(response, ('Accept-Encoding', ))
+    return response
+
+
+def browse_context():
+    """
+    The template context of the browser, rebuilt only when the service
+    description changes.
+    """
+    desc, data, etag = jsonrpc_site.description_snapshot()
+    context = _context[:]
+    if context[0] != etag:
+        context = [etag, {
+            'methods': desc['procs'],
+            'method_names_str': dumps([m['name'] for m in desc['procs']]),
+            'mochikit_version': asset_version('mochikit.js'),
+            'interpreter_version': asset_version('interpreter.js'),
+        }]
+        _context[:] = context
+    return context[1]
 
 
 def browse(request):
-    if (request.GET.get('f', None) == 'mochikit.js'):
-        return HttpResponse(mochikit.mochikit,
-                            content_type='application/x-javascript')
-    if (request.GET.get('f', None) == 'interpreter.js'):
-        return HttpResponse(mochikit.interpreter,
-                            content_type='application/x-javascript')
-    desc = jsonrpc_site.service_desc()
-    return render_to_response('browse.html', {
-        'methods': desc['procs'],
-        'method_names_str': dumps(
-            [m['name'] for m in desc['procs']])
-    })
+    f = request.GET.get('f', None)
+    if f in ASSETS:
+        return serve_asset(request, f)
+    return render(request, 'browse.html', browse_context())
@@ -37,4 +37,4 @@ setup(
     packages=['jsonrpc'],
     zip_safe=False,  # we include templates and tests
     install_requires=['Django>=1.0', 'six'],
-    package_data={'jsonrpc': ['templates/*']})
+    package_data={'jsonrpc': ['templates/*', 'static/jsonrpc/*']})
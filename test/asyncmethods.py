@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from jsonrpc import jsonrpc_method
+
+
+cancelled = []  # requests of the `async.stuck` calls cancelled at their deadline
+
+
+def register(site):
+  "Registers the `async def` methods used by the async dispatch tests"
+
+  @jsonrpc_method('async.sleepy', site=site)
+  async def sleepy(request, i):
+    await asyncio.sleep(0.1)
+    return [i, request.jsonrpc_version]
+
+  arrived = []
+
+  @jsonrpc_method('async.together', site=site)
+  async def together(request, i, n):
+    # returns once ``n`` calls run at the same time, fails after 5 seconds
+    arrived.append(i)
+    for attempt in range(500):
+      if len(arrived) >= n:
+        return [i, request.jsonrpc_version]
+      await asyncio.sleep(0.01)
+    raise RuntimeError('the calls were not run concurrently')
+
+  @jsonrpc_method('async.fails', site=site)
+  async def fails(request):
+    await asyncio.sleep(0)
+    raise IndexError
+
+  @jsonrpc_method('async.sync', site=site)
+  def sync(request, i):
+    return i
+
+  @jsonrpc_method('async.stuck', site=site, timeout=0.05)
+  async def stuck(request):
+    try:
+      await asyncio.sleep(5)
+    except asyncio.CancelledError:
+      cancelled.append(request)
+      raise
+    return 'finished'
+
+  @jsonrpc_method('async.late', site=site, timeout=0.01)
+  def late(request):
+    time.sleep(0.05)
+    return 'done'
+
+  @jsonrpc_method('async.cached', site=site, safe=True, http_cache={'max_age': 60})
+  async def cached(request, a):
+    return int(a)
+
+
+async def whoami(request):
+  await asyncio.sleep(0)
+  return request.user.username
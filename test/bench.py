@@ -0,0 +1,313 @@
+"""
+Benchmarks of `JSONRPCSite.dispatch`, driven through Django's RequestFactory.
+
+    python test/bench.py                      # run every case
+    python test/bench.py -k batch             # only the cases matching 'batch'
+    python test/bench.py --save before.json   # keep the results...
+    python test/bench.py --compare before.json  # ...and compare another run
+
+Every case is run with each protocol version and reports calls per second
+(the best of a few repeats) and, on Python 3.4 or greater, the bytes
+allocated by one call at its peak and those left allocated per call.
+
+The `call` cases time `JSONRPCSite.response_dict` alone, the per-call
+overhead of the site without HTTP and JSON decoding:
+
+    python test/bench.py -k call
+"""
+import gc
+import json
+import optparse
+import os
+import platform
+import subprocess
+import sys
+import time
+
+try:
+  import tracemalloc
+except ImportError:  # Python < 3.4
+  tracemalloc = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+BENCH_SETTINGS = {
+  'DEBUG': False,
+  'SECRET_KEY': 'django-json-rpc-bench',
+  'USE_I18N': False,
+  'INSTALLED_APPS': (
+    'jsonrpc',
+    'django.contrib.auth',
+    'django.contrib.contenttypes'),
+  'DATABASES': {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+      },
+  },
+  # the authenticated case measures the site, not the password hasher
+  'PASSWORD_HASHERS': ('django.contrib.auth.hashers.MD5PasswordHasher',),
+}
+
+from django.conf import settings
+if not settings.configured:
+  settings.configure(**BENCH_SETTINGS)
+
+import django
+if hasattr(django, 'setup'):
+  django.setup()
+
+from django.core import management
+from django.test.client import RequestFactory
+from jsonrpc import jsonrpc_method
+from jsonrpc._json import dumps, get_backend
+from jsonrpc.exceptions import InvalidParamsError
+from jsonrpc.site import JSONRPCSite
+
+VERSIONS = ('1.0', '1.1', '2.0')
+timer = getattr(time, 'perf_counter', time.time)
+# the smallest time a repeat takes, the number of calls is raised until then
+MIN_TIME = 0.2
+
+
+class Null(object):
+  "Swallows the error reports of methods written to stderr"
+  def write(self, s):
+    pass
+
+  def flush(self):
+    pass
+
+
+def make_site():
+  site = JSONRPCSite()
+
+  @jsonrpc_method('bench.echo', site=site)
+  def echo(request, s):
+    return s
+
+  @jsonrpc_method('bench.validated(String, Number, Array) -> Object', validate=True, site=site)
+  def validated(request, name, count, items):
+    return {'name': name, 'count': count, 'items': items}
+
+  @jsonrpc_method('bench.authenticated', authenticated=True, site=site)
+  def authenticated(request, s):
+    return s
+
+  @jsonrpc_method('bench.safe', safe=True, site=site)
+  def safe(request, a, b):
+    return [a, b]
+
+  @jsonrpc_method('bench.large', site=site)
+  def large(request, n):
+    return [{'id': i, 'name': 'item %d' % i, 'tags': ['a', 'b'], 'price': i * 1.5} for i in range(n)]
+
+  @jsonrpc_method('bench.fail', site=site)
+  def fail(request):
+    raise InvalidParamsError('always')
+
+  return site
+
+
+def setup_database():
+  from django.contrib.auth.models import User
+  if django.VERSION[:2] <= (1, 7):
+    management.call_command('syncdb', interactive=False, verbosity=0)
+  else:
+    management.call_command('migrate', interactive=False, verbosity=0)
+  if not User.objects.filter(username='bench').exists():
+    User.objects.create_user(username='bench', email='bench@example.com', password='password')
+
+
+def call(version, method, params, id=1):
+  D = {'method': method, 'params': params, 'id': id}
+  if version == '2.0':
+    D['jsonrpc'] = version
+  else:
+    D['version'] = version
+  return D
+
+
+# name => function of the protocol version returning (HTTP method, path, body)
+CASES = [
+  ('single', lambda v: ('post', '', call(v, 'bench.echo', ['hello']))),
+  ('batch100', lambda v: ('post', '', [call(v, 'bench.echo', [i], i) for i in range(100)])),
+  ('validated', lambda v: ('post', '', call(v, 'bench.validated', ['name', 3, [1, 2, 3]]))),
+  ('authenticated', lambda v: ('post', '', call(v, 'bench.authenticated', ['bench', 'password', 'hello']))),
+  # GET requests are always answered as version 1.1
+  ('get', lambda v: ('get', 'bench.safe', {'a': '1', 'b': 'two'}) if v == '1.1' else None),
+  ('large', lambda v: ('post', '', call(v, 'bench.large', [2000]))),
+  ('error', lambda v: ('post', '', call(v, 'bench.fail', []))),
+  ('call', lambda v: ('call', '', call(v, 'bench.echo', ['hello']))),
+  # 1.1 mixes positional (numbered) and named params
+  ('call_mixed', lambda v: ('call', '', call(v, 'bench.safe', {'0': 'a', 'b': 'two'})) if v == '1.1' else None),
+  ('call_keyword', lambda v: ('call', '', call(v, 'bench.safe', {'a': 'a', 'b': 'two'})) if v == '2.0' else None),
+  ('call_validated', lambda v: ('call', '', call(v, 'bench.validated', ['name', 3, [1, 2, 3]]))),
+]
+
+
+def make_runner(site, factory, http_method, path, body):
+  "Returns a function making one request with a fresh request object"
+  if http_method == 'get':
+    def run():
+      return site.dispatch(factory.get('/json/' + path, body), method=path)
+  elif http_method == 'call':
+    request = factory.post('/json/', '', content_type='application/json-rpc')
+
+    def run():
+      # response_dict fills in missing members, every call gets a fresh one
+      return site.response_dict(request, dict(body))
+  else:
+    data = dumps(body)
+
+    def run():
+      return site.dispatch(factory.post('/json/', data, content_type='application/json-rpc'))
+  return run
+
+
+def time_calls(run, number):
+  gc_enabled = gc.isenabled()
+  gc.disable()
+  try:
+    started = timer()
+    for _ in range(number):
+      run()
+    return timer() - started
+  finally:
+    if gc_enabled:
+      gc.enable()
+
+
+def measure_speed(run, repeat):
+  "The best calls per second of ``repeat`` runs of at least `MIN_TIME`"
+  number = 1
+  while True:
+    elapsed = time_calls(run, number)
+    if elapsed >= MIN_TIME:
+      break
+    number *= 2
+  best = elapsed
+  for _ in range(repeat - 1):
+    best = min(best, time_calls(run, number))
+  return number / best
+
+
+def measure_allocations(run, number=20):
+  "The peak bytes allocated by one call and the bytes each call leaves behind"
+  if tracemalloc is None:
+    return None, None
+  run()  # warm up caches first
+  gc.collect()
+  tracemalloc.start()
+  try:
+    before = tracemalloc.get_traced_memory()[0]
+    run()
+    peak = tracemalloc.get_traced_memory()[1] - before
+    for _ in range(number):
+      run()
+    gc.collect()
+    net = (tracemalloc.get_traced_memory()[0] - before) // (number + 1)
+  finally:
+    tracemalloc.stop()
+  return peak, net
+
+
+def run_cases(pattern=None, repeat=3):
+  """
+  Runs the cases whose name (like `batch100/2.0`) contains ``pattern`` and
+  returns their results by name
+  """
+  site = make_site()
+  factory = RequestFactory()
+  setup_database()
+  results = {}
+  for name, make in CASES:
+    for version in VERSIONS:
+      spec = make(version)
+      key = '%s/%s' % (name, version)
+      if spec is None or (pattern and pattern not in key):
+        continue
+      run = make_runner(site, factory, *spec)
+      stdout, stderr = sys.stdout, sys.stderr
+      sys.stdout = sys.stderr = Null()
+      try:
+        response = run()
+        ops = measure_speed(run, repeat)
+        peak, net = measure_allocations(run)
+      finally:
+        sys.stdout, sys.stderr = stdout, stderr
+      results[key] = {
+        'ops': ops,
+        'alloc_peak': peak,
+        'alloc_net': net,
+        'response_bytes': len(response.content) if hasattr(response, 'content') else None,
+      }
+      print_result(key, results[key])
+  return results
+
+
+def revision():
+  "The git revision of the working tree, `None` outside of a checkout"
+  try:
+    return subprocess.check_output(
+      ['git', 'rev-parse', '--short', 'HEAD'],
+      cwd=os.path.dirname(os.path.abspath(__file__)),
+      stderr=subprocess.STDOUT).decode('ascii').strip()
+  except Exception:
+    return None
+
+
+def environment():
+  return {
+    'revision': revision(),
+    'python': platform.python_version(),
+    'django': django.get_version(),
+    'json_backend': get_backend(),
+    'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+  }
+
+
+def format_bytes(n):
+  return '-' if n is None else '%d' % n
+
+
+def print_result(key, result):
+  print('%-26s %12.1f calls/s %10s B peak %8s B net' % (
+    key, result['ops'], format_bytes(result['alloc_peak']), format_bytes(result['alloc_net'])))
+
+
+def compare(old, new):
+  "Prints how the results ``new`` changed from those of ``old``"
+  print('\n%-26s %12s %12s %8s %10s' % ('case', 'before', 'after', 'speed', 'peak'))
+  for key in sorted(new['results']):
+    if key not in old['results']:
+      continue
+    a, b = old['results'][key], new['results'][key]
+    peak = '-'
+    if a['alloc_peak'] and b['alloc_peak'] is not None:
+      peak = '%+.1f%%' % (100.0 * (b['alloc_peak'] - a['alloc_peak']) / a['alloc_peak'])
+    print('%-26s %12.1f %12.1f %+7.1f%% %10s' % (
+      key, a['ops'], b['ops'], 100.0 * (b['ops'] - a['ops']) / a['ops'], peak))
+
+
+def main(argv=None):
+  parser = optparse.OptionParser(usage='%prog [options]')
+  parser.add_option('-k', dest='pattern', help='only run the cases whose name contains PATTERN')
+  parser.add_option('-r', '--repeat', type='int', default=3, help='timing runs per case, the best one counts')
+  parser.add_option('--save', metavar='FILE', help='write the results to FILE as JSON')
+  parser.add_option('--compare', metavar='FILE', help='compare the results with those saved in FILE')
+  options, args = parser.parse_args(argv)
+
+  env = environment()
+  print('revision %(revision)s, python %(python)s, django %(django)s, json %(json_backend)s' % env)
+  results = {'environment': env, 'results': run_cases(options.pattern, options.repeat)}
+  if options.save:
+    with open(options.save, 'w') as f:
+      json.dump(results, f, indent=2, sort_keys=True)
+  if options.compare:
+    with open(options.compare) as f:
+      compare(json.load(f), results)
+
+
+if __name__ == '__main__':
+  main()
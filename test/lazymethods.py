@@ -0,0 +1,13 @@
+from jsonrpc import jsonrpc_method
+
+
+# imported lazily by the tests, on the first call into the `lazy` namespace
+
+@jsonrpc_method('lazy.echo')
+def echo(request, s):
+  return s
+
+
+@jsonrpc_method('lazy.deeper.echo')
+def deeper_echo(request, s):
+  return s
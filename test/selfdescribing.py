@@ -0,0 +1,12 @@
+from jsonrpc import jsonrpc_method
+from jsonrpc.site import jsonrpc_site
+
+
+# a lazy namespace that describes the site while it is being imported
+
+@jsonrpc_method('selfdesc.echo')
+def echo(request, s):
+  return s
+
+
+description = jsonrpc_site.service_desc()
@@ -1,6 +1,9 @@
+import gzip
+import io
 import os
 import sys
 import unittest
+import zlib
 import time
 import urllib
 import threading
@@ -12,6 +15,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'
 
 TEST_DEFAULTS = {
   'ROOT_URLCONF': 'jsontesturls',
+  'SECRET_KEY': 'django-json-rpc-tests',
   'DEBUG': True,
   'DEBUG_PROPAGATE_EXCEPTIONS': True,
   'DATETIME_FORMAT': 'N j, Y, P',
@@ -49,11 +53,14 @@ if hasattr(django, 'setup'):
 
 from django.core import management
 from django.test import Client
+from django.test.client import RequestFactory
 from django.contrib.auth.models import User
 from jsonrpc import jsonrpc_method, _parse_sig, Any
+from jsonrpc import deadlines
 from jsonrpc.proxy import ServiceProxy, TestingServiceProxy
 from jsonrpc._json import loads, dumps
-from jsonrpc.site import validate_params
+from jsonrpc._compress import gzip_bytes
+from jsonrpc.site import validate_params, JSONRPCSite, jsonrpc_site
 from jsonrpc.exceptions import *
 from jsonrpc._types import *
 
@@ -222,6 +229,50 @@ class JSONRPCFunctionalTests(unittest.TestCase):
         e = exc
       self.assert_(type(e) is sig[1])
 
+  def test_container_sigs(self):
+    name, types, ret = _parse_sig(
+      'jsonrpc.nested(Array(Number), Object{id: Number, tags: Array(String)?}, c=String?) -> list(Object{})', ['a', 'b'])
+    self.assertEquals(types, OrderedDict([
+      ('a', ArrayOf(Number)),
+      ('b', ObjectOf(OrderedDict([('id', Number), ('tags', Optional(ArrayOf(String)))]))),
+      ('c', Optional(String))]))
+    self.assertEquals(ret, ArrayOf(ObjectOf(OrderedDict(), Object), list))
+    self.assertEquals(str(types['b']), 'Object{id: Number, tags: Array(String)?}')
+    self.assertEquals(type_name(ret), 'Array(Object{})')  # JSON names
+    for sig in ('jsonrpc(__import__("os"))', 'jsonrpc(String(Number))', 'jsonrpc(Array{a: Number})',
+                'jsonrpc(Array(Number)', 'jsonrpc(Object{a Number})', 'jsonrpc(a=Array(Nowai))'):
+      self.assertRaises(ValueError, _parse_sig, sig, ['a'])
+
+  def test_validate_containers(self):
+    M = jsonrpc_method('jsonrpc.nested(ids=Array(Number), item=Object{id: Number, tags: Array(String)?}, '
+                       'note=String?)', validate=True, site=JSONRPCSite())(lambda r, ids, item, note=None: ids)
+    for params in ([[1, 2], {'id': 1}], [[], {'id': 1, 'tags': ['a'], 'other': 1}, None],
+                   {'ids': [1], 'item': {'id': 1, 'tags': None}}, [[1], {'id': 1}, 'note']):
+      self.assert_(validate_params(M, {'params': params}) is None)
+    for params, message in (([[1, 'a'], {'id': 1}], 'ids: [1]: '),
+                            ([[1], {'id': 1, 'tags': ['a', 2]}], 'item: tags: [1]: '),
+                            ([[1], {'tags': []}], 'item: member id is missing'),
+                            ([[1], []], 'item: '),
+                            ([[1], {'id': 1}, 1], ' is not the correct type'),
+                            ([[1]], 'Not enough params'),
+                            ({'ids': [1], 'note': 'a'}, 'Not enough params')):
+      try:
+        validate_params(M, {'params': params})
+      except InvalidParamsError as e:
+        self.assert_(message in e.message, e.message)
+      else:
+        self.fail('%r should not be valid' % (params, ))
+
+  def test_describe_containers(self):
+    site = JSONRPCSite()
+    jsonrpc_method('jsonrpc.nested(ids=Array(Number), note=String?) -> Object{n: Number}',
+                   site=site)(lambda r, ids, note=None: None)
+    proc = site.service_desc()['procs'][0]
+    self.assertEquals([(p['name'], p['sig'], p['optional']) for p in proc['params']],
+                      [('ids', 'Array(Number)', False), ('note', 'String?', True)])
+    self.assertEquals(proc['params'][0]['type'], str(Array))
+    self.assertEquals(proc['return']['sig'], 'Object{n: Number}')
+
   def test_validate_args(self):
     sig = 'jsonrpc(String, String) -> String'
     M = jsonrpc_method(sig, validate=True)(lambda r, s1, s2: s1+s2)
@@ -255,6 +306,1400 @@ class JSONRPCFunctionalTests(unittest.TestCase):
     assert Any.kind(None) == Nil
     assert type(1) == Number
     assert type(1.1) == Number
+    assert not type(True) == Number
+    assert Any.kind(True) == Boolean
+
+  def test_types_subclasses(self):
+    class Name(six.text_type):
+      pass
+    assert Any.kind(OrderedDict()) == Object
+    assert Any.kind(Name('omg')) == String
+    assert Any.kind(Name) == String
+    assert Any.kind(Name('omg')) is Any.kind(Name('wtf'))
+
+  def test_kinds_table_published_whole(self):
+    from jsonrpc import _types
+    basetypes = _types._basetypes
+    seen = []
+
+    def _basetypes(T):
+      # another thread classifying a number while the table is being built
+      if not seen:
+        seen.append(None)
+        seen[0] = Any.kind(1)
+      return basetypes(T)
+
+    Any._reset()
+    _types._basetypes = _basetypes
+    try:
+      self.assertEquals(Any.kind(''), String)
+    finally:
+      _types._basetypes = basetypes
+    self.assertEquals(seen, [Number])
+    self.assertEquals(Any.kind(1), Number)
+
+
+class JSONBackendTest(unittest.TestCase):
+  def tearDown(self):
+    from jsonrpc import _json
+    _json.set_backend('auto')
+
+  def _backends(self):
+    from jsonrpc import _json
+    for name in ('json',) + _json.BACKENDS:
+      try:
+        _json.set_backend(name)
+      except ImportError:
+        continue
+      yield name
+
+  def test_roundtrip(self):
+    import datetime, decimal
+    from django.core.serializers.json import DjangoJSONEncoder
+    from jsonrpc._json import dumps_bytes
+    obj = {'s': six.u('\u2603'), 'n': [1, 2.5, None, True], 'big': 2 ** 70,
+           'when': datetime.datetime(2015, 5, 1, 12, 30),
+           'price': decimal.Decimal('1.10'), 1: 'int key'}
+    expected = loads(dumps(obj, cls=DjangoJSONEncoder))
+    for name in self._backends():
+      data = dumps_bytes(obj, cls=DjangoJSONEncoder)
+      self.assert_(isinstance(data, six.binary_type), name)
+      self.assertEquals(loads(data), expected, name)
+      self.assertEquals(loads(data.decode('utf-8')), expected, name)
+
+  def test_unsupported_type(self):
+    from jsonrpc._json import dumps_bytes
+    for name in self._backends():
+      self.assertRaises(TypeError, dumps_bytes, {'o': object()})
+
+
+class ParallelBatchTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(batch_workers=4, batch_concurrency=2)
+    self.factory = RequestFactory()
+
+    @jsonrpc_method('parallel.sleepy', site=self.site)
+    def sleepy(request, i):
+      time.sleep(0.1)
+      return [i, request.jsonrpc_version]
+
+    @jsonrpc_method('parallel.fails', site=self.site)
+    def fails(request):
+      raise IndexError
+
+    self.running = self.most = 0
+    self.lock = threading.Lock()
+    self.overlapped = threading.Event()
+
+    @jsonrpc_method('parallel.overlap', site=self.site)
+    def overlap(request, i):
+      # the first call waits (5 seconds at most) for a second one to start
+      with self.lock:
+        self.running += 1
+        self.most = max(self.most, self.running)
+        if self.running == 2:
+          self.overlapped.set()
+      try:
+        self.overlapped.wait(5)
+      finally:
+        with self.lock:
+          self.running -= 1
+      return [i, request.jsonrpc_version]
+
+  def _batch(self, req):
+    request = self.factory.post('/json/', dumps(req),
+                                content_type='application/json-rpc')
+    return loads(self.site.dispatch(request).content.decode('utf-8'))
+
+  def test_parallel_batch(self):
+    req = [{'jsonrpc': '2.0' if i % 2 else '1.0', 'method': 'parallel.overlap',
+            'params': [i], 'id': i} for i in range(4)]
+    resp = self._batch(req)
+    self.assert_(self.overlapped.is_set(), 'batch was not run in parallel')
+    self.assertEquals(self.most, 2, 'batch_concurrency was not respected')
+    for i, D in enumerate(resp):
+      self.assertEquals(D['id'], i)
+      self.assertEquals(D['result'], [i, req[i]['jsonrpc']])
+
+  def test_parallel_batch_with_errors(self):
+    req = [{'jsonrpc': '2.0', 'method': 'parallel.sleepy' if i % 2 else 'parallel.fails',
+            'params': [i] if i % 2 else [], 'id': i} for i in range(4)]
+    resp = self._batch(req)
+    for i, D in enumerate(resp):
+      self.assertEquals(D['id'], i)
+      if i % 2:
+        self.assertEquals(D['result'][0], i)
+      else:
+        self.assertEquals(D['error']['code'], 500)
+
+  def test_old_connections_closed(self):
+    import django.db
+    close_old_connections = django.db.close_old_connections
+    threads = []
+    django.db.close_old_connections = lambda: threads.append(threading.current_thread())
+    try:
+      self._batch([{'jsonrpc': '2.0', 'method': 'parallel.overlap', 'params': [i], 'id': i}
+                   for i in range(4)])
+    finally:
+      django.db.close_old_connections = close_old_connections
+    # before and after every element, in the pool threads
+    self.assertEquals(len(threads), 8)
+    self.assertFalse(threading.current_thread() in threads)
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'async dispatch requires python 3.5')
+class AsyncDispatchTest(unittest.TestCase):
+  def setUp(self):
+    import asyncio
+    from asyncmethods import register
+    self.loop = asyncio.new_event_loop()
+    self.site = JSONRPCSite()
+    self.factory = RequestFactory()
+    register(self.site)
+
+  def tearDown(self):
+    self.loop.close()
+
+  def _call(self, req, dispatch=None):
+    request = self.factory.post('/json/', dumps(req),
+                                content_type='application/json-rpc')
+    if dispatch is None:
+      response = self.loop.run_until_complete(self.site.async_dispatch(request))
+    else:
+      response = dispatch(request)
+    return loads(response.content.decode('utf-8'))
+
+  def test_async_method(self):
+    resp = self._call({'jsonrpc': '2.0', 'method': 'async.sleepy', 'params': [1], 'id': 1})
+    self.assertEquals(resp['result'], [1, '2.0'])
+
+  def test_async_method_sync_dispatch(self):
+    resp = self._call({'jsonrpc': '2.0', 'method': 'async.sleepy', 'params': [1], 'id': 1},
+                      dispatch=self.site.dispatch)
+    self.assertEquals(resp['result'], [1, '2.0'])
+
+  def test_async_batch(self):
+    req = [{'jsonrpc': '2.0', 'method': 'async.together', 'params': [i, 5], 'id': i}
+           for i in range(5)]
+    req += [{'jsonrpc': '2.0', 'method': 'async.fails', 'params': [], 'id': 5},
+            {'jsonrpc': '2.0', 'method': 'async.sync', 'params': [6], 'id': 6}]
+    resp = self._call(req)
+    for i, D in enumerate(resp[:5]):
+      self.assertEquals(D['id'], i)
+      self.assertEquals(D['result'], [i, '2.0'])
+    self.assertEquals(resp[5]['error']['code'], 500)
+    self.assertEquals(resp[6]['result'], 6)
+
+  def test_authentication_off_the_loop(self):
+    threads = []
+
+    def check(username, password):
+      threads.append(threading.current_thread())
+      return User(username=username)
+
+    from asyncmethods import whoami
+    jsonrpc_method('async.whoami', authenticated=check, site=self.site)(whoami)
+    resp = self._call({'jsonrpc': '2.0', 'method': 'async.whoami', 'params': ['bob', 'pw'], 'id': 1})
+    self.assertEquals(resp['result'], 'bob')
+    self.assert_(threads[0] is not threading.current_thread())
+    resp = self._call({'jsonrpc': '2.0', 'method': 'async.whoami', 'params': ['bob', 'pw'], 'id': 1},
+                      dispatch=self.site.dispatch)
+    self.assertEquals(resp['result'], 'bob')
+    self.assert_(threads[1] is threading.current_thread())
+
+  def test_old_connections_closed(self):
+    import django.db
+    close_old_connections = django.db.close_old_connections
+    threads = []
+    django.db.close_old_connections = lambda: threads.append(threading.current_thread())
+    try:
+      resp = self._call({'jsonrpc': '2.0', 'method': 'async.sync', 'params': [1], 'id': 1})
+    finally:
+      django.db.close_old_connections = close_old_connections
+    self.assertEquals(resp['result'], 1)
+    # around loading the request and around the method
+    self.assertEquals(len(threads), 4)
+    self.assertFalse(threading.current_thread() in threads)
+
+  def test_http_cache(self):
+    request = self.factory.get('/json/', {'a': 1})
+    response = self.loop.run_until_complete(self.site.async_dispatch(request, method='async.cached'))
+    self.assertEquals(loads(response.content)['result'], 1)
+    request = self.factory.get('/json/', {'a': 1}, HTTP_IF_NONE_MATCH=response['ETag'])
+    self.assertEquals(self.loop.run_until_complete(
+      self.site.async_dispatch(request, method='async.cached')).status_code, 304)
+
+  def test_deadline(self):
+    from asyncmethods import cancelled
+    for dispatch in (None, self.site.dispatch):
+      del cancelled[:]
+      resp = self._call({'jsonrpc': '2.0', 'method': 'async.stuck', 'params': [], 'id': 1}, dispatch)
+      self.assertEquals(len(cancelled), 1, 'the method was not cancelled')
+      self.assertEquals(resp['error']['name'], 'DeadlineExceededError')
+      # a synchronous method cannot be stopped, what it did is returned
+      resp = self._call({'jsonrpc': '2.0', 'method': 'async.late', 'params': [], 'id': 1}, dispatch)
+      self.assertEquals(resp['result'], 'done')
+
+
+class StreamingBatchTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(stream_batch_size=3)
+    self.factory = RequestFactory()
+
+    @jsonrpc_method('stream.echo', site=self.site)
+    def echo(request, value):
+      return value
+
+    @jsonrpc_method('stream.unencodable', site=self.site)
+    def unencodable(request):
+      return {'o': object()}
+
+  def _dispatch(self, req):
+    request = self.factory.post('/json/', dumps(req),
+                                content_type='application/json-rpc')
+    return self.site.dispatch(request)
+
+  def test_streamed_batch(self):
+    req = [{'jsonrpc': '2.0', 'method': 'stream.echo', 'params': [i], 'id': i}
+           for i in range(5)]
+    req.append({'jsonrpc': '2.0', 'method': 'stream.unencodable', 'params': [], 'id': 5})
+    response = self._dispatch(req)
+    self.assert_(response.streaming)
+    resp = loads(b''.join(response.streaming_content).decode('utf-8'))
+    self.assertEquals([D['result'] for D in resp[:5]], list(range(5)))
+    self.assertEquals(resp[5]['id'], 5)
+    self.assertEquals(resp[5]['error']['code'], 500)
+    self.assert_('result' not in resp[5])
+
+  def test_small_batch_buffered(self):
+    req = [{'jsonrpc': '2.0', 'method': 'stream.echo', 'params': [i], 'id': i}
+           for i in range(2)]
+    response = self._dispatch(req)
+    self.assert_(not getattr(response, 'streaming', False))
+    self.assertEquals([D['result'] for D in loads(response.content)], [0, 1])
+
+
+class IncrementalRequestTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(incremental_request_size=0)
+    self.factory = RequestFactory()
+    self.notified = []
+
+    @jsonrpc_method('incremental.echo', site=self.site)
+    def echo(request, value):
+      return value
+
+    @jsonrpc_method('incremental.notify', site=self.site)
+    def notify(request, value):
+      self.notified.append(value)
+
+  def _stream(self, data, chunk_size):
+    from io import BytesIO
+    from jsonrpc._json import ArrayStream
+    return list(ArrayStream(BytesIO(data).read, chunk_size=chunk_size))
+
+  def test_array_stream(self):
+    values = [12345, -1.5e10, six.u('sn\u2603wman'), {'a': [1, {'b': None}]}, True, []]
+    data = (' [ ' + ' ,\n'.join(dumps(v) for v in values) + ' ] ').encode('utf-8')
+    for chunk_size in (1, 2, 3, 7, 1024):
+      self.assertEquals(self._stream(data, chunk_size), values)
+    self.assertEquals(self._stream(b'[]', 1), [])
+    for bad in (b'{"a": 1}', b'[1, 2', b'[1 2]', b'[1, nope]', b''):
+      self.assertRaises(ValueError, self._stream, bad, 2)
+
+  def _dispatch(self, data):
+    request = self.factory.post('/json/', data, content_type='application/json-rpc')
+    return self.site.dispatch(request)
+
+  def test_incremental_batch(self):
+    req = [{'jsonrpc': '2.0', 'method': 'incremental.echo', 'params': [i], 'id': i}
+           for i in range(3)]
+    req.append({'jsonrpc': '2.0', 'method': 'incremental.notify', 'params': ['n']})
+    resp = loads(self._dispatch(dumps(req)).content)
+    self.assertEquals([D['result'] for D in resp], [0, 1, 2])
+    self.assertEquals(self.notified, ['n'])
+
+  def test_incremental_single(self):
+    req = {'jsonrpc': '2.0', 'method': 'incremental.echo', 'params': ['x'], 'id': 1}
+    self.assertEquals(loads(self._dispatch(dumps(req)).content)['result'], 'x')
+
+  def test_incremental_notifications(self):
+    req = [{'jsonrpc': '2.0', 'method': 'incremental.notify', 'params': [i]}
+           for i in range(5)]
+    response = self._dispatch(dumps(req))
+    self.assertEquals(response.status_code, 204)
+    self.assertEquals(self.notified, list(range(5)))
+
+  def test_incremental_streamed_parse_error(self):
+    self.site.stream_batch_size = 1
+    response = self._dispatch('[{"jsonrpc": "2.0", "method": "incremental.echo", '
+                              '"params": [1], "id": 1}, {"broken')
+    resp = loads(b''.join(response.streaming_content))
+    self.assertEquals(resp[0]['result'], 1)
+    self.assertEquals(resp[1]['error']['code'], -32600)
+
+  def test_incremental_parse_error(self):
+    response = self._dispatch('[{"jsonrpc": "2.0", "method": "incremental.echo", '
+                              '"params": [1], "id": 1}, {"broken')
+    self.assertEquals(response.status_code, 400)
+
+
+class ResultCacheTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite()
+    self.factory = RequestFactory()
+    self.calls = []
+
+    @jsonrpc_method('cached.lookup', safe=True, cache={'ttl': 60, 'max_entries': 2},
+                    site=self.site)
+    def lookup(request, code, lang='en'):
+      self.calls.append(code)
+      return {'code': code, 'lang': lang}
+
+  def _call(self, params):
+    request = self.factory.post('/json/', dumps({'jsonrpc': '2.0', 'method': 'cached.lookup',
+                                                 'params': params, 'id': 1}),
+                                content_type='application/json-rpc')
+    return loads(self.site.dispatch(request).content)['result']
+
+  def test_cache_hits(self):
+    self.assertEquals(self._call(['nl']), {'code': 'nl', 'lang': 'en'})
+    self.assertEquals(self._call(['nl']), {'code': 'nl', 'lang': 'en'})
+    self.assertEquals(self._call({'code': 'nl'}), {'code': 'nl', 'lang': 'en'})
+    self.assertEquals(self._call(['nl', 'de']), {'code': 'nl', 'lang': 'de'})
+    self.assertEquals(self.calls, ['nl', 'nl'])
+    self.assertEquals(self.site.cache_stats()['cached.lookup'],
+                      {'hits': 2, 'misses': 2, 'size': 2})
+
+  def test_invalidate(self):
+    self._call(['nl'])
+    self._call(['be'])
+    self.site.invalidate('cached.lookup', 'nl')
+    self._call(['nl'])
+    self._call(['be'])
+    self.assertEquals(self.calls, ['nl', 'be', 'nl'])
+    self.site.invalidate('cached.lookup')
+    self._call(['be'])
+    self.assertEquals(self.calls, ['nl', 'be', 'nl', 'be'])
+
+  def test_eviction_and_expiry(self):
+    from jsonrpc.cache import LRUCache, MISSING
+    lru = LRUCache(max_entries=2, ttl=None)
+    lru.set('a', 1)
+    lru.set('b', 2)
+    lru.get('a')
+    lru.set('c', 3)
+    self.assertEquals([lru.get(k) for k in 'abc'], [1, MISSING, 3])
+    lru.set('d', 4, ttl=-1)
+    self.assert_(lru.get('d') is MISSING)
+
+  def test_unsafe_methods_are_not_cached(self):
+    self.assertRaises(ValueError, jsonrpc_method, 'cached.unsafe', cache=True,
+                      site=self.site)
+
+  def test_hit_header(self):
+    post = lambda: self.site.dispatch(self.factory.post('/json/', dumps(
+      {'jsonrpc': '2.0', 'method': 'cached.lookup', 'params': ['fr'], 'id': 1}),
+      content_type='application/json-rpc'))
+    self.assertEquals(post()['X-JSONRPC-Cache'], 'miss')
+    self.assertEquals(post()['X-JSONRPC-Cache'], 'hit')
+    request = self.factory.post('/json/', dumps([{'jsonrpc': '2.0', 'method': 'cached.lookup',
+                                                  'params': ['fr'], 'id': 1}]),
+                                content_type='application/json-rpc')
+    self.assertFalse(self.site.dispatch(request).has_header('X-JSONRPC-Cache'))
+
+  def test_invalidate_backend(self):
+    @jsonrpc_method('cached.shared', safe=True, cache={'ttl': 60, 'backend': 'default'},
+                    site=self.site)
+    def shared(request, code):
+      self.calls.append(code)
+      return code
+
+    call = lambda: loads(self.site.dispatch(self.factory.post('/json/', dumps(
+      {'jsonrpc': '2.0', 'method': 'cached.shared', 'params': ['nl'], 'id': 1}),
+      content_type='application/json-rpc')).content)['result']
+    call()
+    self.site.urls['cached.shared'].json_cache.local.clear()
+    call()  # from the Django cache
+    self.assertEquals(self.calls, ['nl'])
+    self.site.invalidate('cached.shared')
+    call()
+    self.site.invalidate('cached.shared', 'nl')
+    call()
+    self.assertEquals(self.calls, ['nl'] * 3)
+
+  def test_authenticated_results_per_user(self):
+    check = lambda username, password: User(username=username) if password == 'secret' else None
+
+    @jsonrpc_method('cached.whoami', safe=True, cache=True, authenticated=check, site=self.site)
+    def whoami(request):
+      self.calls.append(request.user.username)
+      return request.user.username
+
+    call = lambda username: loads(self.site.dispatch(self.factory.post('/json/', dumps(
+      {'jsonrpc': '2.0', 'method': 'cached.whoami', 'params': [username, 'secret'], 'id': 1}),
+      content_type='application/json-rpc')).content)['result']
+    self.assertEquals([call('alice'), call('bob'), call('alice'), call('bob')],
+                      ['alice', 'bob', 'alice', 'bob'])
+    self.assertEquals(self.calls, ['alice', 'bob'])
+
+
+class HTTPCacheTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite()
+    self.factory = RequestFactory()
+    self.calls = []
+
+    @jsonrpc_method('http.greet', safe=True, http_cache={'max_age': 60, 'public': True},
+                    site=self.site)
+    def greet(request, name):
+      self.calls.append(name)
+      return 'Hello %s' % name
+
+    @jsonrpc_method('http.version', safe=True, site=self.site,
+                    http_cache={'etag': lambda request, name: 'v1-%s' % name})
+    def version(request, name):
+      self.calls.append(name)
+      return name
+
+  def _get(self, method, **headers):
+    request = self.factory.get('/json/%s' % method, {'name': 'sam'}, **headers)
+    return self.site.dispatch(request, method)
+
+  def test_etag(self):
+    response = self._get('http.greet')
+    self.assertEquals(response.status_code, 200)
+    self.assertEquals(loads(response.content)['result'], 'Hello sam')
+    self.assert_('max-age=60' in response['Cache-Control'])
+    self.assert_('public' in response['Cache-Control'])
+    etag = response['ETag']
+    response = self._get('http.greet', HTTP_IF_NONE_MATCH='"other", %s' % etag)
+    self.assertEquals(response.status_code, 304)
+    self.assertEquals(response.content, b'')
+    self.assertEquals(response['ETag'], etag)
+    response = self._get('http.greet', HTTP_IF_NONE_MATCH='"other"')
+    self.assertEquals(response.status_code, 200)
+
+  def test_cheap_validator(self):
+    response = self._get('http.version')
+    self.assertEquals(response['ETag'], '"v1-sam"')
+    response = self._get('http.version', HTTP_IF_NONE_MATCH='"v1-sam"')
+    self.assertEquals(response.status_code, 304)
+    self.assertEquals(self.calls, ['sam'])
+
+  def test_post_is_not_cached(self):
+    request = self.factory.post('/json/', dumps({'method': 'http.greet', 'params': ['sam'], 'id': 1}),
+                                content_type='application/json-rpc')
+    response = self.site.dispatch(request)
+    self.assertFalse(response.has_header('ETag'))
+
+
+class ServiceDescriptionTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite()
+    self.factory = RequestFactory()
+
+    @jsonrpc_method('desc.echo(s=str) -> str', site=self.site)
+    def echo(request, s):
+      return s
+
+  def _call(self, **headers):
+    request = self.factory.get('/json/system.describe', **headers)
+    return self.site.dispatch(request, 'system.describe')
+
+  def test_describe(self):
+    response = self._call()
+    self.assertEquals(response.status_code, 200)
+    desc = loads(response.content)['result']
+    self.assertEquals(desc, loads(dumps(self.site.service_desc())))
+    self.assertEquals([p['name'] for p in desc['procs']], ['desc.echo'])
+    request = self.factory.post('/json/', dumps({'method': 'system.describe', 'params': [], 'id': 1}),
+                                content_type='application/json-rpc')
+    response = loads(self.site.dispatch(request).content)
+    self.assertEquals(response['result'], desc)
+    self.assertEquals(response['id'], 1)
+
+  def test_etag(self):
+    etag = self._call()['ETag']
+    self.assertEquals(self._call(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    @jsonrpc_method('desc.other', site=self.site)
+    def other(request):
+      return None
+
+    response = self._call(HTTP_IF_NONE_MATCH=etag)
+    self.assertEquals(response.status_code, 200)
+    self.assertNotEquals(response['ETag'], etag)
+    self.assertEquals(len(loads(response.content)['result']['procs']), 2)
+
+  def test_dropped_while_served(self):
+    # another thread registering a method or loading a namespace right after
+    # the description was built
+    describe = self.site.service_desc
+
+    def service_desc():
+      desc = describe()
+      self.site.invalidate_description()
+      return desc
+
+    self.site.service_desc = service_desc
+    response = self._call()
+    self.assertEquals(response.status_code, 200)
+    self.assertEquals([p['name'] for p in loads(response.content)['result']['procs']], ['desc.echo'])
+    desc, data, etag = self.site.description_snapshot()
+    self.assertEquals(response['ETag'], '"%s"' % etag)
+
+
+class LazyNamespaceTest(unittest.TestCase):
+  def setUp(self):
+    self.factory = RequestFactory()
+
+  def _call(self, site, method):
+    request = self.factory.post('/json/', dumps({'method': method, 'params': ['hi'], 'id': 1}),
+                                content_type='application/json-rpc')
+    return loads(site.dispatch(request).content)
+
+  def test_loads_on_first_call(self):
+    self.assertFalse('lazymethods' in sys.modules)
+    jsonrpc_site.add_namespace('lazy', 'lazymethods')
+    self.assertEquals(jsonrpc_site.namespace_report()[0]['loaded'], False)
+    self.assertEquals(self._call(jsonrpc_site, 'lazy.deeper.echo')['result'], 'hi')
+    self.assert_('lazymethods' in sys.modules)
+    report = jsonrpc_site.namespace_report()
+    self.assertEquals(report[0]['namespace'], 'lazy')
+    self.assertEquals(report[0]['loaded'], True)
+    self.assertEquals(report[0]['methods'], 2)
+    self.assert_(report[0]['seconds'] >= 0)
+
+  def test_describe_loads_everything(self):
+    site = JSONRPCSite(namespaces={'nothing': 'json'})
+    self.assertEquals(site.service_desc()['procs'], [])
+    self.assertEquals(site.namespace_report()[0]['loaded'], True)
+    self.assertEquals(site.namespace_report()[0]['methods'], 0)
+
+  def test_broken_namespace(self):
+    site = JSONRPCSite(namespaces={'broken': 'jsonrpc.does_not_exist'})
+    self.assertEquals(self._call(site, 'other.method')['error']['name'], 'MethodNotFoundError')
+    self.assertEquals(site.namespace_report()[0]['seconds'], None)
+    self.assert_(self._call(site, 'broken.method')['error'])
+    report = site.namespace_report()[0]
+    self.assertEquals(report['loaded'], False)
+    self.assert_('ImportError' in report['error'] or 'ModuleNotFoundError' in report['error'])
+
+  def test_describe_skips_broken_namespace(self):
+    site = JSONRPCSite(namespaces={'broken': 'jsonrpc.does_not_exist', 'nothing': 'json'})
+    self.assertEquals(site.service_desc()['procs'], [])
+    report = dict((ns['namespace'], ns) for ns in site.namespace_report())
+    self.assertEquals(report['nothing']['loaded'], True)
+    self.assertEquals(report['broken']['loaded'], False)
+    self.assert_(report['broken']['error'])
+    seconds = report['broken']['seconds']
+    site.invalidate_description()
+    self.assertEquals(site.service_desc()['procs'], [])
+    self.assertEquals(site.namespaces['broken']['seconds'], seconds)  # not imported again
+
+  def test_namespace_describing_the_site(self):
+    jsonrpc_site.add_namespace('selfdesc', 'selfdescribing')
+    try:
+      thread = threading.Thread(target=jsonrpc_site.load_namespace, args=('selfdesc',))
+      thread.daemon = True
+      thread.start()
+      thread.join(5)
+      self.assertFalse(thread.is_alive())
+      self.assertEquals(jsonrpc_site.namespaces['selfdesc']['loaded'], True)
+      self.assertEquals(self._call(jsonrpc_site, 'selfdesc.echo')['result'], 'hi')
+    finally:
+      del jsonrpc_site.namespaces['selfdesc']
+    import selfdescribing
+    self.assert_('selfdesc.echo' in [proc['name'] for proc in selfdescribing.description['procs']])
+
+
+class BrowserAssetTest(unittest.TestCase):
+  def setUp(self):
+    self.factory = RequestFactory()
+
+  def _get(self, **headers):
+    from jsonrpc import views
+    return views.browse(self.factory.get('/json/browse/', {'f': 'mochikit.js'}, **headers))
+
+  def test_assets(self):
+    from jsonrpc import mochikit
+    response = self._get()
+    self.assertEquals(response.status_code, 200)
+    self.assertEquals(response.content, mochikit.mochikit)
+    self.assertFalse(response.has_header('Content-Encoding'))
+    self.assert_('max-age=' in response['Cache-Control'])
+    self.assert_('Accept-Encoding' in response['Vary'])
+
+    response = self._get(HTTP_ACCEPT_ENCODING='gzip, deflate')
+    self.assertEquals(response['Content-Encoding'], 'gzip')
+    self.assertEquals(gzip.GzipFile(fileobj=io.BytesIO(response.content)).read(), mochikit.mochikit)
+    self.assertEquals(self._get(HTTP_ACCEPT_ENCODING='gzip;q=0')
+                      .has_header('Content-Encoding'), False)
+
+  def test_not_modified(self):
+    etag = self._get(HTTP_ACCEPT_ENCODING='gzip')['ETag']
+    response = self._get(HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+    self.assertEquals(response.status_code, 304)
+    self.assertEquals(response.content, b'')
+    self.assertEquals(self._get(HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class KeepAliveServer(object):
+  """
+  A local HTTP/1.1 server answering every JSON-RPC call with the name of the
+  method. It records the client port of every request so tests can tell
+  which connection each request came over.
+  """
+  def __init__(self, close_after_response=False, status=200, delay=0):
+    from six.moves import BaseHTTPServer, socketserver
+    test = self
+    self.ports = []
+    self.paths = []
+    self.status = status
+    self.truncate = False  # drop the connection half way through the body
+    self.hang_up = False  # drop the connection instead of answering
+    self.in_flight = self.max_in_flight = 0
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+      protocol_version = 'HTTP/1.1'
+
+      def do_POST(self):
+        D = loads(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+        with lock:
+          test.ports.append(self.client_address[1])
+          test.paths.append(self.path)
+          test.in_flight += 1
+          test.max_in_flight = max(test.max_in_flight, test.in_flight)
+        time.sleep(delay)
+        with lock:
+          test.in_flight -= 1
+        if test.hang_up:
+          self.close_connection = True
+          return
+        body = dumps({'id': D['id'], 'result': D['method'], 'error': None}).encode('utf-8')
+        self.send_response(test.status)
+        self.send_header('Content-Type', 'application/json-rpc')
+        self.send_header('Content-Length', str(len(body) + (10 if test.truncate else 0)))
+        self.end_headers()
+        self.wfile.write(body)
+        if test.truncate:
+          self.close_connection = True
+          return
+        # drop the connection without saying so in the headers
+        self.close_connection = close_after_response
+
+      def log_message(self, *args):
+        pass
+
+    class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+      daemon_threads = True
+
+    self.server = Server(('127.0.0.1', 0), Handler)
+    self.url = 'http://127.0.0.1:%d/json/' % self.server.server_address[1]
+    self.thread = threading.Thread(target=self.server.serve_forever)
+    self.thread.daemon = True
+    self.thread.start()
+
+  def stop(self):
+    self.server.shutdown()
+    self.server.server_close()
+
+
+class ConnectionPoolTest(unittest.TestCase):
+  def tearDown(self):
+    self.pool.clear()
+    self.server.stop()
+
+  def _pool(self, **kwargs):
+    from jsonrpc.proxy import ConnectionPool
+    self.pool = ConnectionPool(**kwargs)
+    return self.pool
+
+  def test_keep_alive(self):
+    self.server = KeepAliveServer()
+    pool = self._pool(max_size=2)
+    proxy = ServiceProxy(self.server.url, pool=pool)
+    self.assertEquals(proxy.a.b()['result'], 'a.b')
+    self.assertEquals(proxy.a.c()['result'], 'a.c')
+    self.assert_(proxy.a.pool is pool)
+    self.assertEquals(len(set(self.server.ports)), 1)
+    pool.clear()
+    proxy.a.b()
+    self.assertEquals(len(set(self.server.ports)), 2)
+
+  def test_idle_timeout(self):
+    self.server = KeepAliveServer()
+    proxy = ServiceProxy(self.server.url, pool=self._pool(idle_timeout=0))
+    proxy.a()
+    proxy.a()
+    self.assertEquals(len(set(self.server.ports)), 2)
+
+  def test_closed_by_server(self):
+    self.server = KeepAliveServer(close_after_response=True)
+    proxy = ServiceProxy(self.server.url, pool=self._pool())
+    self.assertEquals(proxy.a()['result'], 'a')
+    time.sleep(0.05)
+    self.assertEquals(proxy.b()['result'], 'b')
+    self.assertEquals(len(self.server.ports), 2)
+
+  def test_no_retry_after_response_started(self):
+    self.server = KeepAliveServer()
+    proxy = ServiceProxy(self.server.url, pool=self._pool())
+    proxy.a()
+    self.server.truncate = True
+    self.assertRaises(Exception, proxy.b)
+    self.assertEquals(len(self.server.ports), 2)  # b was not sent twice
+
+  def test_no_retry_without_status_line(self):
+    self.server = KeepAliveServer()
+    proxy = ServiceProxy(self.server.url, pool=self._pool())
+    proxy.a()
+    self.server.hang_up = True
+    # the server read b before hanging up, it may have run it
+    self.assertRaises(Exception, proxy.b)
+    self.assertEquals(len(self.server.ports), 2)
+
+  def test_http_proxy(self):
+    self.server = KeepAliveServer()
+    root = self.server.url[:-len('/json/')]
+    pool = self._pool(proxies={'http': root, 'no': 'direct.example'})
+    self.assertEquals(ServiceProxy('http://service.example/json/', pool=pool).a()['result'], 'a')
+    self.assertEquals(self.server.paths, ['http://service.example:80/json/'])
+    self.assertEquals(pool.proxy_for(('http', 'direct.example', 80)), None)
+    self.assertEquals(pool.proxy_for(('http', 'api.direct.example', 80)), None)
+
+  def test_http_errors(self):
+    from jsonrpc.proxy import ServiceProxyException
+    self.server = KeepAliveServer(status=500)
+    proxy = ServiceProxy(self.server.url, pool=self._pool())
+    self.assertEquals(proxy.a()['result'], 'a')  # a JSON-RPC formatted error
+    self.server.status = 403
+    self.assertRaises(ServiceProxyException, proxy.a)
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'asyncio proxies need python 3.5')
+class AsyncServiceProxyTest(unittest.TestCase):
+  def setUp(self):
+    import asyncio
+    self.asyncio = asyncio
+    self.loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(self.loop)
+
+  def tearDown(self):
+    self.pool.clear()
+    self._run(self.asyncio.sleep(0))  # let the transports close
+    self.server.stop()
+    self.loop.close()
+    self.asyncio.set_event_loop(None)
+
+  def _pool(self, **kwargs):
+    from jsonrpc.proxy import AsyncConnectionPool
+    self.pool = AsyncConnectionPool(**kwargs)
+    return self.pool
+
+  def _run(self, awaitable):
+    return self.loop.run_until_complete(awaitable)
+
+  def test_calls(self):
+    from jsonrpc.proxy import AsyncServiceProxy
+    self.server = KeepAliveServer()
+    proxy = AsyncServiceProxy(self.server.url, pool=self._pool())
+    self.assertEquals(self._run(proxy.a.b())['result'], 'a.b')
+    self.assertEquals(self._run(proxy.a.c('x'))['result'], 'a.c')
+    self.assertEquals(len(set(self.server.ports)), 1)  # one connection
+
+  def test_in_flight_limit(self):
+    from jsonrpc.proxy import AsyncServiceProxy
+    self.server = KeepAliveServer(delay=0.05)
+    proxy = AsyncServiceProxy(self.server.url, pool=self._pool(max_in_flight=2))
+    responses = self._run(self.asyncio.gather(*[proxy.m(i) for i in range(6)]))
+    self.assertEquals([R['result'] for R in responses], ['m'] * 6)
+    self.assertEquals(self.server.max_in_flight, 2)
+    self.assertEquals(len(set(self.server.ports)), 2)
+
+  def test_timeout(self):
+    from jsonrpc.proxy import AsyncServiceProxy
+    self.server = KeepAliveServer(delay=0.3)
+    proxy = AsyncServiceProxy(self.server.url, pool=self._pool(), timeout=5)
+    self.assertRaises(self.asyncio.TimeoutError, self._run, proxy.with_timeout(0.05).slow())
+    self.assertEquals(self._run(proxy.slow())['result'], 'slow')
+
+  def test_closed_by_server(self):
+    from jsonrpc.proxy import AsyncServiceProxy
+    self.server = KeepAliveServer(close_after_response=True)
+    proxy = AsyncServiceProxy(self.server.url, pool=self._pool())
+    self.assertEquals(self._run(proxy.a())['result'], 'a')
+    time.sleep(0.05)
+    self.assertEquals(self._run(proxy.b())['result'], 'b')
+
+  def test_no_retry_after_response_started(self):
+    from jsonrpc.proxy import AsyncServiceProxy
+    self.server = KeepAliveServer()
+    proxy = AsyncServiceProxy(self.server.url, pool=self._pool())
+    self._run(proxy.a())
+    self.server.truncate = True
+    self.assertRaises(self.asyncio.IncompleteReadError, self._run, proxy.b())
+    self.assertEquals(len(self.server.ports), 2)
+
+  def test_connections_per_loop(self):
+    from jsonrpc.proxy import AsyncServiceProxy
+    from jsonrpc._async import run_sync
+    self.server = KeepAliveServer()
+    proxy = AsyncServiceProxy(self.server.url, pool=self._pool())
+    self._run(proxy.a())
+    # a loop of its own, whose connections are closed with it
+    self.assertEquals(run_sync(proxy.b())['result'], 'b')
+    self.assertEquals(len(self.pool._idle), 1)
+    self._run(proxy.c())
+    self.assertEquals(self.server.ports[2], self.server.ports[0])
+    self.assertNotEquals(self.server.ports[1], self.server.ports[0])
+
+  def test_http_errors(self):
+    from jsonrpc.proxy import AsyncServiceProxy, ServiceProxyException
+    self.server = KeepAliveServer(status=500)
+    proxy = AsyncServiceProxy(self.server.url, pool=self._pool())
+    self.assertEquals(self._run(proxy.a())['result'], 'a')
+    self.server.status = 403
+    self.assertRaises(ServiceProxyException, self._run, proxy.a())
+
+
+class CompressionTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(compress_min_size=100)
+    self.factory = RequestFactory()
+
+    @jsonrpc_method('zip.repeat', site=self.site)
+    def repeat(request, s, n):
+      return s * n
+
+  def _post(self, body, **headers):
+    request = self.factory.post('/json/', body, content_type='application/json-rpc', **headers)
+    return self.site.dispatch(request)
+
+  def _call(self, n, **headers):
+    return self._post(dumps({'method': 'zip.repeat', 'params': ['ab', n], 'id': 1}), **headers)
+
+  def test_response(self):
+    response = self._call(100, HTTP_ACCEPT_ENCODING='gzip, deflate')
+    self.assertEquals(response['Content-Encoding'], 'gzip')
+    self.assert_('Accept-Encoding' in response['Vary'])
+    self.assertEquals(loads(zlib.decompress(response.content, 16 + zlib.MAX_WBITS))['result'], 'ab' * 100)
+    # too small, or not accepted
+    self.assertFalse(self._call(10, HTTP_ACCEPT_ENCODING='gzip').has_header('Content-Encoding'))
+    self.assertFalse(self._call(100).has_header('Content-Encoding'))
+    self.assertFalse(self._call(100, HTTP_ACCEPT_ENCODING='gzip;q=0').has_header('Content-Encoding'))
+
+  def test_negotiation(self):
+    from jsonrpc._compress import choose_encoding
+    encodings = ('br', 'gzip')
+    self.assertEquals(choose_encoding('gzip, deflate', encodings), 'gzip')
+    self.assertEquals(choose_encoding('*', encodings), 'br')
+    self.assertEquals(choose_encoding('br;q=0, *', encodings), 'gzip')
+    # a refusal wins over the wildcard
+    self.assertEquals(choose_encoding('gzip;q=0, *', ('gzip',)), None)
+    self.assertEquals(choose_encoding('*;q=0', encodings), None)
+    self.assertEquals(choose_encoding('*;q=0, gzip', encodings), 'gzip')
+    self.assertEquals(choose_encoding('', encodings), None)
+    response = self._call(100, HTTP_ACCEPT_ENCODING='gzip;q=0, *')
+    self.assertNotEquals(response.get('Content-Encoding'), 'gzip')
+
+  def test_request(self):
+    body = gzip_bytes(dumps({'method': 'zip.repeat', 'params': ['ab', 2], 'id': 1}).encode('utf-8'))
+    response = self._post(body, HTTP_CONTENT_ENCODING='gzip')
+    self.assertEquals(loads(response.content)['result'], 'abab')
+    response = self._post(body[:-10], HTTP_CONTENT_ENCODING='gzip')
+    self.assertEquals(loads(response.content)['error']['name'], 'InvalidRequestError')
+    response = self._post(body, HTTP_CONTENT_ENCODING='compress')
+    self.assertEquals(loads(response.content)['error']['name'], 'InvalidRequestError')
+
+  def test_incremental_request(self):
+    self.site.incremental_request_size = 1
+    batch = [{'method': 'zip.repeat', 'params': ['ab', i], 'id': i} for i in range(50)]
+    response = self._post(gzip_bytes(dumps(batch).encode('utf-8')), HTTP_CONTENT_ENCODING='gzip')
+    self.assertEquals([R['result'] for R in loads(response.content)], ['ab' * i for i in range(50)])
+
+  def test_testing_proxy(self):
+    proxy = TestingServiceProxy(Client(), '/json/', version='2.0', compress_min_size=1)
+    self.assertEquals(proxy.jsonrpc.test('Hello')['result'], 'Hello')
+
+
+class MetricsTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(metrics=True)
+    self.factory = RequestFactory()
+
+    @jsonrpc_method('metered.echo', site=self.site)
+    def echo(request, s):
+      return s
+
+    @jsonrpc_method('metered.fail', site=self.site)
+    def fail(request):
+      raise InvalidParamsError('no')
+
+  def _post(self, D):
+    request = self.factory.post('/json/', dumps(D), content_type='application/json-rpc')
+    return loads(self.site.dispatch(request).content)
+
+  def test_counts(self):
+    body = dumps({'jsonrpc': '2.0', 'method': 'metered.echo', 'params': ['hi'], 'id': 1})
+    request = self.factory.post('/json/', body, content_type='application/json-rpc')
+    response = self.site.dispatch(request)
+    self._post({'method': 'metered.echo', 'params': ['hi'], 'id': 2})
+    self._post({'method': 'metered.fail', 'params': [], 'id': 3})
+    self._post({'method': 'metered.nope', 'params': [], 'id': 4})
+    self._post([{'jsonrpc': '2.0', 'method': 'metered.echo', 'params': ['a'], 'id': 5},
+                {'jsonrpc': '2.0', 'method': 'metered.echo', 'params': [], 'id': 6}])
+
+    methods = self.site.metrics.snapshot()['methods']
+    v2 = methods['metered.echo']['2.0']
+    self.assertEquals(v2['calls'], 3)
+    self.assertEquals(v2['errors'], {'TypeError': 1})
+    self.assertEquals(sum(v2['histogram']), 3)
+    # batched calls have no payload sizes of their own
+    self.assertEquals(v2['sized'], 1)
+    self.assertEquals(v2['request_bytes'], len(body))
+    self.assertEquals(v2['response_bytes'], len(response.content))
+    self.assertEquals(methods['metered.echo']['1.0']['calls'], 1)
+    self.assertEquals(methods['metered.fail']['1.0']['errors'], {'InvalidParamsError': 1})
+    self.assertEquals(methods['<unknown>']['1.0']['errors'], {'MethodNotFoundError': 1})
+
+  def test_system_metrics(self):
+    self._post({'method': 'metered.echo', 'params': ['hi'], 'id': 1})
+    R = self._post({'method': 'system.metrics', 'params': [], 'id': 2})['result']
+    self.assertEquals(R['methods']['metered.echo']['1.0']['calls'], 1)
+    self.assertEquals(len(R['buckets']) + 1, len(R['methods']['metered.echo']['1.0']['histogram']))
+    self.assertFalse('system.metrics' in jsonrpc_site.urls and jsonrpc_site.metrics is None)
+
+  def test_prometheus(self):
+    self._post({'method': 'metered.echo', 'params': ['hi'], 'id': 1})
+    self._post({'method': 'metered.fail', 'params': [], 'id': 2})
+    response = self.site.metrics_view(self.factory.get('/metrics'))
+    self.assert_(response['Content-Type'].startswith('text/plain'))
+    text = response.content.decode('utf-8')
+    self.assert_('jsonrpc_call_duration_seconds_bucket{method="metered.echo",version="1.0",le="+Inf"} 1\n' in text)
+    self.assert_('jsonrpc_call_duration_seconds_count{method="metered.fail",version="1.0"} 1\n' in text)
+    self.assert_('jsonrpc_call_errors_total{method="metered.fail",version="1.0",error="InvalidParamsError"} 1\n' in text)
+    self.assert_('jsonrpc_request_size_bytes_count{method="metered.echo",version="1.0"} 1\n' in text)
+    self.assertEquals(JSONRPCSite().metrics_view(self.factory.get('/metrics')).status_code, 404)
+
+
+class AuthTokenTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(login=60)
+    self.factory = RequestFactory()
+    self.checked = []
+
+    @jsonrpc_method('auth.whoami', authenticated=True, site=self.site)
+    def whoami(request):
+      return request.user.username
+
+    def check(username, password):
+      self.checked.append(username)
+      if password == 'secret':
+        return User(username=username)
+
+    @jsonrpc_method('auth.custom', authenticated=check, site=self.site)
+    def custom(request, s):
+      return [request.user.username, s]
+
+  def _call(self, method, params, site=None, **headers):
+    request = self.factory.post('/json/', dumps({'jsonrpc': '2.0', 'method': method, 'params': params, 'id': 1}),
+                                content_type='application/json-rpc', **headers)
+    return loads((site or self.site).dispatch(request).content)
+
+  def test_login(self):
+    R = self._call('system.login', ['sammeh', 'password'])['result']
+    self.assertEquals(R['expires_in'], 60)
+    token = R['token']
+    self.assertEquals(self._call('auth.whoami', [], HTTP_AUTHORIZATION='Bearer ' + token)['result'], 'sammeh')
+    self.assertEquals(self._call('auth.whoami', {'token': token})['result'], 'sammeh')
+    self.assertEquals(self._call('auth.whoami', [], HTTP_AUTHORIZATION='Bearer ' + token[:-2])['error']['name'],
+                      'InvalidCredentialsError')
+    self.assertEquals(self._call('system.login', ['sammeh', 'wrong'])['error']['name'], 'InvalidCredentialsError')
+    # tokens are only accepted where they are issued
+    site = JSONRPCSite()
+    jsonrpc_method('auth.whoami', authenticated=True, site=site)(lambda request: request.user.username)
+    self.assertEquals(self._call('auth.whoami', [], site=site, HTTP_AUTHORIZATION='Bearer ' + token)['error']['name'],
+                      'InvalidParamsError')
+
+  def test_validated_methods(self):
+    jsonrpc_method('auth.double(Number) -> Number', authenticated=True, validate=True, site=self.site)(
+      lambda request, n: n * 2)
+    token = self._call('system.login', ['sammeh', 'password'])['result']['token']
+    self.assertEquals(self._call('auth.double', [3], HTTP_AUTHORIZATION='Bearer ' + token)['result'], 6)
+    self.assertEquals(self._call('auth.double', {'token': token, 'n': 3})['result'], 6)
+    self.assertEquals(self._call('auth.double', ['sammeh', 'password', 3])['result'], 6)
+    self.assertEquals(self._call('auth.double', {'username': 'sammeh', 'password': 'password', 'n': 3})['result'], 6)
+    self.assertEquals(self._call('auth.double', ['x'], HTTP_AUTHORIZATION='Bearer ' + token)['error']['name'],
+                      'InvalidParamsError')
+    self.assertEquals(self._call('auth.double', [3])['error']['name'], 'InvalidParamsError')
+    params = self.site.procedure_desc('auth.double')['params']
+    self.assertEquals([(p['name'], p['optional']) for p in params],
+                      [('username', True), ('password', True), ('n', False)])
+
+  def test_password_change_revokes_tokens(self):
+    user = User.objects.create_user(username='tokenuser', email='t@rf.com', password='old')
+    try:
+      token = self._call('system.login', ['tokenuser', 'old'])['result']['token']
+      self.assertEquals(self._call('auth.whoami', {'token': token})['result'], 'tokenuser')
+      user.set_password('new')
+      user.save()
+      self.assertEquals(self._call('auth.whoami', {'token': token})['error']['name'], 'InvalidCredentialsError')
+    finally:
+      user.delete()
+
+  def test_credential_cache(self):
+    site = JSONRPCSite(credential_cache=True)
+
+    def check(username, password):
+      self.checked.append(username)
+      for user in User.objects.filter(username=username, is_active=True):
+        if user.check_password(password):
+          return user
+
+    jsonrpc_method('auth.cached', authenticated=check, site=site)(lambda request, s: [request.user.username, s])
+    call = lambda params: self._call('auth.cached', params, site=site)
+    user = User.objects.create_user('cacheduser', 'cached@example.com', 'secret')
+    try:
+      for i in range(3):
+        self.assertEquals(call(['cacheduser', 'secret', 'hi'])['result'], ['cacheduser', 'hi'])
+      self.assertEquals(self.checked, ['cacheduser'])
+      for i in range(2):
+        self.assertEquals(call(['cacheduser', 'wrong', 'hi'])['error']['name'], 'InvalidCredentialsError')
+      self.assertEquals(len(self.checked), 3)
+      # deactivated users and changed passwords are locked out right away
+      user.is_active = False
+      user.save()
+      self.assertEquals(call(['cacheduser', 'secret', 'hi'])['error']['name'], 'InvalidCredentialsError')
+      user.is_active = True
+      user.set_password('new')
+      user.save()
+      self.assertEquals(call(['cacheduser', 'secret', 'hi'])['error']['name'], 'InvalidCredentialsError')
+      self.assertEquals(call({'username': 'cacheduser', 'password': 'new', 's': 'hi'})['result'], ['cacheduser', 'hi'])
+    finally:
+      user.delete()
+    # off by default, unsaved users are never cached
+    self.assertEquals(self.site.credential_cache, None)
+    del self.checked[:]
+    site.register('auth.custom', self.site.urls['auth.custom'])
+    self._call('auth.custom', ['bob', 'secret', 'hi'], site=site)
+    self._call('auth.custom', ['bob', 'secret', 'hi'], site=site)
+    self.assertEquals(self.checked, ['bob', 'bob'])
+
+  def _batch(self, site, calls):
+    batch = [{'jsonrpc': '2.0', 'method': 'auth.custom', 'params': params, 'id': i} for i, params in enumerate(calls)]
+    request = self.factory.post('/json/', dumps(batch), content_type='application/json-rpc')
+    return loads(site.dispatch(request).content)
+
+  def test_batch_authenticates_once(self):
+    calls = [['bob', 'secret', i] for i in range(50)] + [['bob', 'wrong', 'x'], ['eve', 'secret', 'y']]
+    R = self._batch(self.site, calls)
+    self.assertEquals([r['result'] for r in R[:50]], [['bob', i] for i in range(50)])
+    self.assertEquals(R[50]['error']['name'], 'InvalidCredentialsError')
+    self.assertEquals(R[51]['result'], ['eve', 'y'])
+    self.assertEquals(sorted(self.checked), ['bob', 'bob', 'eve'])
+    # every batch checks again
+    self._batch(self.site, [['bob', 'secret', 1]])
+    self.assertEquals(len(self.checked), 4)
+
+  def test_parallel_batch_authenticates_once(self):
+    site = JSONRPCSite(batch_workers=4, credential_cache=False)
+    check = lambda username, password: self.checked.append(username) or User(username=username)
+    jsonrpc_method('auth.custom', authenticated=check, site=site)(lambda request, s: [request.user.username, s])
+    R = self._batch(site, [['bob', 'secret', i] for i in range(20)])
+    self.assertEquals([r['result'] for r in R], [['bob', i] for i in range(20)])
+    self.assertEquals(self.checked, ['bob'])
+
+  def test_parallel_batch_different_credentials(self):
+    site = JSONRPCSite(batch_workers=4)
+    checking = {'bob': threading.Event(), 'eve': threading.Event()}
+
+    def check(username, password):
+      # only succeeds when the other user is being checked at the same time
+      checking[username].set()
+      other = 'eve' if username == 'bob' else 'bob'
+      if checking[other].wait(5):
+        return User(username=username)
+
+    jsonrpc_method('auth.custom', authenticated=check, site=site)(lambda request, s: [request.user.username, s])
+    R = self._batch(site, [['bob', 'secret', 1], ['eve', 'secret', 2]])
+    self.assertEquals([r.get('result') for r in R], [['bob', 1], ['eve', 2]])
+
+
+class LimitTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(limits={'slow': {'max_in_flight': 1, 'max_queue': 0}})
+    self.factory = RequestFactory()
+    self.go = threading.Event()
+
+    @jsonrpc_method('slow.wait', site=self.site)
+    def wait(request):
+      self.go.wait(5)
+      return 'done'
+
+    @jsonrpc_method('health.ping', site=self.site)
+    def ping(request):
+      return 'pong'
+
+  def tearDown(self):
+    self.go.set()
+
+  def _post(self, D):
+    request = self.factory.post('/json/', dumps(D), content_type='application/json-rpc')
+    return self.site.dispatch(request)
+
+  def _call(self, method, id=1):
+    return {'jsonrpc': '2.0', 'method': method, 'params': [], 'id': id}
+
+  def _hold(self, name):
+    "Starts a call of slow.wait in the background, returns once it has a slot"
+    results = []
+    t = threading.Thread(target=lambda: results.append(loads(self._post(self._call('slow.wait')).content)))
+    t.start()
+    while self.site.limits[name].occupancy()['in_flight'] < 1:
+      time.sleep(0.005)
+    return t, results
+
+  def test_busy(self):
+    t, results = self._hold('slow')
+    response = self._post(self._call('slow.wait'))
+    self.assertEquals(response.status_code, 503)
+    self.assertEquals(response['Retry-After'], '1')
+    error = loads(response.content)['error']
+    self.assertEquals(error['name'], 'ServerBusyError')
+    self.assertEquals(error['data'], {'retry_after': 1})
+    # other methods are not held up
+    self.assertEquals(loads(self._post(self._call('health.ping')).content)['result'], 'pong')
+    report = loads(self._post(self._call('system.limits')).content)['result']
+    self.assertEquals(report['slow']['in_flight'], 1)
+    self.assertEquals(report['slow']['rejected'], 1)
+    self.go.set()
+    t.join()
+    self.assertEquals(results[0]['result'], 'done')
+    self.assertEquals(self.site.limits['slow'].occupancy()['in_flight'], 0)
+
+  def test_queue(self):
+    self.site.set_limit('slow', 1, max_queue=1, timeout=5)
+    t, results = self._hold('slow')
+    threading.Timer(0.05, self.go.set).start()
+    self.assertEquals(loads(self._post(self._call('slow.wait')).content)['result'], 'done')
+    t.join()
+    self.assertEquals(self.site.limits['slow'].occupancy()['admitted'], 2)
+
+  def test_batch_elements(self):
+    self.site.set_limit('*', 1, max_queue=0, retry_after=2.5)
+    # one after another, every element gets the slot
+    R = loads(self._post([self._call('health.ping', i) for i in range(3)]).content)
+    self.assertEquals([r['result'] for r in R], ['pong'] * 3)
+    t, results = self._hold('*')
+    response = self._post([self._call('health.ping', i) for i in range(2)])
+    self.assertEquals(response.status_code, 200)
+    self.assertEquals([r['error']['data'] for r in loads(response.content)], [{'retry_after': 2.5}] * 2)
+    self.assertEquals(self._post(self._call('health.ping'))['Retry-After'], '3')
+    self.go.set()
+    t.join()
+    self.site.set_limit('*', None)
+    self.assertEquals(sorted(self.site.limits), ['slow'])
+
+
+class RequestLimitTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite(max_body_size=1000, max_batch_size=5, max_params_depth=2)
+    self.factory = RequestFactory()
+
+    @jsonrpc_method('limited.echo', site=self.site)
+    def echo(request, value):
+      return value
+
+  def _request(self, body, **headers):
+    return self.factory.post('/json/', body, content_type='application/json-rpc', **headers)
+
+  def _post(self, body, **headers):
+    return loads(self.site.dispatch(self._request(body, **headers)).content)
+
+  def _call(self, value, id=1):
+    return {'jsonrpc': '2.0', 'method': 'limited.echo', 'params': [value], 'id': id}
+
+  def test_body_size(self):
+    self.assertEquals(self._post(dumps(self._call('a' * 900)))['result'], 'a' * 900)
+    request = self._request(dumps(self._call('a' * 1000)))
+    error = loads(self.site.dispatch(request).content)['error']
+    self.assertEquals(error['name'], 'InvalidRequestError')
+    self.assert_('larger than 1000 bytes' in error['message'])
+    self.assertFalse(hasattr(request, '_body'))  # never read
+
+  def test_decompressed_size(self):
+    bomb = gzip_bytes(dumps(self._call(' ' * 100000)).encode('utf-8'))
+    self.assert_(len(bomb) < 1000)
+    self.assert_('larger than' in self._post(bomb, HTTP_CONTENT_ENCODING='gzip')['error']['message'])
+    small = gzip_bytes(dumps(self._call('abc')).encode('utf-8'))
+    self.assertEquals(self._post(small, HTTP_CONTENT_ENCODING='gzip')['result'], 'abc')
+    self.site.incremental_request_size = 1
+    bomb = gzip_bytes(dumps([self._call(' ' * 100000)]).encode('utf-8'))
+    self.assert_('larger than' in self._post(bomb, HTTP_CONTENT_ENCODING='gzip')['error']['message'])
+
+  def test_decompressed_size_brotli(self):
+    from jsonrpc import _compress
+    if _compress.brotli is None:
+      raise unittest.SkipTest('brotli is not installed')
+    bomb = _compress.compress(dumps(self._call(' ' * 100000)).encode('utf-8'), 'br')
+    small = _compress.compress(dumps(self._call('abc')).encode('utf-8'), 'br')
+    if not _compress.BOUNDED_BROTLI:
+      # too old to stop early, brotli bodies are refused outright
+      self.assertEquals(self._post(small, HTTP_CONTENT_ENCODING='br')['error']['name'], 'InvalidRequestError')
+      return
+    self.assert_('larger than' in self._post(bomb, HTTP_CONTENT_ENCODING='br')['error']['message'])
+    self.assertEquals(self._post(small, HTTP_CONTENT_ENCODING='br')['result'], 'abc')
+    self.site.incremental_request_size = 1
+    bomb = _compress.compress(dumps([self._call(' ' * 100000)]).encode('utf-8'), 'br')
+    self.assert_('larger than' in self._post(bomb, HTTP_CONTENT_ENCODING='br')['error']['message'])
+
+  def test_batch_size(self):
+    self.assertEquals(len(self._post(dumps([self._call(i, i) for i in range(5)]))), 5)
+    error = self._post(dumps([self._call(i, i) for i in range(6)]))['error']
+    self.assertEquals(error['message'], 'InvalidRequestError: Batch of more than 5 elements')
+    self.site.incremental_request_size = 1
+    self.assertEquals(len(self._post(dumps([self._call(i, i) for i in range(5)]))), 5)
+    error = self._post(dumps([self._call(i, i) for i in range(6)]))['error']
+    self.assertEquals(error['message'], 'InvalidRequestError: Batch of more than 5 elements')
+
+  def test_params_depth(self):
+    # params are the first level
+    R = self._post(dumps([self._call([1, 2], 1), self._call([[1]], 2), self._call({'a': [1]}, 3)]))
+    self.assertEquals(R[0]['result'], [1, 2])
+    self.assertEquals(R[1]['error']['message'], 'InvalidRequestError: Params nested more than 2 levels deep')
+    self.assertEquals(R[2]['error']['name'], 'InvalidRequestError')
+
+
+class ErrorLogTest(unittest.TestCase):
+  def setUp(self):
+    import logging
+    from jsonrpc.errorlog import ErrorLog
+
+    class Collect(logging.Handler):
+      def emit(handler, record):
+        self.records.append((record, handler.format(record), threading.current_thread()))
+
+    self.records = []
+    self.handler = Collect()
+    self.parent = logging.getLogger('jsonrpctest')
+    self.parent.addHandler(self.handler)
+    self.parent.propagate = False
+    self.log = ErrorLog(burst=2, name='jsonrpctest.errors')
+
+  def tearDown(self):
+    self.log.stop()
+    self.parent.removeHandler(self.handler)
+
+  def _fail(self, method, exc=ValueError):
+    try:
+      raise exc('boom')
+    except Exception:
+      self.log.report(method, sys.exc_info())
+
+  def test_rate_limit(self):
+    for i in range(5):
+      self._fail('a.b')
+    self._fail('a.c')
+    self._fail('a.b', KeyError)
+    self.log.stop()  # waits for the queue to be emitted
+    messages = [message.split('\n')[0] for record, message, thread in self.records]
+    self.assertEquals(messages, ['Exception in a.b'] * 2 + ['Exception in a.c', 'Exception in a.b'])
+    # formatted by the background thread
+    self.assert_('ValueError: boom' in self.records[0][1])
+    self.assertFalse(self.records[0][2] is threading.current_thread())
+
+  def test_suppressed_count(self):
+    self.log.limiter.interval = 0.05
+    for i in range(5):
+      self._fail('a.b')
+    time.sleep(0.06)
+    self._fail('a.b')
+    self.log.stop()
+    self.assertEquals(self.records[-1][0].getMessage(), 'Exception in a.b (3 more like it left out)')
+
+  def test_no_stack_unless_asked(self):
+    try:
+      raise InvalidParamsError('nope')
+    except InvalidParamsError as e:
+      self.assertFalse('stack' in e.json_rpc_format)
+      self.assert_('InvalidParamsError' in e.json_rpc_error(stack=True)['stack'])
+
+
+class DeadlineTest(unittest.TestCase):
+  def setUp(self):
+    self.site = JSONRPCSite()
+    self.factory = RequestFactory()
+    self.ran = []
+
+    @jsonrpc_method('work.slow', site=self.site, timeout=0.05)
+    def slow(request, seconds):
+      self.ran.append(seconds)
+      time.sleep(seconds)
+      return 'done'
+
+    @jsonrpc_method('work.deadline', site=self.site)
+    def deadline(request):
+      return [request.jsonrpc_deadline, deadlines.remaining()]
+
+    @jsonrpc_method('work.forward', site=self.site)
+    def forward(request):
+      proxy = TestingServiceProxy(self, '/json/', version='2.0')
+      return proxy.work.deadline()['result']
+
+  def post(self, path, **extra):
+    "Lets the proxies of work.forward call the site under test"
+    return self.site.dispatch(self.factory.post(path, **extra))
+
+  def _post(self, D, **extra):
+    request = self.factory.post('/json/', dumps(D), content_type='application/json-rpc', **extra)
+    return self.site.dispatch(request)
+
+  def _call(self, method, params=[], id=1, **members):
+    return dict({'jsonrpc': '2.0', 'method': method, 'params': params, 'id': id}, **members)
+
+  def test_method_timeout(self):
+    self.assertEquals(loads(self._post(self._call('work.slow', [0])).content)['result'], 'done')
+    # finishing late, its work is done and its result returned all the same
+    response = self._post(self._call('work.slow', [0.1]))
+    self.assertEquals(response.status_code, 200)
+    self.assertEquals(loads(response.content)['result'], 'done')
+
+  def test_client_timeout(self):
+    start = time.time()
+    deadline, remaining = loads(self._post(self._call('work.deadline'), HTTP_X_JSONRPC_TIMEOUT='5').content)['result']
+    self.assert_(start + 5 <= deadline <= time.time() + 5)
+    self.assert_(0 < remaining <= deadline - start)
+    # the shortest timeout wins
+    deadline, remaining = loads(self._post(self._call('work.deadline', timeout=1), HTTP_X_JSONRPC_TIMEOUT='5').content)['result']
+    self.assert_(remaining <= 1)
+    self.assertEquals(loads(self._post(self._call('work.deadline')).content)['result'], [None, None])
+    for bad in ('soon', '-1', '0'):
+      error = loads(self._post(self._call('work.deadline'), HTTP_X_JSONRPC_TIMEOUT=bad).content)['error']
+      self.assertEquals(error['name'], 'InvalidRequestError')
+
+  def test_batch_skips_expired_calls(self):
+    batch = [self._call('work.slow', [0.1], id=1), self._call('work.slow', [0], id=2)]
+    responses = loads(self._post(batch).content)
+    self.assertEquals(responses[0]['result'], 'done')
+    self.assertEquals(responses[1]['error']['name'], 'DeadlineExceededError')
+    self.assertEquals(responses[1]['error']['code'], -32001)
+    self.assertEquals(self.ran, [0.1])
+
+  def test_proxy_propagates_deadline(self):
+    deadline, remaining = loads(self._post(self._call('work.forward'), HTTP_X_JSONRPC_TIMEOUT='2').content)['result']
+    self.assert_(0 < remaining <= 2)
+    self.assert_(deadline <= time.time() + 2)
+
+  def test_proxy_refuses_expired_calls(self):
+    token = deadlines.set_deadline(time.time() - 1)
+    try:
+      # nothing listens there, the call must not even be attempted
+      self.assertRaises(DeadlineExceededError, ServiceProxy('http://127.0.0.1:9/json/').anything)
+    finally:
+      deadlines.reset_deadline(token)
 
 
 class ServiceProxyTest(JSONServerTestCase):
@@ -281,6 +1726,32 @@ class ServiceProxyTest(JSONServerTestCase):
     self.assert_(proxy.jsonrpc.test(string='Hello')['result'] == 'Hello')
     self.assert_(proxy.jsonrpc.test('Hello')['result'] == 'Hello')
 
+  def test_compressed_requests(self):
+    proxy = ServiceProxy(self.host, version='2.0', compress_min_size=1)
+    self.assertEquals(proxy.jsonrpc.test(string='Hello')['result'], 'Hello')
+
+  def test_batch(self):
+    proxy = ServiceProxy(self.host, version='2.0')
+    with proxy.batch() as b:
+      hello = b.jsonrpc.test('Hello')
+      world = b.call('jsonrpc.test', string='World')
+      b.notify('jsonrpc.notify', 'ignored')
+      fails = proxy.jsonrpc.batch().fails('oops')
+      self.assertFalse(hello.done())
+    self.assertEquals(hello.result()['result'], 'Hello')
+    self.assertEquals(world.result()['result'], 'World')
+    self.assertRaises(ValueError, fails.result)  # its batch was never sent
+
+  def test_testing_proxy_batch(self):
+    proxy = TestingServiceProxy(Client(), self.host, version='2.0').jsonrpc
+    with proxy.batch() as b:
+      hello = b.test('Hello')
+      missing = b.missing('Hello')
+    self.assertEquals(hello.result()['result'], 'Hello')
+    self.assertEquals(missing.result()['error']['name'], 'MethodNotFoundError')
+    with proxy.batch() as b:
+      b.notify('notify', 'Hello')  # answered with an empty 204
+
 
 class JSONRPCTest(JSONServerTestCase):
   def setUp(self):